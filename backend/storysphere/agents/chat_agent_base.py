@@ -43,7 +43,7 @@ TOOL SELECTION RULES:
 - For "Relationship between X and Y?" or "X和Y的關係?" → get_entity_relationship
 - For "How does X change/develop?" or "X的發展?" → get_character_arc (includes LLM insight); for raw event list only → get_entity_timeline
 - For "Compare X and Y" (characters, narrative analysis) or "比較X和Y" → compare_characters (includes LLM analysis); for quick data diff or non-character entities → compare_entities (pure data, no LLM)
-- For finding passages or searching content → vector_search
+- For finding passages or searching content → hybrid_search (matches exact names/phrases and meaning); vector_search only for purely thematic similarity
 - For chapter overview or "這章講什麼?" → get_summary or get_chapter_summary (use chapter_number from context)
 - For "important characters/entities in this chapter" → get_summary (use the chapter_number from context) to read the summary, then identify the key characters mentioned. You can also use get_keywords with the chapter_number to supplement.
 - For keywords or themes → get_keywords (use chapter_number from context if asking about a specific chapter)
@@ -56,7 +56,7 @@ CONTEXT USAGE RULES:
 - When calling tools that need document_id, always use the document_id from the context.
 - The book_title and chapter_title in context tell you which story and chapter the user is reading.
 
-DO NOT use vector_search for entity lookups. DO NOT use get_entity_attributes when the user wants relationships.
+DO NOT use hybrid_search or vector_search for entity lookups. DO NOT use get_entity_attributes when the user wants relationships.
 """
 
 
@@ -78,7 +78,7 @@ _PATTERNS: list[tuple[str, re.Pattern, list[str], float]] = [
             r"(?:搜索|search|find|哪裡提到|where\s+is|mentioned|引用|passage\s+about)",
             re.IGNORECASE,
         ),
-        ["vector_search"],
+        ["hybrid_search"],
         0.8,
     ),
 ]
@@ -121,6 +121,17 @@ def get_vector_service():
 VectorServiceDep = Annotated[Any, Depends(get_vector_service)]
 
 
+def get_hybrid_search_service(vector: VectorServiceDep, doc: DocServiceDep):
+    # Stateless wrapper over the two singletons — cheap to build per request,
+    # and follows any override of either dependency.
+    from storysphere.services.hybrid_search_service import HybridSearchService  # noqa: PLC0415
+
+    return HybridSearchService(vector, doc)
+
+
+HybridSearchDep = Annotated[Any, Depends(get_hybrid_search_service)]
+
+
 @lru_cache(maxsize=1)
 def get_llm():
     from storysphere.config.settings import get_settings  # noqa: PLC0415
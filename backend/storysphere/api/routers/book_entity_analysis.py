@@ -76,8 +76,7 @@ async def list_character_analyses(
     book_id: str, doc: DocServiceDep, kg: KGServiceDep, cache: AnalysisCacheDep
 ) -> dict:
     """List character analyses (analyzed + unanalyzed)."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     from storysphere.domain.entities import EntityType  # noqa: PLC0415
@@ -381,8 +380,7 @@ async def trigger_batch_entity_analysis(
     """
     from storysphere.domain.entities import EntityType  # noqa: PLC0415
 
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(
             status_code=404,
             detail=f"Book '{book_id}' not found",
@@ -443,8 +441,7 @@ async def get_entity_voice_profile(
     ``cached_only=true``: only reads the cache, never triggers generation —
     404 if no cached profile exists yet.
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     entity = await kg.get_entity(entity_id)
@@ -499,8 +496,7 @@ async def delete_entity_voice_profile(
     kg: KGServiceDep,
 ) -> None:
     """Invalidate the cached voice profile so the next GET recomputes it."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     entity = await kg.get_entity(entity_id)
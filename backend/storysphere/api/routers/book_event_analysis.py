@@ -57,8 +57,7 @@ async def get_event_detail(
     book_id: str, event_id: str, doc: DocServiceDep, kg: KGServiceDep
 ) -> dict:
     """Get event detail with resolved participant and location names."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     event = await kg.get_event(event_id)
@@ -106,8 +105,7 @@ async def list_event_analyses(
     book_id: str, doc: DocServiceDep, kg: KGServiceDep, cache: AnalysisCacheDep
 ) -> dict:
     """List event analyses (analyzed + unanalyzed)."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     from storysphere.services.analysis_models import EventAnalysisResult  # noqa: PLC0415
@@ -501,8 +499,7 @@ async def trigger_batch_event_analysis(
     existing event are silently excluded. Omitted → all events.
     Returns a task_id for progress tracking.
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(
             status_code=404,
             detail=f"Book '{book_id}' not found",
@@ -29,6 +29,7 @@ from storysphere.api.schemas.book_graph import (
     ConfirmInferredRequest,
     EpistemicStateResponse,
     GraphDataResponse,
+    GraphDeltaResponse,
     GraphEdge,
     GraphNode,
     InferredRelationResponse,
@@ -65,8 +66,7 @@ async def get_book_graph(
     - mode: "chapter" (reading order) or "story" (chronological)
     - position: chapter number or chron_index depending on mode
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     # Snapshot mode: use get_snapshot() when mode+position provided
@@ -83,60 +83,15 @@ async def get_book_graph(
         events = await kg.get_events(document_id=book_id)
 
     entity_ids = {e.id for e in entities}
-
-    nodes = [
-        GraphNode(
-            id=e.id,
-            name=e.name,
-            type=e.entity_type.value,
-            description=e.description,
-            chunk_count=e.mention_count,
-        ).model_dump(by_alias=True)
-        for e in entities
-    ]
-
-    edges: list[dict] = [
-        GraphEdge(
-            id=rel.id,
-            source=rel.source_id,
-            target=rel.target_id,
-            label=rel.relation_type.value,
-        ).model_dump(by_alias=True)
+    nodes = [_entity_node(e) for e in entities]
+    edges = [
+        _relation_edge(rel)
         for rel in relations
         if rel.source_id in entity_ids and rel.target_id in entity_ids
     ]
-
     for event in events:
-        nodes.append(
-            GraphNode(
-                id=event.id,
-                name=event.title,
-                type="event",
-                description=event.description,
-                chunk_count=len(event.participants),
-                event_type=event.event_type.value,
-                chapter=event.chapter,
-            ).model_dump(by_alias=True)
-        )
-        for pid in event.participants:
-            if pid in entity_ids:
-                edges.append(
-                    GraphEdge(
-                        id=f"evt-{event.id}-{pid}",
-                        source=event.id,
-                        target=pid,
-                        label="participates_in",
-                    ).model_dump(by_alias=True)
-                )
-        if event.location_id and event.location_id in entity_ids:
-            edges.append(
-                GraphEdge(
-                    id=f"evt-{event.id}-loc",
-                    source=event.id,
-                    target=event.location_id,
-                    label="occurs_at",
-                ).model_dump(by_alias=True)
-            )
+        nodes.append(_event_node(event))
+        edges += _event_edges(event, entity_ids)
 
     if include_inferred:
         from storysphere.domain.inferred_relations import InferenceStatus  # noqa: PLC0415
@@ -162,6 +117,111 @@ async def get_book_graph(
     return GraphDataResponse(nodes=nodes, edges=edges).model_dump(by_alias=True)
 
 
+# ── #9c GET /books/:bookId/graph/delta ───────────────────────────────────────
+
+
+@router.get("/{book_id}/graph/delta", response_model=GraphDeltaResponse)
+async def get_book_graph_delta(
+    book_id: str,
+    doc: DocServiceDep,
+    kg: KGServiceDep,
+    mode: str,
+    from_position: int = Query(..., alias="from"),
+    to_position: int = Query(..., alias="to"),
+) -> dict:
+    """Changes to the #9 snapshot graph moving from one position to another.
+
+    Applying it to ``/graph?mode=…&position=<from>`` gives
+    ``/graph?mode=…&position=<to>``: drop the removed ids — and every edge
+    touching a removed node — then add the added nodes and edges.
+    Inferred edges are not covered.
+    """
+    if not await doc.document_exists(book_id):
+        raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
+    if mode not in ("chapter", "story"):
+        raise HTTPException(status_code=422, detail="mode must be 'chapter' or 'story'")
+
+    delta = await kg.get_snapshot_delta(book_id, mode, from_position, to_position)
+    events, entities, _ = await kg.get_snapshot(book_id, mode, to_position)
+    entity_ids = {e.id for e in entities}
+    new_ids = {e.id for e in delta.added_entities} | {ev.id for ev in delta.added_events}
+
+    nodes = [_entity_node(e) for e in delta.added_entities]
+    nodes += [_event_node(ev) for ev in delta.added_events]
+    edges = [_relation_edge(rel) for rel in delta.added_relations]
+    for event in events:
+        # Event edges appear with the event or with the entity they point at.
+        edges += [
+            edge
+            for edge in _event_edges(event, entity_ids)
+            if event.id in new_ids or edge["target"] in new_ids
+        ]
+    removed_nodes = [e.id for e in delta.removed_entities] + [
+        ev.id for ev in delta.removed_events
+    ]
+    return GraphDeltaResponse(
+        added_nodes=nodes,
+        added_edges=edges,
+        removed_node_ids=removed_nodes,
+        removed_edge_ids=[rel.id for rel in delta.removed_relations],
+    ).model_dump(by_alias=True)
+
+
+def _entity_node(entity: Any) -> dict:
+    return GraphNode(
+        id=entity.id,
+        name=entity.name,
+        type=entity.entity_type.value,
+        description=entity.description,
+        chunk_count=entity.mention_count,
+    ).model_dump(by_alias=True)
+
+
+def _event_node(event: Any) -> dict:
+    return GraphNode(
+        id=event.id,
+        name=event.title,
+        type="event",
+        description=event.description,
+        chunk_count=len(event.participants),
+        event_type=event.event_type.value,
+        chapter=event.chapter,
+    ).model_dump(by_alias=True)
+
+
+def _relation_edge(relation: Any) -> dict:
+    return GraphEdge(
+        id=relation.id,
+        source=relation.source_id,
+        target=relation.target_id,
+        label=relation.relation_type.value,
+    ).model_dump(by_alias=True)
+
+
+def _event_edges(event: Any, entity_ids: set[str]) -> list[dict]:
+    """Participation and location edges from *event* to the visible entities."""
+    edges = [
+        GraphEdge(
+            id=f"evt-{event.id}-{pid}",
+            source=event.id,
+            target=pid,
+            label="participates_in",
+        ).model_dump(by_alias=True)
+        for pid in event.participants
+        if pid in entity_ids
+    ]
+    if event.location_id and event.location_id in entity_ids:
+        edges.append(
+            GraphEdge(
+                id=f"evt-{event.id}-loc",
+                source=event.id,
+                target=event.location_id,
+                label="occurs_at",
+            ).model_dump(by_alias=True)
+        )
+    return edges
+
+
 # ── Link Prediction / Inferred Relations (F-01) ──────────────────────────────
 
 
@@ -174,8 +234,7 @@ async def run_link_inference(
     lp: LinkPredictionServiceDep,
 ) -> dict:
     """Run Common Neighbors + Adamic-Adar inference on the full book graph."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     from storysphere.config.settings import get_settings  # noqa: PLC0415
@@ -200,8 +259,7 @@ async def list_inferred_relations(
     status: str | None = None,
 ) -> dict:
     """List inferred relation candidates for a book."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     from storysphere.domain.inferred_relations import InferenceStatus  # noqa: PLC0415
@@ -232,8 +290,7 @@ async def confirm_inferred_relation(
     suggested_relation_type is promoted to its canonical RelationType via
     INFERRED_TO_CANONICAL (see domain.inferred_relations).
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     ir = await lp.get_inferred(ir_id)
@@ -269,8 +326,7 @@ async def reject_inferred_relation(
     lp: LinkPredictionServiceDep,
 ) -> None:
     """Reject (dismiss) an inferred relation candidate."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     ir = await lp.get_inferred(ir_id)
@@ -319,8 +375,7 @@ async def get_entity_epistemic_state(
     kg: KGServiceDep = None,
 ) -> dict:
     """Return what a character knows and doesn't know up to a given chapter."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     entity = await kg.get_entity(entity_id)
@@ -388,8 +443,7 @@ async def classify_book_visibility(
 
     Temporary endpoint — may be replaced once a full re-ingest pipeline is available.
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     task_id = str(uuid4())
@@ -47,7 +47,9 @@ async def list_chapters(
     back matter, not part of the reading flow — they're excluded here even
     though they remain stored (e.g. for a future cross-book lookup).
     """
-    document = await doc.get_document(book_id)
+    from storysphere.services.document_service import PROJECTION_NO_EMBEDDINGS  # noqa: PLC0415
+
+    document = await doc.get_document(book_id, projection=PROJECTION_NO_EMBEDDINGS)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
@@ -219,7 +221,9 @@ async def get_chapter_chunks(
     kg: KGServiceDep,
 ) -> list[dict]:
     """Get chunks (paragraphs) for a chapter with entity segments."""
-    document = await doc.get_document(book_id)
+    from storysphere.services.document_service import PROJECTION_NO_EMBEDDINGS  # noqa: PLC0415
+
+    document = await doc.get_document(book_id, projection=PROJECTION_NO_EMBEDDINGS)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
@@ -278,8 +282,7 @@ async def get_entity_chunks(
     kg: KGServiceDep,
 ) -> dict:
     """Get all chunks (paragraphs) where a specific entity appears."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     entity = await kg.get_entity(entity_id)
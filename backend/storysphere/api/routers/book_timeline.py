@@ -49,7 +49,7 @@ router = APIRouter(prefix="/books", tags=["books"])
 @router.get("/{book_id}/timeline-config", response_model=TimelineConfigResponse)
 async def get_timeline_config(book_id: str, doc: DocServiceDep) -> dict:
     """Get the timeline snapshot configuration for a book."""
-    document = await doc.get_document(book_id)
+    document = await doc.get_document_header(book_id)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
     if document.timeline_config is None:
@@ -71,15 +71,14 @@ async def update_timeline_config(
 
     from storysphere.domain.timeline import TimelineConfig  # noqa: PLC0415
 
-    document = await doc.get_document(book_id)
+    document = await doc.get_document_header(book_id)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     cfg = document.timeline_config or TimelineConfig()
     update = body.model_dump(exclude_none=True)
     updated = cfg.model_copy(update={**update, "configured_at": datetime.utcnow()})
-    document.timeline_config = updated
-    await doc.save_document(document)
+    await doc.update_timeline_config(book_id, updated)
     return updated.model_dump()
 
 
@@ -92,7 +91,7 @@ async def detect_timeline(
     """Re-run timeline structure detection for a book."""
     from storysphere.domain.timeline import TimelineConfig, TimelineDetectionResult  # noqa: PLC0415
 
-    document = await doc.get_document(book_id)
+    document = await doc.get_document_header(book_id)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
@@ -114,7 +113,7 @@ async def detect_timeline(
 
     # Update config, preserving any existing user choices
     existing = document.timeline_config
-    document.timeline_config = TimelineConfig(
+    timeline_config = TimelineConfig(
         chapter_mode_enabled=existing.chapter_mode_enabled if existing else False,
         story_mode_enabled=existing.story_mode_enabled if existing else False,
         default_mode=existing.default_mode if existing else "chapter",
@@ -127,7 +126,7 @@ async def detect_timeline(
         chapter_mode_configured=existing.chapter_mode_configured if existing else False,
         story_mode_configured=existing.story_mode_configured if existing else False,
     )
-    await doc.save_document(document)
+    await doc.update_timeline_config(book_id, timeline_config)
     return result.model_dump()
 
 
@@ -178,7 +177,7 @@ async def get_book_timeline(
         order: "narrative" (chapter order) or "chronological".
         event_type: optional filter by event type.
     """
-    document = await doc.get_document(book_id)
+    document = await doc.get_document_header(book_id)
     if document is None:
         raise HTTPException(
             status_code=404,
@@ -187,7 +186,7 @@ async def get_book_timeline(
 
     all_events = await kg.get_events(document_id=book_id)
 
-    # Build chapter_title lookup from already-fetched document (zero extra I/O)
+    # Build chapter_title lookup from already-fetched header (zero extra I/O)
     chapter_title_map: dict[int, str | None] = {
         ch.number: ch.title for ch in document.chapters
     }
@@ -366,8 +365,7 @@ async def compute_book_timeline(
 
     Requires EEP (event analysis) to have been run first for best results.
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     events = await kg.get_events(document_id=book_id)
@@ -150,7 +150,7 @@ async def list_books(doc: DocServiceDep, kg: KGServiceDep) -> list[dict]:
 @router.get("/{book_id}", response_model=BookDetailResponse)
 async def get_book(book_id: str, doc: DocServiceDep, kg: KGServiceDep) -> dict:
     """Get book detail."""
-    document = await doc.get_document(book_id)
+    document = await doc.get_document_header(book_id)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
@@ -207,8 +207,7 @@ async def delete_book(
     transaction across them, so the order matters where one store's keys are
     read from another (see the TEU note below).
     """
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     # Finalise any associated ingestion task first, so the pipeline can't keep
@@ -302,8 +301,7 @@ async def rerun_pipeline_step(
             status_code=422,
             detail=f"Unknown step '{step}'. Valid steps: {sorted(_RERUN_STEPS)}",
         )
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     task_id = str(uuid4())
@@ -323,8 +321,7 @@ async def trigger_book_analysis(
     agent: AnalysisAgentDep,
 ) -> dict:
     """Trigger full-book analysis for all entities."""
-    document = await doc.get_document(book_id)
-    if document is None:
+    if not await doc.document_exists(book_id):
         raise HTTPException(status_code=404, detail=f"Book '{book_id}' not found")
 
     task_id = str(uuid4())
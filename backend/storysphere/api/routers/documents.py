@@ -25,7 +25,9 @@ async def list_documents(doc: DocServiceDep) -> list[DocumentSummary]:
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(document_id: str, doc: DocServiceDep) -> DocumentResponse:
     """Return full document details including chapter list."""
-    document = await doc.get_document(document_id)
+    from storysphere.services.document_service import PROJECTION_NO_EMBEDDINGS  # noqa: PLC0415
+
+    document = await doc.get_document(document_id, projection=PROJECTION_NO_EMBEDDINGS)
     if document is None:
         raise HTTPException(status_code=404, detail=f"Document '{document_id}' not found")
 
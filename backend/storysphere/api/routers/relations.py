@@ -25,8 +25,9 @@ async def get_relation_paths(
     source_id: str = Query(description="Source entity ID"),
     target_id: str = Query(description="Target entity ID"),
     max_length: int = Query(default=3, ge=1, le=6),
+    max_paths: int | None = Query(default=None, ge=1, le=100, description="Most paths returned"),
 ) -> RelationPathsResponse:
-    """Find all simple paths between two entities in the knowledge graph."""
+    """Find the cheapest simple paths between two entities in the knowledge graph."""
     source = await kg.get_entity(source_id)
     if source is None:
         raise HTTPException(status_code=404, detail=f"Entity '{source_id}' not found")
@@ -38,6 +39,7 @@ async def get_relation_paths(
         source_id=source_id,
         target_id=target_id,
         max_length=max_length,
+        max_paths=max_paths,
     )
     return RelationPathsResponse(
         source_id=source_id,
@@ -50,6 +52,7 @@ async def get_relation_paths(
 async def get_relation_stats(
     kg: KGServiceDep,
     entity_id: str | None = Query(default=None, description="Scope to a specific entity (optional)"),
+    document_id: str | None = Query(default=None, description="Scope to one book (optional)"),
 ) -> RelationStatsResponse:
     """Return relation-type distribution and weight statistics."""
     if entity_id is not None:
@@ -57,5 +60,5 @@ async def get_relation_stats(
         if entity is None:
             raise HTTPException(status_code=404, detail=f"Entity '{entity_id}' not found")
 
-    stats = await kg.get_relation_stats(entity_id=entity_id)
+    stats = await kg.get_relation_stats(entity_id=entity_id, document_id=document_id)
     return RelationStatsResponse(stats=stats.model_dump())
@@ -1,4 +1,4 @@
-"""Semantic and full-text search endpoint."""
+"""Semantic, full-text and hybrid search endpoint."""
 
 from __future__ import annotations
 
@@ -8,7 +8,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
 
-from storysphere.api.deps import DocServiceDep, VectorServiceDep
+from storysphere.api.deps import DocServiceDep, HybridSearchDep, VectorServiceDep
 
 router = APIRouter(prefix="/search", tags=["search"])
 
@@ -19,7 +19,7 @@ class SearchRequest(BaseModel):
     book_id: str | None = None
     query: str
     top_k: int = Field(default=10, ge=1, le=50)
-    mode: Literal["semantic", "fulltext"] = "fulltext"
+    mode: Literal["semantic", "fulltext", "hybrid"] = "fulltext"
 
 
 class SearchResultMetadata(BaseModel):
@@ -36,6 +36,8 @@ class SearchResult(BaseModel):
     id: str
     text: str
     score: float
+    #: Excerpt with matches wrapped in ``<mark>``; full-text and hybrid modes only.
+    snippet: str | None = None
     metadata: SearchResultMetadata
 
 
@@ -43,9 +45,16 @@ class SearchResult(BaseModel):
 async def search(
     vector: VectorServiceDep,
     doc: DocServiceDep,
+    hybrid: HybridSearchDep,
     body: SearchRequest,
 ) -> list[SearchResult]:
-    if body.mode == "fulltext":
+    if body.mode == "hybrid":
+        results = await hybrid.search(
+            query=body.query,
+            top_k=body.top_k,
+            document_id=body.book_id,
+        )
+    elif body.mode == "fulltext":
         results = await doc.search_paragraphs_by_text(
             query=body.query,
             document_id=body.book_id,
@@ -63,6 +72,7 @@ async def search(
             id=r.id,
             text=r.text,
             score=r.score,
+            snippet=r.snippet,
             metadata=SearchResultMetadata(
                 document_id=r.document_id,
                 chapter_number=r.chapter_number,
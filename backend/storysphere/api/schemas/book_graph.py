@@ -55,6 +55,15 @@ class GraphDataResponse(BaseModel):
     edges: list[GraphEdge] = []
 
 
+class GraphDeltaResponse(BaseModel):
+    model_config = _CAMEL
+
+    added_nodes: list[GraphNode] = []
+    added_edges: list[GraphEdge] = []
+    removed_node_ids: list[str] = []
+    removed_edge_ids: list[str] = []
+
+
 class MisbeliefItemSchema(BaseModel):
     model_config = _CAMEL
 
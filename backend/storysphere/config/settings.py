@@ -68,6 +68,14 @@ class Settings(BaseSettings):
 
     # ── Database ───────────────────────────────────────────────────────────────
     database_url: str = "sqlite+aiosqlite:///./var/storysphere.db"
+    document_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description=(
+            "Estimated memory budget of the process-wide cache of hydrated "
+            "documents and headers (DocumentService). 0 disables it."
+        ),
+    )
 
     # ── Deployment Mode ────────────────────────────────────────────────────────
     deploy_mode: Literal["lightweight", "standard"] = "lightweight"
@@ -77,6 +85,40 @@ class Settings(BaseSettings):
     qdrant_api_key: str = ""
     qdrant_collection_prefix: str = "storysphere_book"
     qdrant_local_path: str = "./var/qdrant_local"
+    qdrant_quantization: Literal["none", "scalar", "binary"] = Field(
+        default="none",
+        description=(
+            "Quantize vectors of newly created collections: scalar = int8 "
+            "(4x smaller), binary = 1 bit per dimension (32x smaller, coarser). "
+            "Searches rescore candidates with the original vectors. Needs "
+            "Qdrant server; local mode always searches exact float32."
+        ),
+    )
+    qdrant_quantization_oversampling: float = Field(
+        default=2.0,
+        ge=1.0,
+        description=(
+            "Quantized search fetches top_k × this many candidates before "
+            "rescoring; raise it (binary: 3–4) if recall drops."
+        ),
+    )
+    qdrant_on_disk_vectors: bool = Field(
+        default=False,
+        description=(
+            "Keep the original float32 vectors of newly created collections on "
+            "disk (memory-mapped). With quantization only the quantized copy "
+            "stays in RAM and the originals are read for rescoring."
+        ),
+    )
+    qdrant_shared_collection: str = Field(
+        default="",
+        description=(
+            "Keep every book's paragraphs in this one collection, filtered by "
+            "the indexed document_id payload, instead of one collection per "
+            "book. Empty = per-book collections. Move existing books over with "
+            "services.vector_migration."
+        ),
+    )
 
     # ── Ingestion ──────────────────────────────────────────────────────────────
     ingestion_concurrency: int = Field(
@@ -88,10 +130,68 @@ class Settings(BaseSettings):
             "the provider's rate limit allows — a 429 aborts the whole step."
         ),
     )
+    ingestion_stream_chapters: bool = Field(
+        default=False,
+        description=(
+            "Phase 2 loads only the chapter headers and streams each chapter's "
+            "paragraphs from SQLite as the pipelines reach it, so peak memory "
+            "follows the largest chapter instead of the whole book."
+        ),
+    )
 
     # ── Knowledge Graph ────────────────────────────────────────────────────────
     kg_mode: Literal["networkx", "neo4j"] = "networkx"
     kg_persistence_path: str = "./var/knowledge_graph.json"
+    kg_snapshot_format: Literal["binary", "json"] = Field(
+        default="binary",
+        description=(
+            "Encoding of the per-book KG shard files: compact columnar 'binary' "
+            "snapshots, or readable 'json'. Either loads regardless of the setting."
+        ),
+    )
+    kg_lazy_load: bool = Field(
+        default=True,
+        description=(
+            "Startup reads only the KG manifest and shard headers; each book's "
+            "subgraph is loaded on first access. JSON shards always load eagerly."
+        ),
+    )
+    kg_max_resident_books: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "With kg_lazy_load, the number of books kept in memory before the "
+            "least recently used saved, unchanged ones are unloaded. 0 = no limit."
+        ),
+    )
+    kg_wal_enabled: bool = Field(
+        default=True,
+        description=(
+            "Append every KG mutation to a log in the shard directory, replayed "
+            "on load, so changes made since the last save survive a crash."
+        ),
+    )
+    kg_wal_compact_records: int = Field(
+        default=10_000,
+        ge=0,
+        description=(
+            "Save (and so empty the KG mutation log) once it holds this many "
+            "records. 0 = only when save() is called."
+        ),
+    )
+    kg_path_max_results: int = Field(
+        default=20,
+        ge=1,
+        description="Paths get_relation_paths returns when the caller does not say, cheapest first.",
+    )
+    kg_path_time_budget_ms: int = Field(
+        default=500,
+        ge=0,
+        description=(
+            "Time after which get_relation_paths stops searching and returns the "
+            "cheapest paths found so far. 0 = no limit."
+        ),
+    )
     kg_auto_switch_threshold: int = Field(
         default=10_000, description="Entity count above which Neo4j is recommended"
     )
@@ -113,6 +213,14 @@ class Settings(BaseSettings):
         description="Device for embedding inference: cpu | cuda | mps",
     )
     embedding_batch_size: int = Field(default=32, description="Batch size for embedding generation")
+    embedding_query_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Search query embeddings VectorService keeps, least recently used "
+            "dropped first. 0 = embed every query."
+        ),
+    )
     qdrant_vector_size: int = Field(
         default=384,
         description="Vector dimension — must match embedding model output",
@@ -122,6 +230,24 @@ class Settings(BaseSettings):
         description="sentence-transformers model for imagery term clustering (supports 50+ languages)",
     )
 
+    # ── Hybrid Search ──────────────────────────────────────────────────────────
+    hybrid_search_candidates: int = Field(
+        default=50,
+        ge=1,
+        description=(
+            "Results each leg of hybrid search (BM25 full-text, dense vectors) "
+            "contributes before fusion; at least top_k."
+        ),
+    )
+    hybrid_search_rrf_k: int = Field(
+        default=60,
+        ge=1,
+        description=(
+            "Reciprocal-rank-fusion constant: a result at rank r of a leg scores "
+            "1 / (k + r). Larger values flatten the advantage of the top ranks."
+        ),
+    )
+
     # ── Summarization ─────────────────────────────────────────────────────────
     summary_max_chapter_chars: int = Field(
         default=8000, description="Max chapter chars sent to LLM for summarization"
@@ -0,0 +1,99 @@
+"""ChapterStream — feed phase-2 pipelines one chapter at a time from SQLite.
+
+A pipeline normally receives a whole ``Document`` with every paragraph of the
+book in memory.  Given a ``ChapterStream`` instead, it receives a header-only
+Document (chapters without paragraphs, from ``PROJECTION_HEADERS``) and pulls
+each chapter's paragraphs through ``chapters_of`` as it reaches them.
+
+Chapter-level output (``Chapter.summary``, ``Chapter.keywords``) lands on the
+header Document's own Chapter objects, so callers save it the usual way.
+Paragraph-level output (entities, embeddings) would be dropped with the
+paragraphs, so the pipeline names those fields in ``persist=`` and the stream
+writes them before letting the chapter go.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Iterable
+
+from storysphere.domain.documents import Chapter, Document
+
+logger = logging.getLogger(__name__)
+
+
+class ChapterStream:
+    """Re-iterable, chapter-at-a-time view of a stored book.
+
+    Usage::
+
+        doc = await doc_service.get_document(doc_id, projection=PROJECTION_HEADERS)
+        stream = ChapterStream(doc_service, doc)
+        await pipeline.run(doc, chapters=stream)
+
+    Every ``chapters()`` call is a fresh pass over the book, so multi-pass
+    pipelines (entities, then paragraph linking) simply iterate twice.
+    """
+
+    def __init__(self, document_service, document: Document, projection=None) -> None:
+        if projection is None:
+            from storysphere.services.document_service import (  # noqa: PLC0415
+                PROJECTION_NO_EMBEDDINGS,
+            )
+
+            projection = PROJECTION_NO_EMBEDDINGS
+        self._document_service = document_service
+        self._document = document
+        self._projection = projection
+
+    async def chapters(self, *, persist: Iterable[str] = ()) -> AsyncIterator[Chapter]:
+        """Yield the header Document's chapters with their paragraphs loaded.
+
+        A chapter's paragraphs are released when the consumer asks for the
+        next chapter, after the *persist* fields (``save_chapter_fields``
+        names) have been written.
+
+        Chapters that appear in the database but not in the header Document
+        (restructured since it was read) are skipped.
+        """
+        persist = frozenset(persist)
+        headers = {ch.id: ch for ch in self._document.chapters}
+        async for loaded in self._document_service.iter_chapters(
+            self._document.id, projection=self._projection
+        ):
+            chapter = headers.get(loaded.id)
+            if chapter is None:
+                logger.warning(
+                    "ChapterStream: chapter %s of %s not in the header document — skipped",
+                    loaded.number,
+                    self._document.id,
+                )
+                continue
+            chapter.paragraphs = loaded.paragraphs
+            try:
+                yield chapter
+                if persist:
+                    await self._document_service.save_chapter_fields(chapter, persist)
+            finally:
+                chapter.paragraphs = []
+
+
+async def _in_memory(chapters: list[Chapter]) -> AsyncIterator[Chapter]:
+    for chapter in chapters:
+        yield chapter
+
+
+def chapters_of(
+    document: Document,
+    stream: ChapterStream | None,
+    *,
+    persist: Iterable[str] = (),
+) -> AsyncIterator[Chapter]:
+    """The chapters a pipeline should walk: streamed if *stream* is given.
+
+    Without a stream this walks ``document.chapters`` as-is and *persist* is
+    ignored — the caller saves the whole Document afterwards, as before.
+    """
+    if stream is not None:
+        return stream.chapters(persist=persist)
+    return _in_memory(document.chapters)
@@ -11,7 +11,11 @@ With Qdrant enabled (production path):
 
 Without Qdrant (dev / test path):
     embed chapter → store on Paragraph.embedding
-    DocumentService will persist the embeddings to SQLite.
+    DocumentService will persist the embeddings to SQLite as packed float32
+    blobs.
+
+Given a ``ChapterStream`` the paragraphs themselves are read from SQLite one
+chapter at a time too, so the book's text is never all in memory either.
 
 Peak memory for a 1 000-page novel:
     ≈ model (90 MB) + one chapter's vectors (~0.5 MB) instead of the full
@@ -26,6 +30,7 @@ from dataclasses import dataclass, field
 from storysphere.core.error_handling import is_rate_limit_error
 from storysphere.domain.documents import ChapterRole, Document, Paragraph, extract_body_text
 from storysphere.pipelines.base import BasePipeline
+from storysphere.pipelines.chapter_stream import ChapterStream, chapters_of
 
 from .embedding_generator import EmbeddingGenerator
 
@@ -63,11 +68,22 @@ class FeatureExtractionPipeline(BasePipeline[Document, FeatureExtractionResult])
         self._keyword_extractor = keyword_extractor  # BaseKeywordExtractor | None
         self._keyword_aggregator = keyword_aggregator  # KeywordAggregator | None
 
-    async def run(self, input_data: Document, *, sub_cb=None, murmur_cb=None) -> FeatureExtractionResult:
+    async def run(
+        self,
+        input_data: Document,
+        *,
+        chapters: ChapterStream | None = None,
+        sub_cb=None,
+        murmur_cb=None,
+    ) -> FeatureExtractionResult:
         """Embed paragraphs chapter by chapter and (optionally) store in Qdrant.
 
         Args:
-            input_data: A ``Document`` populated by ``DocumentProcessingPipeline``.
+            input_data: A ``Document`` populated by ``DocumentProcessingPipeline``,
+                or a header-only Document when *chapters* is given.
+            chapters: Stream paragraphs from SQLite one chapter at a time
+                instead of reading them off *input_data*.  In the no-Qdrant
+                path each chapter's embeddings are written as it completes.
 
         Returns:
             ``FeatureExtractionResult`` with counts and Qdrant IDs.
@@ -77,16 +93,20 @@ class FeatureExtractionPipeline(BasePipeline[Document, FeatureExtractionResult])
         total_keywords = 0
         all_qdrant_ids: list[str] = []
         all_chapter_keywords: list[dict[str, float]] = []
+        # A streamed header Document has no paragraphs yet, so count by role.
         chapters_with_content = [
-            ch for ch in doc.chapters if ch.paragraphs and ch.role == ChapterRole.body
+            ch for ch in doc.chapters
+            if ch.role == ChapterRole.body and (chapters is not None or ch.paragraphs)
         ]
         total_chapters = len(chapters_with_content)
         chapters_done = 0
+        to_qdrant = self._vector_service is not None or self._qdrant is not None
+        persist = () if to_qdrant else ("paragraphs.embedding",)
 
         if sub_cb:
             sub_cb(0, total_chapters, "章節特徵")
 
-        for chapter in doc.chapters:
+        async for chapter in chapters_of(doc, chapters, persist=persist):
             paragraphs = chapter.paragraphs
             if not paragraphs:
                 continue
@@ -157,7 +177,7 @@ class FeatureExtractionPipeline(BasePipeline[Document, FeatureExtractionResult])
                         )
                         all_chapter_keywords.append(chapter.keywords)
 
-            if self._vector_service is not None or self._qdrant is not None:
+            if to_qdrant:
                 # Qdrant path: write immediately, do NOT keep embedding in memory.
                 # vectors will be GC-able once this iteration ends.
                 ids = await self._upsert_to_qdrant(doc, body_paras, vectors)
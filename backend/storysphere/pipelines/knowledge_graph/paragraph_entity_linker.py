@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 import re
 
-from storysphere.domain.documents import Document, ParagraphEntity, ParagraphRole
+from storysphere.domain.documents import Chapter, Document, ParagraphEntity, ParagraphRole
 from storysphere.domain.entities import Entity
 
 logger = logging.getLogger(__name__)
@@ -27,9 +27,31 @@ class ParagraphEntityLinker:
             document: Fully parsed document with chapters and paragraphs.
             entities: Deduplicated entity list (post entity-linker).
         """
-        if not entities:
+        matcher = self.prepare(entities)
+        if matcher is None:
             return
 
+        total_linked = 0
+        for chapter in document.chapters:
+            total_linked += self.link_chapter(chapter, matcher)
+
+        logger.info(
+            "ParagraphEntityLinker: linked %d mentions across %d paragraphs",
+            total_linked,
+            document.total_paragraphs,
+        )
+
+    def prepare(
+        self, entities: list[Entity]
+    ) -> tuple[re.Pattern, dict[str, Entity]] | None:
+        """Compile the matcher for *entities*; ``None`` when there is nothing to link.
+
+        Split out of ``link`` so a chapter-at-a-time caller compiles the regex
+        once for the book and then calls ``link_chapter`` per chapter.
+        """
+        if not entities:
+            return None
+
         # Build name→entity lookup (longest match first)
         name_map: dict[str, Entity] = {}  # lowercase surface → Entity
         for ent in entities:
@@ -42,36 +64,37 @@ class ParagraphEntityLinker:
                     name_map[a_lower] = ent
 
         if not name_map:
-            return
+            return None
 
         # Compile regex once for all paragraphs
         pattern = self._compile_pattern(sorted(name_map.keys(), key=len, reverse=True))
+        return pattern, name_map
 
-        total_linked = 0
-        for chapter in document.chapters:
-            for para in chapter.paragraphs:
-                if para.role != ParagraphRole.body:
-                    continue
-                para_entities: list[ParagraphEntity] = []
-                for m in pattern.finditer(para.text):
-                    ent = name_map[m.group(0).lower()]
-                    para_entities.append(
-                        ParagraphEntity(
-                            entity_id=ent.id,
-                            entity_name=ent.name,
-                            entity_type=ent.entity_type.value,
-                            start=m.start(),
-                            end=m.end(),
-                        )
+    @staticmethod
+    def link_chapter(
+        chapter: Chapter, matcher: tuple[re.Pattern, dict[str, Entity]]
+    ) -> int:
+        """Populate ``paragraph.entities`` for one chapter; returns the mention count."""
+        pattern, name_map = matcher
+        linked = 0
+        for para in chapter.paragraphs:
+            if para.role != ParagraphRole.body:
+                continue
+            para_entities: list[ParagraphEntity] = []
+            for m in pattern.finditer(para.text):
+                ent = name_map[m.group(0).lower()]
+                para_entities.append(
+                    ParagraphEntity(
+                        entity_id=ent.id,
+                        entity_name=ent.name,
+                        entity_type=ent.entity_type.value,
+                        start=m.start(),
+                        end=m.end(),
                     )
-                para.entities = para_entities if para_entities else None
-                total_linked += len(para_entities)
-
-        logger.info(
-            "ParagraphEntityLinker: linked %d mentions across %d paragraphs",
-            total_linked,
-            document.total_paragraphs,
-        )
+                )
+            para.entities = para_entities if para_entities else None
+            linked += len(para_entities)
+        return linked
 
     @staticmethod
     def _compile_pattern(sorted_names: list[str]) -> re.Pattern:
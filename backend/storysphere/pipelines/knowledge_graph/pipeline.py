@@ -13,6 +13,7 @@ from storysphere.domain.entities import Entity
 from storysphere.domain.events import Event, EventType
 from storysphere.domain.relations import Relation
 from storysphere.pipelines.base import BasePipeline
+from storysphere.pipelines.chapter_stream import ChapterStream, chapters_of
 
 from .entity_extractor import EntityExtractor
 from .entity_linker import EntityLinker
@@ -88,11 +89,22 @@ class KnowledgeGraphPipeline(BasePipeline[Document, KGExtractionResult]):
 
         return get_settings().ingestion_concurrency
 
-    async def run(self, input_data: Document, *, sub_cb=None, murmur_cb=None) -> KGExtractionResult:
+    async def run(
+        self,
+        input_data: Document,
+        *,
+        chapters: ChapterStream | None = None,
+        sub_cb=None,
+        murmur_cb=None,
+    ) -> KGExtractionResult:
         """Extract KG data from all chapters in the document.
 
         Args:
-            input_data: Fully processed ``Document`` (with paragraphs).
+            input_data: Fully processed ``Document`` (with paragraphs), or a
+                header-only Document when *chapters* is given.
+            chapters: Optional ``ChapterStream`` over the stored book. The
+                entity pass and the paragraph-linking pass then each stream
+                the book once, and paragraph entities are saved per chapter.
 
         Returns:
             ``KGExtractionResult`` with all extracted entities, relations, events.
@@ -105,10 +117,11 @@ class KnowledgeGraphPipeline(BasePipeline[Document, KGExtractionResult]):
         chapter_texts: dict[int, str] = {}
         # Only body chapters carry narrative content; front/back matter chapters
         # (toc/preface/afterword/other) are excluded from the knowledge graph.
+        # A streamed header Document has no paragraphs yet, so count by role.
         chapters_with_content = [
             ch for ch in doc.chapters
             if ch.role == ChapterRole.body
-            and any(extract_body_text(p) for p in ch.paragraphs)
+            and (chapters is not None or any(extract_body_text(p) for p in ch.paragraphs))
         ]
         total_chapters = len(chapters_with_content)
         chapters_done = 0
@@ -119,7 +132,7 @@ class KnowledgeGraphPipeline(BasePipeline[Document, KGExtractionResult]):
         # ── Step 1: extract entities per paragraph ──────────────────────────
         # Paragraph-level extraction keeps each LLM call small, avoiding
         # truncation issues on long chapters with local models.
-        for chapter in doc.chapters:
+        async for chapter in chapters_of(doc, chapters):
             if chapter.role != ChapterRole.body:
                 continue  # front/back matter — not story content
             # Only process body paragraphs; separators carry no narrative content.
@@ -243,9 +256,18 @@ class KnowledgeGraphPipeline(BasePipeline[Document, KGExtractionResult]):
         # the executor for the same reason as the entity linker above, so a
         # long book cannot stall the event loop (and with it progress reporting).
         self._log_step("paragraph_entity_link")
-        await asyncio.get_running_loop().run_in_executor(
-            None, self._paragraph_entity_linker.link, doc, unique_entities
-        )
+        loop = asyncio.get_running_loop()
+        if chapters is None:
+            await loop.run_in_executor(
+                None, self._paragraph_entity_linker.link, doc, unique_entities
+            )
+        else:
+            matcher = self._paragraph_entity_linker.prepare(unique_entities)
+            if matcher is not None:
+                async for chapter in chapters.chapters(persist=("paragraphs.entities",)):
+                    await loop.run_in_executor(
+                        None, self._paragraph_entity_linker.link_chapter, chapter, matcher
+                    )
 
         self._fill_relation_valid_to(all_relations)
         self._fill_entity_valid_to(unique_entities, all_events)
@@ -290,18 +312,13 @@ class KnowledgeGraphPipeline(BasePipeline[Document, KGExtractionResult]):
                 "KGPipeline cleared prior graph for %s: %s", document_id, removed
             )
 
-        for entity in result.entities:
-            if document_id:
-                entity.document_id = document_id
-            await self._kg_service.add_entity(entity)
-        for relation in result.relations:
-            if document_id:
-                relation.document_id = document_id
-            await self._kg_service.add_relation(relation)
-        for event in result.events:
-            if document_id:
-                event.document_id = document_id
-            await self._kg_service.add_event(event)
+        if document_id:
+            for record in (*result.entities, *result.relations, *result.events):
+                record.document_id = document_id
+        # Batched: one pass each on NetworkX, a few UNWIND round trips on Neo4j.
+        await self._kg_service.add_entities(result.entities)
+        await self._kg_service.add_relations(result.relations)
+        await self._kg_service.add_events(result.events)
         logger.info("KGPipeline persisted to KGService")
 
     # ── Timeline post-processing ─────────────────────────────────────────────
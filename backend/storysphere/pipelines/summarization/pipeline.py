@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from storysphere.core.error_handling import is_rate_limit_error
 from storysphere.domain.documents import ChapterRole, Document
 from storysphere.pipelines.base import BasePipeline
+from storysphere.pipelines.chapter_stream import ChapterStream, chapters_of
 
 from .summarizer import ChapterSummarizer
 
@@ -39,20 +40,33 @@ class SummarizationPipeline(BasePipeline[Document, SummarizationResult]):
     def __init__(self, summarizer: ChapterSummarizer | None = None) -> None:
         self._summarizer = summarizer or ChapterSummarizer()
 
-    async def run(self, input_data: Document, *, sub_cb=None, murmur_cb=None) -> SummarizationResult:
+    async def run(
+        self,
+        input_data: Document,
+        *,
+        chapters: ChapterStream | None = None,
+        sub_cb=None,
+        murmur_cb=None,
+    ) -> SummarizationResult:
+        """Summarize chapters, then the book.
+
+        With *chapters*, *input_data* is a header-only Document and chapter
+        text is streamed from SQLite; summaries land on its chapters as usual.
+        """
         doc = input_data
         # Only body chapters are summarized; front/back matter (toc/preface/
-        # afterword/other) is not story content.
+        # afterword/other) is not story content.  A streamed header Document
+        # has no paragraphs yet, so count by role.
         total = sum(
             1 for ch in doc.chapters
-            if ch.paragraphs and ch.role == ChapterRole.body
+            if ch.role == ChapterRole.body and (chapters is not None or ch.paragraphs)
         )
 
         if sub_cb:
             sub_cb(0, total, "章節摘要")
 
         chapters_summarized = await self._summarize_chapters(
-            doc, total=total, sub_cb=sub_cb, murmur_cb=murmur_cb
+            doc, chapters, total=total, sub_cb=sub_cb, murmur_cb=murmur_cb
         )
 
         chapter_summaries = [
@@ -87,7 +101,13 @@ class SummarizationPipeline(BasePipeline[Document, SummarizationResult]):
         )
 
     async def _summarize_chapters(
-        self, doc: Document, *, total: int, sub_cb=None, murmur_cb=None
+        self,
+        doc: Document,
+        stream: ChapterStream | None,
+        *,
+        total: int,
+        sub_cb=None,
+        murmur_cb=None,
     ) -> int:
         """Summarize each chapter individually; failed chapters are skipped.
 
@@ -95,7 +115,7 @@ class SummarizationPipeline(BasePipeline[Document, SummarizationResult]):
         counted as done and skipped, enabling resume after a rate-limit abort.
         """
         chapters_summarized = 0
-        for chapter in doc.chapters:
+        async for chapter in chapters_of(doc, stream):
             if not chapter.paragraphs:
                 logger.debug("Skipping chapter %d — no paragraphs", chapter.number)
                 continue
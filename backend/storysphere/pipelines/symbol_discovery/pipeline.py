@@ -10,11 +10,13 @@ Follows KnowledgeGraphPipeline conventions:
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
 
 from storysphere.core.utils.text_matching import squash_spacing
 from storysphere.domain.documents import Document
 from storysphere.pipelines.base import BasePipeline
+from storysphere.pipelines.chapter_stream import ChapterStream, chapters_of
 
 logger = logging.getLogger(__name__)
 
@@ -48,11 +50,21 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         self._extractor = imagery_extractor or ImageryExtractor()
         self._symbol_service = symbol_service or SymbolService()
 
-    async def run(self, input_data: Document, *, sub_cb=None, murmur_cb=None) -> SymbolDiscoveryResult:
+    async def run(
+        self,
+        input_data: Document,
+        *,
+        chapters: ChapterStream | None = None,
+        sub_cb=None,
+        murmur_cb=None,
+    ) -> SymbolDiscoveryResult:
         """Run imagery extraction and persist results for a document.
 
         Args:
-            input_data: Fully processed Document with chapters and paragraphs.
+            input_data: Fully processed Document with chapters and paragraphs,
+                or a header-only Document when *chapters* is given.
+            chapters: Optional ``ChapterStream``; extraction and anchoring then
+                each stream the book once instead of holding it in memory.
 
         Returns:
             SymbolDiscoveryResult with counts of extracted entities/occurrences.
@@ -65,7 +77,9 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
 
         # Extract imagery from all chapters sequentially
         try:
-            raw_extractions = await self._extract_all_chapters(doc, sub_cb=sub_cb)
+            raw_extractions = await self._extract_all_chapters(
+                doc, chapters, sub_cb=sub_cb
+            )
         except Exception as exc:  # noqa: BLE001
             logger.error("Imagery extraction failed for book %s: %s", doc.id, exc)
             result.errors.append(f"extraction: {exc}")
@@ -78,7 +92,7 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         # Cluster and persist
         try:
             imagery_count, occurrence_count = await self._build_and_persist(
-                doc, raw_extractions, murmur_cb=murmur_cb
+                doc, raw_extractions, chapters, murmur_cb=murmur_cb
             )
             result.imagery_count = imagery_count
             result.occurrence_count = occurrence_count
@@ -94,7 +108,9 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         )
         return result
 
-    async def _extract_all_chapters(self, doc: Document, sub_cb=None) -> list[dict]:
+    async def _extract_all_chapters(
+        self, doc: Document, stream: ChapterStream | None = None, sub_cb=None
+    ) -> list[dict]:
         """Extract imagery from every chapter sequentially."""
         all_raw: list[dict] = []
         total = len(doc.chapters)
@@ -102,7 +118,8 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         if sub_cb:
             sub_cb(0, total, "章節符號")
 
-        for i, chapter in enumerate(doc.chapters):
+        i = 0
+        async for chapter in chapters_of(doc, stream):
             chapter_text = "\n".join(p.text for p in chapter.paragraphs)
             self._log_step("extract_chapter", chapter=chapter.number)
             chapter_items = await self._extractor.extract_chapter_imagery(
@@ -110,8 +127,9 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
                 chapter_number=chapter.number,
                 language=doc.language,
             )
+            i += 1
             if sub_cb:
-                sub_cb(i + 1, total, "章節符號")
+                sub_cb(i, total, "章節符號")
             # Paragraph anchoring is deliberately *not* done here — it needs the
             # synonym clusters, which only exist after every chapter is in.
             for item in chapter_items:
@@ -122,12 +140,20 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         return all_raw
 
     async def _build_and_persist(
-        self, doc: Document, raw_extractions: list[dict], *, murmur_cb=None
+        self,
+        doc: Document,
+        raw_extractions: list[dict],
+        stream: ChapterStream | None = None,
+        *,
+        murmur_cb=None,
     ) -> tuple[int, int]:
         """Cluster synonyms, build domain objects, and write to SQLite."""
         terms = [ex.get("term", "") for ex in raw_extractions if ex.get("term")]
         clusters = await self._extractor.cluster_synonyms(terms)
-        anchored = self._anchor_extractions(doc, raw_extractions, clusters)
+        if stream is None:
+            anchored = self._anchor_extractions(doc, raw_extractions, clusters)
+        else:
+            anchored = await self._anchor_streamed(stream, raw_extractions, clusters)
         entities, occurrences = await self._extractor.build_imagery_entities(
             raw_extractions=anchored,
             book_id=doc.id,
@@ -171,24 +197,65 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
         else entirely (B-079).
         """
         chapters = {c.number: c for c in doc.chapters}
+        forms_by_term = self._forms_by_term(clusters)
+
+        anchored: list[dict] = []
+        for ex in raw_extractions:
+            chapter = chapters.get(ex.get("chapter_number", 0))
+            if chapter is None:
+                self._warn_missing_chapter(ex)
+                continue
+            anchored.extend(self._anchor_in_chapter(chapter, [ex], forms_by_term))
+
+        return anchored
+
+    async def _anchor_streamed(
+        self, stream: ChapterStream, raw_extractions: list[dict], clusters: list
+    ) -> list[dict]:
+        """``_anchor_extractions`` over a ``ChapterStream``, one chapter in memory.
+
+        Extractions are grouped by chapter so the book is streamed once;
+        extraction order is chapter order already, so the result order matches.
+        """
+        forms_by_term = self._forms_by_term(clusters)
+        by_chapter: dict[int, list[dict]] = defaultdict(list)
+        for ex in raw_extractions:
+            by_chapter[ex.get("chapter_number", 0)].append(ex)
 
+        anchored: list[dict] = []
+        async for chapter in stream.chapters():
+            extractions = by_chapter.pop(chapter.number, None)
+            if extractions:
+                anchored.extend(
+                    self._anchor_in_chapter(chapter, extractions, forms_by_term)
+                )
+        for extractions in by_chapter.values():
+            for ex in extractions:
+                self._warn_missing_chapter(ex)
+        return anchored
+
+    @staticmethod
+    def _forms_by_term(clusters: list) -> dict[str, list[str]]:
         forms_by_term: dict[str, list[str]] = {}
         for cluster in clusters:
             forms = [cluster.canonical_term, *cluster.variants]
             for form in forms:
                 forms_by_term[form] = forms
+        return forms_by_term
 
+    @staticmethod
+    def _warn_missing_chapter(ex: dict) -> None:
+        logger.warning(
+            "Imagery %r names chapter %s, which this book does not have",
+            ex.get("term", ""), ex.get("chapter_number"),
+        )
+
+    def _anchor_in_chapter(
+        self, chapter, extractions: list[dict], forms_by_term: dict[str, list[str]]
+    ) -> list[dict]:
         anchored: list[dict] = []
-        for ex in raw_extractions:
+        for ex in extractions:
             term = ex.get("term", "")
-            chapter = chapters.get(ex.get("chapter_number", 0))
-            if chapter is None:
-                logger.warning(
-                    "Imagery %r names chapter %s, which this book does not have",
-                    term, ex.get("chapter_number"),
-                )
-                continue
-
             aliases = [f for f in forms_by_term.get(term, []) if f != term]
             hit = self._find_anchor(
                 chapter, term, aliases, ex.get("context_sentence", "")
@@ -203,7 +270,6 @@ class SymbolDiscoveryPipeline(BasePipeline[Document, SymbolDiscoveryResult]):
 
             ex["paragraph_id"], ex["position"] = hit
             anchored.append(ex)
-
         return anchored
 
     @staticmethod
@@ -136,8 +136,9 @@ class TemporalPipeline(BasePipeline[str, TemporalPipelineResult]):
 
         # 7. Write ranks back to events
         _report(90, "寫回事件排序")
-        for event_id, rank in ranks.items():
-            await self._kg_service.update_event_rank(event_id, rank)
+        await self._kg_service.bulk_update_event_fields(
+            {event_id: {"chronological_rank": rank} for event_id, rank in ranks.items()}
+        )
 
         # 8. Assign chron_index and back-fill entity first_chron_index
         await self._assign_chron_indices(document_id, ranks, events_dict)
@@ -189,8 +190,9 @@ class TemporalPipeline(BasePipeline[str, TemporalPipelineResult]):
     async def _write_event_chron_indices(
         self, sorted_ids: list[str], events_dict: dict[str, Any]
     ) -> None:
-        for idx, event_id in enumerate(sorted_ids, start=1):
-            await self._kg_service.update_event_chron_index(event_id, idx)
+        await self._kg_service.bulk_update_event_fields(
+            {event_id: {"chron_index": idx} for idx, event_id in enumerate(sorted_ids, start=1)}
+        )
 
     @staticmethod
     def _build_entity_first_map(
@@ -206,8 +208,9 @@ class TemporalPipeline(BasePipeline[str, TemporalPipelineResult]):
         return entity_first
 
     async def _write_entity_chron_indices(self, entity_first: dict[str, int]) -> None:
-        for entity_id, first_idx in entity_first.items():
-            await self._kg_service.update_entity_chron_index(entity_id, first_idx)
+        await self._kg_service.bulk_update_entity_fields(
+            {entity_id: {"first_chron_index": idx} for entity_id, idx in entity_first.items()}
+        )
 
     async def _load_eep_map(
         self,
@@ -0,0 +1,166 @@
+"""DocumentCache — process-wide LRU of hydrated Documents and headers.
+
+Every page of a book (graph, reader, timeline, unraveling) starts with
+``DocumentService.get_document`` or ``get_document_header``, and each call
+used to rebuild the same Pydantic objects from SQLite.  The cache keeps the
+hydrated objects, bounded by an *estimated* in-memory size rather than an
+entry count — one full book with embeddings outweighs a hundred headers.
+
+It is process-wide, not per ``DocumentService``: the API, the ingestion graph
+and the voice profiler each build their own service, and a write through any
+of them has to evict what the others cached.  Entries are namespaced by
+database so two databases (tests, tooling) never share rows.
+
+Races: a read that misses records the document's *generation* before it
+hits SQLite and only stores its result if no write invalidated the document
+in between, so a slow read cannot put pre-write data back after the write
+evicted it.
+
+Usage::
+
+    cache = get_document_cache()
+    gen = cache.generation(ns, doc_id)
+    doc = cache.get((ns, doc_id, projection), cache_type="document")
+    if doc is None:
+        doc = await load()
+        cache.put((ns, doc_id, projection), doc, size, generation=gen)
+    ...
+    cache.invalidate(ns, doc_id)          # after every write
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+#: A key's first two elements are always (namespace, document_id).
+CacheKey = tuple[Hashable, ...]
+
+
+class DocumentCache:
+    """Byte-bounded LRU keyed by ``(namespace, document_id, ...)`` tuples.
+
+    ``max_bytes=0`` disables the cache: every ``get`` misses and ``put`` is a
+    no-op.  Values are stored as given — callers that hand out mutable
+    objects must copy on the way in and out.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, tuple[Any, int]] = OrderedDict()
+        self._keys_by_document: dict[tuple[Hashable, str], set[CacheKey]] = {}
+        self._generations: dict[tuple[Hashable, str], int] = {}
+        self._epochs: dict[Hashable, int] = {}
+        self._bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, namespace: Hashable, document_id: str) -> tuple[int, int]:
+        """Write counter for one document; pass it back to ``put``."""
+        with self._lock:
+            return self._generation((namespace, document_id))
+
+    def _generation(self, doc_key: tuple[Hashable, str]) -> tuple[int, int]:
+        return self._epochs.get(doc_key[0], 0), self._generations.get(doc_key, 0)
+
+    def get(self, key: CacheKey, *, cache_type: str) -> Any | None:
+        """Return the cached value or ``None``, recording the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if self.enabled:
+            from storysphere.core.metrics import get_metrics  # noqa: PLC0415
+
+            get_metrics().record_cache_event(
+                cache_type, hit=entry is not None, cache_key=str(key[1])
+            )
+        return entry[0] if entry is not None else None
+
+    def put(
+        self, key: CacheKey, value: Any, size: int, *, generation: tuple[int, int]
+    ) -> None:
+        """Store *value*, evicting least-recently-used entries to fit.
+
+        Skipped when the document was invalidated since *generation* was
+        read, or when *value* alone is larger than the whole budget.
+        """
+        if size > self._max_bytes:
+            return
+        doc_key = (key[0], key[1])
+        with self._lock:
+            if self._generation(doc_key) != generation:
+                return
+            self._discard(key)
+            self._entries[key] = (value, size)
+            self._keys_by_document.setdefault(doc_key, set()).add(key)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, namespace: Hashable, document_id: str) -> None:
+        """Drop every entry of one document and bump its generation."""
+        doc_key = (namespace, document_id)
+        with self._lock:
+            self._generations[doc_key] = self._generations.get(doc_key, 0) + 1
+            for key in list(self._keys_by_document.get(doc_key, ())):
+                self._discard(key)
+
+    def clear(self, namespace: Hashable | None = None) -> None:
+        """Drop every entry, or every entry of one *namespace*."""
+        with self._lock:
+            doc_keys = [
+                k for k in self._keys_by_document if namespace is None or k[0] == namespace
+            ]
+            namespaces = {k[0] for k in self._keys_by_document} | set(self._epochs)
+            if namespace is not None:
+                namespaces = {namespace}
+            for ns in namespaces:
+                self._epochs[ns] = self._epochs.get(ns, 0) + 1
+            for doc_key in doc_keys:
+                for key in list(self._keys_by_document.get(doc_key, ())):
+                    self._discard(key)
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry[1]
+        doc_key = (key[0], key[1])
+        keys = self._keys_by_document.get(doc_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_document[doc_key]
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_singleton: DocumentCache | None = None
+_singleton_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide DocumentCache, sized from settings on first use."""
+    global _singleton
+    if _singleton is None:
+        with _singleton_lock:
+            if _singleton is None:
+                from storysphere.config.settings import get_settings  # noqa: PLC0415
+
+                _singleton = DocumentCache(get_settings().document_cache_max_bytes)
+    return _singleton
@@ -3,7 +3,7 @@
 Uses SQLAlchemy 2.x async engine with aiosqlite.  The schema is minimal:
 - ``documents``  — one row per ingested novel.
 - ``chapters``   — one row per chapter.
-- ``paragraphs`` — one row per paragraph (text + embedding as JSON blob).
+- ``paragraphs`` — one row per paragraph (text + embedding as a packed float32 blob).
 
 Phase 2 stores only the serialised domain objects; Phase 3 retrieval tools
 will query this via the service interface.
@@ -13,10 +13,33 @@ from __future__ import annotations
 
 import json
 import logging
-
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, and_, func, select
+import re
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    and_,
+    bindparam,
+    event,
+    func,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy import delete as sa_delete
 from sqlalchemy import text as sa_text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -30,14 +53,142 @@ from storysphere.domain.documents import (
     ParagraphRole,
     PipelineStatus,
 )
+from storysphere.domain.timeline import TimelineConfig
+from storysphere.services.document_cache import get_document_cache
+from storysphere.services.keyword_service import STOP_WORDS
 from storysphere.services.query_models import (
+    ChapterHeader,
     ChapterKeywordMatch,
+    DocumentHeader,
     DocumentSummary,
     VectorSearchResult,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Rows converted per UPDATE batch when migrating embedding_json → embedding_blob.
+_EMBEDDING_MIGRATION_BATCH = 500
+
+# Applied to every new SQLite connection.  WAL lets API reads proceed while
+# ingestion writes; synchronous=NORMAL is durable under WAL except for the
+# last commits on power loss; busy_timeout makes a writer wait for the lock
+# instead of raising "database is locked".  Sizes: mmap 256 MiB, page cache
+# 64 MiB (negative cache_size is KiB).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=10000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Minimum query-token length the trigram tokenizer can match; shorter tokens
+# (most two-character CJK names) fall back to a LIKE filter.
+_FTS_MIN_TOKEN_CHARS = 3
+
+# Punctuation around a query token ("hero," "'stop'" "-x"), stripped before
+# the token is quoted for MATCH.
+_EDGE_PUNCTUATION = re.compile(r"^[\W_]+|[\W_]+$")
+
+
+# Paragraph full-text index: an external-content FTS5 table over
+# ``paragraphs.text`` (rowids shared with ``paragraphs``), kept in sync by
+# triggers so every write path — ORM, bulk executemany, raw SQL — is covered.
+# ``paragraphs`` has a TEXT primary key, so its rowid is implicit and VACUUM
+# may renumber it: vacuum through ``DocumentService.vacuum``, which rebuilds
+# the index afterwards, never with a bare ``VACUUM``.
+# The trigram tokenizer needs no word segmentation, so CJK text is searchable.
+_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS paragraphs_fts USING fts5("
+    "text, content='paragraphs', content_rowid='rowid', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS paragraphs_fts_ai AFTER INSERT ON paragraphs BEGIN "
+    "INSERT INTO paragraphs_fts(rowid, text) VALUES (new.rowid, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS paragraphs_fts_ad AFTER DELETE ON paragraphs BEGIN "
+    "INSERT INTO paragraphs_fts(paragraphs_fts, rowid, text) "
+    "VALUES ('delete', old.rowid, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS paragraphs_fts_au AFTER UPDATE OF text ON paragraphs "
+    "WHEN old.text IS NOT new.text BEGIN "
+    "INSERT INTO paragraphs_fts(paragraphs_fts, rowid, text) "
+    "VALUES ('delete', old.rowid, old.text); "
+    "INSERT INTO paragraphs_fts(rowid, text) VALUES (new.rowid, new.text); END",
+]
+
+# Entity-mention index: explodes ``paragraphs.entities_json`` into
+# ``paragraph_entities`` rows.  Triggers rather than Python so the bulk
+# upsert, replace, dirty-field and delete paths all stay in sync without each
+# having to remember to.  OR IGNORE: a linker that reports the same mention
+# twice must not abort the paragraph write.
+_MENTION_SELECT = (
+    "SELECT {row}.id, {row}.document_id, json_extract(value, '$.entity_id'), "
+    "json_extract(value, '$.start'), json_extract(value, '$.end') "
+    "FROM json_each({row}.entities_json)"
+)
+_MENTION_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS paragraph_entities_ai AFTER INSERT ON paragraphs "
+    "WHEN new.entities_json IS NOT NULL BEGIN "
+    "INSERT OR IGNORE INTO paragraph_entities"
+    "(paragraph_id, document_id, entity_id, start, \"end\") "
+    + _MENTION_SELECT.format(row="new") + "; END",
+    "CREATE TRIGGER IF NOT EXISTS paragraph_entities_ad AFTER DELETE ON paragraphs "
+    "WHEN old.entities_json IS NOT NULL BEGIN "
+    "DELETE FROM paragraph_entities WHERE paragraph_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS paragraph_entities_au AFTER UPDATE OF entities_json "
+    "ON paragraphs WHEN old.entities_json IS NOT new.entities_json BEGIN "
+    "DELETE FROM paragraph_entities WHERE paragraph_id = old.id; "
+    "INSERT OR IGNORE INTO paragraph_entities"
+    "(paragraph_id, document_id, entity_id, start, \"end\") "
+    + _MENTION_SELECT.format(row="new")
+    + " WHERE new.entities_json IS NOT NULL; END",
+]
+_MENTION_BACKFILL = (
+    "INSERT OR IGNORE INTO paragraph_entities"
+    "(paragraph_id, document_id, entity_id, start, \"end\") "
+    + _MENTION_SELECT.format(row="paragraphs").replace(
+        "FROM json_each", "FROM paragraphs, json_each"
+    )
+    + " WHERE paragraphs.entities_json IS NOT NULL"
+)
+
+# Chapter keyword index: explodes ``chapters.keywords_json`` ({keyword: score})
+# into ``chapter_keywords`` rows, the same way as the mention index above.
+_KEYWORD_SELECT = (
+    "SELECT {row}.document_id, {row}.number, key, value FROM json_each({row}.keywords_json)"
+)
+_KEYWORD_DDL = [
+    "CREATE TRIGGER IF NOT EXISTS chapter_keywords_ai AFTER INSERT ON chapters "
+    "WHEN new.keywords_json IS NOT NULL BEGIN "
+    "INSERT OR REPLACE INTO chapter_keywords(document_id, chapter_number, keyword, score) "
+    + _KEYWORD_SELECT.format(row="new") + "; END",
+    "CREATE TRIGGER IF NOT EXISTS chapter_keywords_ad AFTER DELETE ON chapters "
+    "WHEN old.keywords_json IS NOT NULL BEGIN "
+    "DELETE FROM chapter_keywords "
+    "WHERE document_id = old.document_id AND chapter_number = old.number; END",
+    "CREATE TRIGGER IF NOT EXISTS chapter_keywords_au "
+    "AFTER UPDATE OF keywords_json, number, document_id ON chapters "
+    "WHEN old.keywords_json IS NOT new.keywords_json OR old.number != new.number "
+    "OR old.document_id != new.document_id BEGIN "
+    "DELETE FROM chapter_keywords "
+    "WHERE document_id = old.document_id AND chapter_number = old.number; "
+    "INSERT OR REPLACE INTO chapter_keywords(document_id, chapter_number, keyword, score) "
+    + _KEYWORD_SELECT.format(row="new")
+    + " WHERE new.keywords_json IS NOT NULL; END",
+]
+_KEYWORD_BACKFILL = (
+    "INSERT OR REPLACE INTO chapter_keywords(document_id, chapter_number, keyword, score) "
+    + _KEYWORD_SELECT.format(row="chapters").replace(
+        "FROM json_each", "FROM chapters, json_each"
+    )
+    + " WHERE chapters.keywords_json IS NOT NULL"
+)
+
+# Rows per executemany batch on the bulk save paths.  Bounds how many
+# parameter sets the driver holds at once; SQLite itself has no per-batch limit.
+_BULK_WRITE_BATCH = 1000
+
 
 # ── ORM models ───────────────────────────────────────────────────────────────
 
@@ -64,6 +215,7 @@ class _DocumentRow(_Base):
 
 class _ChapterRow(_Base):
     __tablename__ = "chapters"
+    __table_args__ = (Index("ix_chapters_document_number", "document_id", "number"),)
 
     id = Column(String, primary_key=True)
     document_id = Column(String, ForeignKey("documents.id"), nullable=False)
@@ -76,6 +228,16 @@ class _ChapterRow(_Base):
 
 class _ParagraphRow(_Base):
     __tablename__ = "paragraphs"
+    __table_args__ = (
+        # Whole-book reads in reading order (get_document, get_paragraphs).
+        Index(
+            "ix_paragraphs_document_chapter_position",
+            "document_id",
+            "chapter_number",
+            "position",
+        ),
+        Index("ix_paragraphs_chapter_position", "chapter_id", "position"),
+    )
 
     id = Column(String, primary_key=True)
     chapter_id = Column(String, ForeignKey("chapters.id"), nullable=False)
@@ -83,12 +245,383 @@ class _ParagraphRow(_Base):
     chapter_number = Column(Integer, nullable=False)
     position = Column(Integer, nullable=False)
     text = Column(Text, nullable=False)
-    embedding_json = Column(Text, nullable=True)  # JSON-encoded list[float]
+    # Legacy: JSON-encoded list[float]. Never written any more; init_db moves
+    # existing values into embedding_blob and clears this column.
+    embedding_json = Column(Text, nullable=True)
+    embedding_blob = Column(LargeBinary, nullable=True)  # packed native float32
     entities_json = Column(Text, nullable=True)  # JSON-encoded list[ParagraphEntity]
     title_span_json = Column(Text, nullable=True)  # JSON-encoded [start, end] or null
     role = Column(String, nullable=False, server_default="body")
 
 
+class _ParagraphEntityRow(_Base):
+    """One entity mention in one paragraph — a derived index of ``entities_json``.
+
+    ``entities_json`` stays the source of truth for hydrating paragraphs; this
+    table exists so "which paragraphs mention entity X" is an index lookup.
+    Maintained by the ``paragraph_entities_*`` triggers in ``_MENTION_DDL``.
+    """
+
+    __tablename__ = "paragraph_entities"
+    __table_args__ = (
+        # paragraph_id trailing makes it covering for get_paragraphs_by_entity.
+        Index(
+            "ix_paragraph_entities_document_entity",
+            "document_id",
+            "entity_id",
+            "paragraph_id",
+        ),
+    )
+
+    paragraph_id = Column(String, ForeignKey("paragraphs.id"), primary_key=True)
+    entity_id = Column(String, primary_key=True)
+    start = Column(Integer, primary_key=True)
+    end = Column(Integer, nullable=False)
+    document_id = Column(String, nullable=False)
+
+
+class _ChapterKeywordRow(_Base):
+    """One keyword of one chapter — a derived index of ``chapters.keywords_json``.
+
+    The primary key serves chapter → keywords; the secondary index serves
+    keyword → chapters.  Maintained by the ``chapter_keywords_*`` triggers in
+    ``_KEYWORD_DDL``.
+    """
+
+    __tablename__ = "chapter_keywords"
+    __table_args__ = (
+        Index(
+            "ix_chapter_keywords_document_keyword",
+            "document_id",
+            "keyword",
+            "chapter_number",
+            "score",
+        ),
+    )
+
+    document_id = Column(String, primary_key=True)
+    chapter_number = Column(Integer, primary_key=True)
+    keyword = Column(String, primary_key=True)
+    score = Column(Float, nullable=False)
+
+
+# ── Projections ──────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class DocumentProjection:
+    """Which parts of a book ``get_document`` hydrates.
+
+    Columns a projection drops are never selected, so a caller that only
+    needs chapter titles does not pay for reading and decoding every
+    paragraph's text and embedding.  Dropped paragraph fields come back as the
+    model default (``None``); dropped text comes back as ``""`` because
+    ``Paragraph.text`` is required.
+    """
+
+    #: False skips the paragraphs table entirely — chapters come back empty.
+    paragraphs: bool = True
+    text: bool = True
+    embeddings: bool = True
+    entities: bool = True
+
+
+PROJECTION_FULL = DocumentProjection()
+#: Everything the reader and the analysis views use — only vectors dropped.
+PROJECTION_NO_EMBEDDINGS = DocumentProjection(embeddings=False)
+#: Paragraph structure (ids, positions, roles) without any heavy column.
+PROJECTION_NO_TEXT = DocumentProjection(text=False, embeddings=False, entities=False)
+#: Document row and chapter metadata only.
+PROJECTION_HEADERS = DocumentProjection(paragraphs=False)
+
+
+def _pack_embedding(vector: list[float] | None) -> bytes | None:
+    """Pack a vector as contiguous float32 — 4 bytes a dimension instead of ~20 as JSON."""
+    if not vector:
+        return None
+    return array("f", vector).tobytes()
+
+
+def _unpack_embedding(blob: bytes | None) -> list[float] | None:
+    if not blob:
+        return None
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+def _document_fields(doc_row: _DocumentRow) -> dict:
+    """Decode a ``documents`` row into the fields ``Document`` and ``DocumentHeader`` share."""
+    return {
+        "id": doc_row.id,
+        "title": doc_row.title,
+        "author": doc_row.author,
+        "file_path": doc_row.file_path,
+        "file_type": FileType(doc_row.file_type),
+        "summary": doc_row.summary,
+        "keywords": json.loads(doc_row.keywords_json) if doc_row.keywords_json else None,
+        "language": doc_row.language or "en",
+        "processed_at": (
+            datetime.fromisoformat(doc_row.processed_at) if doc_row.processed_at else None
+        ),
+        "timeline_config": (
+            TimelineConfig.model_validate_json(doc_row.timeline_config_json)
+            if doc_row.timeline_config_json
+            else None
+        ),
+        "pipeline_status": (
+            PipelineStatus.model_validate_json(doc_row.pipeline_status_json)
+            if doc_row.pipeline_status_json
+            else PipelineStatus()
+        ),
+    }
+
+
+def _chapter_from_row(ch_row: _ChapterRow, paragraphs: list[Paragraph]) -> Chapter:
+    return Chapter(
+        id=ch_row.id,
+        number=ch_row.number,
+        title=ch_row.title,
+        role=ChapterRole(ch_row.role) if ch_row.role else ChapterRole.body,
+        summary=ch_row.summary,
+        keywords=json.loads(ch_row.keywords_json) if ch_row.keywords_json else None,
+        paragraphs=paragraphs,
+    )
+
+
+def _paragraph_columns(projection: DocumentProjection) -> list:
+    cols = [
+        _ParagraphRow.id,
+        _ParagraphRow.chapter_id,
+        _ParagraphRow.chapter_number,
+        _ParagraphRow.position,
+        _ParagraphRow.role,
+        _ParagraphRow.title_span_json,
+    ]
+    if projection.text:
+        cols.append(_ParagraphRow.text)
+    if projection.embeddings:
+        cols.append(_ParagraphRow.embedding_blob)
+    if projection.entities:
+        cols.append(_ParagraphRow.entities_json)
+    return cols
+
+
+def _paragraph_from_row(row) -> Paragraph:
+    """Build a ``Paragraph`` from a row selected with ``_paragraph_columns``."""
+    m = row._mapping
+    entities_json = m.get("entities_json")
+    title_span_json = m.get("title_span_json")
+    return Paragraph(
+        id=m["id"],
+        text=m.get("text") or "",
+        chapter_number=m["chapter_number"],
+        position=m["position"],
+        role=ParagraphRole(m["role"]) if m["role"] else ParagraphRole.body,
+        embedding=_unpack_embedding(m.get("embedding_blob")),
+        entities=(
+            [ParagraphEntity(**e) for e in json.loads(entities_json)]
+            if entities_json
+            else None
+        ),
+        title_span=tuple(json.loads(title_span_json)) if title_span_json else None,
+    )
+
+
+def _content_tokens(tokens: list[str]) -> list[str]:
+    """*tokens* without edge punctuation, English stop words and short ASCII words."""
+    content = []
+    for token in tokens:
+        token = _EDGE_PUNCTUATION.sub("", token)
+        if token.lower() in STOP_WORDS:
+            continue
+        if token.isascii() and len(token) < _FTS_MIN_TOKEN_CHARS:
+            continue
+        content.append(token)
+    return content
+
+
+def _occurrence_score(text: str, tokens: list[str]) -> float:
+    text_lower = text.lower()
+    return float(sum(text_lower.count(t.lower()) for t in tokens))
+
+
+# ── Row encoding (write side) ────────────────────────────────────────────────
+
+
+def _keywords_json(keywords: dict[str, float] | None) -> str | None:
+    return json.dumps(keywords, ensure_ascii=False) if keywords else None
+
+
+def _entities_json(entities: list[ParagraphEntity] | None) -> str | None:
+    if not entities:
+        return None
+    return json.dumps([e.model_dump() for e in entities], ensure_ascii=False)
+
+
+def _document_values(document: Document) -> dict:
+    return {
+        "id": document.id,
+        "title": document.title,
+        "author": document.author,
+        "file_path": document.file_path,
+        "file_type": document.file_type.value,
+        "processed_at": document.processed_at.isoformat() if document.processed_at else None,
+        "summary": document.summary,
+        "keywords_json": _keywords_json(document.keywords),
+        "language": document.language,
+        "timeline_config_json": (
+            document.timeline_config.model_dump_json() if document.timeline_config else None
+        ),
+        "pipeline_status_json": document.pipeline_status.model_dump_json(),
+    }
+
+
+def _chapter_values(document_id: str, chapter: Chapter) -> dict:
+    return {
+        "id": chapter.id,
+        "document_id": document_id,
+        "number": chapter.number,
+        "title": chapter.title,
+        "role": chapter.role.value,
+        "summary": chapter.summary,
+        "keywords_json": _keywords_json(chapter.keywords),
+    }
+
+
+def _paragraph_values(document_id: str, chapter_id: str, para: Paragraph) -> dict:
+    return {
+        "id": para.id,
+        "chapter_id": chapter_id,
+        "document_id": document_id,
+        "chapter_number": para.chapter_number,
+        "position": para.position,
+        "text": para.text,
+        "role": para.role.value,
+        "embedding_blob": _pack_embedding(para.embedding),
+        "entities_json": _entities_json(para.entities),
+        "title_span_json": (
+            json.dumps(list(para.title_span)) if para.title_span is not None else None
+        ),
+    }
+
+
+def _batches(rows: list[dict]) -> Iterator[list[dict]]:
+    for start in range(0, len(rows), _BULK_WRITE_BATCH):
+        yield rows[start : start + _BULK_WRITE_BATCH]
+
+
+def _upsert_stmt(table, columns):
+    """``INSERT ... ON CONFLICT(id) DO UPDATE`` overwriting *columns*."""
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={name: stmt.excluded[name] for name in columns if name != "id"},
+    )
+
+
+def _check_fields(fields: Iterable[str]) -> set[str]:
+    fields = set(fields)
+    unknown = fields - _DIRTY_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown document fields: {sorted(unknown)}")
+    return fields
+
+
+#: Fields ``save_document_fields`` can write, as ``"<level>.<field>"`` →
+#: (table, column, encoder).  The encoder takes the owning domain object.
+_DIRTY_FIELDS = {
+    "document.summary": (
+        _DocumentRow.__table__, "summary", lambda d: d.summary,
+    ),
+    "document.keywords": (
+        _DocumentRow.__table__, "keywords_json", lambda d: _keywords_json(d.keywords),
+    ),
+    "chapters.summary": (
+        _ChapterRow.__table__, "summary", lambda c: c.summary,
+    ),
+    "chapters.keywords": (
+        _ChapterRow.__table__, "keywords_json", lambda c: _keywords_json(c.keywords),
+    ),
+    "paragraphs.embedding": (
+        _ParagraphRow.__table__, "embedding_blob", lambda p: _pack_embedding(p.embedding),
+    ),
+    "paragraphs.entities": (
+        _ParagraphRow.__table__, "entities_json", lambda p: _entities_json(p.entities),
+    ),
+}
+
+
+# ── Engine setup ─────────────────────────────────────────────────────────────
+
+
+def _apply_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    for table in _Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+# ── Read cache ───────────────────────────────────────────────────────────────
+
+# Rough per-object overheads (CPython, Pydantic v2) for sizing cache entries.
+# A str costs about 2 bytes a character once CJK is involved; a list of
+# floats about 32 bytes an element (boxed float + pointer).
+_OBJECT_BYTES = 600
+_CHAR_BYTES = 2
+_FLOAT_BYTES = 32
+_MENTION_BYTES = 400
+
+
+def _estimated_bytes(document: Document | DocumentHeader) -> int:
+    """Approximate in-memory size of a hydrated document, for the cache budget."""
+    size = _OBJECT_BYTES + _CHAR_BYTES * len(document.summary or "")
+    size += _OBJECT_BYTES * len(document.keywords or {})
+    for ch in document.chapters:
+        size += _OBJECT_BYTES + _CHAR_BYTES * (len(ch.title or "") + len(ch.summary or ""))
+        for para in getattr(ch, "paragraphs", ()):
+            size += _OBJECT_BYTES + _CHAR_BYTES * len(para.text)
+            size += _FLOAT_BYTES * len(para.embedding or ())
+            size += _MENTION_BYTES * len(para.entities or ())
+    return size
+
+
+def _copy_document(document: Document) -> Document:
+    """Copy the object tree a caller may mutate, sharing the immutable leaves.
+
+    Documents, chapters, paragraphs and pipeline status are mutated in place
+    by the workflow and pipelines, so each gets a shallow copy; strings,
+    embedding lists and entity lists are only ever replaced, never edited,
+    and are shared.  About a tenth of the cost of hydrating from SQLite.
+    """
+    return document.model_copy(
+        update={
+            "pipeline_status": document.pipeline_status.model_copy(),
+            "chapters": [
+                ch.model_copy(update={"paragraphs": [p.model_copy() for p in ch.paragraphs]})
+                for ch in document.chapters
+            ],
+        }
+    )
+
+
+def _copy_header(header: DocumentHeader) -> DocumentHeader:
+    return header.model_copy(
+        update={
+            "pipeline_status": header.pipeline_status.model_copy(),
+            "chapters": [ch.model_copy() for ch in header.chapters],
+        }
+    )
+
+
 # ── Service ──────────────────────────────────────────────────────────────────
 
 
@@ -109,14 +642,29 @@ class DocumentService:
         settings = get_settings()
         url = database_url or settings.database_url
         self._engine = create_async_engine(url, echo=False)
+        if self._engine.dialect.name == "sqlite":
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self._session_factory = async_sessionmaker(
             self._engine, expire_on_commit=False, class_=AsyncSession
         )
+        # Set by init_db; False when this SQLite build lacks FTS5/trigram.
+        self._fts_enabled = False
+        # Hydrated documents are cached process-wide, namespaced by database
+        # file.  An in-memory database is private to its engine, so it gets
+        # a namespace of its own.
+        self._cache = get_document_cache()
+        engine_url = self._engine.url
+        self._cache_ns = engine_url.render_as_string(hide_password=True)
+        if engine_url.database in (None, "", ":memory:"):
+            self._cache_ns = f"{self._cache_ns}#{id(self)}"
 
     async def init_db(self) -> None:
         """Create all tables (idempotent — safe to call on every startup)."""
         async with self._engine.begin() as conn:
             await conn.run_sync(_Base.metadata.create_all)
+            # create_all only builds indexes with their table; add the ones
+            # declared since an existing database was created.
+            await conn.run_sync(_create_missing_indexes)
         # Migrations: add columns to existing tables
         async with self._engine.begin() as conn:
             for stmt in [
@@ -127,95 +675,177 @@ class DocumentService:
                 "ALTER TABLE paragraphs ADD COLUMN title_span_json TEXT",
                 "ALTER TABLE paragraphs ADD COLUMN role TEXT NOT NULL DEFAULT 'body'",
                 "ALTER TABLE chapters ADD COLUMN role TEXT NOT NULL DEFAULT 'body'",
+                "ALTER TABLE paragraphs ADD COLUMN embedding_blob BLOB",
             ]:
                 try:
                     await conn.execute(sa_text(stmt))
                 except Exception:
                     pass  # column already exists
+        await self._migrate_embedding_json()
+        await self._init_json_index(
+            _MENTION_DDL,
+            _ParagraphEntityRow.paragraph_id,
+            _ParagraphRow.entities_json,
+            _MENTION_BACKFILL,
+            "paragraph entity mentions",
+        )
+        await self._init_json_index(
+            _KEYWORD_DDL,
+            _ChapterKeywordRow.document_id,
+            _ChapterRow.keywords_json,
+            _KEYWORD_BACKFILL,
+            "chapter keywords",
+        )
+        await self._init_text_index()
+        # Migrations above may have rewritten rows behind the cache's back.
+        self._cache.clear(self._cache_ns)
         logger.info("DocumentService: database tables initialised")
 
-    # ── Save ─────────────────────────────────────────────────────────────────
+    async def _init_json_index(
+        self, ddl: list[str], indexed_col, source_col, backfill: str, label: str
+    ) -> None:
+        """Install the triggers of a table derived from a JSON column, backfilling if empty.
 
-    async def save_document(self, document: Document) -> None:
-        """Persist a ``Document`` (and all its chapters/paragraphs) to SQLite.
+        The backfill runs when the derived table has no rows but some source
+        row has JSON — i.e. a database from before the table existed.
+        """
+        async with self._engine.begin() as conn:
+            for stmt in ddl:
+                await conn.execute(sa_text(stmt))
+            indexed = (await conn.execute(select(indexed_col).limit(1))).first()
+            pending = (
+                await conn.execute(select(source_col).where(source_col.isnot(None)).limit(1))
+            ).first()
+            if indexed is None and pending is not None:
+                result = await conn.execute(sa_text(backfill))
+                logger.info("DocumentService: indexed %d %s", result.rowcount, label)
+
+    async def _init_text_index(self) -> None:
+        """Create the paragraph FTS5 index and its triggers (idempotent).
+
+        Backfills from ``paragraphs`` the first time the index is created, so
+        databases that predate it become searchable on the next start.
+        Without FTS5 trigram support (SQLite < 3.34) text search falls back to
+        ``LIKE`` scans.
+        """
+        try:
+            async with self._engine.begin() as conn:
+                existed = (
+                    await conn.execute(
+                        sa_text(
+                            "SELECT 1 FROM sqlite_master "
+                            "WHERE type = 'table' AND name = 'paragraphs_fts'"
+                        )
+                    )
+                ).first() is not None
+                for stmt in _FTS_DDL:
+                    await conn.execute(sa_text(stmt))
+                if not existed:
+                    await conn.execute(
+                        sa_text("INSERT INTO paragraphs_fts(paragraphs_fts) VALUES ('rebuild')")
+                    )
+        except Exception as exc:
+            logger.warning(
+                "DocumentService: FTS5 trigram index unavailable, text search uses LIKE: %s",
+                exc,
+            )
+            return
+        self._fts_enabled = True
 
-        Chapters and paragraphs are upserted (delete-then-insert for simplicity).
+    async def rebuild_text_index(self) -> None:
+        """Rebuild the paragraph FTS5 index from ``paragraphs``.
+
+        Only needed if the index was bypassed — e.g. rows written with the
+        triggers dropped, or a database restored from a partial copy.
         """
-        async with self._session_factory() as session:
-            async with session.begin():
-                # Upsert document row
-                await session.merge(
-                    _DocumentRow(
-                        id=document.id,
-                        title=document.title,
-                        author=document.author,
-                        file_path=document.file_path,
-                        file_type=document.file_type.value,
-                        processed_at=(
-                            document.processed_at.isoformat()
-                            if document.processed_at
-                            else None
-                        ),
-                        summary=document.summary,
-                        keywords_json=(
-                            json.dumps(document.keywords, ensure_ascii=False)
-                            if document.keywords
-                            else None
-                        ),
-                        language=document.language,
-                        timeline_config_json=(
-                            document.timeline_config.model_dump_json()
-                            if document.timeline_config
-                            else None
-                        ),
-                        pipeline_status_json=document.pipeline_status.model_dump_json(),
+        if not self._fts_enabled:
+            return
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                sa_text("INSERT INTO paragraphs_fts(paragraphs_fts) VALUES ('rebuild')")
+            )
+
+    async def vacuum(self) -> None:
+        """``VACUUM`` the database, then rebuild the paragraph FTS5 index.
+
+        VACUUM may renumber the implicit rowids of ``paragraphs`` (its primary
+        key is TEXT), which the external-content index is keyed on; left
+        alone, searches would then return the wrong paragraphs.
+        """
+        async with self._engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.exec_driver_sql("VACUUM")
+        await self.rebuild_text_index()
+
+    async def _migrate_embedding_json(self) -> None:
+        """Move legacy JSON-text embeddings into ``embedding_blob``.
+
+        Converts in batches and clears ``embedding_json`` as it goes, so the
+        migration is resumable and a no-op once every row has moved.  SQLite
+        does not shrink the file on its own; call ``vacuum()`` afterwards to
+        get the space back (a bare ``VACUUM`` would desync the FTS index).
+        """
+        migrated = 0
+        while True:
+            async with self._engine.begin() as conn:
+                rows = (
+                    await conn.execute(
+                        select(_ParagraphRow.id, _ParagraphRow.embedding_json)
+                        .where(_ParagraphRow.embedding_json.isnot(None))
+                        .limit(_EMBEDDING_MIGRATION_BATCH)
                     )
+                ).all()
+                if not rows:
+                    break
+                await conn.execute(
+                    update(_ParagraphRow)
+                    .where(_ParagraphRow.id == bindparam("pid"))
+                    .values(embedding_blob=bindparam("blob"), embedding_json=None),
+                    [
+                        {"pid": r.id, "blob": _pack_embedding(json.loads(r.embedding_json))}
+                        for r in rows
+                    ],
                 )
+                migrated += len(rows)
+        if migrated:
+            logger.info(
+                "DocumentService: migrated %d paragraph embeddings to float32 blobs", migrated
+            )
 
-                for chapter in document.chapters:
-                    await session.merge(
-                        _ChapterRow(
-                            id=chapter.id,
-                            document_id=document.id,
-                            number=chapter.number,
-                            title=chapter.title,
-                            role=chapter.role.value,
-                            summary=chapter.summary,
-                            keywords_json=(
-                                json.dumps(chapter.keywords, ensure_ascii=False)
-                                if chapter.keywords
-                                else None
-                            ),
-                        )
-                    )
-                    for para in chapter.paragraphs:
-                        await session.merge(
-                            _ParagraphRow(
-                                id=para.id,
-                                chapter_id=chapter.id,
-                                document_id=document.id,
-                                chapter_number=para.chapter_number,
-                                position=para.position,
-                                text=para.text,
-                                role=para.role.value,
-                                embedding_json=(
-                                    json.dumps(para.embedding) if para.embedding else None
-                                ),
-                                entities_json=(
-                                    json.dumps(
-                                        [e.model_dump() for e in para.entities],
-                                        ensure_ascii=False,
-                                    )
-                                    if para.entities
-                                    else None
-                                ),
-                                title_span_json=(
-                                    json.dumps(list(para.title_span))
-                                    if para.title_span is not None
-                                    else None
-                                ),
-                            )
-                        )
+    # ── Save ─────────────────────────────────────────────────────────────────
+
+    async def save_document(self, document: Document) -> None:
+        """Persist a ``Document`` (and all its chapters/paragraphs) to SQLite.
+
+        Every row is upserted with ``INSERT ... ON CONFLICT(id) DO UPDATE``,
+        executed in batches of ``_BULK_WRITE_BATCH`` parameter sets, so a
+        book costs a handful of statements rather than a SELECT-then-INSERT
+        per paragraph.  Rows no longer on the Document are left alone — use
+        ``replace_chapters`` when the chapter structure changed.
+
+        Pipeline steps that only changed a few columns should call
+        ``save_document_fields`` instead.
+        """
+        chapter_rows = [_chapter_values(document.id, ch) for ch in document.chapters]
+        paragraph_rows = [
+            _paragraph_values(document.id, ch.id, para)
+            for ch in document.chapters
+            for para in ch.paragraphs
+        ]
+        doc_values = _document_values(document)
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                _upsert_stmt(_DocumentRow.__table__, doc_values).values(**doc_values)
+            )
+            if chapter_rows:
+                stmt = _upsert_stmt(_ChapterRow.__table__, chapter_rows[0])
+                for batch in _batches(chapter_rows):
+                    await conn.execute(stmt, batch)
+            if paragraph_rows:
+                stmt = _upsert_stmt(_ParagraphRow.__table__, paragraph_rows[0])
+                for batch in _batches(paragraph_rows):
+                    await conn.execute(stmt, batch)
+        self._invalidate(document.id)
 
         logger.info(
             "DocumentService.save_document: id=%s chapters=%d paragraphs=%d",
@@ -224,68 +854,118 @@ class DocumentService:
             document.total_paragraphs,
         )
 
+    async def save_document_fields(self, document: Document, fields: Iterable[str]) -> None:
+        """Write only the named columns of an already-saved ``Document``.
+
+        For pipeline steps that change a known handful of columns on rows
+        that already exist — a summarisation pass touches ``chapters.summary``
+        and nothing else, so rewriting every paragraph's text and embedding
+        is pure cost.  Each field becomes one batched ``UPDATE ... WHERE id``.
+
+        Args:
+            document: The Document carrying the new values.  Rows it does not
+                contain are untouched; rows missing from the database are
+                silently skipped (nothing is inserted).
+            fields: Iterable of keys of ``_DIRTY_FIELDS``: ``document.summary``,
+                ``document.keywords``, ``chapters.summary``,
+                ``chapters.keywords``, ``paragraphs.embedding``,
+                ``paragraphs.entities``.
+
+        Raises:
+            ValueError: A field name is not one of the above.
+        """
+        fields = _check_fields(fields)
+        owners = {
+            "document": [document],
+            "chapters": document.chapters,
+            "paragraphs": [p for ch in document.chapters for p in ch.paragraphs],
+        }
+        await self._write_fields(owners, fields)
+        self._invalidate(document.id)
+        if fields:
+            logger.info(
+                "DocumentService.save_document_fields: id=%s fields=%s",
+                document.id,
+                ",".join(sorted(fields)),
+            )
+
+    async def save_chapter_fields(self, chapter: Chapter, fields: Iterable[str]) -> None:
+        """``save_document_fields`` for one chapter and its paragraphs.
+
+        For callers streaming a book with ``iter_chapters`` that need a
+        chapter's output on disk before moving to the next one.  Only
+        ``chapters.*`` and ``paragraphs.*`` fields are accepted.
+
+        Raises:
+            ValueError: A field name is unknown or a ``document.*`` field.
+        """
+        fields = _check_fields(fields)
+        document_level = {f for f in fields if f.startswith("document.")}
+        if document_level:
+            raise ValueError(f"Not chapter fields: {sorted(document_level)}")
+        await self._write_fields(
+            {"chapters": [chapter], "paragraphs": chapter.paragraphs}, fields
+        )
+        if fields:
+            async with self._session_factory() as session:
+                document_id = (
+                    await session.execute(
+                        select(_ChapterRow.document_id).where(_ChapterRow.id == chapter.id)
+                    )
+                ).scalar_one_or_none()
+            if document_id is not None:
+                self._invalidate(document_id)
+
+    def _invalidate(self, document_id: str) -> None:
+        """Evict *document_id* from the read cache; call after every committed write."""
+        self._cache.invalidate(self._cache_ns, document_id)
+
+    async def _write_fields(self, owners: dict[str, list], fields: set[str]) -> None:
+        """One batched ``UPDATE ... WHERE id`` per field, taking values from *owners*."""
+        if not fields:
+            return
+        async with self._engine.begin() as conn:
+            for field in sorted(fields):
+                table, column, encode = _DIRTY_FIELDS[field]
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("row_id"))
+                    .values({column: bindparam("value")})
+                )
+                rows = [
+                    {"row_id": obj.id, "value": encode(obj)}
+                    for obj in owners[field.split(".", 1)[0]]
+                ]
+                for batch in _batches(rows):
+                    await conn.execute(stmt, batch)
+
     async def replace_chapters(self, document: Document) -> None:
         """Delete all chapters/paragraphs for a document and re-insert.
 
         Used after a chapter-review step changes the chapter structure.
-        The document row itself is not modified.
+        The document row itself is not modified.  The re-insert is a plain
+        batched executemany — there is nothing left to conflict with.
         """
-        async with self._session_factory() as session:
-            async with session.begin():
-                await session.execute(
-                    sa_delete(_ParagraphRow).where(
-                        _ParagraphRow.document_id == document.id
-                    )
-                )
-                await session.execute(
-                    sa_delete(_ChapterRow).where(
-                        _ChapterRow.document_id == document.id
-                    )
-                )
-                for chapter in document.chapters:
-                    session.add(
-                        _ChapterRow(
-                            id=chapter.id,
-                            document_id=document.id,
-                            number=chapter.number,
-                            title=chapter.title,
-                            role=chapter.role.value,
-                            summary=chapter.summary,
-                            keywords_json=(
-                                json.dumps(chapter.keywords, ensure_ascii=False)
-                                if chapter.keywords
-                                else None
-                            ),
-                        )
-                    )
-                    for para in chapter.paragraphs:
-                        session.add(
-                            _ParagraphRow(
-                                id=para.id,
-                                chapter_id=chapter.id,
-                                document_id=document.id,
-                                chapter_number=para.chapter_number,
-                                position=para.position,
-                                text=para.text,
-                                role=para.role.value,
-                                embedding_json=(
-                                    json.dumps(para.embedding) if para.embedding else None
-                                ),
-                                entities_json=(
-                                    json.dumps(
-                                        [e.model_dump() for e in para.entities],
-                                        ensure_ascii=False,
-                                    )
-                                    if para.entities
-                                    else None
-                                ),
-                                title_span_json=(
-                                    json.dumps(list(para.title_span))
-                                    if para.title_span is not None
-                                    else None
-                                ),
-                            )
-                        )
+        chapter_rows = [_chapter_values(document.id, ch) for ch in document.chapters]
+        paragraph_rows = [
+            _paragraph_values(document.id, ch.id, para)
+            for ch in document.chapters
+            for para in ch.paragraphs
+        ]
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                sa_delete(_ParagraphRow).where(_ParagraphRow.document_id == document.id)
+            )
+            await conn.execute(
+                sa_delete(_ChapterRow).where(_ChapterRow.document_id == document.id)
+            )
+            for table, rows in (
+                (_ChapterRow.__table__, chapter_rows),
+                (_ParagraphRow.__table__, paragraph_rows),
+            ):
+                for batch in _batches(rows):
+                    await conn.execute(table.insert(), batch)
+        self._invalidate(document.id)
         logger.info(
             "DocumentService.replace_chapters: id=%s chapters=%d paragraphs=%d",
             document.id,
@@ -295,14 +975,44 @@ class DocumentService:
 
     # ── Fetch ─────────────────────────────────────────────────────────────────
 
-    async def get_document(self, document_id: str) -> Document | None:
-        """Retrieve a full ``Document`` (with chapters and paragraphs) by ID."""
+    async def get_document(
+        self,
+        document_id: str,
+        projection: DocumentProjection = PROJECTION_FULL,
+    ) -> Document | None:
+        """Retrieve a ``Document`` (with chapters and paragraphs) by ID.
+
+        Chapters and paragraphs are each loaded with one query for the whole
+        book and grouped in Python — the cost no longer grows with the number
+        of chapters.  Pass a narrower *projection* when the caller does not
+        need every paragraph column.
+
+        Results are served from the process-wide read cache when possible;
+        every call returns a fresh object tree the caller may mutate.
+        """
+        if not self._cache.enabled:
+            return await self._load_document(document_id, projection)
+        key = (self._cache_ns, document_id, projection)
+        cached = self._cache.get(key, cache_type="document")
+        if cached is not None:
+            return _copy_document(cached)
+        generation = self._cache.generation(self._cache_ns, document_id)
+        document = await self._load_document(document_id, projection)
+        if document is not None:
+            self._cache.put(
+                key, _copy_document(document), _estimated_bytes(document),
+                generation=generation,
+            )
+        return document
+
+    async def _load_document(
+        self, document_id: str, projection: DocumentProjection
+    ) -> Document | None:
         async with self._session_factory() as session:
             doc_row = await session.get(_DocumentRow, document_id)
             if doc_row is None:
                 return None
 
-            # Fetch chapters
             ch_result = await session.execute(
                 select(_ChapterRow)
                 .where(_ChapterRow.document_id == document_id)
@@ -310,88 +1020,122 @@ class DocumentService:
             )
             chapter_rows = ch_result.scalars().all()
 
-            chapters: list[Chapter] = []
-            for ch_row in chapter_rows:
-                # Fetch paragraphs for this chapter
+            by_chapter: dict[str, list[Paragraph]] = {}
+            if projection.paragraphs:
                 para_result = await session.execute(
-                    select(_ParagraphRow)
-                    .where(_ParagraphRow.chapter_id == ch_row.id)
-                    .order_by(_ParagraphRow.position)
+                    select(*_paragraph_columns(projection))
+                    .where(_ParagraphRow.document_id == document_id)
+                    .order_by(_ParagraphRow.chapter_number, _ParagraphRow.position)
                 )
-                para_rows = para_result.scalars().all()
-                paragraphs = [
-                    Paragraph(
-                        id=pr.id,
-                        text=pr.text,
-                        chapter_number=pr.chapter_number,
-                        position=pr.position,
-                        role=ParagraphRole(pr.role) if pr.role else ParagraphRole.body,
-                        embedding=(
-                            json.loads(pr.embedding_json) if pr.embedding_json else None
-                        ),
-                        entities=(
-                            [ParagraphEntity(**e) for e in json.loads(pr.entities_json)]
-                            if pr.entities_json
-                            else None
-                        ),
-                        title_span=(
-                            tuple(json.loads(pr.title_span_json))
-                            if pr.title_span_json
-                            else None
-                        ),
+                for pr in para_result:
+                    by_chapter.setdefault(pr.chapter_id, []).append(_paragraph_from_row(pr))
+
+            chapters = [
+                _chapter_from_row(ch_row, by_chapter.get(ch_row.id, []))
+                for ch_row in chapter_rows
+            ]
+
+            return Document(**_document_fields(doc_row), chapters=chapters)
+
+    async def iter_chapters(
+        self,
+        document_id: str,
+        projection: DocumentProjection = PROJECTION_FULL,
+    ) -> AsyncIterator[Chapter]:
+        """Stream a book's chapters in order, each with its paragraphs.
+
+        One query lists the chapters up front; each chapter's paragraphs are
+        then read when it is reached, so only one chapter's paragraphs are in
+        memory at a time (as long as the caller lets go of the previous one).
+        Every query runs on its own short-lived connection — the consumer can
+        spend minutes on LLM calls between chapters without holding a read
+        transaction open against concurrent writers.
+
+        Yields nothing for an unknown document.
+        """
+        async with self._session_factory() as session:
+            chapter_rows = (
+                await session.execute(
+                    select(_ChapterRow)
+                    .where(_ChapterRow.document_id == document_id)
+                    .order_by(_ChapterRow.number)
+                )
+            ).scalars().all()
+
+        for ch_row in chapter_rows:
+            paragraphs: list[Paragraph] = []
+            if projection.paragraphs:
+                async with self._session_factory() as session:
+                    rows = await session.execute(
+                        select(*_paragraph_columns(projection))
+                        .where(_ParagraphRow.chapter_id == ch_row.id)
+                        .order_by(_ParagraphRow.position)
                     )
-                    for pr in para_rows
-                ]
-                chapters.append(
-                    Chapter(
+                    paragraphs = [_paragraph_from_row(r) for r in rows]
+            yield _chapter_from_row(ch_row, paragraphs)
+
+    async def get_document_header(self, document_id: str) -> DocumentHeader | None:
+        """Return the document row and chapter metadata, without paragraphs.
+
+        For endpoints that only need to 404-check a book or read its title,
+        language, status or chapter list — the cost does not grow with the
+        length of the text.  Paragraph counts come from one aggregate query.
+        Cached like ``get_document``.
+        """
+        if not self._cache.enabled:
+            return await self._load_header(document_id)
+        key = (self._cache_ns, document_id, "header")
+        cached = self._cache.get(key, cache_type="document_header")
+        if cached is not None:
+            return _copy_header(cached)
+        generation = self._cache.generation(self._cache_ns, document_id)
+        header = await self._load_header(document_id)
+        if header is not None:
+            self._cache.put(
+                key, _copy_header(header), _estimated_bytes(header), generation=generation
+            )
+        return header
+
+    async def _load_header(self, document_id: str) -> DocumentHeader | None:
+        async with self._session_factory() as session:
+            doc_row = await session.get(_DocumentRow, document_id)
+            if doc_row is None:
+                return None
+
+            ch_result = await session.execute(
+                select(_ChapterRow)
+                .where(_ChapterRow.document_id == document_id)
+                .order_by(_ChapterRow.number)
+            )
+            count_result = await session.execute(
+                select(_ParagraphRow.chapter_id, func.count())
+                .where(_ParagraphRow.document_id == document_id)
+                .group_by(_ParagraphRow.chapter_id)
+            )
+            counts = dict(count_result.all())
+
+            return DocumentHeader(
+                **_document_fields(doc_row),
+                chapters=[
+                    ChapterHeader(
                         id=ch_row.id,
                         number=ch_row.number,
                         title=ch_row.title,
                         role=ChapterRole(ch_row.role) if ch_row.role else ChapterRole.body,
                         summary=ch_row.summary,
-                        keywords=(
-                            json.loads(ch_row.keywords_json)
-                            if ch_row.keywords_json
-                            else None
-                        ),
-                        paragraphs=paragraphs,
+                        paragraph_count=counts.get(ch_row.id, 0),
                     )
-                )
+                    for ch_row in ch_result.scalars().all()
+                ],
+            )
 
-            from datetime import datetime  # noqa: PLC0415
-
-            from storysphere.domain.timeline import TimelineConfig  # noqa: PLC0415
-
-            return Document(
-                id=doc_row.id,
-                title=doc_row.title,
-                author=doc_row.author,
-                file_path=doc_row.file_path,
-                file_type=FileType(doc_row.file_type),
-                chapters=chapters,
-                summary=doc_row.summary,
-                keywords=(
-                    json.loads(doc_row.keywords_json)
-                    if doc_row.keywords_json
-                    else None
-                ),
-                language=doc_row.language or "en",
-                processed_at=(
-                    datetime.fromisoformat(doc_row.processed_at)
-                    if doc_row.processed_at
-                    else None
-                ),
-                timeline_config=(
-                    TimelineConfig.model_validate_json(doc_row.timeline_config_json)
-                    if doc_row.timeline_config_json
-                    else None
-                ),
-                pipeline_status=(
-                    PipelineStatus.model_validate_json(doc_row.pipeline_status_json)
-                    if doc_row.pipeline_status_json
-                    else PipelineStatus()
-                ),
+    async def document_exists(self, document_id: str) -> bool:
+        """Return True if a document with this ID is stored."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(_DocumentRow.id).where(_DocumentRow.id == document_id)
             )
+            return result.first() is not None
 
     async def update_pipeline_status(self, document_id: str, pipeline_status: PipelineStatus) -> None:
         """Update only the pipeline_status column for a document."""
@@ -403,6 +1147,21 @@ class DocumentService:
                     ),
                     {"json": pipeline_status.model_dump_json(), "id": document_id},
                 )
+        self._invalidate(document_id)
+
+    async def update_timeline_config(
+        self, document_id: str, timeline_config: TimelineConfig
+    ) -> None:
+        """Update only the timeline_config column for a document."""
+        async with self._session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    sa_text(
+                        "UPDATE documents SET timeline_config_json = :json WHERE id = :id"
+                    ),
+                    {"json": timeline_config.model_dump_json(), "id": document_id},
+                )
+        self._invalidate(document_id)
 
     async def get_document_language(self, document_id: str) -> str:
         """Return the detected/configured language for a document, or ``'en'``."""
@@ -479,31 +1238,42 @@ class DocumentService:
     ) -> list[Paragraph]:
         """Return paragraphs for a document, optionally filtered by chapter."""
         async with self._session_factory() as session:
-            query = select(_ParagraphRow).where(
+            query = select(*_paragraph_columns(PROJECTION_FULL)).where(
                 _ParagraphRow.document_id == document_id
             )
             if chapter_number is not None:
                 query = query.where(_ParagraphRow.chapter_number == chapter_number)
             query = query.order_by(_ParagraphRow.chapter_number, _ParagraphRow.position)
             result = await session.execute(query)
-            return [
-                Paragraph(
-                    id=pr.id,
-                    text=pr.text,
-                    chapter_number=pr.chapter_number,
-                    position=pr.position,
-                    role=ParagraphRole(pr.role) if pr.role else ParagraphRole.body,
-                    embedding=(
-                        json.loads(pr.embedding_json) if pr.embedding_json else None
-                    ),
-                    entities=(
-                        [ParagraphEntity(**e) for e in json.loads(pr.entities_json)]
-                        if pr.entities_json
-                        else None
-                    ),
+            return [_paragraph_from_row(pr) for pr in result]
+
+    async def get_embedding_matrix(
+        self, document_id: str
+    ) -> tuple[list[str], np.ndarray]:
+        """Return ``(paragraph_ids, matrix)`` for every embedded paragraph of a book.
+
+        Rows are in reading order and aligned with *paragraph_ids*.  The stored
+        blobs are concatenated once and viewed as a single read-only float32
+        array, so no per-value Python floats are created — a whole book loads
+        in milliseconds.  Paragraphs without an embedding are left out.
+        """
+        import numpy as np  # noqa: PLC0415
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(_ParagraphRow.id, _ParagraphRow.embedding_blob)
+                .where(
+                    _ParagraphRow.document_id == document_id,
+                    _ParagraphRow.embedding_blob.isnot(None),
                 )
-                for pr in result.scalars().all()
-            ]
+                .order_by(_ParagraphRow.chapter_number, _ParagraphRow.position)
+            )
+            rows = result.all()
+
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32)
+        matrix = np.frombuffer(b"".join(r.embedding_blob for r in rows), dtype=np.float32)
+        return [r.id for r in rows], matrix.reshape(len(rows), -1)
 
     async def get_paragraphs_by_entity(
         self,
@@ -512,40 +1282,36 @@ class DocumentService:
     ) -> list[tuple[str, int, str | None, Paragraph]]:
         """Return paragraphs that mention a specific entity.
 
+        An indexed lookup on ``paragraph_entities`` joined back to the
+        paragraph and chapter rows.  Paragraphs come back with text and all
+        their entity mentions but without embeddings.
+
         Returns a list of (chapter_id, chapter_number, chapter_title, Paragraph)
         tuples, ordered by chapter_number then position.
         """
+        mentioning = (
+            select(_ParagraphEntityRow.paragraph_id)
+            .where(
+                _ParagraphEntityRow.document_id == document_id,
+                _ParagraphEntityRow.entity_id == entity_id,
+            )
+        )
         async with self._session_factory() as session:
             query = (
-                select(_ParagraphRow, _ChapterRow.id, _ChapterRow.title)
-                .join(_ChapterRow, _ParagraphRow.chapter_id == _ChapterRow.id)
-                .where(
-                    _ParagraphRow.document_id == document_id,
-                    _ParagraphRow.entities_json.isnot(None),
+                select(
+                    *_paragraph_columns(PROJECTION_NO_EMBEDDINGS),
+                    _ChapterRow.title.label("chapter_title"),
                 )
+                .join(_ChapterRow, _ParagraphRow.chapter_id == _ChapterRow.id)
+                .where(_ParagraphRow.id.in_(mentioning))
                 .order_by(_ParagraphRow.chapter_number, _ParagraphRow.position)
             )
-            result = await session.execute(query)
-            rows = result.all()
+            rows = (await session.execute(query)).all()
 
-        matches: list[tuple[str, int, str | None, Paragraph]] = []
-        for pr, ch_id, ch_title in rows:
-            entities_list = json.loads(pr.entities_json)
-            if not any(e.get("entity_id") == entity_id for e in entities_list):
-                continue
-            paragraph = Paragraph(
-                id=pr.id,
-                text=pr.text,
-                chapter_number=pr.chapter_number,
-                position=pr.position,
-                role=ParagraphRole(pr.role) if pr.role else ParagraphRole.body,
-                embedding=(
-                    json.loads(pr.embedding_json) if pr.embedding_json else None
-                ),
-                entities=[ParagraphEntity(**e) for e in entities_list],
-            )
-            matches.append((ch_id, pr.chapter_number, ch_title, paragraph))
-        return matches
+        return [
+            (r.chapter_id, r.chapter_number, r.chapter_title, _paragraph_from_row(r))
+            for r in rows
+        ]
 
     async def get_book_summary(self, document_id: str) -> str | None:
         """Return the book-level summary for a document, or None."""
@@ -570,6 +1336,7 @@ class DocumentService:
                 row = result.scalar_one_or_none()
                 if row is not None:
                     row.summary = summary
+        self._invalidate(document_id)
 
     async def save_book_summary(self, document_id: str, summary: str) -> None:
         """Update (or set) the book-level summary for a document."""
@@ -578,6 +1345,7 @@ class DocumentService:
                 row = await session.get(_DocumentRow, document_id)
                 if row is not None:
                     row.summary = summary
+        self._invalidate(document_id)
 
     # ── Keywords ─────────────────────────────────────────────────────────────
 
@@ -596,6 +1364,7 @@ class DocumentService:
                 row = result.scalar_one_or_none()
                 if row is not None:
                     row.keywords_json = json.dumps(keywords, ensure_ascii=False)
+        self._invalidate(document_id)
 
     async def get_chapter_keywords(
         self, document_id: str, chapter_number: int
@@ -622,6 +1391,7 @@ class DocumentService:
                 row = await session.get(_DocumentRow, document_id)
                 if row is not None:
                     row.keywords_json = json.dumps(keywords, ensure_ascii=False)
+        self._invalidate(document_id)
 
     async def get_book_keywords(self, document_id: str) -> dict[str, float] | None:
         """Return keyword scores for a book, or None."""
@@ -634,63 +1404,170 @@ class DocumentService:
                 return None
             return json.loads(raw)
 
+    async def get_keywords_for_chapters(
+        self, document_id: str, chapter_numbers: Iterable[int]
+    ) -> dict[int, dict[str, float]]:
+        """Return keyword scores for several chapters in one indexed query.
+
+        Keyed by chapter number; each dict is ordered by descending score.
+        Chapters without keywords (or that don't exist) are absent.
+        """
+        numbers = sorted(set(chapter_numbers))
+        if not numbers:
+            return {}
+        async with self._session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(
+                        _ChapterKeywordRow.chapter_number,
+                        _ChapterKeywordRow.keyword,
+                        _ChapterKeywordRow.score,
+                    )
+                    .where(
+                        _ChapterKeywordRow.document_id == document_id,
+                        _ChapterKeywordRow.chapter_number.in_(numbers),
+                    )
+                    .order_by(_ChapterKeywordRow.chapter_number, _ChapterKeywordRow.score.desc())
+                )
+            ).all()
+        result: dict[int, dict[str, float]] = {}
+        for number, keyword, score in rows:
+            result.setdefault(number, {})[keyword] = score
+        return result
+
     async def search_chapters_by_keyword(
         self, document_id: str, keyword: str
     ) -> list[ChapterKeywordMatch]:
-        """Find chapters containing a specific keyword."""
+        """Find chapters containing a specific keyword (indexed on ``chapter_keywords``)."""
         async with self._session_factory() as session:
-            result = await session.execute(
-                select(_ChapterRow).where(
-                    _ChapterRow.document_id == document_id,
-                    _ChapterRow.keywords_json.isnot(None),
-                ).order_by(_ChapterRow.number)
-            )
-            matches: list[ChapterKeywordMatch] = []
-            keyword_lower = keyword.lower()
-            for row in result.scalars().all():
-                kws = json.loads(row.keywords_json)
-                if keyword_lower in kws:
-                    matches.append(ChapterKeywordMatch(
-                        chapter_number=row.number,
-                        title=row.title,
-                        score=kws[keyword_lower],
-                    ))
-            return matches
+            rows = (
+                await session.execute(
+                    select(_ChapterKeywordRow.chapter_number, _ChapterRow.title, _ChapterKeywordRow.score)
+                    .join(
+                        _ChapterRow,
+                        and_(
+                            _ChapterRow.document_id == _ChapterKeywordRow.document_id,
+                            _ChapterRow.number == _ChapterKeywordRow.chapter_number,
+                        ),
+                    )
+                    .where(
+                        _ChapterKeywordRow.document_id == document_id,
+                        _ChapterKeywordRow.keyword == keyword.lower(),
+                    )
+                    .order_by(_ChapterKeywordRow.chapter_number)
+                )
+            ).all()
+        return [
+            ChapterKeywordMatch(chapter_number=number, title=title, score=score)
+            for number, title, score in rows
+        ]
 
     async def search_paragraphs_by_text(
         self,
         query: str,
         document_id: str | None = None,
         top_k: int = 20,
+        *,
+        match_any: bool = False,
     ) -> list[VectorSearchResult]:
-        """Full-text search on paragraph text using SQLite LIKE (AND for multiple tokens).
-
-        Each space-separated token must appear in the paragraph (AND semantics).
-        Score = total occurrence count of all tokens; results sorted descending.
+        """Full-text search on paragraph text (AND across space-separated tokens).
+
+        Backed by the ``paragraphs_fts`` trigram index: tokens of three or
+        more characters go through ``MATCH`` and results are ordered by BM25;
+        shorter tokens (two-character CJK names) can't be matched by a
+        trigram index and are applied as a ``LIKE`` filter on the candidates.
+        A query made only of short tokens — or a SQLite without FTS5 — falls
+        back to a ``LIKE`` scan ordered by occurrence count.
+
+        With *match_any*, a paragraph needs only one of the tokens (OR), which
+        suits natural-language queries such as the hybrid retriever's; BM25
+        still puts paragraphs matching more of them first.  Such a query is
+        first reduced to its content words: punctuation around tokens is
+        stripped, and English stop words and ASCII tokens under three
+        characters are dropped — OR-ed, they would match nearly every
+        paragraph.  Short CJK tokens are kept for the ``LIKE`` fallback.
+
+        ``score`` is the BM25 relevance, negated so larger is better, and the
+        results are ordered by it; the ``LIKE`` fallback scores by the total
+        occurrence count of all tokens instead.  ``snippet`` marks matches
+        with ``<mark>`` tags when the index was used.
         """
         tokens = [t for t in query.strip().split() if t]
+        if match_any:
+            tokens = _content_tokens(tokens)
         if not tokens:
             return []
+        long_tokens = [t for t in tokens if len(t) >= _FTS_MIN_TOKEN_CHARS]
+        if not self._fts_enabled or not long_tokens:
+            return await self._search_paragraphs_by_like(
+                tokens, document_id, top_k, match_any=match_any
+            )
+
+        short_tokens = [] if match_any else [t for t in tokens if len(t) < _FTS_MIN_TOKEN_CHARS]
+        operator = " OR " if match_any else " AND "
+        match = operator.join('"' + t.replace('"', '""') + '"' for t in long_tokens)
+        params: dict = {"match": match, "top_k": top_k}
+        filters = ""
+        if document_id:
+            filters += " AND p.document_id = :document_id"
+            params["document_id"] = document_id
+        for i, token in enumerate(short_tokens):
+            filters += f" AND p.text LIKE :short{i}"
+            params[f"short{i}"] = f"%{token}%"
+
+        sql = sa_text(
+            "SELECT p.id, p.text, p.document_id, p.chapter_number, p.position, "
+            "snippet(paragraphs_fts, 0, '<mark>', '</mark>', '…', 32) AS snippet, "
+            "-bm25(paragraphs_fts) AS score "
+            "FROM paragraphs_fts JOIN paragraphs AS p ON p.rowid = paragraphs_fts.rowid "
+            f"WHERE paragraphs_fts MATCH :match{filters} "
+            "ORDER BY score DESC LIMIT :top_k"
+        )
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(sql, params)).all()
+
+        return [
+            VectorSearchResult(
+                id=r.id,
+                score=r.score,
+                text=r.text,
+                document_id=r.document_id,
+                chapter_number=r.chapter_number,
+                position=r.position,
+                snippet=r.snippet,
+            )
+            for r in rows
+        ]
 
+    async def _search_paragraphs_by_like(
+        self,
+        tokens: list[str],
+        document_id: str | None,
+        top_k: int,
+        *,
+        match_any: bool = False,
+    ) -> list[VectorSearchResult]:
+        """Unindexed fallback: one ``LIKE`` per token, scored by occurrence count."""
         async with self._session_factory() as session:
-            stmt = select(_ParagraphRow)
+            stmt = select(
+                _ParagraphRow.id,
+                _ParagraphRow.text,
+                _ParagraphRow.document_id,
+                _ParagraphRow.chapter_number,
+                _ParagraphRow.position,
+            )
             if document_id:
                 stmt = stmt.where(_ParagraphRow.document_id == document_id)
-            for token in tokens:
-                stmt = stmt.where(_ParagraphRow.text.ilike(f"%{token}%"))
-
-            result = await session.execute(stmt)
-            rows = result.scalars().all()
+            likes = [_ParagraphRow.text.ilike(f"%{token}%") for token in tokens]
+            stmt = stmt.where(or_(*likes) if match_any else and_(*likes))
 
-        def _score(text: str) -> float:
-            text_lower = text.lower()
-            return float(sum(text_lower.count(t.lower()) for t in tokens))
+            rows = (await session.execute(stmt)).all()
 
         return sorted(
             [
                 VectorSearchResult(
                     id=r.id,
-                    score=_score(r.text),
+                    score=_occurrence_score(r.text, tokens),
                     text=r.text,
                     document_id=r.document_id,
                     chapter_number=r.chapter_number,
@@ -723,6 +1600,7 @@ class DocumentService:
                         _DocumentRow.id == document_id
                     )
                 )
+        self._invalidate(document_id)
         logger.debug(
             "DocumentService.delete_document: id=%s", document_id
         )
@@ -0,0 +1,103 @@
+"""HybridSearchService — BM25 full-text and dense retrieval, fused by rank.
+
+Full-text search (``DocumentService.search_paragraphs_by_text``) finds exact
+names and phrasing the embedding model blurs; semantic search
+(``VectorService.search``) finds paraphrases with no word in common.  This
+service runs both for the same query, concurrently, and merges them with
+reciprocal rank fusion: a paragraph at rank *r* (1-based) of a leg scores
+``1 / (k + r)``, summed over the legs that returned it.  RRF needs no score
+normalisation — BM25 and cosine scores are not comparable — and no LLM call.
+
+Both legs index paragraphs by the same id (Qdrant points are upserted with
+the paragraph's id), so a paragraph found by both appears once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+from storysphere.services.query_models import VectorSearchResult
+
+logger = logging.getLogger(__name__)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[VectorSearchResult]], k: int = 60
+) -> list[VectorSearchResult]:
+    """Fuse best-first *rankings* into one, scored ``sum(1 / (k + rank))``.
+
+    A paragraph in several rankings keeps the first ranking's fields, except
+    that a ``snippet`` from any of them is kept.
+    """
+    fused: dict[str, VectorSearchResult] = {}
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, start=1):
+            scores[result.id] = scores.get(result.id, 0.0) + 1.0 / (k + rank)
+            seen = fused.get(result.id)
+            if seen is None:
+                fused[result.id] = result
+            elif seen.snippet is None and result.snippet is not None:
+                fused[result.id] = seen.model_copy(update={"snippet": result.snippet})
+    order = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [fused[pid].model_copy(update={"score": scores[pid]}) for pid in order]
+
+
+class HybridSearchService:
+    """Paragraph search combining the full-text index and the vector index.
+
+    Usage::
+
+        svc = HybridSearchService(vector_service, doc_service)
+        results = await svc.search("黛玉葬花", document_id="book-123")
+    """
+
+    def __init__(
+        self,
+        vector_service,
+        doc_service,
+        *,
+        candidates: int | None = None,
+        rrf_k: int | None = None,
+    ) -> None:
+        from storysphere.config.settings import get_settings  # noqa: PLC0415
+
+        settings = get_settings()
+        self._vector = vector_service
+        self._doc = doc_service
+        self._candidates = candidates or settings.hybrid_search_candidates
+        self._rrf_k = rrf_k or settings.hybrid_search_rrf_k
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        document_id: str | None = None,
+    ) -> list[VectorSearchResult]:
+        """Best *top_k* paragraphs for *query*, by fused rank.
+
+        ``score`` is the RRF score (at most ``2 / (k + 1)``).  If one leg
+        fails — Qdrant down, no full-text index — the other's ranking is
+        returned alone; if both fail, the first error is raised.
+        """
+        depth = max(top_k, self._candidates)
+        lexical, dense = await asyncio.gather(
+            self._doc.search_paragraphs_by_text(
+                query, document_id=document_id, top_k=depth, match_any=True
+            ),
+            self._vector.search(query_text=query, top_k=depth, document_id=document_id),
+            return_exceptions=True,
+        )
+        rankings = []
+        for leg, res in (("full-text", lexical), ("semantic", dense)):
+            if isinstance(res, BaseException):
+                if not isinstance(res, Exception):  # cancellation
+                    raise res
+                logger.warning("Hybrid search: %s leg failed: %s", leg, res)
+                continue
+            rankings.append(res)
+        if not rankings:
+            raise lexical
+        return reciprocal_rank_fusion(rankings, self._rrf_k)[:top_k]
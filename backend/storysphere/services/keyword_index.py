@@ -0,0 +1,64 @@
+"""keyword_index — per-book inverted index behind ``VectorService.search_by_keyword``.
+
+A Qdrant filter on the ``keywords`` payload finds the paragraphs tagged with a
+keyword, but only in storage order; ranking them by their ``keyword_scores``
+would mean reading every match.  ``KeywordIndex`` keeps, per keyword, the
+score of every paragraph tagged with it, so the best ``top_k`` are a heap
+selection away and only those points need fetching.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Mapping
+
+
+class KeywordIndex:
+    """keyword → {point id → score} for one book's paragraphs.
+
+    Keywords are matched lower-cased, as the keyword extractors emit them.
+    A paragraph listed under a keyword without a score ranks at 0.
+    """
+
+    __slots__ = ("_postings", "_point_keywords")
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, float]] = {}
+        self._point_keywords: dict[str, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._point_keywords)
+
+    @classmethod
+    def from_payloads(cls, points: Iterable[tuple[str, Mapping]]) -> KeywordIndex:
+        """Build from ``(point id, payload)`` pairs."""
+        index = cls()
+        for point_id, payload in points:
+            index.add(point_id, payload.get("keywords") or (), payload.get("keyword_scores") or {})
+        return index
+
+    def add(self, point_id: str, keywords: Iterable[str], scores: Mapping[str, float]) -> None:
+        """Index (or re-index) a paragraph's keywords and their scores."""
+        self.discard(point_id)
+        ranked = {kw.lower(): float(score) for kw, score in scores.items()}
+        for kw in keywords:
+            ranked.setdefault(kw.lower(), 0.0)
+        for kw, score in ranked.items():
+            self._postings.setdefault(kw, {})[point_id] = score
+        if ranked:
+            self._point_keywords[point_id] = tuple(ranked)
+
+    def discard(self, point_id: str) -> None:
+        """Forget a paragraph, if indexed."""
+        for kw in self._point_keywords.pop(point_id, ()):
+            posting = self._postings[kw]
+            del posting[point_id]
+            if not posting:
+                del self._postings[kw]
+
+    def top(self, keyword: str, k: int) -> list[tuple[float, str]]:
+        """The *k* best ``(score, point id)`` for *keyword*, best first."""
+        posting = self._postings.get(keyword.lower())
+        if not posting:
+            return []
+        return heapq.nlargest(k, ((score, pid) for pid, score in posting.items()))
@@ -31,7 +31,7 @@ logger = logging.getLogger(__name__)
 
 # -- Stop words (minimal English set for TF-IDF) ----------------------------
 
-_STOP_WORDS = frozenset(
+STOP_WORDS = frozenset(
     "a an the and or but if in on at to for of is it its this that was were "
     "be been being have has had do does did will would shall should may might "
     "can could not no nor so yet also very too just about above after again "
@@ -229,7 +229,7 @@ class TfidfKeywordExtractor(BaseKeywordExtractor):
 
         # Tokenize: lowercase, keep only alphabetic tokens ≥ 3 chars
         words = re.findall(r"[a-zA-Z]{3,}", text.lower())
-        words = [w for w in words if w not in _STOP_WORDS]
+        words = [w for w in words if w not in STOP_WORDS]
 
         if not words:
             return {}
@@ -397,7 +397,7 @@ class KeywordService:
         """Get keywords relevant to a specific entity.
 
         Strategy: find chapters where the entity appears (via KGService timeline),
-        then aggregate per-chapter keywords. Falls back to book-level keywords
+        fetch their keywords in one batched query, then aggregate. Falls back to book-level keywords
         if kg_service is unavailable or the entity has no timeline.
         """
         chapter_keywords: list[dict[str, float]] = []
@@ -407,14 +407,15 @@ class KeywordService:
                 entity = await self._kg_service.get_entity_by_name(entity_name)
                 if entity is not None:
                     events = await self._kg_service.get_entity_timeline(entity.id)
-                    chapters_seen: set[int] = set()
-                    for evt in events:
-                        ch = getattr(evt, "chapter_number", None)
-                        if ch is not None and ch not in chapters_seen:
-                            chapters_seen.add(ch)
-                            kws = await self.get_chapter_keywords(document_id, ch)
-                            if kws:
-                                chapter_keywords.append(kws)
+                    chapters = {
+                        ch
+                        for evt in events
+                        if (ch := getattr(evt, "chapter_number", None)) is not None
+                    }
+                    by_chapter = await self._doc_service.get_keywords_for_chapters(
+                        document_id, chapters
+                    )
+                    chapter_keywords = [kws for _, kws in sorted(by_chapter.items()) if kws]
             except Exception:
                 logger.warning(
                     "Failed to get entity timeline for %r, falling back to book keywords",
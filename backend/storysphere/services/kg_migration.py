@@ -16,11 +16,9 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any
 
 from storysphere.core.utils.url_masking import mask_url
 
@@ -36,11 +34,11 @@ async def migrate_networkx_to_neo4j(
     batch_size: int = 100,
     verbose: bool = False,
 ) -> dict[str, int]:
-    """Load the NetworkX JSON dump and write it into Neo4j.
+    """Load the NetworkX KG from disk and write it into Neo4j.
 
     Args:
-        json_path:  Path to the ``knowledge_graph.json`` file produced by
-                    ``KGService.save()``.
+        json_path:  Path to the ``knowledge_graph.json`` manifest (or legacy
+                    single-file snapshot) produced by ``KGService.save()``.
         neo4j_url:  Bolt URL, e.g. ``bolt://localhost:7687``.
         user:       Neo4j username.
         password:   Neo4j password.
@@ -50,23 +48,22 @@ async def migrate_networkx_to_neo4j(
     Returns:
         Dict with counts: ``{entities, relations, events, temporal_relations}``.
     """
-    from storysphere.domain.entities import Entity  # noqa: PLC0415
-    from storysphere.domain.events import Event  # noqa: PLC0415
-    from storysphere.domain.relations import Relation, RelationType  # noqa: PLC0415
-    from storysphere.domain.temporal import TemporalRelation  # noqa: PLC0415
+    from storysphere.services.kg_service import KGService  # noqa: PLC0415
     from storysphere.services.kg_service_neo4j import Neo4jKGService  # noqa: PLC0415
 
     path = Path(json_path)
     if not path.exists():
         raise FileNotFoundError(f"Migration source not found: {json_path}")
 
-    with open(path, encoding="utf-8") as fh:
-        payload: dict[str, Any] = json.load(fh)
-
-    entities_raw: dict[str, Any] = payload.get("entities", {})
-    events_raw: dict[str, Any] = payload.get("events", {})
-    temporal_raw: dict[str, Any] = payload.get("temporal_relations", {})
-    edges_raw: list[dict[str, Any]] = payload.get("edges", [])
+    # Read through KGService so both the sharded layout and legacy
+    # single-file snapshots are accepted.  Read-only: the API may be running
+    # on the same graph, and a loading writer would save and empty its log.
+    source = KGService(persistence_path=str(path), read_only=True)
+    await source.load()
+    entity_list = await source.list_entities()
+    event_list = await source.get_events()
+    relation_list = await source.list_relations()  # one per relation, no _rev edges
+    tr_list = await source.get_temporal_relations()
 
     svc = Neo4jKGService(url=neo4j_url, user=user, password=password)
     await svc.verify_connectivity()
@@ -80,58 +77,31 @@ async def migrate_networkx_to_neo4j(
     }
 
     # ── Entities ─────────────────────────────────────────────────────────────
-    entity_list = list(entities_raw.values())
     for i in range(0, len(entity_list), batch_size):
-        batch = entity_list[i : i + batch_size]
-        for edata in batch:
-            entity = Entity.model_validate(edata)
+        for entity in entity_list[i : i + batch_size]:
             await svc.add_entity(entity)
             counts["entities"] += 1
         if verbose:
             logger.info("Entities: %d / %d", counts["entities"], len(entity_list))
 
     # ── Events ────────────────────────────────────────────────────────────────
-    event_list = list(events_raw.values())
     for i in range(0, len(event_list), batch_size):
-        batch = event_list[i : i + batch_size]
-        for evdata in batch:
-            event = Event.model_validate(evdata)
+        for event in event_list[i : i + batch_size]:
             await svc.add_event(event)
             counts["events"] += 1
         if verbose:
             logger.info("Events: %d / %d", counts["events"], len(event_list))
 
-    # ── Relations (from edge list, skip _rev duplicates) ─────────────────────
-    seen_ids: set[str] = set()
-    for edge in edges_raw:
-        key: str = edge.get("key", "")
-        if key.endswith("_rev"):
-            continue
-        if key in seen_ids:
-            continue
-        seen_ids.add(key)
-        relation = Relation(
-            id=key,
-            document_id=edge.get("document_id"),
-            source_id=edge["source"],
-            target_id=edge["target"],
-            relation_type=RelationType(edge.get("relation_type", "other")),
-            description=edge.get("description"),
-            weight=float(edge.get("weight", 1.0)),
-            chapters=edge.get("chapters", []),
-            is_bidirectional=bool(edge.get("is_bidirectional", False)),
-        )
+    # ── Relations ─────────────────────────────────────────────────────────────
+    for relation in relation_list:
         await svc.add_relation(relation)
         counts["relations"] += 1
         if verbose and counts["relations"] % batch_size == 0:
             logger.info("Relations: %d", counts["relations"])
 
     # ── Temporal relations ────────────────────────────────────────────────────
-    tr_list = list(temporal_raw.values())
     for i in range(0, len(tr_list), batch_size):
-        batch = tr_list[i : i + batch_size]
-        for trdata in batch:
-            tr = TemporalRelation.model_validate(trdata)
+        for tr in tr_list[i : i + batch_size]:
             await svc.add_temporal_relation(tr)
             counts["temporal_relations"] += 1
         if verbose:
@@ -167,7 +137,8 @@ async def migrate_neo4j_to_networkx(
         neo4j_url:  Bolt URL, e.g. ``bolt://localhost:7687``.
         user:       Neo4j username.
         password:   Neo4j password.
-        json_path:  Destination path for ``knowledge_graph.json``.
+        json_path:  Destination path for the ``knowledge_graph.json`` manifest;
+                    shards go to the sibling ``.shards/`` directory.
         verbose:    Emit progress logs when True.
 
     Returns:
@@ -1,8 +1,11 @@
 """KGService — NetworkX-backed in-memory knowledge graph.
 
 Provides a thin async interface for adding and querying entities, relations,
-and events.  The graph is persisted to a JSON file on save and loaded on
-startup (if the file exists).
+and events.  The graph is persisted as one shard per book (a compact binary
+snapshot, see ``kg_snapshot``) plus a JSON manifest on save — see ``save``.
+On startup ``load`` reads the manifest and, by default, defers each book
+until it is first queried — see ``load``.  Mutations between saves are
+appended to a log (``kg_wal``) that ``load`` replays.
 
 This class implements KGServiceBase.  For the Neo4j backend see
 ``kg_service_neo4j.Neo4jKGService``.
@@ -10,8 +13,20 @@ This class implements KGServiceBase.  For the Neo4j backend see
 
 from __future__ import annotations
 
+import gc
+import hashlib
+import itertools
 import json
 import logging
+import os
+import re
+import stat
+import tempfile
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -19,13 +34,18 @@ import networkx as nx
 
 from storysphere.domain.entities import Entity, EntityType
 from storysphere.domain.events import Event
-from storysphere.domain.relations import Relation
+from storysphere.domain.relations import Relation, RelationType
 from storysphere.domain.temporal import TemporalRelation
-from storysphere.services.kg_service_base import KGServiceBase
+from storysphere.services.kg_paths import cheapest_paths
+from storysphere.services.kg_service_base import KGServiceBase, check_update_fields
+from storysphere.services.kg_snapshot import decode_shard, encode_snapshot, read_header_file
+from storysphere.services.kg_timeline import TimelineIndex
+from storysphere.services.kg_wal import MUTATION_LOG_NAME, MutationLog
 from storysphere.services.query_models import (
     PathNode,
     RelationPath,
     RelationStats,
+    SnapshotDelta,
     Subgraph,
     SubgraphEdge,
     SubgraphNode,
@@ -33,6 +53,218 @@ from storysphere.services.query_models import (
 
 logger = logging.getLogger(__name__)
 
+#: Identifies one graph edge: (source, target, key).
+EdgeId = tuple[str, str, str]
+
+#: ``format`` of the manifest written at ``kg_persistence_path``.  A file
+#: without it is a legacy single-file snapshot.
+_MANIFEST_FORMAT = "storysphere-kg-shards"
+_MANIFEST_VERSION = 2  # 2: shards may be binary snapshots
+
+#: Mutations recorded in the log whose argument is a model, by method name.
+_LOGGED_MODELS: dict[str, type[Any]] = {
+    "add_entity": Entity,
+    "add_relation": Relation,
+    "add_event": Event,
+    "add_temporal_relation": TemporalRelation,
+}
+#: The same for mutations whose argument is a list of models.
+_LOGGED_MODEL_LISTS: dict[str, type[Any]] = {
+    "add_entities": Entity,
+    "add_relations": Relation,
+    "add_events": Event,
+}
+
+#: Entity fields mirrored in the graph node's attributes (``_entity_attrs``)
+#: or the name index.
+_NODE_ENTITY_FIELDS = frozenset({"name", "aliases", "entity_type", "mention_count"})
+
+#: Shard file stem for records whose ``document_id`` is None.  Document
+#: shards never start with an underscore, so the two cannot collide.
+_UNASSIGNED_SHARD = "_unassigned"
+_SAFE_SHARD_STEM = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,99}")
+
+
+class _SecondaryIndex:
+    """Lookup key → ids, in insertion order, maintained alongside a primary dict.
+
+    Remembers the keys each id was filed under, so re-filing an id after its
+    object changed (a re-added entity with new aliases) and dropping an id
+    both stay exact without rescanning.  Ids keep their position when
+    re-filed under a key they already had.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[Hashable, dict[Hashable, None]] = {}
+        self._keys: dict[Hashable, tuple[Hashable, ...]] = {}
+
+    def set(self, item_id: Hashable, keys: Iterable[Hashable]) -> None:
+        new = tuple(dict.fromkeys(keys))
+        for key in self._keys.get(item_id, ()):
+            if key not in new:
+                self._drop(key, item_id)
+        for key in new:
+            self._ids.setdefault(key, {})[item_id] = None
+        self._keys[item_id] = new
+
+    def set_all(self, item_ids: list, key: Hashable) -> set:
+        """``set(item_id, [key])`` for every id, in bulk; for loading.
+
+        Returns the other keys re-filed ids were moved away from.
+        """
+        if not item_ids:
+            return set()
+        new = (key,)
+        moved: set = set()
+        bucket = self._ids.setdefault(key, {})
+        for item_id in item_ids:
+            old = self._keys.get(item_id, new)
+            if old != new:
+                moved.update(k for k in old if k != key)
+                self.set(item_id, new)
+            else:
+                bucket[item_id] = None
+                self._keys[item_id] = new
+        return moved
+
+    def discard(self, item_id: Hashable) -> None:
+        for key in self._keys.pop(item_id, ()):
+            self._drop(key, item_id)
+
+    def get(self, key: Hashable) -> list:
+        """Ids filed under *key*, as a list the caller may mutate the index under."""
+        return list(self._ids.get(key, ()))
+
+    def keys(self) -> list:
+        """Every key with at least one id filed under it."""
+        return list(self._ids)
+
+    def keys_of(self, item_id: Hashable) -> tuple[Hashable, ...]:
+        """The keys *item_id* is currently filed under."""
+        return self._keys.get(item_id, ())
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._keys.clear()
+
+    def _drop(self, key: Hashable, item_id: Hashable) -> None:
+        bucket = self._ids.get(key)
+        if bucket is not None:
+            bucket.pop(item_id, None)
+            if not bucket:
+                del self._ids[key]
+
+
+class _RelationTally:
+    """Running relation-type counts and weight summary over a changing set of relations.
+
+    ``add`` and ``remove`` are O(1).  The weight extremes are kept until the
+    last relation carrying one is removed; ``stats`` then finds them again
+    among the distinct weights.
+    """
+
+    __slots__ = ("total", "types", "weights", "weight_sum", "_low", "_high")
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.types: Counter[str] = Counter()
+        self.weights: Counter[float] = Counter()  # weight → relations carrying it
+        self.weight_sum = 0.0
+        self._low: float | None = None  # None: not known, recomputed on read
+        self._high: float | None = None
+
+    def add(self, relation_type: str, weight: float) -> None:
+        self.total += 1
+        self.types[relation_type] += 1
+        self.weights[weight] += 1
+        self.weight_sum += weight
+        if self.total == 1:
+            self._low = self._high = weight
+        else:
+            if self._low is not None and weight < self._low:
+                self._low = weight
+            if self._high is not None and weight > self._high:
+                self._high = weight
+
+    def remove(self, relation_type: str, weight: float) -> None:
+        self.total -= 1
+        _decrement(self.types, relation_type)
+        if not _decrement(self.weights, weight):
+            if weight == self._low:
+                self._low = None
+            if weight == self._high:
+                self._high = None
+        # Start an emptied tally from an exact zero, not accumulated rounding.
+        self.weight_sum = self.weight_sum - weight if self.total else 0.0
+
+    def add_many(self, relations: list[tuple[str, float]]) -> None:
+        """``add`` for each ``(relation_type, weight)``, in bulk."""
+        types, weights = zip(*relations, strict=True)
+        was_empty = not self.total
+        self.total += len(relations)
+        self.types.update(types)
+        self.weights.update(weights)
+        self.weight_sum += sum(weights)
+        low, high = min(weights), max(weights)
+        if was_empty:
+            self._low, self._high = low, high
+        else:
+            if self._low is not None and low < self._low:
+                self._low = low
+            if self._high is not None and high > self._high:
+                self._high = high
+
+    def merge(self, other: _RelationTally) -> None:
+        self.total += other.total
+        self.types.update(other.types)
+        self.weights.update(other.weights)
+        self.weight_sum += other.weight_sum
+        self._low = self._high = None
+
+    def stats(self) -> RelationStats:
+        if not self.total:
+            return RelationStats(total_relations=0, weight_avg=0.0, weight_min=0.0, weight_max=0.0)
+        if self._low is None:
+            self._low = min(self.weights)
+        if self._high is None:
+            self._high = max(self.weights)
+        return RelationStats(
+            total_relations=self.total,
+            type_distribution=dict(self.types),
+            weight_avg=self.weight_sum / self.total,
+            weight_min=self._low,
+            weight_max=self._high,
+        )
+
+
+#: ``_RelationTally.add`` or ``_RelationTally.remove``.
+_TallyOp = Callable[[_RelationTally, str, float], None]
+
+
+def _apply_tally(
+    tallies: dict[Hashable, _RelationTally],
+    key: Hashable,
+    apply: _TallyOp,
+    relation: tuple[str, float],
+) -> None:
+    """Apply *apply* to the tally at *key*, creating it first and dropping it once empty."""
+    tally = tallies.get(key)
+    if tally is None:
+        tally = tallies[key] = _RelationTally()
+    apply(tally, *relation)
+    if not tally.total:
+        del tallies[key]
+
+
+def _decrement(counter: Counter, key: Hashable) -> int:
+    """Count one *key* out of *counter*, dropping it at zero; returns what is left."""
+    left = counter[key] - 1
+    if left:
+        counter[key] = left
+    else:
+        del counter[key]
+    return left
+
 
 class KGService(KGServiceBase):
     """NetworkX-backed knowledge graph service.
@@ -42,44 +274,190 @@ class KGService(KGServiceBase):
     - Edges represent relations (edge key = Relation.id).
     - Events are stored as node attributes on a special "_events" list.
 
+    Every book in the process shares one graph, so document-, name- and
+    participant-scoped queries go through secondary indexes (``_SecondaryIndex``)
+    kept in step by ``add_*``, ``remove_*`` and ``load`` — they cost the size
+    of the answer, not the size of the graph.  Relation statistics are
+    running tallies (``_RelationTally``) per book, and per entity and book
+    from the first time an entity's are asked for, updated as edges are
+    written and removed.
+
+    Persistence is sharded per book: every mutation marks the books it
+    touches dirty and ``save`` rewrites only those shards.  Mutate through
+    ``add_*`` / ``update_*`` / ``remove_*`` — an entity or event changed in
+    place after ``get_*`` is not seen as a change and is not saved.
+    Relations are built from edge attributes once and then shared between
+    calls until the edge changes, so the same applies to them.  Each
+    such call is also appended to the mutation log, so it survives a crash
+    before the next ``save`` (see ``kg_wal``).
+
+    With lazy loading, books listed in the manifest stay on disk ("cold")
+    until a method needs them: document-scoped calls load that book, id- and
+    name-based calls the book the shard headers place the id in, and
+    unscoped calls (``list_entities()`` with no filter, global stats) the
+    whole library.  With ``max_resident_books`` the least recently used
+    books that are saved and unchanged are unloaded again.  Relations and
+    event participants that cross books are only seen while both are loaded.
+
+    ``read_only=True`` is for readers of a graph another instance may be
+    writing (migrations, exports): ``load`` replays the mutation log in
+    memory but never saves or empties it, mutations are not logged, and
+    ``save`` raises.
+
     Thread-safety: All methods are async but internally synchronous.
     Do not share an instance across OS threads.
     """
 
-    def __init__(self, persistence_path: str | None = None) -> None:
+    def __init__(
+        self,
+        persistence_path: str | None = None,
+        *,
+        lazy: bool | None = None,
+        max_resident_books: int | None = None,
+        wal: bool | None = None,
+        wal_compact_records: int | None = None,
+        read_only: bool = False,
+    ) -> None:
         self._graph: nx.MultiDiGraph = nx.MultiDiGraph()
         self._events: dict[str, Event] = {}  # event_id → Event
         self._entities: dict[str, Entity] = {}  # entity_id → Entity
         self._temporal_relations: dict[str, TemporalRelation] = {}  # tr_id → TemporalRelation
 
+        # Secondary indexes over the dicts above and the graph's edges.
+        self._entities_by_document = _SecondaryIndex()  # document_id → entity ids
+        self._entities_by_name = _SecondaryIndex()  # lowercase name/alias → entity ids
+        self._events_by_document = _SecondaryIndex()  # document_id → event ids
+        self._events_by_participant = _SecondaryIndex()  # entity_id → event ids
+        self._temporal_by_document = _SecondaryIndex()  # document_id → tr ids
+        self._edges_by_document = _SecondaryIndex()  # document_id → EdgeIds
+
+        # Relations built from edge attributes by the read paths, kept until
+        # the edge is rewritten or removed (_add_edge, _add_edges_bulk, _remove_edge).
+        self._relation_cache: dict[EdgeId, Relation] = {}
+
+        # get_relation_stats tallies over the relations filed under each book,
+        # and per entity and book (its degree there) once that entity is asked for.
+        self._relation_stats: dict[Hashable, _RelationTally] = {}  # document_id →
+        self._entity_relation_stats: dict[str, dict[Hashable, _RelationTally]] = {}  # eid → doc →
+
         from storysphere.config.settings import get_settings  # noqa: PLC0415
 
         settings = get_settings()
         self._persistence_path = Path(
             persistence_path or settings.kg_persistence_path
         )
+        # knowledge_graph.json → knowledge_graph.shards/
+        self._shard_dir = self._persistence_path.with_name(
+            f"{self._persistence_path.stem}.shards"
+        )
+        self._shard_suffix = ".json" if settings.kg_snapshot_format == "json" else ".kgsnap"
+        self._shards: dict[str | None, dict[str, Any]] = {}  # manifest entries on disk
+        self._dirty_documents: set[str | None] = set()
+        self._manifest_stale = True
+
+        # Lazy loading: books in the manifest not loaded yet, and where their
+        # records are according to the shard headers.  These indexes file a
+        # document under its ids, so ``get(entity_id)`` gives its book.
+        self._lazy = settings.kg_lazy_load if lazy is None else lazy
+        self._max_resident_books = (
+            settings.kg_max_resident_books if max_resident_books is None else max_resident_books
+        )
+        self._cold: dict[str | None, dict[str, Any]] = {}  # document_id → manifest entry
+        self._cold_by_entity = _SecondaryIndex()  # entity id → cold document
+        self._cold_by_name = _SecondaryIndex()  # lowercase name/alias → cold documents
+        self._cold_by_event = _SecondaryIndex()  # event id → cold document
+        self._recent: OrderedDict[str | None, None] = OrderedDict()  # loaded books, LRU first
+
+        # Mutations since the last save; None with the log disabled.
+        wal = settings.kg_wal_enabled if wal is None else wal
+        self._wal = MutationLog(self._shard_dir / MUTATION_LOG_NAME) if wal else None
+        self._wal_compact_records = (
+            settings.kg_wal_compact_records if wal_compact_records is None else wal_compact_records
+        )
+        self._wal_muted = 0  # > 0 while loading or replaying
+        self._read_only = read_only
+
+        # get_relation_paths defaults.
+        self._path_max_results = settings.kg_path_max_results
+        self._path_time_budget_ms = settings.kg_path_time_budget_ms
+
+        # get_snapshot interval indexes, dropped by _touch when their book changes.
+        self._timelines: dict[tuple[str | None, str], TimelineIndex] = {}  # (book, mode) →
 
     # ── Entity operations ────────────────────────────────────────────────────
 
     async def add_entity(self, entity: Entity) -> None:
         """Add or replace an entity node in the graph."""
+        await self._require(entity.document_id, *self._cold_by_entity.get(entity.id))
+        self._touch(*self._entities_by_document.keys_of(entity.id), entity.document_id)
         self._entities[entity.id] = entity
+        self._index_entity(entity)
         self._graph.add_node(entity.id, **self._entity_attrs(entity))
+        await self._log("add_entity", entity)
         logger.debug("KGService.add_entity: %s (%s)", entity.name, entity.id)
 
+    async def add_entities(self, entities: Iterable[Entity]) -> None:
+        """Add or replace many entity nodes — one index pass per document."""
+        entities = list(entities)
+        if not entities:
+            return
+        await self._require(
+            *(e.document_id for e in entities),
+            *(d for e in entities for d in self._cold_by_entity.get(e.id)),
+        )
+        by_document: dict[str | None, list[str]] = {}
+        for entity in entities:
+            self._entities[entity.id] = entity
+            by_document.setdefault(entity.document_id, []).append(entity.id)
+            self._entities_by_name.set(
+                entity.id, [entity.name.lower(), *(a.lower() for a in entity.aliases)]
+            )
+        for document_id, entity_ids in by_document.items():
+            self._touch(document_id, *self._entities_by_document.set_all(entity_ids, document_id))
+        self._graph.add_nodes_from((e.id, self._entity_attrs(e)) for e in entities)
+        await self._log("add_entities", entities)
+        logger.debug("KGService.add_entities: %d entities", len(entities))
+
+    async def bulk_update_entity_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Set fields on existing entities: ``{entity_id: {field: value}}``."""
+        updates = check_update_fields(Entity, updates)
+        await self._require(*self._documents_of_entities(*updates))
+        applied: dict[str, dict[str, Any]] = {}
+        for entity_id, changes in updates.items():
+            entity = self._entities.get(entity_id)
+            if entity is None:
+                continue
+            for field, value in changes.items():
+                setattr(entity, field, value)
+            if not _NODE_ENTITY_FIELDS.isdisjoint(changes):
+                self._index_entity(entity)
+                self._graph.nodes[entity_id].update(self._entity_attrs(entity))
+            self._touch(entity.document_id)
+            applied[entity_id] = entity.model_dump(mode="json", include=set(changes))
+        if applied:
+            await self._log("bulk_update_entity_fields", applied)
+
     async def get_entity(self, entity_id: str) -> Entity | None:
         """Return the entity with the given ID, or None."""
+        await self._require(*self._documents_of_entities(entity_id))
         return self._entities.get(entity_id)
 
     async def get_entity_by_name(self, name: str) -> Entity | None:
-        """Return the first entity whose name or alias matches (case-insensitive)."""
-        name_lower = name.lower()
-        for entity in self._entities.values():
-            if entity.name.lower() == name_lower:
-                return entity
-            if any(a.lower() == name_lower for a in entity.aliases):
-                return entity
-        return None
+        """Return the first entity whose name or alias matches (case-insensitive).
+
+        Loaded books are searched first, then the first cold book listing the name.
+        """
+        ids = self._entities_by_name.get(name.lower())
+        if not ids:
+            await self._require(*self._cold_by_name.get(name.lower())[:1])
+            ids = self._entities_by_name.get(name.lower())
+        if not ids:
+            return None
+        entity = self._entities[ids[0]]
+        await self._require(entity.document_id)
+        return entity
 
     async def list_entities(
         self,
@@ -88,9 +466,13 @@ class KGService(KGServiceBase):
         extraction_method: str | None = None,
     ) -> list[Entity]:
         """Return all entities, optionally filtered by type, document, and/or extraction_method."""
-        entities = list(self._entities.values())
+        await self._require_scope(document_id)
         if document_id is not None:
-            entities = [e for e in entities if e.document_id == document_id]
+            entities = [
+                self._entities[eid] for eid in self._entities_by_document.get(document_id)
+            ]
+        else:
+            entities = list(self._entities.values())
         if entity_type is not None:
             entities = [e for e in entities if e.entity_type == entity_type]
         if extraction_method is not None:
@@ -101,6 +483,10 @@ class KGService(KGServiceBase):
 
     async def add_relation(self, relation: Relation) -> None:
         """Add a directed edge for the relation."""
+        await self._require(
+            relation.document_id,
+            *self._documents_of_entities(relation.source_id, relation.target_id),
+        )
         if relation.source_id not in self._graph or relation.target_id not in self._graph:
             logger.warning(
                 "KGService.add_relation: missing node(s) for relation %s. "
@@ -108,21 +494,60 @@ class KGService(KGServiceBase):
                 relation.id,
             )
             return
-        self._graph.add_edge(
-            relation.source_id,
-            relation.target_id,
-            key=relation.id,
-            **self._relation_attrs(relation),
+        self._add_edge(
+            (relation.source_id, relation.target_id, relation.id),
+            self._relation_attrs(relation),
         )
         if relation.is_bidirectional:
-            self._graph.add_edge(
-                relation.target_id,
-                relation.source_id,
-                key=f"{relation.id}_rev",
-                **self._relation_attrs(relation),
+            self._add_edge(
+                (relation.target_id, relation.source_id, f"{relation.id}_rev"),
+                self._relation_attrs(relation),
             )
+        await self._log("add_relation", relation)
         logger.debug("KGService.add_relation: %s", relation.id)
 
+    async def add_relations(self, relations: Iterable[Relation]) -> None:
+        """Add many directed edges — one bulk graph insert, one index pass per document."""
+        relations = list(relations)
+        if not relations:
+            return
+        await self._require(
+            *(r.document_id for r in relations),
+            *self._documents_of_entities(
+                *(n for r in relations for n in (r.source_id, r.target_id))
+            ),
+        )
+        added = [r for r in relations if r.source_id in self._graph and r.target_id in self._graph]
+        if len(added) < len(relations):
+            logger.warning(
+                "KGService.add_relations: skipped %d relation(s) with missing node(s). "
+                "Ensure entities are added first.",
+                len(relations) - len(added),
+            )
+        edges: list[tuple[str, str, str, dict[str, Any]]] = []
+        for relation in added:
+            edges.append(
+                (relation.source_id, relation.target_id, relation.id, self._relation_attrs(relation))
+            )
+            if relation.is_bidirectional:
+                edges.append(
+                    (
+                        relation.target_id,
+                        relation.source_id,
+                        f"{relation.id}_rev",
+                        self._relation_attrs(relation),
+                    )
+                )
+        by_document: dict[str | None, list[EdgeId]] = {}
+        for source, target, key, attrs in edges:
+            by_document.setdefault(attrs["document_id"], []).append((source, target, key))
+        self._add_edges_bulk(edges)
+        for document_id, edge_ids in by_document.items():
+            self._touch(document_id, *self._edges_by_document.set_all(edge_ids, document_id))
+        if added:
+            await self._log("add_relations", added)
+        logger.debug("KGService.add_relations: %d relations", len(added))
+
     async def get_relations(
         self, entity_id: str, *, direction: str = "both"
     ) -> list[Relation]:
@@ -135,6 +560,7 @@ class KGService(KGServiceBase):
         Returns:
             List of ``Relation`` objects reconstructed from edge attributes.
         """
+        await self._require(*self._documents_of_entities(entity_id))
         if entity_id not in self._graph:
             return []
         relations: list[Relation] = []
@@ -149,22 +575,65 @@ class KGService(KGServiceBase):
         if direction in ("out", "both"):
             for _, tgt, key, data in self._graph.out_edges(entity_id, keys=True, data=True):
                 if not key.endswith("_rev"):
-                    _add(self._edge_to_relation(key, entity_id, tgt, data))
+                    _add(self._relation((entity_id, tgt, key), data))
         if direction in ("in", "both"):
             for src, _, key, data in self._graph.in_edges(entity_id, keys=True, data=True):
                 # Include _rev edges: they represent genuine incoming relations
-                _add(self._edge_to_relation(key, src, entity_id, data))
+                _add(self._relation((src, entity_id, key), data))
         return relations
 
     # ── Event operations ─────────────────────────────────────────────────────
 
     async def add_event(self, event: Event) -> None:
         """Store an event. Participant links are derived on read — see get_events."""
+        await self._require(event.document_id, *self._cold_by_event.get(event.id))
+        self._touch(*self._events_by_document.keys_of(event.id), event.document_id)
         self._events[event.id] = event
+        self._events_by_document.set(event.id, [event.document_id])
+        self._events_by_participant.set(event.id, event.participants)
+        await self._log("add_event", event)
         logger.debug("KGService.add_event: %s", event.id)
 
+    async def add_events(self, events: Iterable[Event]) -> None:
+        """Store many events — one index pass per document."""
+        events = list(events)
+        if not events:
+            return
+        await self._require(
+            *(ev.document_id for ev in events),
+            *(d for ev in events for d in self._cold_by_event.get(ev.id)),
+        )
+        by_document: dict[str | None, list[str]] = {}
+        for event in events:
+            self._events[event.id] = event
+            by_document.setdefault(event.document_id, []).append(event.id)
+            self._events_by_participant.set(event.id, event.participants)
+        for document_id, event_ids in by_document.items():
+            self._touch(document_id, *self._events_by_document.set_all(event_ids, document_id))
+        await self._log("add_events", events)
+        logger.debug("KGService.add_events: %d events", len(events))
+
+    async def bulk_update_event_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Set fields on existing events: ``{event_id: {field: value}}``."""
+        updates = check_update_fields(Event, updates)
+        await self._require(*self._documents_of_events(*updates))
+        applied: dict[str, dict[str, Any]] = {}
+        for event_id, changes in updates.items():
+            event = self._events.get(event_id)
+            if event is None:
+                continue
+            for field, value in changes.items():
+                setattr(event, field, value)
+            self._touch(event.document_id)
+            applied[event_id] = event.model_dump(mode="json", include=set(changes))
+        if applied:
+            await self._log("bulk_update_event_fields", applied)
+
     async def get_event(self, event_id: str) -> Event | None:
         """Return the event with the given ID, or None."""
+        await self._require(*self._documents_of_events(event_id))
         return self._events.get(event_id)
 
     async def get_events(
@@ -173,74 +642,103 @@ class KGService(KGServiceBase):
         document_id: str | None = None,
     ) -> list[Event]:
         """Return all events, optionally filtered to those involving an entity and/or document."""
-        if entity_id is None:
-            events = list(self._events.values())
-        else:
-            # Derived from Event.participants, not from a denormalised node
-            # attribute: graph node attrs are not covered by save()/load(), so
-            # the old `event_ids` index was silently empty after every reload
-            # and entity timelines always came back empty.
-            events = [ev for ev in self._events.values() if entity_id in ev.participants]
+        if entity_id is not None:
+            scope = () if document_id is None else (document_id,)
+            await self._require(*self._documents_of_entities(entity_id), *scope)
+            # Indexed from Event.participants by add_event/load, not from a
+            # denormalised node attribute: graph node attrs are not covered by
+            # save()/load(), so the old `event_ids` attribute was silently
+            # empty after every reload and entity timelines came back empty.
+            events = [self._events[evid] for evid in self._events_by_participant.get(entity_id)]
+            if document_id is not None:
+                events = [ev for ev in events if ev.document_id == document_id]
+            return events
+        await self._require_scope(document_id)
         if document_id is not None:
-            events = [ev for ev in events if ev.document_id == document_id]
-        return events
+            return [self._events[evid] for evid in self._events_by_document.get(document_id)]
+        return list(self._events.values())
 
     # ── Temporal relation operations ──────────────────────────────────────────
 
     async def add_temporal_relation(self, tr: TemporalRelation) -> None:
         """Store a temporal relation between two events."""
+        await self._require(tr.document_id)
+        self._touch(*self._temporal_by_document.keys_of(tr.id), tr.document_id)
         self._temporal_relations[tr.id] = tr
+        self._temporal_by_document.set(tr.id, [tr.document_id])
+        await self._log("add_temporal_relation", tr)
 
     async def get_temporal_relations(
         self, document_id: str | None = None
     ) -> list[TemporalRelation]:
         """Return all temporal relations, optionally filtered by document."""
-        trs = list(self._temporal_relations.values())
+        await self._require_scope(document_id)
         if document_id is not None:
-            trs = [t for t in trs if t.document_id == document_id]
-        return trs
+            return [
+                self._temporal_relations[trid]
+                for trid in self._temporal_by_document.get(document_id)
+            ]
+        return list(self._temporal_relations.values())
 
     async def remove_temporal_relations(self, document_id: str) -> int:
         """Remove all temporal relations for a document. Returns count removed."""
-        to_remove = [
-            tid for tid, tr in self._temporal_relations.items()
-            if tr.document_id == document_id
-        ]
+        await self._require(document_id)
+        to_remove = self._temporal_by_document.get(document_id)
         for tid in to_remove:
             del self._temporal_relations[tid]
+            self._temporal_by_document.discard(tid)
+        if to_remove:
+            self._touch(document_id)
+            await self._log("remove_temporal_relations", document_id)
         return len(to_remove)
 
     async def update_event_rank(self, event_id: str, rank: float) -> None:
         """Set the chronological_rank on an existing event."""
+        await self._require(*self._documents_of_events(event_id))
         if event_id in self._events:
             self._events[event_id].chronological_rank = rank
+            self._touch(self._events[event_id].document_id)
+            await self._log("update_event_rank", event_id, rank)
 
     async def update_event_chron_index(self, event_id: str, chron_index: int) -> None:
         """Set the chron_index on an existing event."""
+        await self._require(*self._documents_of_events(event_id))
         if event_id in self._events:
             self._events[event_id].chron_index = chron_index
+            self._touch(self._events[event_id].document_id)
+            await self._log("update_event_chron_index", event_id, chron_index)
 
     async def update_entity_chron_index(
         self, entity_id: str, first_chron_index: int
     ) -> None:
         """Set the first_chron_index on an existing entity."""
+        await self._require(*self._documents_of_entities(entity_id))
         if entity_id in self._entities:
             self._entities[entity_id].first_chron_index = first_chron_index
+            self._touch(self._entities[entity_id].document_id)
+            await self._log("update_entity_chron_index", entity_id, first_chron_index)
 
     async def list_relations(
         self, document_id: str | None = None
     ) -> list[Relation]:
         """Return all relations, optionally filtered by document."""
+        await self._require_scope(document_id or None)
+        if document_id:
+            edges = self._edges_by_document.get(document_id)
+        else:
+            edges = self._graph.edges(keys=True)
+        cache, adjacency = self._relation_cache, self._graph._succ
         relations: list[Relation] = []
         seen: set[str] = set()
-        for u, v, key, data in self._graph.edges(keys=True, data=True):
-            if key.endswith("_rev"):
+        for edge in edges:
+            u, v, key = edge
+            if key.endswith("_rev") or key in seen:
                 continue
-            if document_id and data.get("document_id") != document_id:
-                continue
-            if key not in seen:
-                seen.add(key)
-                relations.append(self._edge_to_relation(key, u, v, data))
+            seen.add(key)
+            relation = cache.get(edge)
+            if relation is None:
+                relation = self._relation(edge, adjacency[u][v][key])
+            relations.append(relation)
         return relations
 
     async def get_snapshot(
@@ -251,6 +749,11 @@ class KGService(KGServiceBase):
     ) -> tuple[list[Event], list[Entity], list[Relation]]:
         """Return the KG state visible at a given reading or story position.
 
+        Answered from a per-book interval index (``kg_timeline``) built on the
+        first call and kept until the book changes, so scrubbing through a
+        book does not re-filter it per position.  Records are ordered by the
+        chapter / chron_index they become visible at.
+
         Args:
             book_id: Document ID.
             mode: ``"chapter"`` (reading order) or ``"story"`` (chronological).
@@ -259,78 +762,31 @@ class KGService(KGServiceBase):
         Returns:
             Tuple of (events, entities, relations) visible at *position*.
         """
-        all_events = await self.get_events(document_id=book_id)
-        all_entities = await self.list_entities(document_id=book_id)
-        all_relations = await self.list_relations(document_id=book_id)
-
-        if mode == "chapter":
-            return self._snapshot_by_chapter(
-                position, all_events, all_entities, all_relations
-            )
-        return self._snapshot_by_chron(
-            position, all_events, all_entities, all_relations
-        )
+        return (await self._timeline(book_id, mode)).snapshot(position)
 
-    @staticmethod
-    def _snapshot_by_chapter(
-        chapter: int,
-        events: list[Event],
-        entities: list[Entity],
-        relations: list[Relation],
-    ) -> tuple[list[Event], list[Entity], list[Relation]]:
-        filtered_events = [
-            e for e in events if (e.chapter or 0) <= chapter
-        ]
-        filtered_entities = [
-            e for e in entities
-            if (e.first_appearance_chapter or 0) <= chapter
-            and (e.valid_to_chapter is None or e.valid_to_chapter > chapter)
-        ]
-        entity_ids = {e.id for e in filtered_entities}
-        filtered_relations = [
-            r for r in relations
-            if r.source_id in entity_ids
-            and r.target_id in entity_ids
-            and (r.valid_from_chapter is None or r.valid_from_chapter <= chapter)
-            and (r.valid_to_chapter is None or r.valid_to_chapter > chapter)
-        ]
-        return filtered_events, filtered_entities, filtered_relations
-
-    @staticmethod
-    def _snapshot_by_chron(
-        chron_index: int,
-        events: list[Event],
-        entities: list[Entity],
-        relations: list[Relation],
-    ) -> tuple[list[Event], list[Entity], list[Relation]]:
-        filtered_events = [
-            e for e in events
-            if e.chron_index is not None and e.chron_index <= chron_index
-        ]
-        filtered_entities = [
-            e for e in entities
-            if e.first_chron_index is not None
-            and e.first_chron_index <= chron_index
-            and (
-                e.valid_to_chron_index is None
-                or e.valid_to_chron_index > chron_index
-            )
-        ]
-        entity_ids = {e.id for e in filtered_entities}
-        filtered_relations = [
-            r for r in relations
-            if r.source_id in entity_ids
-            and r.target_id in entity_ids
-            and (
-                r.valid_from_chron_index is None
-                or r.valid_from_chron_index <= chron_index
-            )
-            and (
-                r.valid_to_chron_index is None
-                or r.valid_to_chron_index > chron_index
+    async def get_snapshot_delta(
+        self,
+        book_id: str,
+        mode: str,
+        from_position: int,
+        to_position: int,
+    ) -> SnapshotDelta:
+        """Return what changes between ``get_snapshot`` at two positions."""
+        return (await self._timeline(book_id, mode)).delta(from_position, to_position)
+
+    async def _timeline(self, book_id: str, mode: str) -> TimelineIndex:
+        await self._require(book_id)
+        mode = "chapter" if mode == "chapter" else "story"
+        index = self._timelines.get((book_id, mode))
+        if index is None:
+            index = TimelineIndex(
+                mode,
+                await self.get_events(document_id=book_id),
+                await self.list_entities(document_id=book_id),
+                await self.list_relations(document_id=book_id),
             )
-        ]
-        return filtered_events, filtered_entities, filtered_relations
+            self._timelines[book_id, mode] = index
+        return index
 
     # ── Timeline / Path / Subgraph queries ──────────────────────────────────
 
@@ -359,32 +815,77 @@ class KGService(KGServiceBase):
         source_id: str,
         target_id: str,
         max_length: int = 3,
+        *,
+        max_paths: int | None = None,
+        time_budget_ms: int | None = None,
     ) -> list[RelationPath]:
-        """Find all simple paths between two entities (up to *max_length* hops)."""
+        """Find the cheapest simple paths between two entities (up to *max_length* hops).
+
+        Direction does not block a path.  Only entities of the books of
+        *source_id* and *target_id* are crossed.  Paths come cheapest first
+        (``kg_paths.cheapest_paths``); the search stops after *max_paths* of
+        them or *time_budget_ms*, returning what it found by then.
+        """
+        await self._require(*self._documents_of_entities(source_id, target_id))
         if source_id not in self._graph or target_id not in self._graph:
             return []
-
-        # Use the undirected view so direction doesn't block reachability.
-        undirected = self._graph.to_undirected(as_view=True)
-        raw_paths: list[list[str]] = list(
-            nx.all_simple_paths(undirected, source_id, target_id, cutoff=max_length)
+        if max_paths is None:
+            max_paths = self._path_max_results
+        if time_budget_ms is None:
+            time_budget_ms = self._path_time_budget_ms
+        deadline = time.monotonic() + time_budget_ms / 1000 if time_budget_ms else None
+
+        books = set(self._documents_of_entities(source_id, target_id))
+        entities, succ, pred = self._entities, self._graph._succ, self._graph._pred
+
+        def neighbours(node: str) -> list[str]:
+            return [
+                n
+                for n in dict.fromkeys(itertools.chain(succ[node], pred[node]))
+                if n in entities and entities[n].document_id in books
+            ]
+
+        edge_data: dict[tuple[str, str], dict] = {}
+
+        def weight(u: str, v: str) -> float:
+            data = edge_data[u, v] = self._best_edge(u, v)
+            return data.get("weight", 1.0)
+
+        found, complete = cheapest_paths(
+            neighbours,
+            weight,
+            source_id,
+            target_id,
+            max_length=max_length,
+            max_paths=max_paths,
+            deadline=deadline,
         )
+        if not complete:
+            logger.info(
+                "KGService.get_relation_paths(%s, %s): time budget of %dms spent, "
+                "returning the %d cheapest path(s) found",
+                source_id,
+                target_id,
+                time_budget_ms,
+                len(found),
+            )
 
         result: list[RelationPath] = []
-        for node_path in raw_paths:
+        for cost, node_path in found:
             nodes: list[PathNode] = []
             for i, node_id in enumerate(node_path):
                 entity = self._entities.get(node_id)
                 nodes.append(PathNode(
                     entity_id=node_id,
                     name=entity.name if entity else node_id,
-                    relation_from_prev=self._best_edge(node_path[i - 1], node_id) if i > 0 else None,
+                    relation_from_prev=edge_data[node_path[i - 1], node_id] if i > 0 else None,
                 ))
-            result.append(RelationPath(nodes=nodes))
+            result.append(RelationPath(nodes=nodes, cost=cost))
         return result
 
     async def get_subgraph(self, entity_id: str, k_hops: int = 2) -> Subgraph:
         """Return the *k*-hop ego-graph around *entity_id*."""
+        await self._require(*self._documents_of_entities(entity_id))
         if entity_id not in self._graph:
             return Subgraph(center=entity_id, nodes=[], edges=[])
 
@@ -415,37 +916,31 @@ class KGService(KGServiceBase):
             ))
         return Subgraph(center=entity_id, nodes=nodes, edges=edges)
 
-    async def get_relation_stats(self, entity_id: str | None = None) -> RelationStats:
+    async def get_relation_stats(
+        self, entity_id: str | None = None, document_id: str | None = None
+    ) -> RelationStats:
         """Return relation-type distribution and weight statistics.
 
-        If *entity_id* is given, scoped to that entity; otherwise global.
+        Scoped to the relations of *entity_id* and/or those filed under
+        *document_id*; with neither, over every book.  Read from the running
+        tallies — no relation is rebuilt.
         """
         if entity_id is not None:
-            relations = await self.get_relations(entity_id)
+            scope = () if document_id is None else (document_id,)
+            await self._require(*self._documents_of_entities(entity_id), *scope)
+            by_document = self._entity_tallies(entity_id)
         else:
-            # Collect all unique relations (skip _rev duplicates).
-            relations = []
-            seen: set[str] = set()
-            for u, v, key, data in self._graph.edges(keys=True, data=True):
-                base_key = key[:-4] if key.endswith("_rev") else key
-                if base_key not in seen:
-                    seen.add(base_key)
-                    relations.append(self._edge_to_relation(key, u, v, data))
-
-        type_dist: dict[str, int] = {}
-        weights: list[float] = []
-        for rel in relations:
-            rtype = rel.relation_type.value
-            type_dist[rtype] = type_dist.get(rtype, 0) + 1
-            weights.append(rel.weight)
-
-        return RelationStats(
-            total_relations=len(relations),
-            type_distribution=type_dist,
-            weight_avg=sum(weights) / len(weights) if weights else 0.0,
-            weight_min=min(weights) if weights else 0.0,
-            weight_max=max(weights) if weights else 0.0,
-        )
+            await self._require_scope(document_id)
+            by_document = self._relation_stats
+        if document_id is not None:
+            tally = by_document.get(document_id)
+            return (tally or _RelationTally()).stats()
+        if len(by_document) == 1:
+            return next(iter(by_document.values())).stats()
+        merged = _RelationTally()
+        for tally in by_document.values():
+            merged.merge(tally)
+        return merged.stats()
 
     # ── Private: edge lookup helper ───────────────────────────────────────────
 
@@ -467,17 +962,22 @@ class KGService(KGServiceBase):
 
     # ── Graph stats ──────────────────────────────────────────────────────────
 
+    # Cold books count from their manifest entries, so none is loaded for this.
+
     @property
     def entity_count(self) -> int:
-        return self._graph.number_of_nodes()
+        return self._graph.number_of_nodes() + self._cold_count("entities")
 
     @property
     def relation_count(self) -> int:
-        return self._graph.number_of_edges()
+        return self._graph.number_of_edges() + self._cold_count("relations")
 
     @property
     def event_count(self) -> int:
-        return len(self._events)
+        return len(self._events) + self._cold_count("events")
+
+    def _cold_count(self, field: str) -> int:
+        return sum(entry.get(field, 0) for entry in self._cold.values())
 
     # ── Document-scoped removal ─────────────────────────────────────────────
 
@@ -487,39 +987,48 @@ class KGService(KGServiceBase):
         Returns:
             Dict with counts of removed entities, relations, events.
         """
+        await self._require(document_id)
         # Identify entity IDs belonging to this document
-        entity_ids = {
-            eid for eid, e in self._entities.items() if e.document_id == document_id
-        }
+        entity_ids = self._entities_by_document.get(document_id)
 
         # Remove edges (relations) connected to those entities
-        edges_to_remove: list[tuple[str, str, str]] = []
-        for u, v, key in self._graph.edges(keys=True):
-            if u in entity_ids or v in entity_ids:
-                edges_to_remove.append((u, v, key))
-        for u, v, key in edges_to_remove:
-            self._graph.remove_edge(u, v, key=key)
+        edges_to_remove: dict[EdgeId, None] = {}
+        for eid in entity_ids:
+            if eid in self._graph:
+                edges_to_remove.update(
+                    dict.fromkeys(self._graph.out_edges(eid, keys=True))
+                )
+                edges_to_remove.update(
+                    dict.fromkeys(self._graph.in_edges(eid, keys=True))
+                )
+        for edge in edges_to_remove:
+            # A relation filed under another book still lives in that book's shard.
+            self._touch(*self._edges_by_document.keys_of(edge))
+            self._remove_edge(edge)
 
         # Remove events belonging to this document
-        event_ids = {
-            evid for evid, ev in self._events.items() if ev.document_id == document_id
-        }
+        event_ids = self._events_by_document.get(document_id)
         for evid in event_ids:
             del self._events[evid]
+            self._events_by_document.discard(evid)
+            self._events_by_participant.discard(evid)
 
         # Remove temporal relations belonging to this document
-        tr_ids = {
-            trid for trid, tr in self._temporal_relations.items()
-            if tr.document_id == document_id
-        }
-        for trid in tr_ids:
-            del self._temporal_relations[trid]
+        with self._unlogged():
+            await self.remove_temporal_relations(document_id)
+
+        self._touch(document_id)
+        self._recent.pop(document_id, None)
 
         # Remove entity nodes
         for eid in entity_ids:
             del self._entities[eid]
+            self._entities_by_document.discard(eid)
+            self._entities_by_name.discard(eid)
+            self._entity_relation_stats.pop(eid, None)
             if eid in self._graph:
                 self._graph.remove_node(eid)
+        await self._log("remove_by_document", document_id)
 
         # Persist the updated graph
         await self.save()
@@ -541,57 +1050,493 @@ class KGService(KGServiceBase):
     # ── Persistence ──────────────────────────────────────────────────────────
 
     async def save(self) -> None:
-        """Persist the graph to JSON on disk."""
-        self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            "entities": {eid: e.model_dump() for eid, e in self._entities.items()},
-            "events": {evid: ev.model_dump() for evid, ev in self._events.items()},
-            "temporal_relations": {
-                trid: tr.model_dump() for trid, tr in self._temporal_relations.items()
-            },
-            "edges": [
-                {
-                    "source": u,
-                    "target": v,
-                    "key": k,
-                    **data,
-                }
-                for u, v, k, data in self._graph.edges(keys=True, data=True)
-            ],
+        """Persist the books changed since the last ``save`` or ``load``.
+
+        Each book is one shard under ``<name>.shards/`` next to
+        ``kg_persistence_path``, which itself holds a small JSON manifest of
+        the shards.  Shards are binary snapshots (``kg_snapshot``), or JSON
+        with ``kg_snapshot_format="json"``; a shard in the other format is
+        rewritten in the configured one the next time its book changes.
+        Only dirty shards are rewritten, so saving one book costs that book,
+        not the library.  Every file goes through a temp file and
+        ``os.replace``; the manifest is replaced after the shards it lists
+        and shards of removed books are deleted after that, so a crash at any
+        point leaves a manifest whose shards are all complete.  The mutation
+        log is emptied once the manifest is in place: every record in it is
+        then in a shard.
+        """
+        if self._read_only:
+            raise RuntimeError(f"KGService on {self._persistence_path} is read-only")
+        if not self._dirty_documents and not self._manifest_stale:
+            self._clear_wal()
+            return
+        with _gc_paused():
+            self._write_dirty_shards()
+        self._clear_wal()
+        logger.info(
+            "KGService saved %d shard(s) to %s",
+            len(self._dirty_documents),
+            self._shard_dir,
+        )
+        self._dirty_documents = set()
+        self._manifest_stale = False
+        # Books saved for the first time can now be unloaded.
+        self._unload_least_recent(keep=())
+
+    def _write_dirty_shards(self) -> None:
+        self._shard_dir.mkdir(parents=True, exist_ok=True)
+        removed: list[str] = []
+        for document_id in self._dirty_documents:
+            payload = self._shard_payload(document_id)
+            if payload is None:
+                entry = self._shards.pop(document_id, None)
+                if entry is not None:
+                    removed.append(entry["file"])
+                continue
+            name = self._shard_file_name(document_id) + self._shard_suffix
+            previous = self._shards.get(document_id)
+            if previous is not None and previous["file"] != name:
+                removed.append(previous["file"])
+            if self._shard_suffix == ".json":
+                data = _json_bytes(payload)
+            else:
+                data = encode_snapshot(payload)
+            _write_atomic(self._shard_dir / name, data)
+            self._shards[document_id] = {
+                "document_id": document_id,
+                "file": name,
+                "entities": len(payload["entities"]),
+                "relations": len(payload["edges"]),
+                "events": len(payload["events"]),
+                "temporal_relations": len(payload["temporal_relations"]),
+            }
+        manifest = {
+            "format": _MANIFEST_FORMAT,
+            "version": _MANIFEST_VERSION,
+            "shards": list(self._shards.values()),
         }
-        with open(self._persistence_path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False, indent=2, default=str)
-        logger.info("KGService saved to %s", self._persistence_path)
+        _write_atomic(self._persistence_path, _json_bytes(manifest))
+        for name in removed:
+            (self._shard_dir / name).unlink(missing_ok=True)
 
     async def load(self) -> None:
-        """Load the graph from JSON on disk (if the file exists)."""
+        """Load the graph from disk (if the manifest exists).
+
+        With lazy loading (``kg_lazy_load``) only the manifest and the header
+        of each binary shard are read here; a book is loaded the first time
+        a method needs it.  JSON shards, and binary ones from before headers
+        carried a directory, still load here.  A legacy single-file snapshot
+        (no ``format`` field) loads as before and is split into shards on the
+        next ``save``.  Mutations logged since the last ``save`` are then
+        replayed and saved, which loads the books they touch.
+        """
         if not self._persistence_path.exists():
             logger.info("KGService: no existing graph at %s", self._persistence_path)
+            await self._replay_wal()
             return
-        with open(self._persistence_path, encoding="utf-8") as fh:
-            payload = json.load(fh)
-        for eid, edata in payload.get("entities", {}).items():
-            entity = Entity.model_validate(edata)
-            self._entities[eid] = entity
-            self._graph.add_node(eid, **self._entity_attrs(entity))
-        for evid, evdata in payload.get("events", {}).items():
-            self._events[evid] = Event.model_validate(evdata)
-        for trid, trdata in payload.get("temporal_relations", {}).items():
-            self._temporal_relations[trid] = TemporalRelation.model_validate(trdata)
-        for edge in payload.get("edges", []):
-            src = edge.pop("source")
-            tgt = edge.pop("target")
-            key = edge.pop("key")
-            self._graph.add_edge(src, tgt, key=key, **edge)
+        with _gc_paused():
+            # The manifest, or a whole legacy snapshot (JSON either way).
+            payload = decode_shard(self._persistence_path.read_bytes(), edge_tuples=True)
+            await self._load_manifest_or_snapshot(payload)
+        await self._replay_wal()
         logger.info(
-            "KGService loaded from %s: %d entities, %d edges",
+            "KGService loaded from %s: %d entities, %d edges (%d book(s) deferred)",
             self._persistence_path,
             self.entity_count,
             self.relation_count,
+            len(self._cold),
+        )
+
+    async def _load_manifest_or_snapshot(self, payload: dict[str, Any]) -> None:
+        pending = set(self._dirty_documents)
+        if payload.get("format") == _MANIFEST_FORMAT:
+            if payload.get("version", 0) > _MANIFEST_VERSION:
+                raise ValueError(
+                    f"KG manifest {self._persistence_path} has version "
+                    f"{payload['version']}; this build reads up to {_MANIFEST_VERSION}"
+                )
+            for entry in payload.get("shards", []):
+                shard_path = self._shard_dir / entry["file"]
+                if not shard_path.exists():
+                    logger.warning("KGService: shard %s listed but missing", shard_path)
+                    continue
+                header = read_header_file(shard_path) if self._lazy else None
+                directory = (header or {}).get("directory")
+                if directory is not None:
+                    self._register_cold(entry, directory)
+                else:
+                    await self._load_payload(
+                        decode_shard(shard_path.read_bytes(), edge_tuples=True)
+                    )
+                self._shards[entry["document_id"]] = entry
+            self._dirty_documents = pending
+            self._manifest_stale = False
+        else:
+            await self._load_payload(payload)
+            self._manifest_stale = True
+            logger.info(
+                "KGService: %s is a single-file snapshot; it will be sharded on the next save",
+                self._persistence_path,
+            )
+
+    async def _load_payload(self, payload: dict[str, Any]) -> None:
+        """Add one snapshot's records (a shard, or a whole legacy file).
+
+        *payload* comes from ``decode_shard(..., edge_tuples=True)``.
+        """
+        with self._unlogged():
+            for edata in payload.get("entities", {}).values():
+                await self.add_entity(Entity.model_validate(edata))
+            for evdata in payload.get("events", {}).values():
+                await self.add_event(Event.model_validate(evdata))
+            for trdata in payload.get("temporal_relations", {}).values():
+                await self.add_temporal_relation(TemporalRelation.model_validate(trdata))
+        # Edges dominate a shard; add them in bulk rather than via _add_edge.
+        edges = payload.get("edges", [])
+        by_document: dict[Hashable, list[EdgeId]] = {}
+        for source, target, key, attrs in edges:
+            by_document.setdefault(attrs.get("document_id"), []).append((source, target, key))
+        self._add_edges_bulk(edges)
+        for document_id, edge_ids in by_document.items():
+            self._touch(document_id, *self._edges_by_document.set_all(edge_ids, document_id))
+
+    def _shard_payload(self, document_id: str | None) -> dict[str, Any] | None:
+        """One book's records in the snapshot layout, or None if it has none left."""
+        entity_ids = self._entities_by_document.get(document_id)
+        event_ids = self._events_by_document.get(document_id)
+        tr_ids = self._temporal_by_document.get(document_id)
+        edges = self._edges_by_document.get(document_id)
+        if not (entity_ids or event_ids or tr_ids or edges):
+            return None
+        return {
+            "document_id": document_id,
+            "entities": {eid: self._entities[eid].model_dump() for eid in entity_ids},
+            "events": {evid: self._events[evid].model_dump() for evid in event_ids},
+            "temporal_relations": {
+                trid: self._temporal_relations[trid].model_dump() for trid in tr_ids
+            },
+            "edges": [
+                {"source": u, "target": v, "key": k, **self._graph.edges[u, v, k]}
+                for u, v, k in edges
+            ],
+        }
+
+    # ── Mutation log ─────────────────────────────────────────────────────────
+
+    async def _log(self, op: str, *args: Any) -> None:
+        """Append a mutation (method name and arguments) that has been applied.
+
+        Saves once the log reaches ``kg_wal_compact_records`` records.
+        """
+        if self._wal is None or self._wal_muted or self._read_only:
+            return
+        if op in _LOGGED_MODELS:
+            args = tuple(arg.model_dump(mode="json") for arg in args)
+        elif op in _LOGGED_MODEL_LISTS:
+            args = tuple([model.model_dump(mode="json") for model in arg] for arg in args)
+        self._wal.append({"op": op, "args": list(args)})
+        if self._wal_compact_records and self._wal.records >= self._wal_compact_records:
+            await self.save()
+
+    async def _replay_wal(self) -> None:
+        """Re-apply the logged mutations, in order, through the public methods."""
+        records = self._wal.read() if self._wal is not None else []
+        if not records:
+            return
+        with self._unlogged():
+            for record in records:
+                op, args = record["op"], record["args"]
+                if op in _LOGGED_MODELS:
+                    args = [_LOGGED_MODELS[op].model_validate(arg) for arg in args]
+                elif op in _LOGGED_MODEL_LISTS:
+                    model = _LOGGED_MODEL_LISTS[op]
+                    args = [[model.model_validate(item) for item in arg] for arg in args]
+                await getattr(self, op)(*args)
+        logger.info(
+            "KGService: replayed %d mutation(s) from %s", len(records), self._wal.path
+        )
+        # Fold them into the shards now rather than replay them again next
+        # time — unless read-only: the log is then the writer's to empty.
+        if not self._read_only:
+            await self.save()
+
+    def _clear_wal(self) -> None:
+        # Not mid-replay: the records not replayed yet are only in the log.
+        if self._wal is not None and not self._wal_muted:
+            self._wal.clear()
+
+    @contextmanager
+    def _unlogged(self) -> Iterator[None]:
+        """Mutate without logging — the records are already on disk."""
+        self._wal_muted += 1
+        try:
+            yield
+        finally:
+            self._wal_muted -= 1
+
+    # ── Lazy loading ─────────────────────────────────────────────────────────
+
+    async def _require(self, *document_ids: str | None) -> None:
+        """Load the cold books among *document_ids* and mark them all used.
+
+        Loading a book may unload least recently used ones over
+        ``max_resident_books`` — never one of *document_ids*.
+        """
+        loaded = False
+        for document_id in dict.fromkeys(document_ids):
+            if document_id in self._cold:
+                await self._hydrate(document_id)
+                loaded = True
+            self._recent[document_id] = None
+            self._recent.move_to_end(document_id)
+        if loaded:
+            self._unload_least_recent(keep=document_ids)
+
+    async def _require_scope(self, document_id: str | None) -> None:
+        """``_require`` one book, or — for an unscoped call — every book."""
+        if document_id is None:
+            await self._require(*self._cold)
+        else:
+            await self._require(document_id)
+
+    def _documents_of_entities(self, *entity_ids: str) -> list[str | None]:
+        """The books holding *entity_ids*, whether loaded or cold."""
+        documents: list[str | None] = []
+        for entity_id in entity_ids:
+            entity = self._entities.get(entity_id)
+            if entity is not None:
+                documents.append(entity.document_id)
+            else:
+                documents += self._cold_by_entity.get(entity_id)
+        return documents
+
+    def _documents_of_events(self, *event_ids: str) -> list[str | None]:
+        """The books holding *event_ids*, whether loaded or cold."""
+        documents: list[str | None] = []
+        for event_id in event_ids:
+            event = self._events.get(event_id)
+            if event is not None:
+                documents.append(event.document_id)
+            else:
+                documents += self._cold_by_event.get(event_id)
+        return documents
+
+    def _register_cold(self, entry: dict[str, Any], directory: dict[str, Any]) -> None:
+        """Record a book as on disk only; *directory* is its shard header's."""
+        document_id = entry["document_id"]
+        entities = directory.get("entities", [])
+        self._cold[document_id] = entry
+        self._cold_by_entity.set(document_id, [row[0] for row in entities])
+        self._cold_by_name.set(
+            document_id, [name.lower() for row in entities for name in row[1:] if name]
         )
+        self._cold_by_event.set(document_id, directory.get("events", []))
+
+    async def _hydrate(self, document_id: str | None) -> None:
+        entry = self._cold.pop(document_id)
+        for index in (self._cold_by_entity, self._cold_by_name, self._cold_by_event):
+            index.discard(document_id)
+        shard_path = self._shard_dir / entry["file"]
+        if not shard_path.exists():
+            logger.warning("KGService: shard %s listed but missing", shard_path)
+            self._shards.pop(document_id, None)
+            self._manifest_stale = True
+            return
+        pending = set(self._dirty_documents)
+        with _gc_paused():
+            await self._load_payload(decode_shard(shard_path.read_bytes(), edge_tuples=True))
+        self._dirty_documents = pending
+        logger.debug("KGService: loaded book %s from %s", document_id, shard_path)
+
+    def _unload_least_recent(self, keep: Iterable[str | None]) -> None:
+        """Unload saved, unchanged books, least recently used first, down to the limit."""
+        if not self._max_resident_books:
+            return
+        # Books loaded eagerly and never used since count as the least recent.
+        loaded = [d for d in self._shards if d not in self._cold and d not in self._recent]
+        loaded += [d for d in self._recent if d in self._shards and d not in self._cold]
+        excess = len(loaded) - self._max_resident_books
+        keep = set(keep)
+        for document_id in loaded:
+            if excess <= 0:
+                break
+            if document_id in keep or document_id in self._dirty_documents:
+                continue
+            if self._unload(document_id):
+                excess -= 1
+
+    def _unload(self, document_id: str | None) -> bool:
+        """Drop a saved, unchanged book from memory; it becomes cold again.
+
+        Refused (False) while a relation filed under another book touches one
+        of its entities — removing the node would take that relation along.
+        """
+        entity_ids = self._entities_by_document.get(document_id)
+        for eid in entity_ids:
+            if eid not in self._graph:
+                continue
+            for edge in (
+                *self._graph.out_edges(eid, keys=True),
+                *self._graph.in_edges(eid, keys=True),
+            ):
+                if any(d != document_id for d in self._edges_by_document.keys_of(edge)):
+                    return False
+        event_ids = self._events_by_document.get(document_id)
+        directory = {
+            "entities": [
+                [eid, self._entities[eid].name, *self._entities[eid].aliases]
+                for eid in entity_ids
+            ],
+            "events": event_ids,
+        }
+        for edge in self._edges_by_document.get(document_id):
+            self._remove_edge(edge)
+        for evid in event_ids:
+            del self._events[evid]
+            self._events_by_document.discard(evid)
+            self._events_by_participant.discard(evid)
+        for trid in self._temporal_by_document.get(document_id):
+            del self._temporal_relations[trid]
+            self._temporal_by_document.discard(trid)
+        for eid in entity_ids:
+            del self._entities[eid]
+            self._entities_by_document.discard(eid)
+            self._entities_by_name.discard(eid)
+            self._entity_relation_stats.pop(eid, None)
+            if eid in self._graph:
+                self._graph.remove_node(eid)
+        self._recent.pop(document_id, None)
+        self._timelines.pop((document_id, "chapter"), None)
+        self._timelines.pop((document_id, "story"), None)
+        self._register_cold(self._shards[document_id], directory)
+        logger.debug("KGService: unloaded book %s", document_id)
+        return True
+
+    @staticmethod
+    def _shard_file_name(document_id: str | None) -> str:
+        """Shard file stem; the suffix follows ``kg_snapshot_format``."""
+        if document_id is None:
+            return _UNASSIGNED_SHARD
+        if _SAFE_SHARD_STEM.fullmatch(document_id):
+            return document_id
+        return "_" + hashlib.sha1(document_id.encode("utf-8")).hexdigest()
 
     # ── Private helpers ──────────────────────────────────────────────────────
 
+    def _touch(self, *document_ids: Hashable) -> None:
+        """Mark the shards of *document_ids* for the next ``save``; drop their timelines."""
+        self._dirty_documents.update(document_ids)
+        if self._timelines:
+            for document_id in document_ids:
+                self._timelines.pop((document_id, "chapter"), None)
+                self._timelines.pop((document_id, "story"), None)
+
+    def _index_entity(self, entity: Entity) -> None:
+        self._entities_by_document.set(entity.id, [entity.document_id])
+        self._entities_by_name.set(
+            entity.id, [entity.name.lower(), *(a.lower() for a in entity.aliases)]
+        )
+
+    def _add_edge(self, edge: EdgeId, attrs: dict[str, Any]) -> None:
+        source, target, key = edge
+        self._touch(*self._edges_by_document.keys_of(edge), attrs.get("document_id"))
+        if self._graph.has_edge(source, target, key):
+            self._tally_edge(edge, self._graph.edges[edge], _RelationTally.remove)
+            self._relation_cache.pop(edge, None)
+        self._graph.add_edge(source, target, key=key, **attrs)
+        self._tally_edge(edge, self._graph.edges[edge], _RelationTally.add)
+        self._edges_by_document.set(edge, [attrs.get("document_id")])
+
+    def _remove_edge(self, edge: EdgeId) -> None:
+        self._tally_edge(edge, self._graph.edges[edge], _RelationTally.remove)
+        self._relation_cache.pop(edge, None)
+        self._graph.remove_edge(*edge)
+        self._edges_by_document.discard(edge)
+
+    def _tally_edge(self, edge: EdgeId, attrs: dict[str, Any], apply: _TallyOp) -> None:
+        """Count an edge into (``_RelationTally.add``) or out of (``.remove``) the tallies.
+
+        A bidirectional relation counts once, by its forward edge, for its
+        book and for each endpoint.
+        """
+        source, target, key = edge
+        if key.endswith("_rev"):
+            return
+        document_id = attrs.get("document_id")
+        relation = (attrs.get("relation_type", "other"), attrs.get("weight", 1.0))
+        _apply_tally(self._relation_stats, document_id, apply, relation)
+        for eid in {source, target}:
+            by_document = self._entity_relation_stats.get(eid)
+            if by_document is not None:
+                _apply_tally(by_document, document_id, apply, relation)
+
+    def _entity_tallies(self, entity_id: str) -> dict[Hashable, _RelationTally]:
+        """*entity_id*'s relation tallies by book, counted from its edges on first use."""
+        tallies = self._entity_relation_stats.get(entity_id)
+        if tallies is None:
+            tallies = self._entity_relation_stats[entity_id] = {}
+            if entity_id in self._graph:
+                graph = self._graph
+                edges = [*graph.out_edges(entity_id, keys=True, data=True)]
+                edges += [e for e in graph.in_edges(entity_id, keys=True, data=True) if e[0] != entity_id]
+                for _, _, key, attrs in edges:
+                    if not key.endswith("_rev"):
+                        relation = (attrs.get("relation_type", "other"), attrs.get("weight", 1.0))
+                        _apply_tally(tallies, attrs.get("document_id"), _RelationTally.add, relation)
+        return tallies
+
+    def _add_edges_bulk(self, edges: list[tuple[str, str, str, dict[str, Any]]]) -> None:
+        """``add_edges_from`` for a decoded shard or a batch, without its per-edge cost.
+
+        ``MultiDiGraph.add_edges_from`` goes through ``add_edge`` and copies
+        every attribute dict; on load that is half the time.  This writes the
+        adjacency the way ``add_edge`` does — one key dict shared by
+        ``_succ[u][v]`` and ``_pred[v][u]`` — and adopts *attrs* as the edge
+        data, so callers must not reuse them.  The relation tallies are kept
+        here; the document index stays with the caller.
+        """
+        graph = self._graph
+        succ, pred = graph._succ, graph._pred
+        graph.add_nodes_from({n for u, v, _, _ in edges for n in (u, v) if n not in succ})
+        new: list[tuple[str, str, str, dict[str, Any]]] = []
+        for edge in edges:
+            u, v, key, attrs = edge
+            keydict = succ[u].get(v)
+            if keydict is None:
+                keydict = succ[u][v] = pred[v][u] = graph.edge_key_dict_factory()
+            existing = keydict.get(key)
+            if existing is None:
+                keydict[key] = attrs
+                new.append(edge)
+            else:
+                self._tally_edge((u, v, key), existing, _RelationTally.remove)
+                self._relation_cache.pop((u, v, key), None)
+                existing.update(attrs)
+                self._tally_edge((u, v, key), existing, _RelationTally.add)
+        self._tally_new_edges(new)
+        # What add_edge does after writing: drop cached views (networkx>=3.3).
+        nx._clear_cache(graph)
+
+    def _tally_new_edges(self, edges: list[tuple[str, str, str, dict[str, Any]]]) -> None:
+        """``_tally_edge(..., add)`` for edges not in the graph before, one update per tally."""
+        by_document: dict[Hashable, list[tuple[str, float]]] = {}
+        entity_stats = self._entity_relation_stats
+        for source, target, key, attrs in edges:
+            if key.endswith("_rev"):
+                continue
+            document_id = attrs.get("document_id")
+            relation = (attrs.get("relation_type", "other"), attrs.get("weight", 1.0))
+            by_document.setdefault(document_id, []).append(relation)
+            if entity_stats and (source in entity_stats or target in entity_stats):
+                for eid in {source, target}:
+                    if eid in entity_stats:
+                        _apply_tally(entity_stats[eid], document_id, _RelationTally.add, relation)
+        for document_id, relations in by_document.items():
+            tally = self._relation_stats.get(document_id)
+            if tally is None:
+                tally = self._relation_stats[document_id] = _RelationTally()
+            tally.add_many(relations)
+
     @staticmethod
     def _entity_attrs(entity: Entity) -> dict[str, Any]:
         return {
@@ -616,6 +1561,16 @@ class KGService(KGServiceBase):
             "valid_to_chron_index": relation.valid_to_chron_index,
         }
 
+    def _relation(self, edge: EdgeId, data: dict[str, Any]) -> Relation:
+        """The ``Relation`` for an edge with attributes *data*, built once per edge version."""
+        relation = self._relation_cache.get(edge)
+        if relation is None:
+            source, target, key = edge
+            relation = self._relation_cache[edge] = self._edge_to_relation(
+                key, source, target, data
+            )
+        return relation
+
     @staticmethod
     def _edge_to_relation(
         key: str,
@@ -623,8 +1578,6 @@ class KGService(KGServiceBase):
         target_id: str,
         data: dict[str, Any],
     ) -> Relation:
-        from storysphere.domain.relations import RelationType  # noqa: PLC0415
-
         return Relation(
             id=key,
             source_id=source_id,
@@ -642,5 +1595,60 @@ class KGService(KGServiceBase):
         )
 
 
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend the cyclic GC around a bulk load or save.
+
+    Both allocate millions of short-lived, acyclic dicts and models; the
+    generational passes they trigger rescan the whole (large) graph and
+    cost a third or more of the elapsed time.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _json_bytes(payload: Any) -> bytes:
+    # json.dumps, not json.dump: dump() streams through the pure-Python encoder.
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode(
+        "utf-8"
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to a temp file beside *path*, then rename it into place.
+
+    The file keeps *path*'s mode, or gets the one ``open()`` would give a
+    new file — ``mkstemp`` alone would leave it 0600.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@cache
+def _umask() -> int:
+    # Only readable by setting it; read once, before any threads write shards.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
 # Alias for code that imports by the new name.
 NetworkXKGService = KGService
@@ -6,12 +6,27 @@ Both NetworkX (default) and Neo4j implementations must satisfy this contract.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import Annotated, Any
+
+from pydantic import TypeAdapter, ValidationError
 
 from storysphere.domain.entities import Entity, EntityType
 from storysphere.domain.events import Event
 from storysphere.domain.relations import Relation
 from storysphere.domain.temporal import TemporalRelation
-from storysphere.services.query_models import RelationPath, RelationStats, Subgraph
+from storysphere.services.query_models import (
+    RelationPath,
+    RelationStats,
+    SnapshotDelta,
+    Subgraph,
+)
+
+#: Fields ``bulk_update_*_fields`` refuse: they place a record in the graph,
+#: so changing them goes through ``add_*`` (or ``remove_by_document``).
+_FIXED_ENTITY_FIELDS = frozenset({"id", "document_id"})
+_FIXED_EVENT_FIELDS = frozenset({"id", "document_id", "participants"})
 
 
 class KGServiceBase(ABC):
@@ -40,12 +55,29 @@ class KGServiceBase(ABC):
     ) -> list[Entity]:
         """Return entities, optionally filtered by type / document / extraction_method."""
 
+    @abstractmethod
+    async def add_entities(self, entities: Iterable[Entity]) -> None:
+        """``add_entity`` for many entities, in one batch."""
+
+    @abstractmethod
+    async def bulk_update_entity_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Set fields on existing entities: ``{entity_id: {field: value}}``.
+
+        Unknown entity ids are skipped; unknown or fixed fields raise ValueError.
+        """
+
     # ── Relation operations ──────────────────────────────────────────────────
 
     @abstractmethod
     async def add_relation(self, relation: Relation) -> None:
         """Add a directed relation edge."""
 
+    @abstractmethod
+    async def add_relations(self, relations: Iterable[Relation]) -> None:
+        """``add_relation`` for many relations, in one batch."""
+
     @abstractmethod
     async def get_relations(
         self, entity_id: str, *, direction: str = "both"
@@ -58,6 +90,19 @@ class KGServiceBase(ABC):
     async def add_event(self, event: Event) -> None:
         """Store an event and attach it to participating entities."""
 
+    @abstractmethod
+    async def add_events(self, events: Iterable[Event]) -> None:
+        """``add_event`` for many events, in one batch."""
+
+    @abstractmethod
+    async def bulk_update_event_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        """Set fields on existing events: ``{event_id: {field: value}}``.
+
+        Unknown event ids are skipped; unknown or fixed fields raise ValueError.
+        """
+
     @abstractmethod
     async def get_event(self, event_id: str) -> Event | None:
         """Return the event with the given ID, or None."""
@@ -115,6 +160,16 @@ class KGServiceBase(ABC):
     ) -> tuple[list[Event], list[Entity], list[Relation]]:
         """Return (events, entities, relations) visible at the given position."""
 
+    @abstractmethod
+    async def get_snapshot_delta(
+        self,
+        book_id: str,
+        mode: str,
+        from_position: int,
+        to_position: int,
+    ) -> SnapshotDelta:
+        """Return what ``get_snapshot`` gains and loses between two positions."""
+
     # ── Timeline / Path / Subgraph queries ──────────────────────────────────
 
     @abstractmethod
@@ -129,16 +184,29 @@ class KGServiceBase(ABC):
         source_id: str,
         target_id: str,
         max_length: int = 3,
+        *,
+        max_paths: int | None = None,
+        time_budget_ms: int | None = None,
     ) -> list[RelationPath]:
-        """Find simple paths between two entities (up to max_length hops)."""
+        """Find the cheapest simple paths between two entities (up to max_length hops).
+
+        Paths stay inside the two entities' books and are ranked by ``cost``
+        (see ``kg_paths``): at most *max_paths* of them, found within
+        *time_budget_ms*.  Both default to the ``kg_path_*`` settings.
+        """
 
     @abstractmethod
     async def get_subgraph(self, entity_id: str, k_hops: int = 2) -> Subgraph:
         """Return the k-hop ego-graph around entity_id."""
 
     @abstractmethod
-    async def get_relation_stats(self, entity_id: str | None = None) -> RelationStats:
-        """Return relation-type distribution and weight statistics."""
+    async def get_relation_stats(
+        self, entity_id: str | None = None, document_id: str | None = None
+    ) -> RelationStats:
+        """Return relation-type distribution and weight statistics.
+
+        Scoped to *entity_id*'s relations and/or *document_id*'s; global with neither.
+        """
 
     # ── Document-scoped removal ─────────────────────────────────────────────
 
@@ -172,3 +240,42 @@ class KGServiceBase(ABC):
     @abstractmethod
     def event_count(self) -> int:
         """Number of events."""
+
+
+def check_update_fields(
+    model: type[Entity] | type[Event], updates: Mapping[str, Mapping[str, Any]]
+) -> dict[str, dict[str, Any]]:
+    """Validate *updates* for ``bulk_update_*_fields`` and return them coerced.
+
+    Each value goes through its field's annotation and constraints, as
+    ``model_validate`` would take it — so ``"conflict"`` becomes ``EventType.CONFLICT`` and a
+    ``story_time`` dict a ``StoryTimeRef``.  Raises ValueError for a field
+    the model lacks or refuses to bulk-update, or for a value that does not
+    validate.
+    """
+    fixed = _FIXED_ENTITY_FIELDS if model is Entity else _FIXED_EVENT_FIELDS
+    fields = {field for changes in updates.values() for field in changes}
+    unknown = sorted(fields - model.model_fields.keys())
+    if unknown:
+        raise ValueError(f"{model.__name__} has no field(s) {unknown}")
+    refused = sorted(fields & fixed)
+    if refused:
+        raise ValueError(f"{model.__name__} field(s) {refused} cannot be bulk-updated")
+    coerced: dict[str, dict[str, Any]] = {}
+    for record_id, changes in updates.items():
+        coerced[record_id] = {}
+        for field, value in changes.items():
+            try:
+                coerced[record_id][field] = _field_adapter(model, field).validate_python(value)
+            except ValidationError as exc:
+                raise ValueError(f"{model.__name__}.{field}: {exc}") from exc
+    return coerced
+
+
+@cache
+def _field_adapter(model: type[Entity] | type[Event], field: str) -> TypeAdapter:
+    # The FieldInfo carries the constraints (ge/le/max_length) the bare
+    # annotation lacks: without them an update could save a record that
+    # model_validate later refuses to load.
+    info = model.model_fields[field]
+    return TypeAdapter(Annotated[info.annotation, info])
@@ -29,19 +29,24 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable, Mapping
+from enum import Enum
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, Query
+from neo4j.exceptions import ClientError
+from pydantic import BaseModel
 
 from storysphere.domain.entities import Entity, EntityType
 from storysphere.domain.events import Event, EventType, NarrativeMode
 from storysphere.domain.relations import Relation, RelationType
 from storysphere.domain.temporal import TemporalRelation, TemporalRelationType
-from storysphere.services.kg_service_base import KGServiceBase
+from storysphere.services.kg_service_base import KGServiceBase, check_update_fields
 from storysphere.services.query_models import (
     PathNode,
     RelationPath,
     RelationStats,
+    SnapshotDelta,
     Subgraph,
     SubgraphEdge,
     SubgraphNode,
@@ -49,6 +54,9 @@ from storysphere.services.query_models import (
 
 logger = logging.getLogger(__name__)
 
+#: Rows per ``UNWIND`` statement in the batch methods.
+_UNWIND_BATCH = 1000
+
 
 class Neo4jKGService(KGServiceBase):
     """Neo4j async-driver-backed knowledge graph service."""
@@ -58,6 +66,12 @@ class Neo4jKGService(KGServiceBase):
             url, auth=(user, password)
         )
 
+        from storysphere.config.settings import get_settings  # noqa: PLC0415
+
+        settings = get_settings()
+        self._path_max_results = settings.kg_path_max_results
+        self._path_time_budget_ms = settings.kg_path_time_budget_ms
+
     async def close(self) -> None:
         """Close the driver connection pool."""
         await self._driver.close()
@@ -81,6 +95,31 @@ class Neo4jKGService(KGServiceBase):
             )
         logger.debug("Neo4jKGService.add_entity: %s (%s)", entity.name, entity.id)
 
+    async def add_entities(self, entities: Iterable[Entity]) -> None:
+        rows = [{"id": e.id, "props": _entity_props(e)} for e in entities]
+        await self._unwind(
+            """
+            UNWIND $rows AS row
+            MERGE (e:Entity {id: row.id})
+            SET e += row.props
+            """,
+            rows,
+        )
+        logger.debug("Neo4jKGService.add_entities: %d entities", len(rows))
+
+    async def bulk_update_entity_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        updates = check_update_fields(Entity, updates)
+        await self._unwind(
+            """
+            UNWIND $rows AS row
+            MATCH (en:Entity {id: row.id})
+            SET en += row.props
+            """,
+            _update_rows(updates),
+        )
+
     async def get_entity(self, entity_id: str) -> Entity | None:
         async with self._driver.session() as session:
             result = await session.run(
@@ -158,6 +197,29 @@ class Neo4jKGService(KGServiceBase):
         else:
             logger.debug("Neo4jKGService.add_relation: %s", relation.id)
 
+    async def add_relations(self, relations: Iterable[Relation]) -> None:
+        rows = [
+            {"id": r.id, "src": r.source_id, "tgt": r.target_id, "props": _relation_props(r)}
+            for r in relations
+        ]
+        records = await self._unwind(
+            """
+            UNWIND $rows AS row
+            MATCH (a:Entity {id: row.src}), (b:Entity {id: row.tgt})
+            MERGE (a)-[r:RELATION {id: row.id}]->(b)
+            SET r += row.props
+            RETURN row.id AS id
+            """,
+            rows,
+        )
+        if len(records) < len(rows):
+            logger.warning(
+                "Neo4jKGService.add_relations: skipped %d relation(s) with missing node(s). "
+                "Ensure entities are added first.",
+                len(rows) - len(records),
+            )
+        logger.debug("Neo4jKGService.add_relations: %d relations", len(records))
+
     async def get_relations(
         self, entity_id: str, *, direction: str = "both"
     ) -> list[Relation]:
@@ -218,6 +280,38 @@ class Neo4jKGService(KGServiceBase):
                 )
         logger.debug("Neo4jKGService.add_event: %s", event.id)
 
+    async def add_events(self, events: Iterable[Event]) -> None:
+        rows = [
+            {"id": ev.id, "props": _event_props(ev), "participants": ev.participants}
+            for ev in events
+        ]
+        await self._unwind(
+            """
+            UNWIND $rows AS row
+            MERGE (ev:Event {id: row.id})
+            SET ev += row.props
+            WITH ev, row
+            UNWIND row.participants AS eid
+            MATCH (e:Entity {id: eid})
+            MERGE (e)-[:PARTICIPATES_IN]->(ev)
+            """,
+            rows,
+        )
+        logger.debug("Neo4jKGService.add_events: %d events", len(rows))
+
+    async def bulk_update_event_fields(
+        self, updates: Mapping[str, Mapping[str, Any]]
+    ) -> None:
+        updates = check_update_fields(Event, updates)
+        await self._unwind(
+            """
+            UNWIND $rows AS row
+            MATCH (ev:Event {id: row.id})
+            SET ev += row.props
+            """,
+            _update_rows(updates),
+        )
+
     async def get_event(self, event_id: str) -> Event | None:
         async with self._driver.session() as session:
             result = await session.run(
@@ -334,6 +428,15 @@ class Neo4jKGService(KGServiceBase):
     ) -> tuple:
         raise NotImplementedError("get_snapshot not implemented for Neo4j backend")
 
+    async def get_snapshot_delta(
+        self,
+        book_id: str,
+        mode: str,
+        from_position: int,
+        to_position: int,
+    ) -> SnapshotDelta:
+        raise NotImplementedError("get_snapshot_delta not implemented for Neo4j backend")
+
     # ── Timeline / Path / Subgraph queries ──────────────────────────────────
 
     async def get_entity_timeline(
@@ -355,21 +458,51 @@ class Neo4jKGService(KGServiceBase):
         source_id: str,
         target_id: str,
         max_length: int = 3,
+        *,
+        max_paths: int | None = None,
+        time_budget_ms: int | None = None,
     ) -> list[RelationPath]:
+        if max_paths is None:
+            max_paths = self._path_max_results
+        if time_budget_ms is None:
+            time_budget_ms = self._path_time_budget_ms
+        # Cost per hop as in kg_paths.hop_cost: 1 - ln(weight clamped to [0.001, 1]).
         cypher = f"""
             MATCH path = (a:Entity {{id: $src}})-[:RELATION*1..{max_length}]-(b:Entity {{id: $tgt}})
+            WHERE ALL(n IN nodes(path) WHERE n.document_id IN [a.document_id, b.document_id])
+              AND ALL(i IN range(0, size(nodes(path)) - 2)
+                      WHERE NOT nodes(path)[i] IN nodes(path)[i + 1..])
+            WITH path, reduce(c = 0.0, r IN relationships(path) |
+                c + 1.0 - log(CASE
+                    WHEN coalesce(r.weight, 1.0) < 0.001 THEN 0.001
+                    WHEN coalesce(r.weight, 1.0) > 1.0 THEN 1.0
+                    ELSE coalesce(r.weight, 1.0) END)) AS cost
             RETURN [n IN nodes(path) | n.id] AS node_ids,
                    [n IN nodes(path) | n.name] AS node_names,
                    [r IN relationships(path) | {{
                        relation_type: r.relation_type,
                        description: r.description,
                        weight: r.weight
-                   }}] AS rels
-            LIMIT 20
+                   }}] AS rels,
+                   cost
+            ORDER BY cost
+            LIMIT $limit
         """
-        async with self._driver.session() as session:
-            result = await session.run(cypher, src=source_id, tgt=target_id)
-            records = await result.data()
+        query = Query(cypher, timeout=time_budget_ms / 1000 if time_budget_ms else None)
+        try:
+            async with self._driver.session() as session:
+                result = await session.run(query, src=source_id, tgt=target_id, limit=max_paths)
+                records = await result.data()
+        except ClientError as exc:
+            if "TransactionTimedOut" not in (exc.code or ""):
+                raise
+            logger.info(
+                "Neo4jKGService.get_relation_paths(%s, %s): time budget of %dms spent",
+                source_id,
+                target_id,
+                time_budget_ms,
+            )
+            return []
 
         paths: list[RelationPath] = []
         for rec in records:
@@ -383,7 +516,7 @@ class Neo4jKGService(KGServiceBase):
                     name=nname,
                     relation_from_prev=rels[i - 1] if i > 0 else None,
                 ))
-            paths.append(RelationPath(nodes=nodes))
+            paths.append(RelationPath(nodes=nodes, cost=rec["cost"]))
         return paths
 
     async def get_subgraph(self, entity_id: str, k_hops: int = 2) -> Subgraph:
@@ -442,19 +575,23 @@ class Neo4jKGService(KGServiceBase):
 
         return Subgraph(center=entity_id, nodes=nodes, edges=edges)
 
-    async def get_relation_stats(self, entity_id: str | None = None) -> RelationStats:
+    async def get_relation_stats(
+        self, entity_id: str | None = None, document_id: str | None = None
+    ) -> RelationStats:
         if entity_id is not None:
             cypher = """
                 MATCH (e:Entity {id: $id})-[r:RELATION]-(o:Entity)
+                WHERE ($doc_id IS NULL OR r.document_id = $doc_id)
                 RETURN r.relation_type AS rtype, r.weight AS weight
             """
-            params: dict[str, Any] = {"id": entity_id}
+            params: dict[str, Any] = {"id": entity_id, "doc_id": document_id}
         else:
             cypher = """
                 MATCH ()-[r:RELATION]->()
+                WHERE ($doc_id IS NULL OR r.document_id = $doc_id)
                 RETURN r.relation_type AS rtype, r.weight AS weight
             """
-            params = {}
+            params = {"doc_id": document_id}
 
         async with self._driver.session() as session:
             result = await session.run(cypher, **params)
@@ -535,6 +672,20 @@ class Neo4jKGService(KGServiceBase):
         )
         return counts
 
+    async def _unwind(self, cypher: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run *cypher* over *rows* (bound as ``$rows``), ``_UNWIND_BATCH`` at a time.
+
+        One session and one round trip per batch; returns every batch's records.
+        """
+        records: list[dict[str, Any]] = []
+        if not rows:
+            return records
+        async with self._driver.session() as session:
+            for start in range(0, len(rows), _UNWIND_BATCH):
+                result = await session.run(cypher, rows=rows[start : start + _UNWIND_BATCH])
+                records += await result.data()
+        return records
+
     # ── Persistence (no-op — Neo4j auto-persists) ────────────────────────────
 
     async def save(self) -> None:
@@ -580,6 +731,25 @@ class Neo4jKGService(KGServiceBase):
 # ── Conversion helpers ────────────────────────────────────────────────────────
 
 
+def _update_rows(updates: Mapping[str, Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """``bulk_update_*_fields`` arguments as ``UNWIND`` rows of node properties."""
+    return [
+        {"id": record_id, "props": {k: _prop_value(v) for k, v in changes.items()}}
+        for record_id, changes in updates.items()
+    ]
+
+
+def _prop_value(value: Any) -> Any:
+    """A model field value the way ``_entity_props`` / ``_event_props`` store it."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
 def _entity_props(entity: Entity) -> dict[str, Any]:
     return {
         "name": entity.name,
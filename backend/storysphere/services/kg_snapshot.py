@@ -0,0 +1,203 @@
+"""kg_snapshot — compact binary encoding of one KG shard.
+
+``KGService.save`` writes each book's shard (entities, events, temporal
+relations, edges) in this format; ``decode_shard`` reads it and the plain
+JSON shards of earlier builds alike, so either can sit behind one manifest.
+
+Layout::
+
+    magic    8 bytes     b"SSKGSNAP"
+    version  uint16 LE   SNAPSHOT_VERSION
+    flags    uint16 LE   bit 0 — body is zlib-compressed
+    hlen     uint32 LE   header length
+    header   hlen bytes  JSON: {"document_id": ..., "counts": {...},
+                               "directory": {...}}
+    body     JSON        columnar sections, see ``_to_columns``
+
+The header's ``directory`` lists the shard's entity ids with their names
+and aliases, and its event ids — enough for ``KGService`` to tell which
+book holds a record without loading the body (``read_header_file``).
+Snapshots written before it existed simply lack the key.
+
+Columnar: each section is stored as blocks of ``{"columns": [...],
+"values": [[column 0], [column 1], ...]}`` — field names once per block
+instead of once per record, and long homogeneous arrays that parse fast.
+Records with a different key set (a legacy edge missing newer attributes)
+go in their own block, so a decoded record has exactly the keys it was
+saved with.
+
+The body is JSON produced by ``orjson`` when it is installed and the
+standard library otherwise; the two read each other's output.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langgraph/langsmith
+    orjson = None
+
+SNAPSHOT_MAGIC = b"SSKGSNAP"
+SNAPSHOT_VERSION = 1
+
+_FLAG_ZLIB = 0x1
+_PREFIX = struct.Struct("<8sHHI")
+
+#: Sections keyed by record id in the row layout; edges are a plain list.
+_KEYED_SECTIONS = ("entities", "events", "temporal_relations")
+
+
+def encode_snapshot(payload: dict[str, Any], *, compress: bool = True) -> bytes:
+    """Encode a shard payload (the row layout ``KGService`` builds) to bytes."""
+    header = {
+        "document_id": payload.get("document_id"),
+        "counts": {
+            section: len(payload.get(section) or ())
+            for section in (*_KEYED_SECTIONS, "edges")
+        },
+        "directory": {
+            "entities": [
+                [entity["id"], entity.get("name"), *(entity.get("aliases") or ())]
+                for entity in (payload.get("entities") or {}).values()
+            ],
+            "events": list(payload.get("events") or {}),
+        },
+    }
+    body: dict[str, Any] = {
+        section: _to_columns(list((payload.get(section) or {}).values()))
+        for section in _KEYED_SECTIONS
+    }
+    body["edges"] = _to_columns(payload.get("edges") or [])
+    header_bytes = _dumps(header)
+    body_bytes = _dumps(body)
+    flags = 0
+    if compress:
+        body_bytes = zlib.compress(body_bytes, 1)
+        flags |= _FLAG_ZLIB
+    return (
+        _PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, len(header_bytes))
+        + header_bytes
+        + body_bytes
+    )
+
+
+def decode_shard(data: bytes, *, edge_tuples: bool = False) -> dict[str, Any]:
+    """Decode a shard file's bytes — binary snapshot or legacy JSON — to the row layout.
+
+    With *edge_tuples*, ``edges`` holds ``(source, target, key, attrs)`` —
+    what ``KGService.load`` adds to its graph — instead of flat dicts; a
+    binary snapshot builds them straight from its columns.
+    """
+    if not data.startswith(SNAPSHOT_MAGIC):
+        payload = _loads(data)
+        if edge_tuples:
+            payload["edges"] = [
+                (attrs.pop("source"), attrs.pop("target"), attrs.pop("key"), attrs)
+                for attrs in payload.get("edges", [])
+            ]
+        return payload
+    header, offset, flags = _read_header(data)
+    body_bytes = data[offset:]
+    if flags & _FLAG_ZLIB:
+        body_bytes = zlib.decompress(body_bytes)
+    body = _loads(body_bytes)
+    payload: dict[str, Any] = {"document_id": header.get("document_id")}
+    for section in _KEYED_SECTIONS:
+        payload[section] = {row["id"]: row for row in _from_columns(body.get(section, []))}
+    edge_blocks = body.get("edges", [])
+    payload["edges"] = _edge_tuples(edge_blocks) if edge_tuples else _from_columns(edge_blocks)
+    return payload
+
+
+def read_header(data: bytes) -> dict[str, Any] | None:
+    """The header of a binary snapshot without decoding its body; None for JSON shards."""
+    if not data.startswith(SNAPSHOT_MAGIC):
+        return None
+    return _read_header(data)[0]
+
+
+def read_header_file(path: Path) -> dict[str, Any] | None:
+    """``read_header`` for a shard on disk, reading only the header's bytes."""
+    with open(path, "rb") as fh:
+        prefix = fh.read(_PREFIX.size)
+        if not prefix.startswith(SNAPSHOT_MAGIC) or len(prefix) < _PREFIX.size:
+            return None
+        header_len = _PREFIX.unpack(prefix)[3]
+        return _read_header(prefix + fh.read(header_len))[0]
+
+
+def _read_header(data: bytes) -> tuple[dict[str, Any], int, int]:
+    _magic, version, flags, header_len = _PREFIX.unpack_from(data)
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(
+            f"KG snapshot version {version}; this build reads up to {SNAPSHOT_VERSION}"
+        )
+    start = _PREFIX.size
+    return _loads(data[start : start + header_len]), start + header_len, flags
+
+
+def _to_columns(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    blocks: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        blocks.setdefault(tuple(row), []).append(row)
+    # Rows of a block share their key order, so transposing the values is
+    # enough; zip() does it in C.
+    return [
+        {"columns": list(columns), "values": list(zip(*map(dict.values, group), strict=True))}
+        for columns, group in blocks.items()
+    ]
+
+
+def _from_columns(blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for block in blocks:
+        columns, values = _block_columns(block)
+        # Rebuilding the dicts is the bulk of decoding: one comprehension, and
+        # the width was checked above, so no per-row strict check.
+        rows += [dict(zip(columns, row, strict=False)) for row in zip(*values, strict=True)]
+    return rows
+
+
+def _edge_tuples(blocks: list[dict[str, Any]]) -> list[tuple[Any, Any, Any, dict[str, Any]]]:
+    edges: list[tuple[Any, Any, Any, dict[str, Any]]] = []
+    for block in blocks:
+        columns, values = _block_columns(block)
+        by_column = dict(zip(columns, values, strict=True))
+        ends = [by_column.pop(name) for name in ("source", "target", "key")]
+        attr_columns = list(by_column)
+        if attr_columns:
+            attrs = [
+                dict(zip(attr_columns, row, strict=False))
+                for row in zip(*by_column.values(), strict=True)
+            ]
+        else:
+            attrs = [{} for _ in ends[0]]
+        edges += zip(*ends, attrs, strict=True)
+    return edges
+
+
+def _block_columns(block: dict[str, Any]) -> tuple[list[str], list[list[Any]]]:
+    columns, values = block["columns"], block["values"]
+    if len(columns) != len(values):
+        raise ValueError(f"KG snapshot block has {len(values)} value columns for {columns}")
+    return columns, values
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode(
+        "utf-8"
+    )
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
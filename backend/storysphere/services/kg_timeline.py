@@ -0,0 +1,142 @@
+"""kg_timeline — per-book interval index behind ``KGService.get_snapshot``.
+
+A record is visible at a position when ``start <= position < end``: events
+from their chapter (or ``chron_index``) on, entities from their first
+appearance until ``valid_to``, relations inside their own validity window
+*and* both endpoints'.  ``TimelineIndex`` stores one book's records sorted by
+``start`` for one mode (``"chapter"`` or ``"story"``), so a snapshot is a
+``bisect`` plus a check of ``end`` over that prefix, and the change between
+two positions only looks at records starting or ending in between.
+
+Records come back ordered by ``start``, ties in the order they were given.
+The index holds the record objects themselves; ``KGService`` drops it when
+the book changes.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from storysphere.domain.entities import Entity
+from storysphere.domain.events import Event
+from storysphere.domain.relations import Relation
+from storysphere.services.query_models import SnapshotDelta
+
+T = TypeVar("T")
+
+_NEVER = float("inf")  # end of a window that does not close
+
+
+@dataclass
+class _Intervals(Generic[T]):
+    """Records with ``[start, end)`` windows, by start and by (finite) end."""
+
+    starts: list[float] = field(default_factory=list)
+    items: list[tuple[float, float, T]] = field(default_factory=list)  # by start
+    ends: list[float] = field(default_factory=list)
+    ending: list[tuple[float, float, T]] = field(default_factory=list)  # finite ends, by end
+
+    @classmethod
+    def build(cls, windows: list[tuple[float, float, T]]) -> _Intervals[T]:
+        windows = [w for w in windows if w[0] < w[1]]  # empty windows never show
+        items = sorted(windows, key=lambda w: w[0])  # stable: ties keep input order
+        ending = sorted((w for w in windows if w[1] != _NEVER), key=lambda w: w[1])
+        return cls(
+            starts=[w[0] for w in items],
+            items=items,
+            ends=[w[1] for w in ending],
+            ending=ending,
+        )
+
+    def at(self, position: int) -> list[T]:
+        """Records visible at *position*."""
+        prefix = self.items[: bisect_right(self.starts, position)]
+        return [item for _, end, item in prefix if end > position]
+
+    def entering(self, after: int, upto: int) -> list[T]:
+        """Records visible at *upto* but not at *after* (``after < upto``)."""
+        window = self.items[bisect_right(self.starts, after) : bisect_right(self.starts, upto)]
+        return [item for _, end, item in window if end > upto]
+
+    def leaving(self, after: int, upto: int) -> list[T]:
+        """Records visible at *after* but not at *upto* (``after < upto``)."""
+        window = self.ending[bisect_right(self.ends, after) : bisect_right(self.ends, upto)]
+        return [item for start, _, item in window if start <= after]
+
+
+class TimelineIndex:
+    """One book's events, entities and relations as validity windows, for one mode."""
+
+    def __init__(
+        self,
+        mode: str,
+        events: Sequence[Event],
+        entities: Sequence[Entity],
+        relations: Sequence[Relation],
+    ) -> None:
+        if mode == "chapter":
+            event_windows = [(ev.chapter or 0, _NEVER, ev) for ev in events]
+            entity_window = {
+                e.id: (e.first_appearance_chapter or 0, _end(e.valid_to_chapter))
+                for e in entities
+            }
+        else:  # "story": records without a chron_index are never visible
+            event_windows = [
+                (ev.chron_index, _NEVER, ev) for ev in events if ev.chron_index is not None
+            ]
+            entity_window = {
+                e.id: (e.first_chron_index, _end(e.valid_to_chron_index))
+                for e in entities
+                if e.first_chron_index is not None
+            }
+        relation_windows = []
+        for r in relations:
+            source = entity_window.get(r.source_id)
+            target = entity_window.get(r.target_id)
+            if source is None or target is None:
+                continue
+            if mode == "chapter":
+                start, end = r.valid_from_chapter, r.valid_to_chapter
+            else:
+                start, end = r.valid_from_chron_index, r.valid_to_chron_index
+            relation_windows.append(
+                (
+                    max(-_NEVER if start is None else start, source[0], target[0]),
+                    min(_end(end), source[1], target[1]),
+                    r,
+                )
+            )
+        self.events = _Intervals.build(event_windows)
+        self.entities = _Intervals.build(
+            [(*entity_window[e.id], e) for e in entities if e.id in entity_window]
+        )
+        self.relations = _Intervals.build(relation_windows)
+
+    def snapshot(self, position: int) -> tuple[list[Event], list[Entity], list[Relation]]:
+        return (
+            self.events.at(position),
+            self.entities.at(position),
+            self.relations.at(position),
+        )
+
+    def delta(self, from_position: int, to_position: int) -> SnapshotDelta:
+        """``snapshot(to_position)`` minus / plus ``snapshot(from_position)``."""
+        if from_position <= to_position:
+            lo, hi, forward = from_position, to_position, True
+        else:
+            lo, hi, forward = to_position, from_position, False
+        parts = {}
+        for name in ("events", "entities", "relations"):
+            intervals: _Intervals = getattr(self, name)
+            entering, leaving = intervals.entering(lo, hi), intervals.leaving(lo, hi)
+            added, removed = (entering, leaving) if forward else (leaving, entering)
+            parts[f"added_{name}"] = added
+            parts[f"removed_{name}"] = removed
+        return SnapshotDelta(**parts)
+
+
+def _end(valid_to: int | None) -> float:
+    return _NEVER if valid_to is None else valid_to
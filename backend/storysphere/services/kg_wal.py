@@ -0,0 +1,97 @@
+"""kg_wal — append-only log of KG mutations made since the last snapshot.
+
+``KGService`` appends one JSON line per mutation (``add_entity``,
+``update_event_chron_index``, …) to ``_wal.jsonl`` in its shard directory,
+replays the log after loading the shards, and empties it once ``save`` has
+written every dirty shard.  A mutation therefore costs one short append
+instead of a shard rewrite, and survives a crash of the process before the
+next ``save``.
+
+Each record is flushed to the OS as it is written, not fsynced: a process
+crash loses nothing, an OS crash may lose the last records.  A line torn
+by such a crash is skipped on replay.
+
+Another ``KGService`` on the same path replays the log on ``load``, saves
+and unlinks it.  The append handle is therefore checked against the path
+before each write and reopened when the file was replaced or removed, so
+later records land in the file the next ``load`` reads, not in an
+unlinked inode.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+#: File name of the log inside the shard directory.  Shard files never use
+#: it: document shards do not start with "_", hashed ones are "_" + 40 hex.
+MUTATION_LOG_NAME = "_wal.jsonl"
+
+
+class MutationLog:
+    """The mutation log at *path*; the file is created on first append."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.records = 0  # records in the file, once read() or append() ran
+        self._fh: IO[bytes] | None = None
+
+    def append(self, record: dict[str, Any]) -> None:
+        if self._fh is not None and not self._is_current():
+            # Replayed and cleared by another instance: its records are in the
+            # shards now, so start the file afresh.
+            self.close()
+            self.records = 0
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "ab")  # noqa: SIM115 - held open between appends
+            if self._fh.tell() and not self.path.read_bytes().endswith(b"\n"):
+                self._fh.write(b"\n")  # keep a torn tail off the next record
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        self._fh.write(line.encode("utf-8") + b"\n")
+        self._fh.flush()
+        self.records += 1
+
+    def _is_current(self) -> bool:
+        """Whether the open handle is still the file at ``path``."""
+        try:
+            on_disk = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        held = os.fstat(self._fh.fileno())
+        return (on_disk.st_dev, on_disk.st_ino) == (held.st_dev, held.st_ino)
+
+    def read(self) -> list[dict[str, Any]]:
+        """Every complete record, oldest first."""
+        if not self.path.exists():
+            self.records = 0
+            return []
+        records: list[dict[str, Any]] = []
+        with open(self.path, "rb") as fh:
+            for number, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.warning(
+                        "KG mutation log %s: skipping torn line %d", self.path, number
+                    )
+        self.records = len(records)
+        return records
+
+    def clear(self) -> None:
+        """Empty the log — its records are all in the shards now."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
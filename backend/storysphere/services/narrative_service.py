@@ -601,8 +601,9 @@ class NarrativeService:
         overtook the cached analysis. See services/cache_invalidation.py.
         """
         from storysphere.services.cache_invalidation import staleness  # noqa: PLC0415
+        from storysphere.services.document_service import PROJECTION_HEADERS  # noqa: PLC0415
 
-        doc = await self._doc.get_document(document_id)
+        doc = await self._doc.get_document(document_id, projection=PROJECTION_HEADERS)
         if doc is None:
             return False, None
         return await staleness(
@@ -688,7 +689,9 @@ class NarrativeService:
                         await self._cache.set(ns_key, ns.model_dump())
                 return stages
 
-        doc = await self._doc.get_document(document_id)
+        from storysphere.services.document_service import PROJECTION_HEADERS  # noqa: PLC0415
+
+        doc = await self._doc.get_document(document_id, projection=PROJECTION_HEADERS)
         if not doc or not doc.chapters:
             logger.warning("map_hero_journey: no chapters found for document=%s", document_id)
             return []
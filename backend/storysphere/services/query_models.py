@@ -6,8 +6,16 @@ providing typed, IDE-friendly results for the tools and API layers.
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
+from storysphere.domain.documents import ChapterRole, FileType, PipelineStatus
+from storysphere.domain.entities import Entity
+from storysphere.domain.events import Event
+from storysphere.domain.relations import Relation
+from storysphere.domain.timeline import TimelineConfig
+
 # ── Document / Chapter ────────────────────────────────────────────────────────
 
 
@@ -21,6 +29,56 @@ class DocumentSummary(BaseModel):
     pipeline_status_json: str | None = Field(default=None, description="JSON-encoded PipelineStatus")
 
 
+class ChapterHeader(BaseModel):
+    """Chapter metadata carried by ``DocumentHeader`` — no paragraphs."""
+
+    id: str = Field(description="Chapter UUID")
+    number: int = Field(description="Story chapter number (front matter ≤ 0)")
+    title: str | None = Field(default=None, description="Chapter title, if any")
+    role: ChapterRole = Field(default=ChapterRole.body, description="Chapter role")
+    summary: str | None = Field(default=None, description="Chapter summary, if generated")
+    paragraph_count: int = Field(default=0, description="Number of stored paragraphs")
+
+
+class DocumentHeader(BaseModel):
+    """Document row plus chapter metadata, returned by ``DocumentService.get_document_header``.
+
+    Everything ``Document`` carries except paragraphs, so endpoints that only
+    404-check a book or read its title / language / status do not pay for
+    hydrating the whole text.
+    """
+
+    id: str = Field(description="Document UUID")
+    title: str = Field(description="Book title")
+    author: str | None = Field(default=None, description="Author, if known")
+    file_path: str = Field(description="Path of the uploaded source file")
+    file_type: FileType = Field(description="Source file type")
+    summary: str | None = Field(default=None, description="Book-level summary")
+    keywords: dict[str, float] | None = Field(default=None, description="Book keyword scores")
+    language: str = Field(default="en", description="ISO 639-1 language code")
+    processed_at: datetime | None = Field(default=None, description="When ingestion finished")
+    timeline_config: TimelineConfig | None = Field(default=None, description="Timeline config")
+    pipeline_status: PipelineStatus = Field(
+        default_factory=PipelineStatus, description="Per-step ingestion status"
+    )
+    chapters: list[ChapterHeader] = Field(
+        default_factory=list, description="Chapters in number order"
+    )
+
+    @property
+    def total_chapters(self) -> int:
+        return len(self.chapters)
+
+    @property
+    def body_chapter_count(self) -> int:
+        """Story chapters only — see ``Document.body_chapter_count``."""
+        return sum(1 for c in self.chapters if c.role == ChapterRole.body)
+
+    @property
+    def total_paragraphs(self) -> int:
+        return sum(c.paragraph_count for c in self.chapters)
+
+
 class ChapterKeywordMatch(BaseModel):
     """Chapter entry returned by ``DocumentService.search_chapters_by_keyword``."""
 
@@ -33,7 +91,8 @@ class ChapterKeywordMatch(BaseModel):
 
 
 class VectorSearchResult(BaseModel):
-    """Single hit returned by ``VectorService.search``."""
+    """Single hit returned by ``VectorService.search``,
+    ``DocumentService.search_paragraphs_by_text`` and ``HybridSearchService.search``."""
 
     id: str = Field(description="Qdrant point ID")
     score: float = Field(description="Cosine similarity score")
@@ -41,6 +100,10 @@ class VectorSearchResult(BaseModel):
     document_id: str = Field(description="Parent document UUID")
     chapter_number: int = Field(description="Chapter number (1-based)")
     position: int = Field(description="Paragraph position within chapter")
+    snippet: str | None = Field(
+        default=None,
+        description="Text excerpt with matches wrapped in <mark> (full-text search only)",
+    )
 
 
 class KeywordSearchResult(BaseModel):
@@ -74,6 +137,10 @@ class RelationPath(BaseModel):
     """One simple path between two entities, as returned by ``KGService.get_relation_paths``."""
 
     nodes: list[PathNode] = Field(default_factory=list, description="Ordered list of nodes along the path")
+    cost: float | None = Field(
+        default=None,
+        description="Search cost: 1 − ln(weight) per hop, so lower is shorter and stronger",
+    )
 
 
 # ── Knowledge-graph subgraph ──────────────────────────────────────────────────
@@ -105,6 +172,28 @@ class Subgraph(BaseModel):
     edges: list[SubgraphEdge] = Field(default_factory=list, description="All edges within the subgraph")
 
 
+# ── Knowledge-graph snapshots ─────────────────────────────────────────────────
+
+
+class SnapshotDelta(BaseModel):
+    """Change between two positions, returned by ``KGService.get_snapshot_delta``.
+
+    ``get_snapshot(to)`` is ``get_snapshot(from)`` with the ``removed_*``
+    records taken out and the ``added_*`` ones put in.
+    """
+
+    added_events: list[Event] = Field(default_factory=list, description="Events that appear")
+    removed_events: list[Event] = Field(default_factory=list, description="Events that go")
+    added_entities: list[Entity] = Field(default_factory=list, description="Entities that appear")
+    removed_entities: list[Entity] = Field(default_factory=list, description="Entities that go")
+    added_relations: list[Relation] = Field(
+        default_factory=list, description="Relations that appear"
+    )
+    removed_relations: list[Relation] = Field(
+        default_factory=list, description="Relations that go"
+    )
+
+
 # ── Knowledge-graph statistics ────────────────────────────────────────────────
 
 
@@ -308,6 +308,8 @@ class SymbolService:
         Raises:
             ValueError: If the imagery entity is not found or book_id mismatches.
         """
+        from storysphere.services.document_service import PROJECTION_NO_EMBEDDINGS  # noqa: PLC0415
+
         cache_key = _sep_cache_key(book_id, imagery_id)
 
         if not force:
@@ -322,7 +324,7 @@ class SymbolService:
         entity, occurrences, document, events = await asyncio.gather(
             self.get_imagery_by_id(imagery_id),
             self.get_occurrences(imagery_id),
-            doc_service.get_document(book_id),
+            doc_service.get_document(book_id, projection=PROJECTION_NO_EMBEDDINGS),
             kg_service.get_events(document_id=book_id),
         )
 
@@ -451,6 +453,8 @@ class SymbolService:
         Raises:
             ValueError: If the book is not found.
         """
+        from storysphere.services.document_service import PROJECTION_NO_EMBEDDINGS  # noqa: PLC0415
+
         cache_key = _overview_cache_key(book_id)
 
         if not force:
@@ -462,7 +466,7 @@ class SymbolService:
         entities, occurrences, document, events, kg_entities = await asyncio.gather(
             self.get_imagery_list(book_id),
             self.get_occurrences_by_book(book_id),
-            doc_service.get_document(book_id),
+            doc_service.get_document(book_id, projection=PROJECTION_NO_EMBEDDINGS),
             kg_service.get_events(document_id=book_id),
             kg_service.list_entities(document_id=book_id),
         )
@@ -0,0 +1,201 @@
+"""vector_migration — move per-book Qdrant collections into one shared collection.
+
+Usage (CLI):
+    python -m storysphere.services.vector_migration --to storysphere_paragraphs [--drop-source]
+
+Then set ``QDRANT_SHARED_COLLECTION`` to the same name so ``VectorService``
+reads and writes the shared collection.
+
+Points keep their ids, vectors and payload, so the migration is idempotent:
+running it again overwrites the copies instead of duplicating them.  A source
+collection is only dropped (``--drop-source``) once the shared collection
+holds at least as many points for that book as were copied.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from qdrant_client import QdrantClient, models
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate_to_shared_collection(
+    target: str | None = None,
+    *,
+    client: QdrantClient | None = None,
+    prefix: str | None = None,
+    vector_size: int | None = None,
+    batch_size: int = 256,
+    drop_source: bool = False,
+    verbose: bool = False,
+) -> dict[str, int]:
+    """Copy every per-book collection into the shared collection *target*.
+
+    Args:
+        target:      Shared collection name (default: ``qdrant_shared_collection``).
+        client:      Qdrant client (default: the one ``VectorService`` would open).
+        prefix:      Per-book collection prefix (default: ``qdrant_collection_prefix``).
+        vector_size: Vector size of the shared collection (default: ``qdrant_vector_size``).
+        batch_size:  Points read and written per batch.
+        drop_source: Drop each per-book collection once its points are copied.
+        verbose:     Emit per-batch progress logs when True.
+
+    Returns:
+        Dict with counts: ``{collections, points, dropped}``.
+    """
+    from storysphere.config.settings import get_settings  # noqa: PLC0415
+    from storysphere.services.vector_service import VectorService  # noqa: PLC0415
+
+    target = target or get_settings().qdrant_shared_collection
+    if not target:
+        raise ValueError("No shared collection named (--to / QDRANT_SHARED_COLLECTION)")
+
+    books = VectorService(client=client, prefix=prefix, shared_collection="")
+    shared = VectorService(
+        client=books._client, vector_size=vector_size, prefix=prefix, shared_collection=target
+    )
+    await shared.ensure_collection(target)
+    loop = asyncio.get_running_loop()
+
+    counts = {"collections": 0, "points": 0, "dropped": 0}
+    for suffix in books.list_book_collections():
+        source = books._col(suffix)
+        if source == target:
+            continue
+        copied = 0
+        document_id = ""
+        offset = None
+        while True:
+            points, offset = await loop.run_in_executor(
+                None,
+                lambda source=source, offset=offset: books._client.scroll(
+                    collection_name=source,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True,
+                ),
+            )
+            if points:
+                paragraphs = [_as_paragraph(point, suffix) for point in points]
+                document_id = paragraphs[0]["document_id"]
+                copied += await shared.upsert_paragraphs(paragraphs, document_id=document_id)
+                if verbose:
+                    logger.info("  %s: %d points copied", source, copied)
+            if offset is None:
+                break
+        counts["collections"] += 1
+        counts["points"] += copied
+        logger.info("Copied %d points from '%s' into '%s'", copied, source, target)
+
+        if drop_source:
+            in_target = await loop.run_in_executor(
+                None,
+                lambda document_id=document_id: shared._client.count(
+                    target,
+                    count_filter=models.Filter(
+                        must=[VectorService._doc_condition([document_id])]
+                    ),
+                    exact=True,
+                ).count,
+            )
+            if copied and in_target < copied:
+                logger.warning(
+                    "Keeping '%s': only %d of %d points found in '%s'",
+                    source, in_target, copied, target,
+                )
+                continue
+            await books.delete_collection(suffix)
+            counts["dropped"] += 1
+
+    if drop_source and not books.list_book_collections():
+        # Nothing left for the per-book keyword revisions to stamp.
+        await loop.run_in_executor(None, books._client.delete_collection, books._revisions)
+
+    logger.info(
+        "Vector migration complete: %d collections, %d points, %d dropped",
+        counts["collections"],
+        counts["points"],
+        counts["dropped"],
+    )
+    return counts
+
+
+def _as_paragraph(point: models.Record, suffix: str) -> dict:
+    """A scrolled point as the paragraph dict ``upsert_paragraphs`` takes."""
+    payload = point.payload or {}
+    return {
+        **payload,
+        "id": str(point.id),
+        "embedding": point.vector,
+        # Points written before document_id was in the payload: fall back to
+        # the collection suffix, which is what _col() resolves it from.
+        "document_id": payload.get("document_id") or suffix,
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m storysphere.services.vector_migration",
+        description="Move per-book Qdrant collections into one shared collection.",
+    )
+    parser.add_argument(
+        "--to",
+        dest="target",
+        default=None,
+        help="Shared collection name (default: QDRANT_SHARED_COLLECTION)",
+    )
+    parser.add_argument(
+        "--prefix",
+        default=None,
+        help="Per-book collection prefix (default: QDRANT_COLLECTION_PREFIX)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="Points per read/write batch (default: 256)",
+    )
+    parser.add_argument(
+        "--drop-source",
+        action="store_true",
+        help="Drop each per-book collection after its points are copied",
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Show per-batch progress",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s  %(levelname)-8s  %(message)s",
+        stream=sys.stdout,
+    )
+
+    args = _build_parser().parse_args()
+
+    result = asyncio.run(
+        migrate_to_shared_collection(
+            args.target,
+            prefix=args.prefix,
+            batch_size=args.batch_size,
+            drop_source=args.drop_source,
+            verbose=args.verbose,
+        )
+    )
+
+    print(
+        f"\nMigration done — "
+        f"{result['collections']} collections, "
+        f"{result['points']} points, "
+        f"{result['dropped']} dropped."
+    )
@@ -7,24 +7,57 @@ per-book management.
 Collection names use a human-readable slug derived from the book title
 (e.g. ``storysphere_book_three_little_pigs``).  The service resolves a
 ``document_id`` (UUID) to the correct collection at query time using a
-lazy scan-and-cache strategy.
+lazy scan-and-cache strategy.  New collections store vectors as the
+``qdrant_quantization`` / ``qdrant_on_disk_vectors`` settings say (see
+``vector_storage_config``); existing ones keep what they were created with.
+
+Alternatively (``qdrant_shared_collection``), every book lives in one shared
+collection whose ``document_id`` and ``keywords`` payload fields are indexed:
+a book is a filter rather than a collection, and cross-book search is a
+single query instead of one per book.  ``services.vector_migration`` moves
+per-book collections into it.
+
+Query embeddings are kept in an LRU keyed by (model, normalised text), and
+queries issued together — in one ``embed_queries`` call, or by concurrent
+``search`` calls — go to the model as one batch; see ``embed_queries``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import re
+import unicodedata
+import uuid
+import warnings
+from collections import OrderedDict
+from collections.abc import Sequence
 from functools import partial
 from typing import Any
 
 from qdrant_client import QdrantClient, models
 
 from storysphere.core.utils.url_masking import mask_url
+from storysphere.services.keyword_index import KeywordIndex
 from storysphere.services.query_models import KeywordSearchResult, VectorSearchResult
 
 logger = logging.getLogger(__name__)
 
+#: Most books ``list_book_collections`` reports for a shared collection.
+_MAX_BOOKS = 100_000
+
+#: Points per scroll page when loading a book's keyword index.
+_SCROLL_BATCH = 1024
+
+#: A query miss waiting in a batch: (cache key, text, its callers' future).
+_QueuedQuery = tuple[tuple[str, str], str, "asyncio.Future[tuple[float, ...]]"]
+
+
+def _revision_id(key: str) -> str:
+    """Point id of a keyword-index key in the revisions collection."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, key))
+
 
 def title_slug(title: str) -> str:
     """Convert a book title to a Qdrant-safe collection name slug.
@@ -41,6 +74,43 @@ def title_slug(title: str) -> str:
     return slug[:50] or "untitled"
 
 
+def vector_storage_config(
+    vector_size: int, quantization: str = "none", on_disk: bool = False
+) -> dict[str, Any]:
+    """``create_collection`` arguments for paragraph vectors.
+
+    *quantization* is ``"none"``, ``"scalar"`` (int8) or ``"binary"``.
+    Quantized vectors are kept in RAM (``always_ram``) even when the
+    originals are *on_disk*, so only rescoring reads from disk.
+    """
+    quantization_config: models.QuantizationConfig | None = None
+    if quantization == "scalar":
+        quantization_config = models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+    elif quantization == "binary":
+        quantization_config = models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True)
+        )
+    return {
+        "vectors_config": models.VectorParams(
+            size=vector_size,
+            distance=models.Distance.COSINE,
+            on_disk=on_disk or None,
+        ),
+        "quantization_config": quantization_config,
+    }
+
+
+def quantized_search_params(oversampling: float) -> models.SearchParams:
+    """Search params for quantized collections: oversample, then rescore in float32."""
+    return models.SearchParams(
+        quantization=models.QuantizationSearchParams(rescore=True, oversampling=oversampling)
+    )
+
+
 class VectorService:
     """Semantic search over paragraph embeddings stored in Qdrant.
 
@@ -49,6 +119,10 @@ class VectorService:
     The service resolves ``document_id`` (UUID) to the correct collection
     at query time via a lazy scan-and-cache strategy.
 
+    With *shared_collection* (default: ``qdrant_shared_collection``), all
+    books share that one collection instead and are told apart by their
+    ``document_id`` payload; the public methods behave the same either way.
+
     Usage::
 
         svc = VectorService()
@@ -63,12 +137,16 @@ class VectorService:
         vector_size: int | None = None,
         in_memory: bool | None = None,
         prefix: str | None = None,
+        shared_collection: str | None = None,
     ) -> None:
         from storysphere.config.settings import get_settings  # noqa: PLC0415
 
         settings = get_settings()
         self._prefix = prefix or settings.qdrant_collection_prefix
         self._vector_size = vector_size or settings.qdrant_vector_size
+        self._shared = (
+            settings.qdrant_shared_collection if shared_collection is None else shared_collection
+        )
 
         if client is not None:
             self._client = client
@@ -98,10 +176,43 @@ class VectorService:
                 ) from exc
             logger.info("VectorService: connected to %s", mask_url(settings.qdrant_url))
 
+        # Vector storage of new collections, and the matching search params.
+        self._quantization = settings.qdrant_quantization
+        self._on_disk_vectors = settings.qdrant_on_disk_vectors
+        self._search_params: models.SearchParams | None = None
+        if self._quantization != "none":
+            if self._is_local():
+                logger.info(
+                    "VectorService: local Qdrant always searches exact float32 vectors; "
+                    "qdrant_quantization=%s has no effect",
+                    self._quantization,
+                )
+            else:
+                self._search_params = quantized_search_params(
+                    settings.qdrant_quantization_oversampling
+                )
+
         self._embedding_fn = None  # lazy
+        # Query embeddings: (model, normalised text) → vector, LRU first.
+        self._embedding_model = settings.embedding_model_name
+        self._query_cache_size = settings.embedding_query_cache_size
+        self._query_vectors: OrderedDict[tuple[str, str], tuple[float, ...]] = OrderedDict()
+        # Misses being embedded, or waiting for the next batch.
+        self._pending_queries: dict[tuple[str, str], asyncio.Future[tuple[float, ...]]] = {}
+        self._query_batch: list[_QueuedQuery] = []
+        self._query_batch_task: asyncio.Task[None] | None = None
         self._created_collections: set[str] = set()
         # document_id (UUID) → Qdrant collection name; built lazily
         self._doc_col_cache: dict[str, str] = {}
+        # Collection (or, shared, document_id) → keyword ranking; loaded lazily.
+        self._keyword_indexes: dict[str, KeywordIndex] = {}
+        self._keyword_writes: dict[str, int] = {}  # upserts seen per key
+        # Every writer, in any process, stamps a key's revision here; an index
+        # built at another revision is rebuilt.  Not "{prefix}_…", so it is
+        # never listed as a book.
+        self._revisions = f"_{self._shared or self._prefix}_keyword_revisions"
+        self._revisions_exist = False
+        self._keyword_index_revisions: dict[str, str | None] = {}  # key → built at
 
     # ── Collection naming ──────────────────────────────────────────────────
 
@@ -112,16 +223,24 @@ class VectorService:
         """Derive the Qdrant collection name for a given book."""
         return f"{prefix}_{document_id}"
 
+    @property
+    def shared_collection(self) -> str:
+        """Name of the collection shared by all books; empty for per-book collections."""
+        return self._shared
+
     def _col(self, document_id: str) -> str:
         """Resolve document_id (UUID or slug) → Qdrant collection name.
 
-        Resolution order:
+        With a shared collection that is always its name.  Otherwise, in
+        resolution order:
         1. Cache hit (document_id → collection_name).
         2. Already-created collection (_created_collections) — no Qdrant call.
         3. Direct name ``{prefix}_{document_id}`` exists in Qdrant.
         4. Scan all book collections, read one payload point each to build
            the UUID → collection_name cache, then retry lookup.
         """
+        if self._shared:
+            return self._shared
         if document_id in self._doc_col_cache:
             return self._doc_col_cache[document_id]
 
@@ -155,8 +274,31 @@ class VectorService:
 
     # ── Collection management ─────────────────────────────────────────────
 
+    def _is_local(self) -> bool:
+        """Whether the client is local-mode Qdrant (in-memory or a local path)."""
+        options = getattr(self._client, "init_options", None) or {}
+        return options.get("location") == ":memory:" or bool(options.get("path"))
+
+    def _collection_config(self) -> dict[str, Any]:
+        """``create_collection`` arguments for vector storage, per the settings."""
+        return vector_storage_config(self._vector_size, self._quantization, self._on_disk_vectors)
+
+    @staticmethod
+    def _doc_condition(document_ids: Sequence[str]) -> models.FieldCondition:
+        """Payload condition selecting the points of *document_ids*."""
+        if len(document_ids) == 1:
+            match = models.MatchValue(value=document_ids[0])
+        else:
+            match = models.MatchAny(any=list(document_ids))
+        return models.FieldCondition(key="document_id", match=match)
+
     async def ensure_collection(self, document_id: str) -> None:
-        """Create the per-book collection if it doesn't exist (idempotent)."""
+        """Create the per-book (or the shared) collection if it doesn't exist (idempotent)."""
+        if self._shared:
+            if self._shared not in self._created_collections:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._ensure_shared_collection)
+            return
         # Use the direct name — avoid calling _col() here to prevent a redundant
         # get_collections() call when the collection doesn't exist yet.
         name = f"{self._prefix}_{document_id}"
@@ -175,20 +317,40 @@ class VectorService:
             partial(
                 self._client.create_collection,
                 collection_name=name,
-                vectors_config=models.VectorParams(
-                    size=self._vector_size,
-                    distance=models.Distance.COSINE,
-                ),
+                **self._collection_config(),
             ),
         )
         self._created_collections.add(name)
         self._doc_col_cache[document_id] = name
+        self._keyword_indexes[name] = KeywordIndex()
         logger.info("VectorService: created collection '%s'", name)
 
+    def _ensure_shared_collection(self) -> None:
+        """Create the shared collection and its payload indexes (sync, idempotent)."""
+        name = self._shared
+        if not self._client.collection_exists(name):
+            self._client.create_collection(collection_name=name, **self._collection_config())
+            logger.info("VectorService: created shared collection '%s'", name)
+        with warnings.catch_warnings():
+            # Local-mode Qdrant accepts payload indexes but warns they do nothing.
+            warnings.filterwarnings("ignore", "Payload indexes have no effect")
+            for field in ("document_id", "keywords"):
+                self._client.create_payload_index(
+                    collection_name=name,
+                    field_name=field,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
+        self._created_collections.add(name)
+
     async def delete_collection(self, document_id: str) -> bool:
-        """Drop a book's collection. Returns True if deleted."""
-        name = self._col(document_id)
+        """Drop a book's collection (its points, with a shared collection).
+
+        Returns True if anything was deleted.
+        """
         loop = asyncio.get_running_loop()
+        if self._shared:
+            return await loop.run_in_executor(None, self._delete_shared_book, document_id)
+        name = self._col(document_id)
         cols = await loop.run_in_executor(None, self._client.get_collections)
         existing = [c.name for c in cols.collections]
         if name not in existing:
@@ -197,6 +359,8 @@ class VectorService:
             None, partial(self._client.delete_collection, collection_name=name)
         )
         self._created_collections.discard(name)
+        self._keyword_indexes.pop(name, None)
+        await loop.run_in_executor(None, self._bump_keyword_revisions, [name])
         # Evict any cached document_id → name entries for this collection
         self._doc_col_cache = {
             k: v for k, v in self._doc_col_cache.items() if v != name
@@ -204,8 +368,39 @@ class VectorService:
         logger.info("VectorService: deleted collection '%s'", name)
         return True
 
+    def _shared_exists(self) -> bool:
+        """Whether the shared collection exists yet (sync)."""
+        if self._shared in self._created_collections:
+            return True
+        return self._client.collection_exists(self._shared)
+
+    def _delete_shared_book(self, document_id: str) -> bool:
+        """Delete one book's points from the shared collection (sync)."""
+        if not self._shared_exists():
+            return False
+        book = models.Filter(must=[self._doc_condition([document_id])])
+        if not self._client.count(self._shared, count_filter=book, exact=True).count:
+            return False
+        self._client.delete(self._shared, points_selector=models.FilterSelector(filter=book))
+        self._keyword_indexes.pop(document_id, None)
+        self._bump_keyword_revisions([document_id])
+        logger.info(
+            "VectorService: deleted book '%s' from shared collection '%s'",
+            document_id,
+            self._shared,
+        )
+        return True
+
     def list_book_collections(self) -> list[str]:
-        """Return document_ids that have collections (filter by prefix)."""
+        """Return document_ids that have collections (filter by prefix).
+
+        With a shared collection: the ``document_id`` values present in it.
+        """
+        if self._shared:
+            if not self._shared_exists():
+                return []
+            facets = self._client.facet(self._shared, key="document_id", limit=_MAX_BOOKS)
+            return [str(hit.value) for hit in facets.hits]
         prefix_with_sep = f"{self._prefix}_"
         doc_ids: list[str] = []
         for col in self._client.get_collections().collections:
@@ -220,20 +415,34 @@ class VectorService:
         query_text: str,
         top_k: int = 5,
         document_id: str | None = None,
+        document_ids: Sequence[str] | None = None,
     ) -> list[VectorSearchResult]:
         """Semantic search: embed *query_text* → Qdrant search → return scored paragraphs.
 
         When *document_id* is provided, searches only that book's collection.
-        When *document_id* is None, searches across all book collections and
-        merges results by score.
+        When *document_id* is None, searches across *document_ids* (default:
+        all book collections) and merges results by score — with a shared
+        collection, in a single query filtered on ``document_id``.
 
         Returns list of dicts with keys:
             ``id``, ``score``, ``text``, ``document_id``, ``chapter_number``, ``position``
         """
+        books = [document_id] if document_id is not None else document_ids
+        if books is not None and not books:
+            return []
         query_vector = await self._embed(query_text)
+        loop = asyncio.get_running_loop()
+
+        if self._shared:
+            if not await loop.run_in_executor(None, self._shared_exists):
+                return []
+            query_filter = models.Filter(must=[self._doc_condition(books)]) if books else None
+            return await loop.run_in_executor(
+                None,
+                partial(self._search_collection, self._shared, query_vector, top_k, query_filter),
+            )
 
         if document_id is not None:
-            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(
                 None,
                 # _col() is evaluated inside the executor, not on the event loop.
@@ -241,22 +450,16 @@ class VectorService:
             )
 
         # Cross-book search
-        doc_ids = self.list_book_collections()
+        doc_ids = list(document_ids) if document_ids is not None else self.list_book_collections()
         if not doc_ids:
             return []
 
-        loop = asyncio.get_running_loop()
         tasks = [
             asyncio.ensure_future(
                 loop.run_in_executor(
                     None,
                     # did= default-arg capture; _col(did) runs inside the executor.
-                    lambda did=did: self._client.query_points(
-                        collection_name=self._col(did),
-                        query=query_vector,
-                        limit=top_k,
-                        with_payload=True,
-                    ),
+                    lambda did=did: self._search_collection(self._col(did), query_vector, top_k),
                 )
             )
             for did in doc_ids
@@ -268,18 +471,24 @@ class VectorService:
             if isinstance(res, Exception):
                 logger.warning("Cross-book search error: %s", res)
                 continue
-            merged.extend(self._parse_hits(res))
+            merged.extend(res)
 
         merged.sort(key=lambda r: r.score, reverse=True)
         return merged[:top_k]
 
     def _search_collection(
-        self, collection_name: str, query_vector: list[float], top_k: int
+        self,
+        collection_name: str,
+        query_vector: list[float],
+        top_k: int,
+        query_filter: models.Filter | None = None,
     ) -> list[VectorSearchResult]:
         """Search a single collection (sync, called from async context)."""
         hits = self._client.query_points(
             collection_name=collection_name,
             query=query_vector,
+            query_filter=query_filter,
+            search_params=self._search_params,
             limit=top_k,
             with_payload=True,
         )
@@ -310,73 +519,86 @@ class VectorService:
         keyword: str,
         top_k: int = 10,
         document_id: str | None = None,
+        document_ids: Sequence[str] | None = None,
     ) -> list[KeywordSearchResult]:
-        """Search paragraphs by keyword match on the ``keywords`` payload field.
+        """Paragraphs tagged with *keyword*, highest ``keyword_scores[keyword]`` first.
 
-        When *document_id* is provided, searches only that book's collection.
-        When *document_id* is None, searches across all book collections.
+        When *document_id* is provided, searches only that book.  When
+        *document_id* is None, searches across *document_ids* (default: all
+        books) and merges the rankings.
+
+        Ranking goes through each book's ``KeywordIndex``: built from one
+        payload-only scroll on the book's first keyword search (or as its
+        paragraphs are upserted, for a book created by this process) and kept
+        up to date by ``upsert_paragraphs``.  Only the *top_k* winners are
+        then fetched.
 
         Returns list of dicts with: ``id``, ``text``, ``document_id``,
         ``chapter_number``, ``position``, ``keyword_scores``.
         """
-        kw_filter = models.Filter(
-            must=[
-                models.FieldCondition(
-                    key="keywords",
-                    match=models.MatchValue(value=keyword.lower()),
-                )
-            ]
-        )
+        books = [document_id] if document_id is not None else document_ids
+        if books is not None and not books:
+            return []
+        loop = asyncio.get_running_loop()
+        if self._shared and not await loop.run_in_executor(None, self._shared_exists):
+            return []
+        if books is None:
+            books = self.list_book_collections()
 
-        if document_id is not None:
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(
-                None,
-                # _col() is evaluated inside the executor, not on the event loop.
-                lambda: self._scroll_keyword(self._col(document_id), kw_filter, top_k),
-            )
+        keys = await asyncio.gather(
+            *(self._keyword_key(book) for book in books), return_exceptions=True
+        )
+        revisions = await loop.run_in_executor(
+            None, self._read_keyword_revisions, [k for k in keys if isinstance(k, str)]
+        )
 
-        # Cross-book keyword search
-        doc_ids = self.list_book_collections()
-        if not doc_ids:
-            return []
+        async def index(key: str | BaseException) -> tuple[str, KeywordIndex]:
+            if isinstance(key, BaseException):
+                raise key
+            return await self._keyword_index(key, revisions.get(key))
 
-        loop = asyncio.get_running_loop()
-        kw_tasks = [
-            loop.run_in_executor(
-                None,
-                # did= default-arg capture; _col(did) runs inside the executor.
-                lambda did=did: self._scroll_keyword(self._col(did), kw_filter, top_k),
-            )
-            for did in doc_ids
-        ]
-        results_lists = await asyncio.gather(*kw_tasks, return_exceptions=True)
-        merged: list[KeywordSearchResult] = []
-        for res in results_lists:
+        indexes = await asyncio.gather(*(index(key) for key in keys), return_exceptions=True)
+        candidates: list[tuple[float, str, str]] = []
+        for book, res in zip(books, indexes, strict=True):
             if isinstance(res, Exception):
-                logger.warning("Cross-book keyword search error: %s", res)
+                if document_id is not None:
+                    raise res
+                logger.warning("Cross-book keyword search error (%s): %s", book, res)
                 continue
-            merged.extend(res)
-        return merged[:top_k]
+            key, index = res
+            candidates.extend((score, pid, key) for score, pid in index.top(keyword, top_k))
+        best = heapq.nlargest(top_k, candidates)
+        if not best:
+            return []
 
-    def _scroll_keyword(
-        self, collection_name: str, kw_filter: models.Filter, top_k: int
-    ) -> list[KeywordSearchResult]:
-        """Scroll a single collection for keyword matches."""
-        scroll_result = self._client.scroll(
-            collection_name=collection_name,
-            scroll_filter=kw_filter,
-            limit=top_k,
-            with_payload=True,
+        by_collection: dict[str, list[str]] = {}
+        for _, pid, key in best:
+            by_collection.setdefault(self._shared or key, []).append(pid)
+        fetched = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None,
+                    partial(
+                        self._client.retrieve,
+                        collection_name=collection,
+                        ids=pids,
+                        with_payload=True,
+                    ),
+                )
+                for collection, pids in by_collection.items()
+            )
         )
+        points = {str(point.id): point for batch in fetched for point in batch}
 
         results: list[KeywordSearchResult] = []
-        points = scroll_result[0] if isinstance(scroll_result, tuple) else scroll_result
-        for point in points:
+        for _, pid, _ in best:
+            point = points.get(pid)
+            if point is None:  # deleted since it was indexed
+                continue
             payload = point.payload or {}
             results.append(
                 KeywordSearchResult(
-                    id=str(point.id),
+                    id=pid,
                     text=payload.get("text", ""),
                     document_id=payload.get("document_id", ""),
                     chapter_number=payload.get("chapter_number", 0),
@@ -386,6 +608,118 @@ class VectorService:
             )
         return results
 
+    async def _keyword_key(self, book: str) -> str:
+        """The key *book*'s keyword index is kept under: its collection, or its
+        document_id in a shared collection."""
+        if self._shared:
+            return book
+        return await asyncio.get_running_loop().run_in_executor(None, self._col, book)
+
+    async def _keyword_index(
+        self, key: str, revision: str | None
+    ) -> tuple[str, KeywordIndex]:
+        """*key* and its ``KeywordIndex``, (re)loading it unless built at *revision*."""
+        index = self._keyword_indexes.get(key)
+        if index is not None and self._keyword_index_revisions.get(key) != revision:
+            index = None  # written since, by another process
+        if index is None:
+            writes = self._keyword_writes.get(key, 0)
+            index = await asyncio.get_running_loop().run_in_executor(
+                None, self._load_keyword_index, key
+            )
+            # An upsert that landed mid-scroll may be missing: use, don't keep.
+            if self._keyword_writes.get(key, 0) == writes:
+                self._keyword_indexes[key] = index
+                self._keyword_index_revisions[key] = revision
+        return key, index
+
+    def _read_keyword_revisions(self, keys: list[str]) -> dict[str, str]:
+        """Current revision of each of *keys* that has one (sync)."""
+        if not keys or not self._has_revisions():
+            return {}
+        points = self._client.retrieve(
+            self._revisions, ids=[_revision_id(key) for key in keys], with_payload=True
+        )
+        revisions = {str(point.id): (point.payload or {}).get("revision") for point in points}
+        return {key: revisions[_revision_id(key)] for key in keys if _revision_id(key) in revisions}
+
+    def _bump_keyword_revisions(self, keys: Sequence[str]) -> None:
+        """Stamp *keys* as written (sync); other processes' indexes of them go stale.
+
+        An index loaded here stays valid if nobody else wrote the key since it
+        was built — this process applied its own write to it already.
+        """
+        if not keys:
+            return
+        if not self._has_revisions():
+            try:
+                self._client.create_collection(self._revisions, vectors_config={})
+            except Exception:
+                if not self._client.collection_exists(self._revisions):
+                    raise  # not just another writer creating it first
+            self._revisions_exist = True
+        seen = self._read_keyword_revisions(list(keys))
+        points = []
+        for key in keys:
+            revision = uuid.uuid4().hex
+            points.append(
+                models.PointStruct(
+                    id=_revision_id(key), vector={}, payload={"key": key, "revision": revision}
+                )
+            )
+            if key in self._keyword_indexes:
+                if self._keyword_index_revisions.get(key) == seen.get(key):
+                    self._keyword_index_revisions[key] = revision
+                else:
+                    del self._keyword_indexes[key]
+        self._client.upsert(self._revisions, points=points)
+
+    def _has_revisions(self) -> bool:
+        """Whether the revisions collection exists yet (sync)."""
+        if not self._revisions_exist:
+            self._revisions_exist = self._client.collection_exists(self._revisions)
+        return self._revisions_exist
+
+    def _load_keyword_index(self, key: str) -> KeywordIndex:
+        """Build a book's keyword index from its points' payloads (sync)."""
+        if self._shared:
+            collection = self._shared
+            scroll_filter = models.Filter(must=[self._doc_condition([key])])
+        else:
+            collection, scroll_filter = key, None
+        payloads: list[tuple[str, dict]] = []
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=collection,
+                scroll_filter=scroll_filter,
+                limit=_SCROLL_BATCH,
+                offset=offset,
+                with_payload=["keywords", "keyword_scores"],
+            )
+            payloads.extend((str(point.id), point.payload or {}) for point in points)
+            if offset is None:
+                break
+        return KeywordIndex.from_payloads(payloads)
+
+    def _index_keywords(
+        self, paragraphs: list[dict[str, Any]], collection_name: str
+    ) -> set[str]:
+        """Apply upserted paragraphs to the keyword indexes already loaded.
+
+        Returns the keys written to.
+        """
+        touched: set[str] = set()
+        for p in paragraphs:
+            key = p.get("document_id", "") if self._shared else collection_name
+            if key not in touched:
+                touched.add(key)
+                self._keyword_writes[key] = self._keyword_writes.get(key, 0) + 1
+            index = self._keyword_indexes.get(key)
+            if index is not None:
+                index.add(str(p["id"]), p.get("keywords", []), p.get("keyword_scores", {}))
+        return touched
+
     # ── Upsert (used by ingestion / tests) ────────────────────────────────
 
     async def upsert_paragraphs(
@@ -433,24 +767,111 @@ class VectorService:
             None,
             partial(self._client.upsert, collection_name=collection_name, points=points),
         )
+        touched = self._index_keywords(paragraphs, collection_name)
+        await loop.run_in_executor(None, self._bump_keyword_revisions, sorted(touched))
         return len(points)
 
-    # ── Private: embedding ────────────────────────────────────────────────
+    # ── Query embedding ───────────────────────────────────────────────────
 
-    async def _embed(self, text: str) -> list[float]:
-        """Embed a single query string (lazy-loads the embedding model)."""
+    async def embed_queries(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed search queries, one vector per text, in order.
+
+        Texts are matched up to Unicode (NFC) and whitespace normalisation.
+        Cached ones cost nothing; the rest — together with misses from other
+        calls made before this one yields, e.g. the ``search`` calls of one
+        ``asyncio.gather`` — are embedded in a single model call, each
+        distinct text once.  Hits and misses are recorded as the
+        ``"query_embedding"`` cache type in ``core.metrics``.
+        """
+        from storysphere.core.metrics import get_metrics  # noqa: PLC0415
+
+        metrics = get_metrics()
+        keys = [self._query_key(text) for text in texts]
+        futures: dict[tuple[str, str], asyncio.Future[tuple[float, ...]]] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in futures:
+                continue
+            vector = self._query_vectors.get(key)
+            if vector is not None:
+                self._query_vectors.move_to_end(key)
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(vector)
+            else:
+                future = self._pending_queries.get(key) or self._enqueue_query(key, text)
+            metrics.record_cache_event("query_embedding", hit=vector is not None)
+            futures[key] = future
+        # Shielded: a cancelled caller must not cancel a future others share.
+        vectors = {key: await asyncio.shield(future) for key, future in futures.items()}
+        return [list(vectors[key]) for key in keys]
+
+    def _query_key(self, text: str) -> tuple[str, str]:
+        return self._embedding_model, " ".join(unicodedata.normalize("NFC", text).split())
+
+    def _enqueue_query(
+        self, key: tuple[str, str], text: str
+    ) -> asyncio.Future[tuple[float, ...]]:
+        loop = asyncio.get_running_loop()
+        future = self._pending_queries[key] = loop.create_future()
+        if not self._query_batch:
+            # Runs once the callers already scheduled have queued their misses.
+            self._query_batch = []
+            task = loop.create_task(self._embed_query_batch(self._query_batch))
+            task.add_done_callback(partial(self._settle_query_batch, self._query_batch))
+            self._query_batch_task = task
+        self._query_batch.append((key, text, future))
+        return future
+
+    async def _embed_query_batch(self, batch: list[_QueuedQuery]) -> None:
+        if self._query_batch is batch:
+            self._query_batch = []  # later misses start the next batch
+        texts = [text for _, text, _ in batch]
+        try:
+            vectors = await asyncio.get_running_loop().run_in_executor(
+                None, self._embed_texts, texts
+            )
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (key, _, future), vector in zip(batch, vectors, strict=True):
+            vector = tuple(vector)
+            if self._query_cache_size:
+                self._query_vectors[key] = vector
+                if len(self._query_vectors) > self._query_cache_size:
+                    self._query_vectors.popitem(last=False)
+            if not future.done():
+                future.set_result(vector)
+
+    def _settle_query_batch(self, batch: list[_QueuedQuery], task: asyncio.Task[None]) -> None:
+        """Close *batch* however its task ended — cancelled, even before it ran.
+
+        Futures still unresolved fail, so their callers are not left waiting
+        on a dead batch, and the keys are released for the next one.
+        """
+        if self._query_batch is batch:
+            self._query_batch = []
+        for key, _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("query embedding batch was cancelled"))
+            if self._pending_queries.get(key) is future:
+                del self._pending_queries[key]
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Run the embedding model (lazy-loaded) on *texts*; sync, for the executor."""
         if self._embedding_fn is None:
             from storysphere.core.embeddings import get_embeddings  # noqa: PLC0415
 
             self._embedding_fn = get_embeddings()
+        if len(texts) == 1:
+            return [self._embedding_fn.embed_query(texts[0])]
+        # get_embeddings() sets no query-only prompt or encode kwargs, so a
+        # batch of queries encodes exactly as embed_query would, one by one.
+        return self._embedding_fn.embed_documents(texts)
 
-        import asyncio
-
-        loop = asyncio.get_running_loop()
-        vector = await loop.run_in_executor(
-            None, self._embedding_fn.embed_query, text
-        )
-        return vector
+    async def _embed(self, text: str) -> list[float]:
+        """Embed a single query string (see ``embed_queries``)."""
+        return (await self.embed_queries([text]))[0]
 
 
 # ── Singleton ──────────────────────────────────────────────────────────────────
@@ -20,16 +20,18 @@ from storysphere.tools.schemas import RelationPathsInput
 
 
 class GetRelationPathsTool(BaseTool):
-    """Find all simple paths between two entities up to a maximum hop count."""
+    """Find the strongest simple paths between two entities up to a maximum hop count."""
 
     name: str = "get_relation_paths"
     description: str = (
         "Find relationship paths between two entities in the knowledge graph. "
-        "Returns all simple paths (no cycles) up to max_length hops. "
-        "Each path shows entities and connecting relations. "
+        "Returns the strongest simple paths (no cycles) up to max_length hops: "
+        "fewest hops and highest relation weights first, at most max_paths of them. "
+        "Each path shows entities, connecting relations and its cost (lower = stronger). "
         "USE for: 'How are X and Y connected?', degrees of separation. "
         "DO NOT USE for: single entity's direct relations or subgraph exploration. "
-        "Input: source and target entity ID/name, optional max_length (1–5, default 3)."
+        "Input: source and target entity ID/name, optional max_length (1–5, default 3), "
+        "optional max_paths (1–20, default from server settings)."
     )
     args_schema: type[RelationPathsInput] = RelationPathsInput
 
@@ -38,7 +40,9 @@ class GetRelationPathsTool(BaseTool):
     class Config:
         arbitrary_types_allowed = True
 
-    async def _arun(self, source: str, target: str, max_length: int = 3) -> str:
+    async def _arun(
+        self, source: str, target: str, max_length: int = 3, max_paths: int | None = None
+    ) -> str:
         src_entity = await resolve_entity(self.kg_service, source)
         if src_entity is None:
             return handle_not_found(source)
@@ -47,7 +51,7 @@ class GetRelationPathsTool(BaseTool):
             return handle_not_found(target)
 
         paths = await self.kg_service.get_relation_paths(
-            src_entity.id, tgt_entity.id, max_length=max_length
+            src_entity.id, tgt_entity.id, max_length=max_length, max_paths=max_paths
         )
         if not paths:
             return format_tool_output(
@@ -55,5 +59,9 @@ class GetRelationPathsTool(BaseTool):
             )
         return format_tool_output({"paths": paths, "count": len(paths)})
 
-    def _run(self, source: str, target: str, max_length: int = 3) -> str:
-        return asyncio.get_event_loop().run_until_complete(self._arun(source, target, max_length))
+    def _run(
+        self, source: str, target: str, max_length: int = 3, max_paths: int | None = None
+    ) -> str:
+        return asyncio.get_event_loop().run_until_complete(
+            self._arun(source, target, max_length, max_paths)
+        )
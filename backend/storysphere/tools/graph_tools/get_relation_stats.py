@@ -26,10 +26,10 @@ class GetRelationStatsTool(BaseTool):
     description: str = (
         "Get statistical summary of relations: type distribution, "
         "average/min/max weight, total count. "
-        "Can be scoped to a specific entity or computed globally. "
+        "Can be scoped to a specific entity and/or document, or computed globally. "
         "USE for: pattern analysis, 'most common relation type', statistical overview. "
         "DO NOT USE for: listing specific relations for an entity. "
-        "Input: optional entity_id to scope; omit for global stats."
+        "Input: optional entity_id and/or document_id to scope; omit both for global stats."
     )
     args_schema: type[RelationStatsInput] = RelationStatsInput
 
@@ -38,9 +38,11 @@ class GetRelationStatsTool(BaseTool):
     class Config:
         arbitrary_types_allowed = True
 
-    async def _arun(self, entity_id: str | None = None) -> str:
-        stats = await self.kg_service.get_relation_stats(entity_id=entity_id)
+    async def _arun(self, entity_id: str | None = None, document_id: str | None = None) -> str:
+        stats = await self.kg_service.get_relation_stats(
+            entity_id=entity_id, document_id=document_id
+        )
         return format_tool_output(stats)
 
-    def _run(self, entity_id: str | None = None) -> str:
-        return asyncio.get_event_loop().run_until_complete(self._arun(entity_id))
+    def _run(self, entity_id: str | None = None, document_id: str | None = None) -> str:
+        return asyncio.get_event_loop().run_until_complete(self._arun(entity_id, document_id))
@@ -3,6 +3,7 @@ from storysphere.tools.retrieval_tools.get_chapter_summary import GetChapterSumm
 from storysphere.tools.retrieval_tools.get_keywords import GetKeywordsTool
 from storysphere.tools.retrieval_tools.get_paragraphs import GetParagraphsTool
 from storysphere.tools.retrieval_tools.get_summary import GetSummaryTool
+from storysphere.tools.retrieval_tools.hybrid_search import HybridSearchTool
 from storysphere.tools.retrieval_tools.vector_search import VectorSearchTool
 
 __all__ = [
@@ -11,5 +12,6 @@ __all__ = [
     "GetKeywordsTool",
     "GetParagraphsTool",
     "GetSummaryTool",
+    "HybridSearchTool",
     "VectorSearchTool",
 ]
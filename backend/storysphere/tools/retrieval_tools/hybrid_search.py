@@ -0,0 +1,55 @@
+"""HybridSearchTool — full-text and semantic search over paragraphs, fused.
+
+USE when: the user wants to find passages — by exact names or phrases, by
+    topic, or by a free-form question. The default search tool.
+DO NOT USE when: the user asks about a specific chapter summary
+    (use GetSummaryTool) or specific entity data (use graph tools).
+Example queries: "Find passages about betrayal.", "Where is 大觀園 described?",
+    "Which scenes mention the letter from Mr. Darcy?"
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from langchain_core.tools import BaseTool
+
+from storysphere.tools.base import format_tool_output
+from storysphere.tools.schemas import HybridSearchInput
+
+
+class HybridSearchTool(BaseTool):
+    """Paragraph search over the full-text and vector indexes, fused by rank."""
+
+    name: str = "hybrid_search"
+    description: str = (
+        "Search the novel's paragraphs by exact words AND by meaning at once, "
+        "returning the top-k passages that rank best across both. "
+        "USE for: finding passages — by character/place names, quoted phrases, "
+        "topics or free-form questions. Prefer this over vector_search. "
+        "DO NOT USE for: chapter summaries or structured entity queries. "
+        "Input: query, optional top_k (1–20), optional document_id filter."
+    )
+    args_schema: type[HybridSearchInput] = HybridSearchInput
+
+    hybrid_search_service: Any = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    async def _arun(
+        self,
+        query: str,
+        top_k: int = 5,
+        document_id: str | None = None,
+    ) -> str:
+        results = await self.hybrid_search_service.search(
+            query=query, top_k=top_k, document_id=document_id
+        )
+        return format_tool_output(results)
+
+    def _run(self, query: str, top_k: int = 5, document_id: str | None = None) -> str:
+        return asyncio.get_event_loop().run_until_complete(
+            self._arun(query, top_k, document_id)
+        )
@@ -65,6 +65,15 @@ class RelationPathsInput(BaseModel):
         ge=1,
         le=5,
     )
+    max_paths: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of paths, strongest first. Range: 1–20. "
+            "If omitted, the server default applies."
+        ),
+        ge=1,
+        le=20,
+    )
 
 
 class SubgraphInput(BaseModel):
@@ -80,12 +89,16 @@ class SubgraphInput(BaseModel):
 
 
 class RelationStatsInput(BaseModel):
-    """Input for relation statistics, optionally scoped to an entity."""
+    """Input for relation statistics, optionally scoped to an entity and/or a document."""
 
     entity_id: str | None = Field(
         default=None,
         description="If provided, stats are scoped to this entity. Otherwise, global stats.",
     )
+    document_id: str | None = Field(
+        default=None,
+        description="If provided, stats are scoped to this document. Otherwise, all documents.",
+    )
 
 
 # ── Retrieval Tool Inputs ────────────────────────────────────────────────────
@@ -107,6 +120,22 @@ class VectorSearchInput(BaseModel):
     )
 
 
+class HybridSearchInput(BaseModel):
+    """Input for hybrid (full-text + semantic) search over paragraphs."""
+
+    query: str = Field(description="Search query: names, phrases, or a natural-language question.")
+    top_k: int = Field(
+        default=5,
+        description="Number of results to return. Range: 1–20.",
+        ge=1,
+        le=20,
+    )
+    document_id: str | None = Field(
+        default=None,
+        description="If provided, restrict search to this document.",
+    )
+
+
 class GetSummaryInput(BaseModel):
     """Input for retrieving a chapter or book summary."""
 
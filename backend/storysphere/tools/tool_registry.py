@@ -39,6 +39,7 @@ from storysphere.tools.retrieval_tools import (
     GetKeywordsTool,
     GetParagraphsTool,
     GetSummaryTool,
+    HybridSearchTool,
     VectorSearchTool,
 )
 
@@ -54,6 +55,7 @@ def get_chat_tools(
     analysis_service: Any = None,
     keyword_service: Any = None,
     analysis_agent: Any = None,
+    hybrid_search_service: Any = None,
 ) -> list[BaseTool]:
     """Return all tools available to the chat agent (Phase 4).
 
@@ -67,10 +69,19 @@ def get_chat_tools(
         analysis_service: Optional AnalysisService for insight generation.
         keyword_service: Optional KeywordService for keyword retrieval.
         analysis_agent: Optional AnalysisAgent for deep character analysis.
+        hybrid_search_service: Optional HybridSearchService; by default one
+            over *vector_service* and *doc_service*.
 
     Returns:
         List of fully-functional tools for the chat agent.
     """
+    if hybrid_search_service is None:
+        from storysphere.services.hybrid_search_service import (  # noqa: PLC0415
+            HybridSearchService,
+        )
+
+        hybrid_search_service = HybridSearchService(vector_service, doc_service)
+
     return [
         # Graph tools (7)
         GetEntityAttributesTool(kg_service=kg_service),
@@ -80,7 +91,8 @@ def get_chat_tools(
         GetRelationPathsTool(kg_service=kg_service),
         GetSubgraphTool(kg_service=kg_service),
         GetRelationStatsTool(kg_service=kg_service),
-        # Retrieval tools (6)
+        # Retrieval tools (7)
+        HybridSearchTool(hybrid_search_service=hybrid_search_service),
         VectorSearchTool(vector_service=vector_service),
         GetSummaryTool(doc_service=doc_service),
         GetChapterSummaryTool(doc_service=doc_service),
@@ -143,6 +155,7 @@ def get_all_tool_names() -> list[str]:
         "get_relation_paths",
         "get_subgraph",
         "get_relation_stats",
+        "hybrid_search",
         "vector_search",
         "get_summary",
         "get_chapter_summary",
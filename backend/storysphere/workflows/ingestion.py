@@ -32,6 +32,7 @@ from storysphere.core.tracing import update_span as _lf_update_span
 from storysphere.core.utils.url_masking import mask_url
 from storysphere.domain.documents import Chapter, Document, Paragraph, StepStatus
 from storysphere.domain.timeline import TimelineConfig, TimelineDetectionResult
+from storysphere.pipelines.chapter_stream import ChapterStream
 from storysphere.pipelines.document_processing import DocumentProcessingPipeline
 from storysphere.pipelines.feature_extraction import FeatureExtractionPipeline
 from storysphere.pipelines.feature_extraction.pipeline import FeatureExtractionResult
@@ -72,21 +73,40 @@ class StepSpec:
     pipeline_attr: str
     #: Field on ``PipelineStatus`` this step reports into.
     status_field: str
-    #: True when the pipeline writes its output onto the Document itself
-    #: (chapter summaries, chapter keywords) rather than into the KG or the
-    #: vector store — those need an explicit save or the LLM output is
-    #: generated, charged for, and then dropped.
-    mutates_document: bool
+    #: ``DocumentService.save_document_fields`` names of the columns the
+    #: pipeline writes onto the Document itself (summaries, keywords,
+    #: paragraph entities). Empty for steps whose output lives only in the KG
+    #: or the symbol store. Document output needs an explicit save or the LLM
+    #: output is generated, charged for, and then dropped; naming the columns
+    #: keeps that save from rewriting every paragraph's text and embedding.
+    document_fields: frozenset[str] = frozenset()
+
+    @property
+    def mutates_document(self) -> bool:
+        return bool(self.document_fields)
 
 
 #: The analysis steps that run after chapter review, keyed by the step name the
 #: rerun endpoint exposes. Single source of truth for both callers:
 #: ``run_phase2`` runs all four in order, the rerun endpoint runs exactly one.
 INGESTION_STEPS: dict[str, StepSpec] = {
-    "summarization": StepSpec("_summarization_pipeline", "summarization", True),
-    "feature-extraction": StepSpec("_feature_pipeline", "feature_extraction", True),
-    "knowledge-graph": StepSpec("_kg_pipeline", "knowledge_graph", False),
-    "symbol-discovery": StepSpec("_symbol_pipeline", "symbol_discovery", False),
+    "summarization": StepSpec(
+        "_summarization_pipeline",
+        "summarization",
+        frozenset({"document.summary", "chapters.summary"}),
+    ),
+    "feature-extraction": StepSpec(
+        "_feature_pipeline",
+        "feature_extraction",
+        # Embeddings only land on the Document in the no-Qdrant path; in the
+        # Qdrant path this writes the NULLs that were already there.
+        frozenset({"document.keywords", "chapters.keywords", "paragraphs.embedding"}),
+    ),
+    # ParagraphEntityLinker annotates paragraphs with entity mentions.
+    "knowledge-graph": StepSpec(
+        "_kg_pipeline", "knowledge_graph", frozenset({"paragraphs.entities"})
+    ),
+    "symbol-discovery": StepSpec("_symbol_pipeline", "symbol_discovery"),
 }
 
 
@@ -272,13 +292,14 @@ class IngestionWorkflow:
         *,
         sub_cb: Callable | None = None,
         murmur_cb: Callable | None = None,
+        stream: ChapterStream | None = None,
     ) -> StepOutcome:
         """Run one analysis step against *doc* and record how it went.
 
         Runs the step's pipeline, moves ``doc.pipeline_status`` to done or
         failed, persists that status, and — for steps whose output lands on the
-        Document — saves the Document so partial output survives a later
-        failure.
+        Document — saves the columns it wrote so partial output survives a
+        later failure.
 
         Pipeline failures are returned in the outcome rather than raised: the
         steps are independent, and callers differ on whether to continue
@@ -293,6 +314,9 @@ class IngestionWorkflow:
         Args:
             step: A key of ``INGESTION_STEPS``.
             doc: The Document to run against; mutated in place by the pipeline.
+            stream: ``ChapterStream`` over *doc* when *doc* is header-only. The
+                pipeline saves paragraph columns per chapter as it streams, so
+                only the document and chapter columns are saved here.
 
         Raises:
             KeyError: *step* is not a known step name.
@@ -302,9 +326,17 @@ class IngestionWorkflow:
         pipeline = getattr(self, spec.pipeline_attr)
         outcome = StepOutcome(step=step)
 
+        document_fields = spec.document_fields
+        run_kwargs: dict[str, Any] = {"sub_cb": sub_cb, "murmur_cb": murmur_cb}
+        if stream is not None:
+            run_kwargs["chapters"] = stream
+            document_fields = frozenset(
+                f for f in document_fields if not f.startswith("paragraphs.")
+            )
+
         self._log_step(spec.status_field)
         try:
-            outcome.result = await pipeline.run(doc, sub_cb=sub_cb, murmur_cb=murmur_cb)
+            outcome.result = await pipeline.run(doc, **run_kwargs)
             doc.pipeline_status.mark_done(spec.status_field)
         except Exception as exc:  # noqa: BLE001
             logger.error("Step '%s' failed: %s", step, exc)
@@ -313,9 +345,9 @@ class IngestionWorkflow:
 
         await self._document_service.update_pipeline_status(doc.id, doc.pipeline_status)
 
-        if spec.mutates_document:
+        if document_fields:
             try:
-                await self._document_service.save_document(doc)
+                await self._document_service.save_document_fields(doc, document_fields)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Step '%s' persist failed (non-fatal): %s", step, exc)
 
@@ -351,7 +383,7 @@ class IngestionWorkflow:
             teu_keys_for,
         )
 
-        doc = await self._document_service.get_document(doc_id)
+        doc, stream = await self._load_for_steps(doc_id)
         if doc is None:
             return StepOutcome(step=step, error=f"Book '{doc_id}' not found")
 
@@ -363,7 +395,7 @@ class IngestionWorkflow:
                 [e.id for e in await self._kg_service.get_events(document_id=doc_id)]
             )
 
-        outcome = await self.run_step(step, doc)
+        outcome = await self.run_step(step, doc, stream=stream)
 
         if outcome.ok and step == "knowledge-graph":
             try:
@@ -391,6 +423,32 @@ class IngestionWorkflow:
 
         return outcome
 
+    async def _load_for_steps(
+        self, doc_id: str
+    ) -> tuple[Document | None, ChapterStream | None]:
+        """Load *doc_id* for the analysis steps.
+
+        With ``ingestion_stream_chapters`` on, only the chapter headers are
+        loaded and a ``ChapterStream`` is returned for the pipelines to pull
+        paragraphs through; otherwise the whole book is loaded and the stream
+        is ``None``.
+        """
+        from storysphere.config.settings import get_settings  # noqa: PLC0415
+
+        if not get_settings().ingestion_stream_chapters:
+            return await self._document_service.get_document(doc_id), None
+
+        from storysphere.services.document_service import (  # noqa: PLC0415
+            PROJECTION_HEADERS,
+        )
+
+        doc = await self._document_service.get_document(
+            doc_id, projection=PROJECTION_HEADERS
+        )
+        if doc is None:
+            return None, None
+        return doc, ChapterStream(self._document_service, doc)
+
     @staticmethod
     async def _drop_inferred_relations(doc_id: str) -> None:
         """Discard link-prediction output after the KG it was inferred from is gone.
@@ -610,17 +668,22 @@ class IngestionWorkflow:
         Loads the document from DB using *doc_id*. Expects Phase 1 (and optional
         chapter review) to have already completed.
         """
-        doc = await self._document_service.get_document(doc_id)
+        doc, stream = await self._load_for_steps(doc_id)
         if doc is None:
             raise ValueError(f"Document '{doc_id}' not found — Phase 1 may not have completed")
         set_llm_service_context("ingestion", book_id=doc.id)
+        paragraph_count = doc.total_paragraphs
+        if stream is not None:
+            # A header-only Document has no paragraphs to count.
+            header = await self._document_service.get_document_header(doc_id)
+            paragraph_count = sum(ch.paragraph_count for ch in header.chapters) if header else 0
 
         _lf_update_span(metadata={
             "doc_id": doc_id,
             "title": doc.title,
             "language": doc.language,
             "chapters": doc.total_chapters,
-            "paragraphs": doc.total_paragraphs,
+            "paragraphs": paragraph_count,
         })
 
         errors: list[str] = []
@@ -686,6 +749,7 @@ class IngestionWorkflow:
                 "summarization", doc,
                 sub_cb=_step_sub_cb(25, "章節摘要", "summarization", "章節摘要"),
                 murmur_cb=_summ_murmur_cb,
+                stream=stream,
             )
             if outcome.ok:
                 summ_result = outcome.result
@@ -706,6 +770,7 @@ class IngestionWorkflow:
             "feature-extraction", doc,
             sub_cb=_step_sub_cb(45, "特徵擷取", "featureExtraction", "章節特徵"),
             murmur_cb=_murmur,
+            stream=stream,
         )
         if outcome.ok:
             feat_result = outcome.result
@@ -721,6 +786,7 @@ class IngestionWorkflow:
                 "knowledge-graph", doc,
                 sub_cb=_step_sub_cb(65, "知識圖譜擷取", "knowledgeGraph", ""),
                 murmur_cb=_murmur,
+                stream=stream,
             )
             if outcome.ok:
                 kg_result = outcome.result
@@ -741,6 +807,7 @@ class IngestionWorkflow:
                 "symbol-discovery", doc,
                 sub_cb=_step_sub_cb(82, "符號探索", "symbolExploration", "章節符號"),
                 murmur_cb=_murmur,
+                stream=stream,
             )
             if outcome.ok:
                 symbol_result = outcome.result
@@ -775,7 +842,7 @@ class IngestionWorkflow:
                 ranked_count,
             )
             try:
-                await self._document_service.save_document(doc)
+                await self._document_service.update_timeline_config(doc.id, doc.timeline_config)
             except Exception as exc:  # noqa: BLE001
                 logger.warning("Timeline config persist failed (non-fatal): %s", exc)
 
@@ -804,7 +871,7 @@ class IngestionWorkflow:
             document_id=doc.id,
             document_title=doc.title,
             chapters=doc.total_chapters,
-            paragraphs=doc.total_paragraphs,
+            paragraphs=paragraph_count,
             paragraphs_embedded=feat_result.paragraphs_embedded,
             keywords_extracted=feat_result.keywords_extracted,
             chapters_summarized=summ_result.chapters_summarized,
@@ -3970,6 +3970,8 @@ export interface components {
             text: string;
             /** Score */
             score: number;
+            /** Snippet */
+            snippet?: string | null;
             metadata: components["schemas"]["SearchResultMetadata"];
         };
         /** SearchResultMetadata */
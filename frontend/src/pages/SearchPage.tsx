@@ -34,7 +34,7 @@ function highlightText(text: string, query: string): React.ReactNode {
 }
 
 function formatScore(score: number, mode: SearchMode): string {
-  if (mode === 'fulltext') return `${score}次`;
+  if (mode === 'fulltext') return score.toFixed(1);
   return `${Math.round(score * 100)}%`;
 }
 
@@ -0,0 +1,121 @@
+"""Benchmark: API-style reads against storysphere.db while an ingest is writing.
+
+Seeds a throwaway SQLite file with a few books, then runs one writer that
+ingests more books (``save_document`` followed by the dirty-field saves the
+analysis steps do) while several readers loop over what the API serves:
+``get_document_header``, ``get_paragraphs`` for one chapter, and a full-text
+search.  Reports read latency percentiles and failed reads, once with the
+engine PRAGMAs DocumentService applies on connect (WAL, synchronous=NORMAL,
+busy_timeout, mmap, cache) and once with SQLite defaults.
+
+Usage::
+
+    uv run python scripts/bench_concurrent_reads.py
+    uv run python scripts/bench_concurrent_reads.py --books 10 --readers 8
+
+Nothing under ``var/`` is touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import storysphere.services.document_service as document_service  # noqa: E402
+from bench_document_hydration import build_document  # noqa: E402
+from storysphere.services.document_service import DocumentService  # noqa: E402
+
+
+async def _reader(
+    svc: DocumentService, book_ids: list[str], stop: asyncio.Event, rng: random.Random
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    while not stop.is_set():
+        book_id = rng.choice(book_ids)
+        t0 = time.perf_counter()
+        try:
+            await svc.get_document_header(book_id)
+            await svc.get_paragraphs(book_id, chapter_number=rng.randint(1, 20))
+            await svc.search_paragraphs_by_text("harbour", document_id=book_id, top_k=10)
+        except Exception:  # noqa: BLE001 — "database is locked" is what we count
+            errors += 1
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies, errors
+
+
+async def _writer(svc: DocumentService, books: int, chapters: int, paragraphs: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(books):
+        doc = build_document(chapters, paragraphs)
+        await svc.save_document(doc)
+        for ch in doc.chapters:
+            ch.summary = f"Summary of chapter {ch.number}."
+        await svc.save_document_fields(doc, {"chapters.summary", "paragraphs.entities"})
+    return time.perf_counter() - t0
+
+
+async def run(label: str, args: argparse.Namespace) -> None:
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        svc = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp}/bench.db")
+        await svc.init_db()
+        seeded = []
+        for _ in range(3):
+            doc = build_document(args.chapters, args.paragraphs)
+            await svc.save_document(doc)
+            seeded.append(doc.id)
+
+        stop = asyncio.Event()
+        readers = [
+            asyncio.create_task(_reader(svc, seeded, stop, rng)) for _ in range(args.readers)
+        ]
+        ingest_s = await _writer(svc, args.books, args.chapters, args.paragraphs)
+        stop.set()
+        results = await asyncio.gather(*readers)
+        await svc._engine.dispose()
+
+    latencies = sorted(ms for lat, _ in results for ms in lat)
+    errors = sum(e for _, e in results)
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<10}{ingest_s:>10.1f}{len(latencies):>8}{errors:>8}"
+        f"{q[49]:>9.1f}{q[94]:>9.1f}{q[98]:>9.1f}{latencies[-1]:>9.1f}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"ingest {args.books} books × {args.chapters} chapters × {args.paragraphs} paragraphs, "
+        f"{args.readers} concurrent readers"
+    )
+    print(
+        f"{'engine':<10}{'ingest s':>10}{'reads':>8}{'errors':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    tuned = document_service._SQLITE_PRAGMAS
+    await run("tuned", args)
+    document_service._SQLITE_PRAGMAS = ()
+    try:
+        await run("defaults", args)
+    finally:
+        document_service._SQLITE_PRAGMAS = tuned
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=5, help="books ingested during the run")
+    parser.add_argument("--chapters", type=int, default=40)
+    parser.add_argument("--paragraphs", type=int, default=50, help="paragraphs per chapter")
+    parser.add_argument("--readers", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
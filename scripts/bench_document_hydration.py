@@ -0,0 +1,185 @@
+"""Benchmark: DocumentService.get_document hydration cost per projection.
+
+Builds a synthetic book in a throwaway SQLite file — by default 100 chapters
+× 50 paragraphs = 5,000 paragraphs, each with a 384-float embedding and two
+entity mentions, i.e. the shape a fully ingested novel has on disk — then
+times:
+
+    legacy     the pre-batching path: one paragraph SELECT per chapter and
+               every column decoded (kept here only as the baseline)
+    full       get_document()                         — all columns
+    no-emb     get_document(PROJECTION_NO_EMBEDDINGS) — what the reader uses
+    no-text    get_document(PROJECTION_NO_TEXT)       — structure only
+    headers    get_document(PROJECTION_HEADERS)       — no paragraphs at all
+    cached-*   the same reads served from the DocumentCache (a repeat page
+               load): only the copy handed to the caller is paid for
+
+The uncached cases run with the read cache disabled.
+
+Usage::
+
+    uv run python scripts/bench_document_hydration.py
+    uv run python scripts/bench_document_hydration.py --chapters 300 --paragraphs 20 --runs 5
+
+Nothing under ``var/`` is touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from sqlalchemy import select  # noqa: E402
+from storysphere.domain.documents import (  # noqa: E402
+    Chapter,
+    Document,
+    FileType,
+    Paragraph,
+    ParagraphEntity,
+)
+from storysphere.services.document_cache import DocumentCache  # noqa: E402
+from storysphere.services.document_service import (  # noqa: E402
+    PROJECTION_FULL,
+    PROJECTION_HEADERS,
+    PROJECTION_NO_EMBEDDINGS,
+    PROJECTION_NO_TEXT,
+    DocumentService,
+    _ChapterRow,
+    _ParagraphRow,
+    _unpack_embedding,
+)
+
+_DIM = 384
+
+
+def build_document(chapters: int, paragraphs: int) -> Document:
+    text = "The rain had not stopped for three days, and the harbour lay grey. " * 6
+    return Document(
+        title="Synthetic Serial",
+        file_path="/tmp/synthetic.txt",
+        file_type=FileType.TXT,
+        chapters=[
+            Chapter(
+                number=c,
+                title=f"Chapter {c}",
+                paragraphs=[
+                    Paragraph(
+                        text=text,
+                        chapter_number=c,
+                        position=p,
+                        embedding=[(c * p % 97) / 97.0] * _DIM,
+                        entities=[
+                            ParagraphEntity(
+                                entity_id="ent-a", entity_name="Ana",
+                                entity_type="character", start=0, end=3,
+                            ),
+                            ParagraphEntity(
+                                entity_id="ent-b", entity_name="Harbour",
+                                entity_type="location", start=40, end=47,
+                            ),
+                        ],
+                    )
+                    for p in range(paragraphs)
+                ],
+            )
+            for c in range(1, chapters + 1)
+        ],
+    )
+
+
+async def legacy_get_document(svc: DocumentService, document_id: str) -> int:
+    """The N+1 shape get_document had before batching — baseline only."""
+    async with svc._session_factory() as session:
+        chapter_rows = (
+            await session.execute(
+                select(_ChapterRow)
+                .where(_ChapterRow.document_id == document_id)
+                .order_by(_ChapterRow.number)
+            )
+        ).scalars().all()
+        count = 0
+        for ch_row in chapter_rows:
+            rows = (
+                await session.execute(
+                    select(_ParagraphRow)
+                    .where(_ParagraphRow.chapter_id == ch_row.id)
+                    .order_by(_ParagraphRow.position)
+                )
+            ).scalars().all()
+            for pr in rows:
+                Paragraph(
+                    id=pr.id,
+                    text=pr.text,
+                    chapter_number=pr.chapter_number,
+                    position=pr.position,
+                    embedding=_unpack_embedding(pr.embedding_blob),
+                    entities=(
+                        [ParagraphEntity(**e) for e in json.loads(pr.entities_json)]
+                        if pr.entities_json
+                        else None
+                    ),
+                )
+                count += 1
+        return count
+
+
+async def _time(fn, runs: int) -> list[float]:
+    await fn()  # warm the page cache
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+async def main(chapters: int, paragraphs: int, runs: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        svc = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp}/bench.db")
+        await svc.init_db()
+        cached = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp}/bench.db")
+        cached._cache = DocumentCache(max_bytes=1 << 30)
+        svc._cache = DocumentCache(max_bytes=0)
+        doc = build_document(chapters, paragraphs)
+        await svc.save_document(doc)
+        print(f"book: {chapters} chapters × {paragraphs} paragraphs = {doc.total_paragraphs}")
+
+        cases = {
+            "legacy": lambda: legacy_get_document(svc, doc.id),
+            "full": lambda: svc.get_document(doc.id, projection=PROJECTION_FULL),
+            "no-emb": lambda: svc.get_document(doc.id, projection=PROJECTION_NO_EMBEDDINGS),
+            "no-text": lambda: svc.get_document(doc.id, projection=PROJECTION_NO_TEXT),
+            "headers": lambda: svc.get_document(doc.id, projection=PROJECTION_HEADERS),
+            "cached-full": lambda: cached.get_document(doc.id),
+            "cached-no-emb": lambda: cached.get_document(
+                doc.id, projection=PROJECTION_NO_EMBEDDINGS
+            ),
+            "cached-hdr": lambda: cached.get_document_header(doc.id),
+        }
+        baseline: float | None = None
+        print(f"{'case':<14}{'median ms':>12}{'min ms':>10}{'speed-up':>10}")
+        for name, fn in cases.items():
+            samples = await _time(fn, runs)
+            median = statistics.median(samples)
+            baseline = baseline or median
+            print(f"{name:<14}{median:>12.1f}{min(samples):>10.1f}{baseline / median:>9.1f}x")
+        await svc._engine.dispose()
+        await cached._engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=100)
+    parser.add_argument("--paragraphs", type=int, default=50, help="paragraphs per chapter")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.chapters, args.paragraphs, args.runs))
@@ -0,0 +1,195 @@
+"""Benchmark: KGService save/load time and size per snapshot format.
+
+Builds a synthetic library — by default 50 books with 1,000 entities,
+10,000 relations and 400 events each, i.e. 50k entities and 500k edges in
+total — in a throwaway directory, then measures:
+
+    legacy   the pre-sharding single file: ``model_dump`` + ``json.dump(indent=2)``
+             (kept here only as the baseline; still loadable by KGService)
+    json     per-book JSON shards  (``kg_snapshot_format="json"``)
+    binary   per-book binary columnar snapshots (the default)
+
+For each: a full save, the bytes on disk, ``decode`` (reading and parsing
+every file, no graph building), a full eager ``KGService.load()`` and a lazy
+one (``kg_lazy_load``: manifest and shard headers only — the startup cost),
+each the best of ``--repeat`` runs (the first load in a process also pays for
+growing the heap).  The legacy row is *loaded* by the current KGService, so
+its load time already includes the load-path speed-ups; only its save is the
+old code.  Legacy and JSON files have no headers to defer on, so their lazy
+load is a full one.
+
+Usage::
+
+    uv run python scripts/bench_kg_snapshot.py
+    uv run python scripts/bench_kg_snapshot.py --books 10 --entities 500 --relations 2000
+
+Nothing under ``var/`` is touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from storysphere.domain.entities import Entity, EntityType  # noqa: E402
+from storysphere.domain.events import Event, EventType  # noqa: E402
+from storysphere.domain.relations import Relation, RelationType  # noqa: E402
+from storysphere.services.kg_service import KGService  # noqa: E402
+from storysphere.services.kg_snapshot import decode_shard  # noqa: E402
+
+
+async def build_graph(path: Path, books: int, entities: int, relations: int, events: int):
+    rng = random.Random(7)
+    svc = KGService(persistence_path=str(path))
+    for b in range(books):
+        doc = f"book-{b:03d}"
+        ents = [
+            Entity(
+                name=f"Character {b}-{i}",
+                entity_type=EntityType.CHARACTER,
+                aliases=[f"C{i}"],
+                document_id=doc,
+                first_appearance_chapter=1 + i % 40,
+                mention_count=i % 50,
+            )
+            for i in range(entities)
+        ]
+        for entity in ents:
+            await svc.add_entity(entity)
+        for i in range(relations):
+            source, target = rng.sample(ents, 2)
+            await svc.add_relation(
+                Relation(
+                    source_id=source.id,
+                    target_id=target.id,
+                    relation_type=RelationType.FRIENDSHIP,
+                    weight=rng.random(),
+                    chapters=[1 + i % 40],
+                    document_id=doc,
+                )
+            )
+        for i in range(events):
+            await svc.add_event(
+                Event(
+                    title=f"Event {i}",
+                    description="Two characters meet at the harbour in the rain.",
+                    event_type=EventType.MEETING,
+                    chapter=1 + i % 40,
+                    participants=[ents[i % entities].id, ents[(i + 1) % entities].id],
+                    document_id=doc,
+                )
+            )
+    return svc
+
+
+def save_legacy(svc: KGService, path: Path) -> None:
+    """The single-file save KGService used before sharding — baseline only."""
+    payload = {
+        "entities": {eid: e.model_dump() for eid, e in svc._entities.items()},
+        "events": {evid: ev.model_dump() for evid, ev in svc._events.items()},
+        "temporal_relations": {
+            trid: tr.model_dump() for trid, tr in svc._temporal_relations.items()
+        },
+        "edges": [
+            {"source": u, "target": v, "key": k, **data}
+            for u, v, k, data in svc._graph.edges(keys=True, data=True)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, ensure_ascii=False, indent=2, default=str)
+
+
+def files_of(path: Path) -> list[Path]:
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if "shards" not in manifest:
+        return [path]
+    shard_dir = path.with_name(f"{path.stem}.shards")
+    return [path, *(shard_dir / e["file"] for e in manifest["shards"])]
+
+
+def decode_all(files: list[Path]) -> None:
+    # GC paused and edges as tuples, as KGService.load() does; nothing kept alive.
+    gc.disable()
+    try:
+        for f in files:
+            decode_shard(f.read_bytes(), edge_tuples=True)
+    finally:
+        gc.enable()
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+async def _timed_async(coro) -> float:
+    t0 = time.perf_counter()
+    await coro
+    return time.perf_counter() - t0
+
+
+async def main(
+    books: int, entities: int, relations: int, events: int, repeat: int
+) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        t0 = time.perf_counter()
+        svc = await build_graph(root / "build.json", books, entities, relations, events)
+        print(
+            f"graph: {svc.entity_count:,} entities, {svc.relation_count:,} edges, "
+            f"{svc.event_count:,} events in {books} books "
+            f"(built in {time.perf_counter() - t0:.1f}s)"
+        )
+
+        print(
+            f"{'format':<8}{'save s':>9}{'size MB':>10}{'decode s':>10}{'load s':>9}{'lazy s':>9}"
+        )
+        for fmt in ("legacy", "json", "binary"):
+            path = root / fmt / "knowledge_graph.json"
+            path.parent.mkdir()
+            if fmt == "legacy":
+                save_s = _timed(lambda p=path: save_legacy(svc, p))
+            else:
+                svc._shard_dir = path.with_name("knowledge_graph.shards")
+                svc._persistence_path = path
+                svc._shard_suffix = ".json" if fmt == "json" else ".kgsnap"
+                svc._shards = {}
+                svc._dirty_documents = set(svc._entities_by_document.keys())
+                save_s = await _timed_async(svc.save())
+            files = files_of(path)
+            size_mb = sum(f.stat().st_size for f in files) / 1e6
+            decode_s = min(_timed(lambda fs=files: decode_all(fs)) for _ in range(repeat))
+            load_s = {True: float("inf"), False: float("inf")}
+            for _ in range(repeat):
+                for lazy in load_s:
+                    loaded = KGService(persistence_path=str(path), lazy=lazy)
+                    load_s[lazy] = min(load_s[lazy], await _timed_async(loaded.load()))
+                    assert loaded.relation_count == svc.relation_count
+                    del loaded
+                    gc.collect()
+            print(
+                f"{fmt:<8}{save_s:>9.2f}{size_mb:>10.1f}{decode_s:>10.2f}"
+                f"{load_s[False]:>9.2f}{load_s[True]:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=50)
+    parser.add_argument("--entities", type=int, default=1_000, help="entities per book")
+    parser.add_argument("--relations", type=int, default=10_000, help="relations per book")
+    parser.add_argument("--events", type=int, default=400, help="events per book")
+    parser.add_argument("--repeat", type=int, default=3, help="decode/load runs; best is kept")
+    args = parser.parse_args()
+    asyncio.run(main(args.books, args.entities, args.relations, args.events, args.repeat))
@@ -0,0 +1,121 @@
+"""Benchmark: DocumentService.search_paragraphs_by_text, FTS5 index vs LIKE scan.
+
+Loads a synthetic library into a throwaway SQLite file — by default 40 books
+× 2,000 paragraphs of mixed Latin and CJK filler, each query term planted in
+roughly 2% of paragraphs — then times the same queries through:
+
+    like    the unindexed fallback (one LIKE per token, scored in Python)
+    fts     the paragraphs_fts trigram index, BM25-ordered
+
+both across the whole library and filtered to one book.
+
+Usage::
+
+    uv run python scripts/bench_text_search.py
+    uv run python scripts/bench_text_search.py --books 10 --paragraphs 5000 --runs 5
+
+Nothing under ``var/`` is touched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from storysphere.domain.documents import (  # noqa: E402
+    Chapter,
+    Document,
+    FileType,
+    Paragraph,
+)
+from storysphere.services.document_service import DocumentService  # noqa: E402
+
+_QUERIES = ["lantern", "harbour keeper", "大觀園", "黛玉 葬花", "storm window letter"]
+
+
+def build_book(rng: random.Random, index: int, paragraphs: int) -> Document:
+    """Zipf-ish filler over a 5,000-word / 3,000-hanzi vocabulary, with the
+    query terms planted in about one paragraph in fifty."""
+    vocab = [f"w{n}" for n in range(5000)]
+    weights = [1 / (n + 1) for n in range(5000)]
+    hanzi = [chr(0x4E00 + n) for n in range(3000)]
+    planted = [q.split() for q in _QUERIES]
+
+    def _para_text() -> str:
+        words = rng.choices(vocab, weights, k=60)
+        chars = rng.choices(hanzi, weights[:3000], k=80)
+        if rng.random() < 0.02:
+            words += rng.choice(planted)
+        return " ".join(words) + " " + "".join(chars)
+
+    per_chapter = 50
+    return Document(
+        title=f"Book {index}",
+        file_path=f"/tmp/book-{index}.txt",
+        file_type=FileType.TXT,
+        chapters=[
+            Chapter(
+                number=c + 1,
+                paragraphs=[
+                    Paragraph(text=_para_text(), chapter_number=c + 1, position=p)
+                    for p in range(per_chapter)
+                ],
+            )
+            for c in range(max(1, paragraphs // per_chapter))
+        ],
+    )
+
+
+async def _time(fn, runs: int) -> float:
+    await fn()
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def main(books: int, paragraphs: int, runs: int) -> None:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        svc = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp}/bench.db")
+        await svc.init_db()
+        doc_ids = []
+        for i in range(books):
+            doc = build_book(rng, i, paragraphs)
+            await svc.save_document(doc)
+            doc_ids.append(doc.id)
+        print(f"library: {books} books × {paragraphs} paragraphs")
+
+        print(f"{'query':<24}{'scope':<8}{'like ms':>10}{'fts ms':>10}{'speed-up':>10}")
+        for query in _QUERIES:
+            tokens = query.split()
+            for scope, doc_id in (("all", None), ("book", doc_ids[0])):
+                like = await _time(
+                    lambda t=tokens, d=doc_id: svc._search_paragraphs_by_like(t, d, 20), runs
+                )
+                fts = await _time(
+                    lambda q=query, d=doc_id: svc.search_paragraphs_by_text(q, document_id=d),
+                    runs,
+                )
+                print(f"{query:<24}{scope:<8}{like:>10.1f}{fts:>10.1f}{like / fts:>9.1f}x")
+        await svc._engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=40)
+    parser.add_argument("--paragraphs", type=int, default=2000, help="paragraphs per book")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.books, args.paragraphs, args.runs))
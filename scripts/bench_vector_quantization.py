@@ -0,0 +1,177 @@
+"""Benchmark: Qdrant vector storage — float32 vs int8 scalar vs binary quantization.
+
+Builds a synthetic corpus — by default 50,000 unit vectors × 384 dimensions
+(the MiniLM size) drawn around 256 cluster centres, queried with 200 noisy
+copies of corpus points — and reports, per storage mode, recall@k against
+exact float32 search, median query latency, and the RAM the vectors need.
+
+    float32          the current layout (``QDRANT_QUANTIZATION=none``)
+    scalar           int8, 4x smaller, rescored with the originals
+    binary           1 bit per dimension, 32x smaller, rescored
+
+Quantization needs a Qdrant server — local mode always searches exact float32
+— so by default the collections are created on ``QDRANT_URL`` (or ``--url``)
+with ``vector_storage_config``, exactly as VectorService creates them, and
+dropped afterwards.  Without a server, ``--simulate`` estimates recall with a
+numpy model of the same quantize → oversample → rescore pipeline (latency is
+then not reported: numpy timings say nothing about Qdrant's).
+
+Usage::
+
+    uv run python scripts/bench_vector_quantization.py --url http://localhost:6333
+    uv run python scripts/bench_vector_quantization.py --simulate --points 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from storysphere.services.vector_service import (  # noqa: E402
+    quantized_search_params,
+    vector_storage_config,
+)
+
+# (label, qdrant_quantization, oversampling)
+_MODES = (
+    ("float32", "none", 1.0),
+    ("scalar", "scalar", 2.0),
+    ("binary", "binary", 2.0),
+    ("binary", "binary", 4.0),
+)
+
+
+def build_corpus(
+    points: int, dim: int, queries: int, clusters: int, seed: int = 7
+) -> tuple[np.ndarray, np.ndarray]:
+    """Unit vectors around *clusters* centres, and queries near corpus points."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim))
+    corpus = centres[rng.integers(clusters, size=points)] + 0.6 * rng.standard_normal((points, dim))
+    corpus /= np.linalg.norm(corpus, axis=1, keepdims=True)
+    picks = corpus[rng.integers(points, size=queries)]
+    query = picks + 0.5 * rng.standard_normal((queries, dim)) / np.sqrt(dim)
+    query /= np.linalg.norm(query, axis=1, keepdims=True)
+    return corpus.astype(np.float32), query.astype(np.float32)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall(found: list[list[int]], truth: np.ndarray) -> float:
+    k = truth.shape[1]
+    return float(np.mean([len(set(f) & set(t)) / k for f, t in zip(found, truth.tolist(), strict=True)]))
+
+
+def ram_mb(points: int, dim: int, mode: str) -> float:
+    bytes_per_vector = {"none": dim * 4, "scalar": dim, "binary": dim / 8}[mode]
+    return points * bytes_per_vector / 2**20
+
+
+# ── Simulation ────────────────────────────────────────────────────────────────
+
+
+def simulate(corpus: np.ndarray, queries: np.ndarray, mode: str, k: int, oversampling: float) -> list[list[int]]:
+    """Quantized candidate search, then float32 rescoring of the candidates."""
+    if mode == "none":
+        return exact_top_k(corpus, queries, k).tolist()
+    if mode == "scalar":
+        # Symmetric int8 over the 0.99 quantile of absolute values, as Qdrant does.
+        limit = np.quantile(np.abs(corpus), 0.99)
+        quantized = np.clip(np.round(corpus / limit * 127), -127, 127).astype(np.int8)
+        approx = queries @ quantized.T.astype(np.float32)
+    else:
+        # Sign bits; agreement count ranks like Qdrant's XOR + popcount.
+        bits = corpus > 0
+        approx = (queries > 0).astype(np.float32) @ bits.T + (queries <= 0).astype(np.float32) @ ~bits.T
+    candidates = np.argsort(-approx, axis=1)[:, : int(k * oversampling)]
+    found = []
+    for q, cand in zip(queries, candidates, strict=True):
+        rescored = corpus[cand] @ q
+        found.append(cand[np.argsort(-rescored)[:k]].tolist())
+    return found
+
+
+# ── Qdrant server ────────────────────────────────────────────────────────────
+
+
+def run_server(url: str, corpus: np.ndarray, queries: np.ndarray, k: int, on_disk: bool):
+    from qdrant_client import QdrantClient, models  # noqa: PLC0415
+
+    client = QdrantClient(url=url, timeout=120)
+    rows = []
+    for label, mode, oversampling in _MODES:
+        name = f"bench_quantization_{mode}"
+        if not client.collection_exists(name):
+            client.create_collection(
+                collection_name=name, **vector_storage_config(corpus.shape[1], mode, on_disk)
+            )
+            for start in range(0, len(corpus), 1000):
+                batch = corpus[start : start + 1000]
+                client.upsert(
+                    collection_name=name,
+                    points=models.Batch(ids=list(range(start, start + len(batch))), vectors=batch.tolist()),
+                    wait=True,
+                )
+            while client.get_collection(name).status != models.CollectionStatus.GREEN:
+                time.sleep(0.5)
+        params = quantized_search_params(oversampling) if mode != "none" else None
+        found, samples = [], []
+        for q in queries:
+            t0 = time.perf_counter()
+            hits = client.query_points(name, query=q.tolist(), limit=k, search_params=params)
+            samples.append((time.perf_counter() - t0) * 1000)
+            found.append([int(p.id) for p in hits.points])
+        rows.append((label, mode, oversampling, found, statistics.median(samples)))
+    for _, mode, _ in _MODES:
+        if client.collection_exists(f"bench_quantization_{mode}"):
+            client.delete_collection(f"bench_quantization_{mode}")
+    return rows
+
+
+def main(args: argparse.Namespace) -> None:
+    corpus, queries = build_corpus(args.points, args.dim, args.queries, args.clusters)
+    truth = exact_top_k(corpus, queries, args.k)
+    print(f"corpus: {args.points} × {args.dim}, {args.queries} queries, recall@{args.k} vs exact float32")
+
+    if args.simulate:
+        rows = [
+            (label, mode, os_, simulate(corpus, queries, mode, args.k, os_), None)
+            for label, mode, os_ in _MODES
+        ]
+        print("(numpy simulation — no latency)")
+    else:
+        from storysphere.config.settings import get_settings  # noqa: PLC0415
+
+        rows = run_server(args.url or get_settings().qdrant_url, corpus, queries, args.k, args.on_disk)
+
+    print(f"{'mode':<10}{'oversample':>11}{'recall':>9}{'p50 ms':>9}{'RAM MB':>9}")
+    for label, mode, oversampling, found, p50 in rows:
+        latency = f"{p50:>9.2f}" if p50 is not None else f"{'—':>9}"
+        print(
+            f"{label:<10}{oversampling:>11.1f}{recall(found, truth):>9.3f}{latency}"
+            f"{ram_mb(args.points, args.dim, mode):>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="Qdrant server (default: QDRANT_URL)")
+    parser.add_argument("--simulate", action="store_true", help="numpy model, no server")
+    parser.add_argument("--on-disk", action="store_true", help="originals on disk (server only)")
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--clusters", type=int, default=256)
+    parser.add_argument("-k", type=int, default=10)
+    main(parser.parse_args())
@@ -13,6 +13,9 @@ shifts every store that persists a chapter number:
                             documents.timeline_config_json.total_chapters
     var/knowledge_graph.json events[].chapter, entities[].first_appearance_chapter
                             and valid_to_chapter, edges[].chapters/valid_from/valid_to
+                            (in each per-book shard under knowledge_graph.shards/,
+                            binary or JSON, or in the file itself for a legacy
+                            single-file graph)
     var/symbol_store.db     symbol_occurrences.chapter_number,
                             imagery_entities.chapter_distribution_json
     var/analysis_cache.db   epistemic (key suffix + payload), sep, teu payloads
@@ -45,6 +48,12 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "backend"))
 
 from storysphere.domain.documents import ChapterRole, assign_chapter_numbers  # noqa: E402
+from storysphere.services.kg_snapshot import (  # noqa: E402
+    decode_shard,
+    encode_snapshot,
+    read_header,
+)
+from storysphere.services.kg_wal import MUTATION_LOG_NAME  # noqa: E402
 
 # Cache kinds verified to carry no chapter number anywhere in their payload.
 # Anything outside this list and the remappers below aborts the run.
@@ -158,10 +167,43 @@ def migrate_knowledge_graph(
 ) -> list[str]:
     if not path.exists():
         return ["  knowledge_graph.json: absent, skipped"]
+    wal = path.with_name(f"{path.stem}.shards") / MUTATION_LOG_NAME
+    if wal.exists() and wal.stat().st_size:
+        # Replaying it over renumbered shards would write the old numbers back.
+        raise Abort(
+            f"{wal} holds KG changes not saved to the shards yet — "
+            "start the backend once (loading folds them in), stop it, and re-run"
+        )
 
-    kg = json.loads(path.read_text(encoding="utf-8"))
     counts = {"events": 0, "entities": 0, "edges": 0}
+    for kg_file in kg_files(path):
+        data = kg_file.read_bytes()
+        kg = decode_shard(data)
+        migrate_kg_payload(kg, mappings, counts)
+        if apply:
+            if read_header(data) is not None:  # binary snapshot shard
+                kg_file.write_bytes(encode_snapshot(kg))
+            else:
+                kg_file.write_text(json.dumps(kg, ensure_ascii=False), encoding="utf-8")
+
+    return [
+        f"  knowledge_graph.json: {counts['events']} events, "
+        f"{counts['entities']} entities, {counts['edges']} edges"
+    ]
 
+
+def kg_files(path: Path) -> list[Path]:
+    """The files holding KG records: the shards a manifest lists, or *path* itself."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if "shards" not in payload:
+        return [path]
+    shard_dir = path.with_name(f"{path.stem}.shards")
+    return [shard_dir / entry["file"] for entry in payload["shards"]]
+
+
+def migrate_kg_payload(
+    kg: dict, mappings: dict[str, dict[int, int]], counts: dict[str, int]
+) -> None:
     def values(section: str) -> list[dict]:
         data = kg.get(section) or []
         return list(data.values()) if isinstance(data, dict) else list(data)
@@ -195,14 +237,6 @@ def migrate_knowledge_graph(
         edge["valid_to_chapter"] = remap(edge.get("valid_to_chapter"), mapping, where)
         counts["edges"] += 1
 
-    if apply:
-        path.write_text(json.dumps(kg, ensure_ascii=False), encoding="utf-8")
-
-    return [
-        f"  knowledge_graph.json: {counts['events']} events, "
-        f"{counts['entities']} entities, {counts['edges']} edges"
-    ]
-
 
 def migrate_symbol_store(
     path: Path, mappings: dict[str, dict[int, int]], *, apply: bool
@@ -451,14 +485,16 @@ def main() -> int:
     kg_path = var_dir / "knowledge_graph.json"
     event_doc: dict[str, str] = {}
     if kg_path.exists():
-        kg = json.loads(kg_path.read_text(encoding="utf-8"))
-        events = kg.get("events") or {}
-        for event in (events.values() if isinstance(events, dict) else events):
-            event_doc[event["id"]] = event.get("document_id")
+        for kg_file in kg_files(kg_path):
+            kg = decode_shard(kg_file.read_bytes())
+            events = kg.get("events") or {}
+            for event in (events.values() if isinstance(events, dict) else events):
+                event_doc[event["id"]] = event.get("document_id")
 
     targets = [
         documents_db,
         kg_path,
+        kg_path.with_name(f"{kg_path.stem}.shards"),
         var_dir / "symbol_store.db",
         var_dir / "analysis_cache.db",
         var_dir / "qdrant_local",
@@ -58,7 +58,7 @@ class TestQueryPatternRecognizer:
         match = self.recognizer.recognize("Find passages about the battle")
         assert match is not None
         assert match.pattern_name == "search"
-        assert "vector_search" in match.suggested_tools
+        assert "hybrid_search" in match.suggested_tools
 
     def test_summary_pattern(self):
         match = self.recognizer.recognize("Give me a summary of chapter 3")
@@ -29,6 +29,8 @@ from storysphere.services.analysis_models import (
     ImpactAnalysis,
 )
 from storysphere.services.query_models import (
+    ChapterHeader,
+    DocumentHeader,
     DocumentSummary,
     PathNode,
     RelationPath,
@@ -53,6 +55,24 @@ def poll_until_terminal(client, task_id: str, attempts: int = 20) -> dict:
     raise AssertionError(f"task {task_id} never settled: {body}")
 
 
+def document_header(document) -> DocumentHeader:
+    """The header ``DocumentService.get_document_header`` would return for *document*."""
+    return DocumentHeader(
+        **document.model_dump(exclude={"chapters"}),
+        chapters=[
+            ChapterHeader(
+                id=ch.id,
+                number=ch.number,
+                title=ch.title,
+                role=ch.role,
+                summary=ch.summary,
+                paragraph_count=len(ch.paragraphs),
+            )
+            for ch in document.chapters
+        ],
+    )
+
+
 def hanging_call():
     """A stand-in for an awaited service call that never returns.
 
@@ -159,10 +179,21 @@ def mock_doc():
     svc.list_documents = AsyncMock(return_value=[
         DocumentSummary(id="doc-1", title="Test Novel", file_type="pdf", chapter_count=2)
     ])
-    async def _get_doc(doc_id):
+    async def _get_doc(doc_id, **_kw):
         return doc if doc_id == "doc-1" else None
 
     svc.get_document = AsyncMock(side_effect=_get_doc)
+    # Header / existence checks follow whatever ``get_document`` currently
+    # returns, so a test that re-points ``get_document`` covers all three.
+    async def _get_header(doc_id):
+        found = await svc.get_document(doc_id)
+        return document_header(found) if found is not None else None
+
+    async def _exists(doc_id):
+        return await svc.get_document(doc_id) is not None
+
+    svc.get_document_header = AsyncMock(side_effect=_get_header)
+    svc.document_exists = AsyncMock(side_effect=_exists)
     return svc
 
 
@@ -12,6 +12,8 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
+from .conftest import document_header
+
 
 def _make_document(language: str):
     from storysphere.domain.documents import Chapter, Document, FileType, Paragraph
@@ -49,10 +51,12 @@ def detail_client(mock_kg, mock_vector, mock_analysis_agent, mock_chat_agent):
     doc_svc = AsyncMock()
     holder = {"doc": _make_document("zh-tw")}
 
-    async def _get_doc(doc_id):
-        return holder["doc"] if doc_id == "book-1" else None
+    async def _get_header(doc_id):
+        if doc_id != "book-1":
+            return None
+        return document_header(holder["doc"])
 
-    doc_svc.get_document = AsyncMock(side_effect=_get_doc)
+    doc_svc.get_document_header = AsyncMock(side_effect=_get_header)
 
     app = create_app()
 
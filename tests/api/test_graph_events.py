@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import networkx as nx
 from storysphere.domain.entities import Entity, EntityType
 from storysphere.domain.events import Event, EventType
+from storysphere.domain.relations import Relation, RelationType
+from storysphere.services.kg_service import KGService
 
 from tests.api.conftest import ALICE, BOB
 
@@ -106,6 +110,48 @@ def test_graph_no_events(client, mock_kg):
     assert event_nodes == []
 
 
+# ── Graph delta endpoint ─────────────────────────────────────────────────────
+
+
+def test_graph_delta_between_chapters(client, mock_kg, tmp_path):
+    """Bob, the duel and the feud all arrive in chapter 2 — and leave going back."""
+    kg = KGService(persistence_path=str(tmp_path / "kg.json"), wal=False)
+    alice = Entity(id="ent-alice", name="Alice", entity_type=EntityType.CHARACTER,
+                   document_id="doc-1", first_appearance_chapter=1)
+    bob = Entity(id="ent-bob", name="Bob", entity_type=EntityType.CHARACTER,
+                 document_id="doc-1", first_appearance_chapter=2)
+    feud = Relation(id="rel-feud", source_id="ent-alice", target_id="ent-bob",
+                    relation_type=RelationType.ENEMY, document_id="doc-1")
+
+    async def _build():
+        await kg.add_entities([alice, bob])
+        await kg.add_relations([feud])
+        await kg.add_events([_evt(chapter=2, participants=["ent-alice", "ent-bob"])])
+
+    asyncio.run(_build())
+    mock_kg.get_snapshot = kg.get_snapshot
+    mock_kg.get_snapshot_delta = kg.get_snapshot_delta
+
+    resp = client.get("/api/v1/books/doc-1/graph/delta?mode=chapter&from=1&to=2")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert {n["id"] for n in data["addedNodes"]} == {"ent-bob", "evt-1"}
+    assert {e["id"] for e in data["addedEdges"]} == {
+        "rel-feud", "evt-evt-1-ent-alice", "evt-evt-1-ent-bob",
+    }
+    assert data["removedNodeIds"] == [] and data["removedEdgeIds"] == []
+
+    back = client.get("/api/v1/books/doc-1/graph/delta?mode=chapter&from=2&to=1").json()
+    assert set(back["removedNodeIds"]) == {"ent-bob", "evt-1"}
+    assert back["removedEdgeIds"] == ["rel-feud"]
+    assert back["addedNodes"] == [] and back["addedEdges"] == []
+
+
+def test_graph_delta_rejects_unknown_mode(client):
+    resp = client.get("/api/v1/books/doc-1/graph/delta?mode=weekly&from=1&to=2")
+    assert resp.status_code == 422
+
+
 # ── Event detail endpoint ────────────────────────────────────────────────────
 
 
@@ -259,7 +259,7 @@ class TestListChapters:
             chapters=[Chapter(number=1, title=None, paragraphs=[])],
             doc_id="book-notitle",
         )
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-notitle" else None
         mock_doc.get_document.side_effect = _get
 
@@ -294,7 +294,7 @@ class TestListChapters:
             chapters=[Chapter(number=1, title="Ch1", paragraphs=paras)],
             doc_id="book-stored",
         )
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-stored" else None
         mock_doc.get_document.side_effect = _get
 
@@ -317,7 +317,7 @@ class TestListChapters:
             doc_id="book-mixed-roles",
         )
 
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-mixed-roles" else None
 
         mock_doc.get_document.side_effect = _get
@@ -336,7 +336,7 @@ class TestListChapters:
             chapters=[Chapter(number=1, title="Ch1", paragraphs=paras)],
             doc_id="book-kg-fallback",
         )
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-kg-fallback" else None
         mock_doc.get_document.side_effect = _get
 
@@ -365,7 +365,7 @@ class TestGetChapterChunks:
 
     def test_returns_404_for_unknown_chapter(self, client, mock_doc):
         doc = self._doc_with_chapter()
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-chunks" else None
         mock_doc.get_document.side_effect = _get
 
@@ -374,7 +374,7 @@ class TestGetChapterChunks:
 
     def test_lookup_by_chapter_number(self, client, mock_doc):
         doc = self._doc_with_chapter()
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-chunks" else None
         mock_doc.get_document.side_effect = _get
 
@@ -385,7 +385,7 @@ class TestGetChapterChunks:
     def test_lookup_by_chapter_id(self, client, mock_doc):
         doc = self._doc_with_chapter()
         chapter_id = doc.chapters[0].id
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-chunks" else None
         mock_doc.get_document.side_effect = _get
 
@@ -394,7 +394,7 @@ class TestGetChapterChunks:
 
     def test_chunk_response_fields(self, client, mock_doc):
         doc = self._doc_with_chapter()
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-chunks" else None
         mock_doc.get_document.side_effect = _get
 
@@ -405,7 +405,7 @@ class TestGetChapterChunks:
 
     def test_chunk_order_matches_paragraph_position(self, client, mock_doc):
         doc = self._doc_with_chapter()
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-chunks" else None
         mock_doc.get_document.side_effect = _get
 
@@ -427,7 +427,7 @@ class TestGetChapterChunks:
             )
         ]
         doc = _make_document([Chapter(number=1, paragraphs=paras)], doc_id="book-seg-stored")
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-seg-stored" else None
         mock_doc.get_document.side_effect = _get
 
@@ -442,7 +442,7 @@ class TestGetChapterChunks:
         """Paragraphs without stored entities fall back to KG text matching."""
         paras = [_make_paragraph("p1", "Alice walked.", 0)]
         doc = _make_document([Chapter(number=1, paragraphs=paras)], doc_id="book-seg-kg")
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-seg-kg" else None
         mock_doc.get_document.side_effect = _get
 
@@ -459,7 +459,7 @@ class TestGetChapterChunks:
             keywords={"mystery": 0.9, "journey": 0.7},
         )
         doc = _make_document([Chapter(number=1, paragraphs=[para])], doc_id="book-kw")
-        def _get(did):
+        def _get(did, **_kw):
             return doc if did == "book-kw" else None
         mock_doc.get_document.side_effect = _get
 
@@ -30,3 +30,18 @@ def test_search_limit(client, mock_vector):
 def test_search_missing_query(client):
     resp = client.post("/api/v1/search/", json={})
     assert resp.status_code == 422  # query is required
+
+
+def test_search_hybrid_fuses_both_legs(client, mock_vector, mock_doc):
+    mock_doc.search_paragraphs_by_text = AsyncMock(return_value=[
+        VectorSearchResult(id="p2", text="Bob", score=3.0, document_id="doc-1", chapter_number=1, position=2, snippet="<mark>Bob</mark>"),
+        VectorSearchResult(id="p1", text="Alice garden", score=1.0, document_id="doc-1", chapter_number=1, position=1),
+    ])
+    resp = client.post("/api/v1/search/", json={"query": "Alice garden", "mode": "hybrid", "bookId": "doc-1"})
+    assert resp.status_code == 200
+    results = resp.json()
+    # p1 is ranked by both legs, p2 only by full-text.
+    assert [r["id"] for r in results] == ["p1", "p2"]
+    assert results[1]["snippet"] == "<mark>Bob</mark>"
+    mock_doc.search_paragraphs_by_text.assert_awaited_once()
+    assert mock_vector.search.await_args.kwargs["document_id"] == "doc-1"
@@ -0,0 +1,147 @@
+"""Tests for ``ChapterStream`` and the pipelines that consume it.
+
+The stream's contract: chapters arrive in order with their paragraphs loaded
+onto the header Document's own Chapter objects, paragraph output named in
+``persist=`` is on disk before the next chapter, and each chapter's paragraphs
+are dropped once the consumer moves on.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from storysphere.domain.documents import Chapter, Document, FileType, Paragraph, ParagraphEntity
+from storysphere.domain.entities import Entity, EntityType
+from storysphere.pipelines.chapter_stream import ChapterStream, chapters_of
+from storysphere.pipelines.knowledge_graph.pipeline import KnowledgeGraphPipeline
+from storysphere.services.document_service import PROJECTION_HEADERS, DocumentService
+
+
+def _make_document() -> Document:
+    return Document(
+        id="doc-stream",
+        title="Stream Test",
+        file_path="/tmp/stream.txt",
+        file_type=FileType.TXT,
+        chapters=[
+            Chapter(
+                number=n,
+                title=f"Chapter {n}",
+                paragraphs=[
+                    Paragraph(text=f"Alice walks in chapter {n}.", chapter_number=n, position=0),
+                    Paragraph(text="The rain keeps falling.", chapter_number=n, position=1),
+                ],
+            )
+            for n in (1, 2, 3)
+        ],
+    )
+
+
+@pytest.fixture
+async def stored(tmp_path):
+    svc = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp_path}/stream.db")
+    await svc.init_db()
+    await svc.save_document(_make_document())
+    header = await svc.get_document("doc-stream", projection=PROJECTION_HEADERS)
+    return svc, header
+
+
+class TestChapterStream:
+    @pytest.mark.asyncio
+    async def test_yields_header_chapters_with_paragraphs(self, stored):
+        svc, header = stored
+        stream = ChapterStream(svc, header)
+
+        seen = []
+        async for chapter in stream.chapters():
+            assert chapter is header.chapters[len(seen)]
+            seen.append((chapter.number, len(chapter.paragraphs)))
+
+        assert seen == [(1, 2), (2, 2), (3, 2)]
+
+    @pytest.mark.asyncio
+    async def test_paragraphs_are_released_after_each_chapter(self, stored):
+        svc, header = stored
+        stream = ChapterStream(svc, header)
+
+        async for chapter in stream.chapters():
+            earlier = [c for c in header.chapters if c.number < chapter.number]
+            assert all(c.paragraphs == [] for c in earlier)
+
+        assert header.total_paragraphs == 0
+
+    @pytest.mark.asyncio
+    async def test_persist_saves_paragraph_output_per_chapter(self, stored):
+        svc, header = stored
+        stream = ChapterStream(svc, header)
+
+        async for chapter in stream.chapters(persist=("paragraphs.entities",)):
+            chapter.paragraphs[1].entities = [
+                ParagraphEntity(
+                    entity_id=f"rain-{chapter.number}", entity_name="rain",
+                    entity_type="concept", start=4, end=8,
+                )
+            ]
+            chapter.summary = "not named, so not persisted"
+
+        full = await svc.get_document("doc-stream")
+        assert [ch.paragraphs[1].entities[0].entity_id for ch in full.chapters] == [
+            "rain-1", "rain-2", "rain-3",
+        ]
+        assert all(ch.summary is None for ch in full.chapters)
+
+    @pytest.mark.asyncio
+    async def test_is_re_iterable(self, stored):
+        svc, header = stored
+        stream = ChapterStream(svc, header)
+
+        first = [ch.number async for ch in stream.chapters()]
+        second = [ch.number async for ch in stream.chapters()]
+
+        assert first == second == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_chapters_of_without_stream_walks_the_document(self):
+        doc = _make_document()
+
+        chapters = [ch async for ch in chapters_of(doc, None)]
+
+        assert chapters == doc.chapters
+        assert doc.total_paragraphs == 6
+
+
+class TestKnowledgeGraphPipelineStreaming:
+    @pytest.mark.asyncio
+    async def test_paragraph_entities_are_saved_per_chapter(self, stored):
+        svc, header = stored
+        alice = Entity(
+            id="ent-alice",
+            name="Alice",
+            entity_type=EntityType.CHARACTER,
+            first_appearance_chapter=1,
+        )
+        entity_extractor = AsyncMock()
+        entity_extractor.extract.return_value = []
+        relation_extractor = AsyncMock()
+        relation_extractor.extract.return_value = ([], [])
+        entity_linker = MagicMock()
+        entity_linker.link.return_value = [alice]
+        pipeline = KnowledgeGraphPipeline(
+            entity_extractor=entity_extractor,
+            relation_extractor=relation_extractor,
+            entity_linker=entity_linker,
+            concurrency=1,
+        )
+
+        await pipeline.run(header, chapters=ChapterStream(svc, header))
+
+        # Every body paragraph went through extraction, one chapter at a time.
+        assert entity_extractor.extract.await_count == 6
+        assert relation_extractor.extract.await_count == 3
+        full = await svc.get_document("doc-stream")
+        for chapter in full.chapters:
+            mentions = chapter.paragraphs[0].entities
+            assert [(m.entity_id, m.start, m.end) for m in mentions] == [("ent-alice", 0, 5)]
+            assert chapter.paragraphs[1].entities is None
+        assert header.total_paragraphs == 0
@@ -421,9 +421,9 @@ class TestPersistence:
 
         await pipeline.run(doc)
 
-        assert kg.add_entity.await_count == 1
-        assert kg.add_relation.await_count == 1
-        assert kg.add_event.await_count == 1
+        kg.add_entities.assert_awaited_once_with([alice])
+        kg.add_relations.assert_awaited_once_with([rel])
+        kg.add_events.assert_awaited_once_with([evt])
         assert alice.document_id == "doc-kg"
         assert rel.document_id == "doc-kg"
         assert evt.document_id == "doc-kg"
@@ -465,7 +465,7 @@ class TestRerunIdempotency:
         assert "remove_by_document" in names
         # Ordering is the whole point: clearing after the writes would delete
         # what we just wrote.
-        assert names.index("remove_by_document") < names.index("add_entity")
+        assert names.index("remove_by_document") < names.index("add_entities")
         kg.remove_by_document.assert_awaited_once_with("doc-kg")
 
     @pytest.mark.asyncio
@@ -483,7 +483,7 @@ class TestRerunIdempotency:
         )
 
         kg.remove_by_document.assert_not_awaited()
-        assert kg.add_entity.await_count == 1
+        assert len(kg.add_entities.await_args.args[0]) == 1
 
     @pytest.mark.asyncio
     async def test_second_run_replaces_rather_than_appends(self, tmp_path):
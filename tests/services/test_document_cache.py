@@ -0,0 +1,214 @@
+"""Tests for the process-wide DocumentCache and DocumentService's use of it."""
+
+from __future__ import annotations
+
+import pytest
+from storysphere.core.metrics import get_metrics
+from storysphere.domain.documents import (
+    Chapter,
+    Document,
+    FileType,
+    Paragraph,
+    PipelineStatus,
+    StepStatus,
+)
+from storysphere.services.document_cache import DocumentCache
+from storysphere.services.document_service import (
+    PROJECTION_HEADERS,
+    PROJECTION_NO_EMBEDDINGS,
+    DocumentService,
+)
+
+
+def _make_document() -> Document:
+    return Document(
+        title="Cached Novel",
+        file_path="/tmp/cached.txt",
+        file_type=FileType.TXT,
+        chapters=[
+            Chapter(
+                number=n,
+                title=f"Chapter {n}",
+                paragraphs=[
+                    Paragraph(text=f"Paragraph {i} of {n}.", chapter_number=n, position=i)
+                    for i in range(3)
+                ],
+            )
+            for n in (1, 2)
+        ],
+    )
+
+
+@pytest.fixture
+async def service(tmp_path):
+    svc = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp_path}/cache.db")
+    await svc.init_db()
+    return svc
+
+
+class TestDocumentCache:
+    def test_evicts_least_recently_used_to_fit_the_budget(self):
+        cache = DocumentCache(max_bytes=100)
+        for doc_id in ("a", "b", "c"):
+            cache.put(("ns", doc_id), doc_id, 40, generation=cache.generation("ns", doc_id))
+        # "a" was evicted to make room for "c".
+        assert cache.get(("ns", "a"), cache_type="t") is None
+        assert cache.get(("ns", "b"), cache_type="t") == "b"
+        assert cache.size_bytes == 80
+
+    def test_get_refreshes_recency(self):
+        cache = DocumentCache(max_bytes=100)
+        for doc_id in ("a", "b"):
+            cache.put(("ns", doc_id), doc_id, 40, generation=cache.generation("ns", doc_id))
+        cache.get(("ns", "a"), cache_type="t")
+        cache.put(("ns", "c"), "c", 40, generation=cache.generation("ns", "c"))
+
+        assert cache.get(("ns", "a"), cache_type="t") == "a"
+        assert cache.get(("ns", "b"), cache_type="t") is None
+
+    def test_oversized_values_are_not_cached(self):
+        cache = DocumentCache(max_bytes=10)
+        cache.put(("ns", "a"), "a", 11, generation=cache.generation("ns", "a"))
+        assert len(cache) == 0
+
+    def test_invalidate_drops_every_entry_of_the_document(self):
+        cache = DocumentCache(max_bytes=1000)
+        gen = cache.generation("ns", "a")
+        cache.put(("ns", "a", "full"), 1, 10, generation=gen)
+        cache.put(("ns", "a", "header"), 2, 10, generation=gen)
+        cache.put(("ns", "b", "full"), 3, 10, generation=cache.generation("ns", "b"))
+
+        cache.invalidate("ns", "a")
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 10
+
+    def test_put_after_invalidation_is_discarded(self):
+        """A read that started before a write must not cache pre-write data."""
+        cache = DocumentCache(max_bytes=1000)
+        gen = cache.generation("ns", "a")
+        cache.invalidate("ns", "a")
+        cache.put(("ns", "a"), "stale", 10, generation=gen)
+        assert cache.get(("ns", "a"), cache_type="t") is None
+
+    def test_clear_discards_in_flight_reads_of_the_namespace(self):
+        cache = DocumentCache(max_bytes=1000)
+        gen = cache.generation("ns", "a")
+        other = cache.generation("other", "a")
+        cache.clear("ns")
+        cache.put(("ns", "a"), "stale", 10, generation=gen)
+        cache.put(("other", "a"), "fresh", 10, generation=other)
+        assert len(cache) == 1
+
+    def test_zero_budget_disables(self):
+        cache = DocumentCache(max_bytes=0)
+        cache.put(("ns", "a"), "a", 1, generation=cache.generation("ns", "a"))
+        assert not cache.enabled
+        assert cache.get(("ns", "a"), cache_type="t") is None
+
+
+class TestDocumentServiceCache:
+    @pytest.mark.asyncio
+    async def test_repeat_reads_hit_and_are_recorded(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        get_metrics().reset()
+
+        await service.get_document(doc.id, projection=PROJECTION_NO_EMBEDDINGS)
+        await service.get_document(doc.id, projection=PROJECTION_NO_EMBEDDINGS)
+        await service.get_document_header(doc.id)
+        await service.get_document_header(doc.id)
+
+        stats = get_metrics().get_stats()["cache_events"]
+        assert (stats["document"]["hit"], stats["document"]["miss"]) == (1, 1)
+        assert (stats["document_header"]["hit"], stats["document_header"]["miss"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_projections_are_cached_separately(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+
+        headers = await service.get_document(doc.id, projection=PROJECTION_HEADERS)
+        full = await service.get_document(doc.id)
+
+        assert headers.total_paragraphs == 0
+        assert full.total_paragraphs == 6
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_copies(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+
+        first = await service.get_document(doc.id)
+        first.chapters[0].summary = "edited, never saved"
+        first.chapters[0].paragraphs[0].text = "edited, never saved"
+        first.pipeline_status.mark_done("summarization")
+
+        second = await service.get_document(doc.id)
+        assert second.chapters[0].summary is None
+        assert second.chapters[0].paragraphs[0].text == "Paragraph 0 of 1."
+        assert second.pipeline_status.summarization != StepStatus.done
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda svc, doc: svc.update_pipeline_status(
+                doc.id, PipelineStatus(summarization=StepStatus.done)
+            ),
+            lambda svc, doc: svc.save_chapter_summary(doc.id, 1, "New summary."),
+            lambda svc, doc: svc.save_book_summary(doc.id, "New summary."),
+            lambda svc, doc: svc.save_book_keywords(doc.id, {"rain": 1.0}),
+            lambda svc, doc: svc.save_chapter_keywords(doc.id, 1, {"rain": 1.0}),
+            lambda svc, doc: svc.replace_chapters(doc),
+        ],
+    )
+    async def test_writes_invalidate(self, service, write):
+        doc = _make_document()
+        await service.save_document(doc)
+        before = await service.get_document(doc.id)
+        await service.get_document_header(doc.id)
+
+        doc.chapters = doc.chapters[:1]
+        await write(service, doc)
+
+        header_key = (service._cache_ns, doc.id, "header")
+        assert service._cache.get(header_key, cache_type="test") is None
+        assert await service.get_document(doc.id) != before
+
+    @pytest.mark.asyncio
+    async def test_save_chapter_fields_invalidates(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        await service.get_document(doc.id)
+
+        chapter = doc.chapters[1]
+        chapter.summary = "Streamed summary."
+        await service.save_chapter_fields(chapter, {"chapters.summary"})
+
+        assert (await service.get_document(doc.id)).chapters[1].summary == "Streamed summary."
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        await service.get_document(doc.id)
+        await service.get_document_header(doc.id)
+
+        await service.delete_document(doc.id)
+
+        assert await service.get_document(doc.id) is None
+        assert await service.get_document_header(doc.id) is None
+
+    @pytest.mark.asyncio
+    async def test_other_service_instances_see_writes(self, service, tmp_path):
+        """The cache is process-wide, so a write through one service evicts
+        what another service on the same database cached."""
+        other = DocumentService(database_url=f"sqlite+aiosqlite:///{tmp_path}/cache.db")
+        doc = _make_document()
+        await service.save_document(doc)
+        await other.get_document_header(doc.id)
+
+        await service.save_book_summary(doc.id, "Written elsewhere.")
+
+        assert (await other.get_document_header(doc.id)).summary == "Written elsewhere."
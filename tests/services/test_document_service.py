@@ -11,7 +11,12 @@ from storysphere.domain.documents import (
     Paragraph,
     ParagraphEntity,
 )
-from storysphere.services.document_service import DocumentService
+from storysphere.services.document_service import (
+    PROJECTION_HEADERS,
+    PROJECTION_NO_EMBEDDINGS,
+    PROJECTION_NO_TEXT,
+    DocumentService,
+)
 
 
 def _make_document(num_chapters: int = 2, paras_per_chapter: int = 3) -> Document:
@@ -66,7 +71,7 @@ class TestDocumentServiceSave:
 
     @pytest.mark.asyncio
     async def test_embedding_roundtrip(self, service):
-        """Embeddings stored as JSON should be recovered correctly."""
+        """Embeddings stored as float32 blobs should be recovered correctly."""
         doc = _make_document(num_chapters=1, paras_per_chapter=1)
         doc.chapters[0].paragraphs[0].embedding = [0.5] * 384
         await service.save_document(doc)
@@ -77,6 +82,70 @@ class TestDocumentServiceSave:
         assert len(para.embedding) == 384
         assert abs(para.embedding[0] - 0.5) < 1e-6
 
+    @pytest.mark.asyncio
+    async def test_embedding_stored_as_float32_blob(self, service):
+        from sqlalchemy import text
+
+        doc = _make_document(num_chapters=1, paras_per_chapter=1)
+        await service.save_document(doc)
+
+        async with service._engine.connect() as conn:
+            row = (
+                await conn.execute(text("SELECT embedding_json, embedding_blob FROM paragraphs"))
+            ).one()
+        assert row.embedding_json is None
+        assert len(row.embedding_blob) == 384 * 4
+
+    @pytest.mark.asyncio
+    async def test_init_db_migrates_legacy_json_embeddings(self, service):
+        import json
+
+        from sqlalchemy import text
+
+        doc = _make_document(num_chapters=1, paras_per_chapter=1)
+        await service.save_document(doc)
+        para_id = doc.chapters[0].paragraphs[0].id
+        async with service._engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "UPDATE paragraphs SET embedding_blob = NULL, embedding_json = :j "
+                    "WHERE id = :id"
+                ),
+                {"j": json.dumps([0.25] * 384), "id": para_id},
+            )
+
+        await service.init_db()
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.chapters[0].paragraphs[0].embedding == [0.25] * 384
+        async with service._engine.connect() as conn:
+            leftover = (
+                await conn.execute(
+                    text("SELECT COUNT(*) FROM paragraphs WHERE embedding_json IS NOT NULL")
+                )
+            ).scalar()
+        assert leftover == 0
+
+    @pytest.mark.asyncio
+    async def test_embedding_matrix_in_reading_order(self, service):
+        np = pytest.importorskip("numpy")
+        doc = _make_document(num_chapters=2, paras_per_chapter=2)
+        doc.chapters[1].paragraphs[0].embedding = [0.75] * 384
+        await service.save_document(doc)
+
+        ids, matrix = await service.get_embedding_matrix(doc.id)
+        assert ids == [doc.chapters[0].paragraphs[0].id, doc.chapters[1].paragraphs[0].id]
+        assert matrix.shape == (2, 384)
+        assert matrix.dtype == np.float32
+        assert matrix[1, 0] == pytest.approx(0.75)
+
+    @pytest.mark.asyncio
+    async def test_embedding_matrix_empty_for_unembedded_book(self, service):
+        pytest.importorskip("numpy")
+        ids, matrix = await service.get_embedding_matrix("nonexistent-id")
+        assert ids == []
+        assert matrix.shape == (0, 0)
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_document_returns_none(self, service):
         result = await service.get_document("nonexistent-id")
@@ -177,6 +246,96 @@ class TestDocumentServiceGetParagraphs:
         assert positions == sorted(positions)
 
 
+class TestDocumentServiceProjection:
+    @pytest.mark.asyncio
+    async def test_paragraphs_grouped_under_their_chapter(self, service):
+        doc = _make_document(num_chapters=3, paras_per_chapter=4)
+        await service.save_document(doc)
+
+        retrieved = await service.get_document(doc.id)
+        for original, loaded in zip(doc.chapters, retrieved.chapters, strict=True):
+            assert [p.id for p in loaded.paragraphs] == [p.id for p in original.paragraphs]
+
+    @pytest.mark.asyncio
+    async def test_no_embeddings_keeps_text_and_entities(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        doc.chapters[0].paragraphs[0].entities = [
+            ParagraphEntity(
+                entity_id="ent-1", entity_name="Alice", entity_type="character", start=0, end=5
+            ),
+        ]
+        await service.save_document(doc)
+
+        retrieved = await service.get_document(doc.id, projection=PROJECTION_NO_EMBEDDINGS)
+        para = retrieved.chapters[0].paragraphs[0]
+        assert para.embedding is None
+        assert para.text == "Chapter 1 paragraph 0."
+        assert para.entities[0].entity_id == "ent-1"
+
+    @pytest.mark.asyncio
+    async def test_no_text_keeps_paragraph_structure(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=3)
+        await service.save_document(doc)
+
+        retrieved = await service.get_document(doc.id, projection=PROJECTION_NO_TEXT)
+        assert retrieved.total_paragraphs == 6
+        para = retrieved.chapters[1].paragraphs[2]
+        assert (para.chapter_number, para.position, para.text) == (2, 2, "")
+
+    @pytest.mark.asyncio
+    async def test_headers_skip_paragraphs(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=3)
+        doc.chapters[0].summary = "Opening."
+        await service.save_document(doc)
+
+        retrieved = await service.get_document(doc.id, projection=PROJECTION_HEADERS)
+        assert retrieved.total_chapters == 2
+        assert retrieved.total_paragraphs == 0
+        assert retrieved.chapters[0].summary == "Opening."
+
+
+class TestDocumentServiceHeader:
+    @pytest.mark.asyncio
+    async def test_header_carries_chapters_and_paragraph_counts(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=3)
+        doc.chapters[0].role = ChapterRole.preface
+        doc.language = "zh"
+        await service.save_document(doc)
+
+        header = await service.get_document_header(doc.id)
+        assert header.title == "Test Novel"
+        assert header.language == "zh"
+        assert [c.number for c in header.chapters] == [1, 2]
+        assert header.chapters[0].role == ChapterRole.preface
+        assert header.total_paragraphs == 6
+        assert header.body_chapter_count == 1
+
+    @pytest.mark.asyncio
+    async def test_header_of_unknown_document_is_none(self, service):
+        assert await service.get_document_header("nonexistent-id") is None
+
+    @pytest.mark.asyncio
+    async def test_document_exists(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=1)
+        await service.save_document(doc)
+
+        assert await service.document_exists(doc.id) is True
+        assert await service.document_exists("nonexistent-id") is False
+
+    @pytest.mark.asyncio
+    async def test_update_timeline_config_leaves_paragraphs_alone(self, service):
+        from storysphere.domain.timeline import TimelineConfig
+
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        await service.save_document(doc)
+
+        await service.update_timeline_config(doc.id, TimelineConfig(total_chapters=7))
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.timeline_config.total_chapters == 7
+        assert retrieved.chapters[0].paragraphs[0].embedding is not None
+
+
 class TestDocumentServiceEntities:
     @pytest.mark.asyncio
     async def test_entities_roundtrip(self, service):
@@ -241,6 +400,78 @@ class TestDocumentServiceEntities:
         assert paragraphs[0].entities[0].entity_name == "Alice"
 
 
+def _mention(entity_id: str, start: int = 0) -> ParagraphEntity:
+    return ParagraphEntity(
+        entity_id=entity_id, entity_name=entity_id, entity_type="character",
+        start=start, end=start + 3,
+    )
+
+
+class TestDocumentServiceEntityIndex:
+    @pytest.mark.asyncio
+    async def test_paragraphs_by_entity_in_reading_order(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=3)
+        doc.chapters[1].paragraphs[2].entities = [_mention("ana"), _mention("ana", 10)]
+        doc.chapters[0].paragraphs[1].entities = [_mention("ana"), _mention("bo", 5)]
+        doc.chapters[0].paragraphs[2].entities = [_mention("bo")]
+        await service.save_document(doc)
+
+        rows = await service.get_paragraphs_by_entity(doc.id, "ana")
+
+        assert [(num, p.position) for _, num, _, p in rows] == [(1, 1), (2, 2)]
+        ch_id, _, ch_title, para = rows[0]
+        assert ch_id == doc.chapters[0].id
+        assert ch_title == "Chapter 1"
+        assert para.text == "Chapter 1 paragraph 1."
+        assert [e.entity_id for e in para.entities] == ["ana", "bo"]
+
+    @pytest.mark.asyncio
+    async def test_scoped_to_document(self, service):
+        a = _make_document(num_chapters=1, paras_per_chapter=1)
+        b = _make_document(num_chapters=1, paras_per_chapter=1)
+        for d in (a, b):
+            d.chapters[0].paragraphs[0].entities = [_mention("ana")]
+            await service.save_document(d)
+
+        rows = await service.get_paragraphs_by_entity(b.id, "ana")
+
+        assert [p.id for _, _, _, p in rows] == [b.chapters[0].paragraphs[0].id]
+
+    @pytest.mark.asyncio
+    async def test_index_follows_every_write_path(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        await service.save_document(doc)
+        assert await service.get_paragraphs_by_entity(doc.id, "ana") == []
+
+        doc.chapters[0].paragraphs[0].entities = [_mention("ana")]
+        await service.save_document_fields(doc, {"paragraphs.entities"})
+        assert len(await service.get_paragraphs_by_entity(doc.id, "ana")) == 1
+
+        doc.chapters[0].paragraphs[0].entities = [_mention("bo")]
+        await service.save_document(doc)
+        assert await service.get_paragraphs_by_entity(doc.id, "ana") == []
+
+        await service.replace_chapters(doc)
+        assert len(await service.get_paragraphs_by_entity(doc.id, "bo")) == 1
+
+        await service.delete_document(doc.id)
+        assert await service.get_paragraphs_by_entity(doc.id, "bo") == []
+
+    @pytest.mark.asyncio
+    async def test_init_db_backfills_existing_mentions(self, service):
+        from sqlalchemy import text  # noqa: PLC0415
+
+        doc = _make_document(num_chapters=1, paras_per_chapter=1)
+        doc.chapters[0].paragraphs[0].entities = [_mention("ana")]
+        await service.save_document(doc)
+        async with service._engine.begin() as conn:
+            await conn.execute(text("DELETE FROM paragraph_entities"))
+
+        await service.init_db()
+
+        assert len(await service.get_paragraphs_by_entity(doc.id, "ana")) == 1
+
+
 class TestDocumentServiceIdempotency:
     @pytest.mark.asyncio
     async def test_save_twice_does_not_duplicate(self, service):
@@ -251,3 +482,302 @@ class TestDocumentServiceIdempotency:
 
         docs = await service.list_documents()
         assert len(docs) == 1
+
+    @pytest.mark.asyncio
+    async def test_resave_overwrites_changed_rows(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        await service.save_document(doc)
+        doc.summary = "Book summary."
+        doc.chapters[0].keywords = {"harbour": 0.9}
+        doc.chapters[0].paragraphs[1].text = "Rewritten."
+        await service.save_document(doc)
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.summary == "Book summary."
+        assert retrieved.chapters[0].keywords == {"harbour": 0.9}
+        assert retrieved.chapters[0].paragraphs[1].text == "Rewritten."
+        assert retrieved.total_paragraphs == 2
+
+    @pytest.mark.asyncio
+    async def test_save_spans_several_write_batches(self, service, monkeypatch):
+        import storysphere.services.document_service as mod
+
+        monkeypatch.setattr(mod, "_BULK_WRITE_BATCH", 2)
+        doc = _make_document(num_chapters=3, paras_per_chapter=5)
+        await service.save_document(doc)
+        await service.replace_chapters(doc)
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.total_chapters == 3
+        assert retrieved.total_paragraphs == 15
+
+
+class TestDocumentServiceDirtyFields:
+    @pytest.mark.asyncio
+    async def test_writes_only_the_named_columns(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=2)
+        await service.save_document(doc)
+
+        doc.chapters[0].summary = "Ch1 summary."
+        doc.chapters[1].keywords = {"storm": 0.5}
+        doc.chapters[0].paragraphs[0].text = "Not meant to be saved."
+        await service.save_document_fields(doc, {"chapters.summary"})
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.chapters[0].summary == "Ch1 summary."
+        assert retrieved.chapters[1].keywords is None
+        assert retrieved.chapters[0].paragraphs[0].text == "Chapter 1 paragraph 0."
+
+    @pytest.mark.asyncio
+    async def test_paragraph_entities_and_book_keywords(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        await service.save_document(doc)
+
+        doc.keywords = {"rain": 1.0}
+        doc.chapters[0].paragraphs[1].entities = [
+            ParagraphEntity(
+                entity_id="e1", entity_name="Ana", entity_type="character", start=0, end=3
+            )
+        ]
+        await service.save_document_fields(doc, ["document.keywords", "paragraphs.entities"])
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.keywords == {"rain": 1.0}
+        assert retrieved.chapters[0].paragraphs[0].entities is None
+        assert retrieved.chapters[0].paragraphs[1].entities[0].entity_id == "e1"
+        # Embeddings were not named, so the stored vector survives.
+        assert retrieved.chapters[0].paragraphs[0].embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_raises(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=1)
+        with pytest.raises(ValueError, match="paragraphs.text"):
+            await service.save_document_fields(doc, {"paragraphs.text"})
+
+
+class TestDocumentServiceIterChapters:
+    @pytest.mark.asyncio
+    async def test_yields_chapters_in_order_with_their_paragraphs(self, service):
+        doc = _make_document(num_chapters=3, paras_per_chapter=2)
+        await service.save_document(doc)
+
+        streamed = [ch async for ch in service.iter_chapters(doc.id)]
+        full = await service.get_document(doc.id)
+
+        assert [ch.number for ch in streamed] == [1, 2, 3]
+        assert streamed == full.chapters
+
+    @pytest.mark.asyncio
+    async def test_projection_is_applied(self, service):
+        doc = _make_document(num_chapters=1, paras_per_chapter=2)
+        await service.save_document(doc)
+
+        chapters = [
+            ch
+            async for ch in service.iter_chapters(doc.id, projection=PROJECTION_NO_EMBEDDINGS)
+        ]
+
+        assert chapters[0].paragraphs[0].text == "Chapter 1 paragraph 0."
+        assert chapters[0].paragraphs[0].embedding is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_document_yields_nothing(self, service):
+        assert [ch async for ch in service.iter_chapters("missing")] == []
+
+    @pytest.mark.asyncio
+    async def test_save_chapter_fields_writes_one_chapter(self, service):
+        doc = _make_document(num_chapters=2, paras_per_chapter=1)
+        await service.save_document(doc)
+
+        async for chapter in service.iter_chapters(doc.id):
+            chapter.summary = f"Summary {chapter.number}."
+            if chapter.number == 2:
+                await service.save_chapter_fields(chapter, {"chapters.summary"})
+
+        retrieved = await service.get_document(doc.id)
+        assert retrieved.chapters[0].summary is None
+        assert retrieved.chapters[1].summary == "Summary 2."
+
+    @pytest.mark.asyncio
+    async def test_save_chapter_fields_rejects_document_fields(self, service):
+        chapter = _make_document(num_chapters=1).chapters[0]
+        with pytest.raises(ValueError, match="document.summary"):
+            await service.save_chapter_fields(chapter, {"document.summary"})
+
+
+def _text_document(title: str, texts: list[str]) -> Document:
+    return Document(
+        title=title,
+        file_path=f"/tmp/{title}.txt",
+        file_type=FileType.TXT,
+        chapters=[
+            Chapter(
+                number=1,
+                paragraphs=[
+                    Paragraph(text=t, chapter_number=1, position=i) for i, t in enumerate(texts)
+                ],
+            )
+        ],
+    )
+
+
+class TestDocumentServiceTextSearch:
+    @pytest.mark.asyncio
+    async def test_index_is_enabled(self, service):
+        assert service._fts_enabled
+
+    @pytest.mark.asyncio
+    async def test_ranked_by_bm25_with_snippet(self, service):
+        doc = _text_document(
+            "harbour",
+            [
+                "The lighthouse keeper slept.",
+                "A lighthouse, another lighthouse, and a third lighthouse on the cape.",
+                "Nothing here.",
+            ],
+        )
+        await service.save_document(doc)
+
+        results = await service.search_paragraphs_by_text("lighthouse")
+
+        assert [r.position for r in results] == [1, 0]
+        # score is the (negated) BM25 the rows are ordered by.
+        assert results[0].score > results[1].score > 0
+        assert "<mark>lighthouse</mark>" in results[0].snippet
+
+    @pytest.mark.asyncio
+    async def test_cjk_text_and_short_tokens(self, service):
+        doc = _text_document("紅樓", ["寶玉走進大觀園，黛玉正在葬花。", "賈母在大觀園設宴。"])
+        await service.save_document(doc)
+
+        results = await service.search_paragraphs_by_text("大觀園 黛玉")
+
+        assert [r.position for r in results] == [0]
+        # A query of only two-character tokens still works, via LIKE.
+        results = await service.search_paragraphs_by_text("賈母")
+        assert [r.position for r in results] == [1]
+        assert results[0].snippet is None
+
+    @pytest.mark.asyncio
+    async def test_filtered_by_document(self, service):
+        a = _text_document("a", ["shared phrase in book a"])
+        b = _text_document("b", ["shared phrase in book b"])
+        await service.save_document(a)
+        await service.save_document(b)
+
+        results = await service.search_paragraphs_by_text("shared phrase", document_id=b.id)
+
+        assert [r.document_id for r in results] == [b.id]
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_replacements_and_deletes(self, service):
+        doc = _text_document("sync", ["original wording"])
+        await service.save_document(doc)
+
+        doc.chapters[0].paragraphs[0].text = "revised wording"
+        await service.save_document(doc)
+        assert await service.search_paragraphs_by_text("original") == []
+        assert len(await service.search_paragraphs_by_text("revised")) == 1
+
+        doc.chapters[0].paragraphs = [Paragraph(text="fresh start", chapter_number=1, position=0)]
+        await service.replace_chapters(doc)
+        assert await service.search_paragraphs_by_text("revised") == []
+        assert len(await service.search_paragraphs_by_text("fresh")) == 1
+
+        await service.delete_document(doc.id)
+        assert await service.search_paragraphs_by_text("fresh") == []
+
+    @pytest.mark.asyncio
+    async def test_init_db_backfills_existing_paragraphs(self, service):
+        from sqlalchemy import text  # noqa: PLC0415
+
+        doc = _text_document("legacy", ["written before the index existed"])
+        await service.save_document(doc)
+        async with service._engine.begin() as conn:
+            await conn.execute(text("DROP TABLE paragraphs_fts"))
+
+        await service.init_db()
+
+        assert len(await service.search_paragraphs_by_text("before the index")) == 1
+
+    @pytest.mark.asyncio
+    async def test_vacuum_keeps_the_index_on_the_right_rows(self, service):
+        gone = _text_document("gone", [f"filler paragraph {i}" for i in range(50)])
+        kept = _text_document("kept", ["the lighthouse keeper", "a quiet harbour"])
+        await service.save_document(gone)
+        await service.save_document(kept)
+        await service.delete_document(gone.id)
+
+        await service.vacuum()
+
+        results = await service.search_paragraphs_by_text("harbour")
+        assert [(r.document_id, r.text) for r in results] == [(kept.id, "a quiet harbour")]
+
+    @pytest.mark.asyncio
+    async def test_match_any(self, service):
+        doc = _text_document(
+            "any",
+            ["the lighthouse keeper", "a keeper of the lighthouse and its garden", "only a garden"],
+        )
+        await service.save_document(doc)
+
+        assert await service.search_paragraphs_by_text("lighthouse garden") != []
+        results = await service.search_paragraphs_by_text("lighthouse garden", match_any=True)
+        # Matching both tokens ranks first.
+        assert [r.position for r in results][0] == 1
+        assert sorted(r.position for r in results) == [0, 1, 2]
+        # Stop words and short ASCII tokens alone would match nearly everything.
+        assert await service.search_paragraphs_by_text("of the ly", match_any=True) == []
+
+    @pytest.mark.asyncio
+    async def test_match_any_strips_punctuation(self, service):
+        doc = _text_document(
+            "punct", ["the keeper climbed", "a garden by the sea", "蕭炎走進花園"]
+        )
+        await service.save_document(doc)
+
+        results = await service.search_paragraphs_by_text(
+            'Who is "the keeper:" - and the garden?', match_any=True
+        )
+        assert sorted(r.position for r in results) == [0, 1]
+        # Short CJK tokens still reach the LIKE fallback.
+        results = await service.search_paragraphs_by_text("蕭炎 ,", match_any=True)
+        assert [r.position for r in results] == [2]
+
+    @pytest.mark.asyncio
+    async def test_quotes_in_query_are_literal(self, service):
+        doc = _text_document("quotes", ['He said "stop" twice.'])
+        await service.save_document(doc)
+
+        assert len(await service.search_paragraphs_by_text('"stop"')) == 1
+
+
+class TestDocumentServiceEngine:
+    @pytest.mark.asyncio
+    async def test_connections_use_wal_and_busy_timeout(self, service):
+        from sqlalchemy import text  # noqa: PLC0415
+
+        async with service._engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 10000
+
+    @pytest.mark.asyncio
+    async def test_init_db_adds_indexes_to_existing_database(self, service):
+        from sqlalchemy import text  # noqa: PLC0415
+
+        async with service._engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_paragraphs_document_chapter_position"))
+
+        await service.init_db()
+
+        async with service._engine.connect() as conn:
+            plan = (
+                await conn.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM paragraphs "
+                        "WHERE document_id = 'd' ORDER BY chapter_number, position"
+                    )
+                )
+            ).all()
+        assert "ix_paragraphs_document_chapter_position" in " ".join(r[-1] for r in plan)
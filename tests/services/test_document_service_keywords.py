@@ -103,3 +103,50 @@ class TestSearchChaptersByKeyword:
 
         results = await service.search_chapters_by_keyword(doc.id, "nonexistent")
         assert results == []
+
+
+class TestChapterKeywordIndex:
+    async def test_get_keywords_for_chapters_batches(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        await service.save_chapter_keywords(doc.id, 1, {"hero": 0.5, "quest": 0.9})
+        await service.save_chapter_keywords(doc.id, 2, {"journey": 0.8})
+
+        result = await service.get_keywords_for_chapters(doc.id, [2, 1, 99])
+
+        assert result == {1: {"quest": 0.9, "hero": 0.5}, 2: {"journey": 0.8}}
+        assert list(result[1]) == ["quest", "hero"]  # descending score
+        assert await service.get_keywords_for_chapters(doc.id, []) == {}
+
+    async def test_index_follows_keyword_rewrites(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        await service.save_chapter_keywords(doc.id, 1, {"hero": 0.9})
+        await service.save_chapter_keywords(doc.id, 1, {"villain": 0.4})
+
+        assert await service.search_chapters_by_keyword(doc.id, "hero") == []
+        assert [m.chapter_number for m in await service.search_chapters_by_keyword(doc.id, "villain")] == [1]
+
+    async def test_index_follows_save_and_replace(self, service):
+        doc = _make_document()
+        doc.chapters[1].keywords = {"road": 0.6}
+        await service.save_document(doc)
+        assert [m.title for m in await service.search_chapters_by_keyword(doc.id, "road")] == [
+            "The Journey"
+        ]
+
+        doc.chapters = doc.chapters[1:]
+        doc.chapters[0].number = 1
+        await service.replace_chapters(doc)
+        assert await service.get_keywords_for_chapters(doc.id, [1, 2]) == {1: {"road": 0.6}}
+
+        await service.delete_document(doc.id)
+        assert await service.get_keywords_for_chapters(doc.id, [1, 2]) == {}
+
+    async def test_search_is_case_insensitive(self, service):
+        doc = _make_document()
+        await service.save_document(doc)
+        await service.save_chapter_keywords(doc.id, 2, {"hero": 0.7})
+
+        results = await service.search_chapters_by_keyword(doc.id, "Hero")
+        assert [(m.chapter_number, m.score) for m in results] == [(2, 0.7)]
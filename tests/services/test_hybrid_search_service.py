@@ -0,0 +1,99 @@
+"""Tests for HybridSearchService and reciprocal rank fusion."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from storysphere.services.hybrid_search_service import (
+    HybridSearchService,
+    reciprocal_rank_fusion,
+)
+from storysphere.services.query_models import VectorSearchResult
+
+
+def _hit(pid: str, score: float = 1.0, snippet: str | None = None) -> VectorSearchResult:
+    return VectorSearchResult(
+        id=pid,
+        score=score,
+        text=f"paragraph {pid}",
+        document_id="doc1",
+        chapter_number=1,
+        position=0,
+        snippet=snippet,
+    )
+
+
+class TestReciprocalRankFusion:
+    def test_scores_and_order(self):
+        fused = reciprocal_rank_fusion(
+            [[_hit("a"), _hit("b"), _hit("c")], [_hit("c"), _hit("a")]], k=10
+        )
+        assert [r.id for r in fused] == ["a", "c", "b"]
+        assert fused[0].score == pytest.approx(1 / 11 + 1 / 12)
+        assert fused[1].score == pytest.approx(1 / 13 + 1 / 11)
+        assert fused[2].score == pytest.approx(1 / 12)
+
+    def test_duplicates_keep_a_snippet(self):
+        fused = reciprocal_rank_fusion([[_hit("a")], [_hit("a", snippet="<mark>x</mark>")]])
+        assert len(fused) == 1
+        assert fused[0].snippet == "<mark>x</mark>"
+
+    def test_empty(self):
+        assert reciprocal_rank_fusion([[], []]) == []
+
+
+class TestHybridSearchService:
+    @pytest.fixture
+    def doc(self):
+        svc = AsyncMock()
+        svc.search_paragraphs_by_text = AsyncMock(return_value=[_hit("lex1"), _hit("both")])
+        return svc
+
+    @pytest.fixture
+    def vector(self):
+        svc = AsyncMock()
+        svc.search = AsyncMock(return_value=[_hit("both"), _hit("dense1")])
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_fuses_both_legs(self, doc, vector):
+        svc = HybridSearchService(vector, doc, candidates=30, rrf_k=60)
+
+        results = await svc.search("garden", top_k=2, document_id="doc1")
+
+        assert [r.id for r in results] == ["both", "lex1"]
+        doc.search_paragraphs_by_text.assert_awaited_once_with(
+            "garden", document_id="doc1", top_k=30, match_any=True
+        )
+        vector.search.assert_awaited_once_with(query_text="garden", top_k=30, document_id="doc1")
+
+    @pytest.mark.asyncio
+    async def test_legs_run_concurrently(self, doc, vector):
+        started = []
+
+        async def leg(name, result):
+            started.append(name)
+            await asyncio.sleep(0.05)
+            assert len(started) == 2  # the other leg began before this one ended
+            return result
+
+        doc.search_paragraphs_by_text = lambda *a, **kw: leg("lexical", [_hit("x")])
+        vector.search = lambda *a, **kw: leg("dense", [_hit("y")])
+
+        results = await HybridSearchService(vector, doc).search("q")
+        assert {r.id for r in results} == {"x", "y"}
+
+    @pytest.mark.asyncio
+    async def test_one_failing_leg_falls_back_to_the_other(self, doc, vector):
+        vector.search = AsyncMock(side_effect=ConnectionError("qdrant down"))
+        results = await HybridSearchService(vector, doc).search("q")
+        assert [r.id for r in results] == ["lex1", "both"]
+
+    @pytest.mark.asyncio
+    async def test_both_legs_failing_raises(self, doc, vector):
+        doc.search_paragraphs_by_text = AsyncMock(side_effect=RuntimeError("db"))
+        vector.search = AsyncMock(side_effect=ConnectionError("qdrant down"))
+        with pytest.raises(RuntimeError):
+            await HybridSearchService(vector, doc).search("q")
@@ -236,8 +236,8 @@ class TestKeywordService:
     async def test_get_entity_keywords_with_timeline(self):
         """When KG has timeline events, aggregate keywords from those chapters."""
         doc_svc = AsyncMock()
-        doc_svc.get_chapter_keywords = AsyncMock(
-            side_effect=lambda _doc, ch: {"battle": 0.8, "sword": 0.6} if ch == 1 else {"peace": 0.7}
+        doc_svc.get_keywords_for_chapters = AsyncMock(
+            return_value={1: {"battle": 0.8, "sword": 0.6}, 3: {"peace": 0.7}}
         )
         doc_svc.get_book_keywords = AsyncMock(return_value={})
 
@@ -246,15 +246,17 @@ class TestKeywordService:
         kg_svc.get_entity_by_name = AsyncMock(return_value=entity_mock)
         event1 = MagicMock(chapter_number=1)
         event2 = MagicMock(chapter_number=3)
-        kg_svc.get_entity_timeline = AsyncMock(return_value=[event1, event2])
+        event3 = MagicMock(chapter_number=1)
+        kg_svc.get_entity_timeline = AsyncMock(return_value=[event1, event2, event3])
 
         svc = KeywordService(doc_service=doc_svc, kg_service=kg_svc)
         result = await svc.get_entity_keywords("doc1", "Alice", top_k=5)
 
         assert isinstance(result, dict)
         assert len(result) > 0
-        # Should have aggregated from chapters 1 and 3
-        assert doc_svc.get_chapter_keywords.await_count == 2
+        assert set(result) == {"battle", "sword", "peace"}
+        # One batched lookup for chapters 1 and 3, not one query per chapter
+        doc_svc.get_keywords_for_chapters.assert_awaited_once_with("doc1", {1, 3})
 
     async def test_get_entity_keywords_no_kg_fallback(self):
         """Without kg_service, falls back to book keywords."""
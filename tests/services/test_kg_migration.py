@@ -27,6 +27,7 @@ from storysphere.services.kg_migration import (
     migrate_networkx_to_neo4j,
 )
 from storysphere.services.kg_service import KGService
+from storysphere.services.kg_snapshot import decode_shard
 
 # ── Neo4j double ─────────────────────────────────────────────────────────────
 
@@ -203,6 +204,13 @@ async def _to_neo4j(path: Path, **kw) -> dict[str, int]:
     )
 
 
+def _shard_payloads(manifest_path: Path) -> list[dict]:
+    """The per-book shard files the manifest at *manifest_path* lists."""
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    shard_dir = manifest_path.with_name(f"{manifest_path.stem}.shards")
+    return [decode_shard((shard_dir / entry["file"]).read_bytes()) for entry in manifest["shards"]]
+
+
 # ── NetworkX → Neo4j ─────────────────────────────────────────────────────────
 
 
@@ -279,6 +287,22 @@ class TestToNeo4j:
         assert counts["events"] == 2
         assert counts["temporal_relations"] == 1
 
+    async def test_legacy_single_file_source_is_accepted(self, source, tmp_path):
+        """Graphs saved before sharding are one JSON file; they still migrate."""
+        legacy = tmp_path / "legacy.json"
+        shard = _shard_payloads(source["path"])[0]
+        shard.pop("document_id")
+        legacy.write_text(json.dumps(shard), encoding="utf-8")
+
+        counts = await _to_neo4j(legacy)
+
+        assert counts == {
+            "entities": 3,
+            "relations": 2,
+            "events": 2,
+            "temporal_relations": 1,
+        }
+
     async def test_running_twice_does_not_duplicate(self, source):
         """The module docstring promises idempotence; hold it to that."""
         await _to_neo4j(source["path"])
@@ -308,8 +332,9 @@ class TestToNetworkX:
         _, out = await self._back(tmp_path)
 
         assert out.exists()
-        payload = json.loads(out.read_text(encoding="utf-8"))
-        assert set(payload) >= {"entities", "events", "temporal_relations", "edges"}
+        shards = _shard_payloads(out)
+        assert len(shards) == 1
+        assert set(shards[0]) >= {"entities", "events", "temporal_relations", "edges"}
 
     async def test_counts_match_what_neo4j_held(self, source, tmp_path):
         await _to_neo4j(source["path"])
@@ -340,8 +365,12 @@ class TestToNetworkX:
         counts, out = await self._back(tmp_path)
 
         assert counts["relations"] == 2
-        payload = json.loads(out.read_text(encoding="utf-8"))
-        keys = [e["key"] for e in payload["edges"] if not e["key"].endswith("_rev")]
+        keys = [
+            e["key"]
+            for shard in _shard_payloads(out)
+            for e in shard["edges"]
+            if not e["key"].endswith("_rev")
+        ]
         assert len(keys) == len(set(keys)), "a relation was written twice"
 
     async def test_empty_graph_produces_empty_counts(self, tmp_path):
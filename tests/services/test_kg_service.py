@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
+import stat
+from unittest.mock import patch
+
 import pytest
 from storysphere.domain.entities import Entity, EntityType
-from storysphere.domain.events import Event, EventType
+from storysphere.domain.events import Event, EventType, StoryTimeRef
 from storysphere.domain.relations import Relation, RelationType
+from storysphere.domain.temporal import TemporalRelation, TemporalRelationType
+from storysphere.services import kg_service as kg_service_module
 from storysphere.services.kg_service import KGService
+from storysphere.services.kg_snapshot import decode_shard, encode_snapshot, read_header
 
 
 def _make_kg_service(tmp_path) -> KGService:
@@ -143,6 +151,28 @@ class TestKGServiceRelations:
         incoming = await service.get_relations(alice.id, direction="in")
         assert len(incoming) >= 1
 
+    @pytest.mark.asyncio
+    async def test_reads_share_relations_until_the_edge_changes(self, service):
+        alice = Entity(name="Alice", entity_type=EntityType.CHARACTER, document_id="book-a")
+        bob = Entity(name="Bob", entity_type=EntityType.CHARACTER, document_id="book-a")
+        await service.add_entities([alice, bob])
+        rel = Relation(source_id=alice.id, target_id=bob.id, relation_type=RelationType.ALLY,
+                       weight=0.3, document_id="book-a")
+        await service.add_relation(rel)
+
+        first = (await service.list_relations(document_id="book-a"))[0]
+        assert (await service.get_relations(alice.id))[0] is first
+        assert (await service.list_relations())[0] is first
+
+        await service.add_relation(rel.model_copy(update={"weight": 0.9}))
+        assert (await service.list_relations(document_id="book-a"))[0].weight == 0.9
+        await service.add_relations([rel.model_copy(update={"relation_type": RelationType.ENEMY})])
+        (changed,) = await service.get_relations(bob.id)
+        assert (changed.relation_type, changed.weight) == (RelationType.ENEMY, 0.3)
+
+        await service.remove_by_document("book-a")
+        assert service._relation_cache == {}
+
 
 # ── Event operations ─────────────────────────────────────────────────────────
 
@@ -216,6 +246,212 @@ class TestKGServiceEvents:
         assert len(await service.get_events(alice.id)) == 1
 
 
+# ── Secondary indexes ────────────────────────────────────────────────────────
+
+
+def _book_entity(name: str, document_id: str, aliases: list[str] | None = None) -> Entity:
+    return Entity(
+        name=name,
+        entity_type=EntityType.CHARACTER,
+        document_id=document_id,
+        aliases=aliases or [],
+    )
+
+
+class TestKGServiceIndexes:
+    @pytest.mark.asyncio
+    async def test_readding_an_entity_refiles_its_names_and_document(self, service):
+        entity = _book_entity("Tom", "book-a", aliases=["Riddle"])
+        await service.add_entity(entity)
+
+        renamed = entity.model_copy(
+            update={"name": "Voldemort", "aliases": ["Tom"], "document_id": "book-b"}
+        )
+        await service.add_entity(renamed)
+
+        assert await service.get_entity_by_name("riddle") is None
+        assert (await service.get_entity_by_name("tom")).name == "Voldemort"
+        assert await service.list_entities(document_id="book-a") == []
+        assert [e.id for e in await service.list_entities(document_id="book-b")] == [entity.id]
+
+    @pytest.mark.asyncio
+    async def test_document_scoped_queries(self, service):
+        alice = _book_entity("Alice", "book-a")
+        bob = _book_entity("Bob", "book-a")
+        carol = _book_entity("Carol", "book-b")
+        for entity in (alice, bob, carol):
+            await service.add_entity(entity)
+        await service.add_relation(
+            Relation(source_id=alice.id, target_id=bob.id,
+                     relation_type=RelationType.FRIENDSHIP, document_id="book-a",
+                     is_bidirectional=True)
+        )
+        await service.add_event(
+            Event(title="Duel", event_type=EventType.BATTLE, description="d",
+                  chapter=1, participants=[alice.id, carol.id], document_id="book-a")
+        )
+        await service.add_temporal_relation(
+            TemporalRelation(document_id="book-b", source_event_id="x",
+                             target_event_id="y",
+                             relation_type=TemporalRelationType.BEFORE)
+        )
+
+        assert [e.name for e in await service.list_entities(document_id="book-a")] == [
+            "Alice", "Bob",
+        ]
+        assert len(await service.list_relations(document_id="book-a")) == 1
+        assert await service.list_relations(document_id="book-b") == []
+        assert len(await service.get_events(carol.id)) == 1
+        assert await service.get_events(carol.id, document_id="book-b") == []
+        assert len(await service.get_temporal_relations(document_id="book-b")) == 1
+
+    @pytest.mark.asyncio
+    async def test_remove_by_document_clears_its_index_entries(self, service):
+        alice = _book_entity("Alice", "book-a")
+        carol = _book_entity("Carol", "book-b")
+        await service.add_entity(alice)
+        await service.add_entity(carol)
+        await service.add_relation(
+            Relation(source_id=alice.id, target_id=carol.id,
+                     relation_type=RelationType.FRIENDSHIP, document_id="book-b")
+        )
+        await service.add_event(
+            Event(title="Meeting", event_type=EventType.MEETING, description="m",
+                  chapter=1, participants=[alice.id], document_id="book-a")
+        )
+
+        counts = await service.remove_by_document("book-a")
+
+        assert counts == {"entities": 1, "relations": 1, "events": 1}
+        assert await service.get_entity_by_name("Alice") is None
+        assert await service.get_events(alice.id) == []
+        # The edge touched a removed entity, so it went even though it was
+        # filed under book-b.
+        assert await service.list_relations(document_id="book-b") == []
+        assert [e.name for e in await service.list_entities(document_id="book-b")] == ["Carol"]
+
+    @pytest.mark.asyncio
+    async def test_indexes_are_rebuilt_on_load(self, tmp_path):
+        path = str(tmp_path / "kg.json")
+        svc = KGService(persistence_path=path)
+        alice = _book_entity("Alice", "book-a", aliases=["Al"])
+        bob = _book_entity("Bob", "book-a")
+        await svc.add_entity(alice)
+        await svc.add_entity(bob)
+        await svc.add_relation(
+            Relation(source_id=alice.id, target_id=bob.id,
+                     relation_type=RelationType.FRIENDSHIP, document_id="book-a")
+        )
+        await svc.save()
+
+        reloaded = KGService(persistence_path=path)
+        await reloaded.load()
+
+        assert (await reloaded.get_entity_by_name("al")).id == alice.id
+        assert len(await reloaded.list_entities(document_id="book-a")) == 2
+        assert len(await reloaded.list_relations(document_id="book-a")) == 1
+
+
+class TestKGServiceBatchMutations:
+    @pytest.mark.asyncio
+    async def test_batch_adds_match_single_adds(self, service):
+        alice = _book_entity("Alice", "book-a", aliases=["Al"])
+        bob = _book_entity("Bob", "book-a")
+        carol = _book_entity("Carol", "book-b")
+        await service.add_entities([alice, bob, carol])
+        await service.add_relations([
+            Relation(source_id=alice.id, target_id=bob.id,
+                     relation_type=RelationType.FRIENDSHIP, document_id="book-a",
+                     is_bidirectional=True),
+            Relation(source_id=alice.id, target_id="missing",
+                     relation_type=RelationType.ENEMY, document_id="book-a"),
+        ])
+        await service.add_events([
+            Event(title="Duel", event_type=EventType.BATTLE, description="d",
+                  chapter=1, participants=[alice.id, carol.id], document_id="book-a"),
+        ])
+
+        assert (await service.get_entity_by_name("al")).id == alice.id
+        assert [e.name for e in await service.list_entities(document_id="book-a")] == [
+            "Alice", "Bob",
+        ]
+        assert service.relation_count == 2  # the pair and its _rev edge
+        assert len(await service.get_relations(bob.id, direction="out")) == 0
+        assert len(await service.get_relations(bob.id, direction="in")) == 1
+        assert len(await service.get_events(carol.id)) == 1
+        assert service._dirty_documents == {"book-a", "book-b"}
+
+    @pytest.mark.asyncio
+    async def test_bulk_field_updates(self, service):
+        alice = _book_entity("Alice", "book-a")
+        event = Event(title="Duel", event_type=EventType.BATTLE, description="d",
+                      chapter=1, participants=[alice.id], document_id="book-a")
+        await service.add_entities([alice])
+        await service.add_events([event])
+
+        await service.bulk_update_event_fields(
+            {event.id: {"chron_index": 3, "chronological_rank": 0.5}, "nope": {"chron_index": 1}}
+        )
+        await service.bulk_update_entity_fields(
+            {alice.id: {"first_chron_index": 3, "aliases": ["Ally"]}}
+        )
+
+        assert (await service.get_event(event.id)).chron_index == 3
+        assert (await service.get_event(event.id)).chronological_rank == 0.5
+        assert (await service.get_entity(alice.id)).first_chron_index == 3
+        assert (await service.get_entity_by_name("ally")).id == alice.id
+        assert service._graph.nodes[alice.id]["aliases"] == ["Ally"]
+        with pytest.raises(ValueError, match="participants"):
+            await service.bulk_update_event_fields({event.id: {"participants": []}})
+        with pytest.raises(ValueError, match="colour"):
+            await service.bulk_update_entity_fields({alice.id: {"colour": "red"}})
+
+    @pytest.mark.asyncio
+    async def test_batch_mutations_are_replayed_from_the_log(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = KGService(persistence_path=str(path))
+        alice = _book_entity("Alice", "book-a")
+        bob = _book_entity("Bob", "book-a")
+        await svc.add_entities([alice, bob])
+        await svc.add_relations([
+            Relation(source_id=alice.id, target_id=bob.id,
+                     relation_type=RelationType.FRIENDSHIP, document_id="book-a"),
+        ])
+        await svc.bulk_update_entity_fields({bob.id: {"first_chron_index": 2}})
+
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        assert len(await recovered.list_relations(document_id="book-a")) == 1
+        assert (await recovered.get_entity(bob.id)).first_chron_index == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_field_updates_replay_as_field_types(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = KGService(persistence_path=str(path))
+        alice = _book_entity("Alice", "book-a")
+        event = Event(title="Duel", event_type=EventType.BATTLE, description="d",
+                      chapter=1, participants=[alice.id], document_id="book-a")
+        await svc.add_entities([alice])
+        await svc.add_events([event])
+        await svc.bulk_update_event_fields({
+            event.id: {"event_type": EventType.CONFLICT, "story_time": {"time_anchor": "dawn"}},
+        })
+        updated = await svc.get_event(event.id)
+        assert updated.event_type is EventType.CONFLICT
+        assert updated.story_time == StoryTimeRef(time_anchor="dawn")
+
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        replayed = await recovered.get_event(event.id)
+        assert replayed.event_type is EventType.CONFLICT
+        assert replayed.story_time == StoryTimeRef(time_anchor="dawn")
+        with pytest.raises(ValueError, match="event_type"):
+            await recovered.bulk_update_event_fields({event.id: {"event_type": "not-a-type"}})
+        with pytest.raises(ValueError, match="emotional_intensity"):
+            await recovered.bulk_update_event_fields({event.id: {"emotional_intensity": 5.0}})
+        assert (await recovered.get_event(event.id)).emotional_intensity is None
+
+
 # ── Persistence ──────────────────────────────────────────────────────────────
 
 
@@ -250,3 +486,472 @@ class TestKGServicePersistence:
         svc = KGService(persistence_path=str(tmp_path / "nonexistent.json"))
         await svc.load()  # should not raise
         assert svc.entity_count == 0
+
+
+class TestKGServiceShardedPersistence:
+    @staticmethod
+    async def _two_books(path) -> KGService:
+        svc = KGService(persistence_path=str(path))
+        for doc in ("book-a", "book-b"):
+            alice = Entity(name="Alice", entity_type=EntityType.CHARACTER, document_id=doc)
+            bob = Entity(name="Bob", entity_type=EntityType.CHARACTER, document_id=doc)
+            await svc.add_entity(alice)
+            await svc.add_entity(bob)
+            await svc.add_relation(
+                Relation(
+                    source_id=alice.id,
+                    target_id=bob.id,
+                    relation_type=RelationType.FRIENDSHIP,
+                    document_id=doc,
+                )
+            )
+            await svc.add_event(
+                Event(
+                    title="Meeting",
+                    description="Alice meets Bob.",
+                    event_type=EventType.MEETING,
+                    chapter=1,
+                    participants=[alice.id],
+                    document_id=doc,
+                )
+            )
+        await svc.add_entity(_make_entity("Loose"))  # no document_id
+        return svc
+
+    @staticmethod
+    def _manifest(path) -> dict:
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_one_shard_per_book_behind_a_manifest(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        await svc.save()
+
+        manifest = self._manifest(path)
+        files = {e["document_id"]: e["file"] for e in manifest["shards"]}
+        assert files == {
+            "book-a": "book-a.kgsnap",
+            "book-b": "book-b.kgsnap",
+            None: "_unassigned.kgsnap",
+        }
+        shard = decode_shard((tmp_path / "kg.shards" / "book-a.kgsnap").read_bytes())
+        assert len(shard["entities"]) == 2
+        assert len(shard["edges"]) == 1
+        assert len(shard["events"]) == 1
+
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert reloaded.entity_count == 5
+        assert len(await reloaded.list_relations(document_id="book-b")) == 1
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    @pytest.mark.asyncio
+    async def test_saved_files_get_the_umask_mode_or_keep_theirs(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        old_mask = os.umask(0o022)
+        try:
+            kg_service_module._umask.cache_clear()
+            await svc.save()
+            shard = tmp_path / "kg.shards" / "book-a.kgsnap"
+            assert stat.S_IMODE(path.stat().st_mode) == 0o644
+            assert stat.S_IMODE(shard.stat().st_mode) == 0o644
+
+            shard.chmod(0o640)
+            await svc.update_event_rank((await svc.get_events(document_id="book-a"))[0].id, 0.5)
+            await svc.save()
+            assert stat.S_IMODE(shard.stat().st_mode) == 0o640
+        finally:
+            os.umask(old_mask)
+            kg_service_module._umask.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_save_rewrites_only_changed_books(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        await svc.save()
+
+        event = (await svc.get_events(document_id="book-b"))[0]
+        await svc.update_event_rank(event.id, 0.5)
+        written = []
+        real_write = kg_service_module._write_atomic
+        with patch.object(
+            kg_service_module,
+            "_write_atomic",
+            side_effect=lambda p, data: (written.append(p.name), real_write(p, data)),
+        ):
+            await svc.save()
+            await svc.save()  # nothing changed since
+
+        assert written == ["book-b.kgsnap", "kg.json"]
+
+    @pytest.mark.asyncio
+    async def test_removed_book_drops_its_shard(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        await svc.save()
+
+        await svc.remove_by_document("book-a")  # saves
+
+        assert not (tmp_path / "kg.shards" / "book-a.kgsnap").exists()
+        assert "book-a" not in {e["document_id"] for e in self._manifest(path)["shards"]}
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert await reloaded.list_entities(document_id="book-a") == []
+        assert len(await reloaded.list_entities(document_id="book-b")) == 2
+
+    @pytest.mark.asyncio
+    async def test_legacy_single_file_loads_and_is_sharded_on_save(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(tmp_path / "seed.json")
+        legacy = {
+            "entities": {eid: e.model_dump(mode="json") for eid, e in svc._entities.items()},
+            "events": {evid: ev.model_dump(mode="json") for evid, ev in svc._events.items()},
+            "temporal_relations": {},
+            "edges": [
+                {"source": u, "target": v, "key": k, **data}
+                for u, v, k, data in svc._graph.edges(keys=True, data=True)
+            ],
+        }
+        path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+        migrated = KGService(persistence_path=str(path))
+        await migrated.load()
+        assert migrated.entity_count == 5
+        await migrated.save()
+
+        assert self._manifest(path)["format"] == "storysphere-kg-shards"
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert reloaded.entity_count == 5
+        assert len(await reloaded.get_events(document_id="book-a")) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_leaves_previous_file_intact(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        await svc.save()
+        before = path.read_bytes()
+
+        await svc.add_entity(_make_entity("Carol"))
+        with patch.object(kg_service_module.os, "fsync", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                await svc.save()
+
+        assert path.read_bytes() == before
+        assert not list(tmp_path.glob("**/*.tmp"))
+        await svc.save()  # still dirty, so the retry writes it
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert await reloaded.get_entity_by_name("Carol") is not None
+
+    @pytest.mark.asyncio
+    async def test_json_format_shards_load_alongside_binary(self, tmp_path):
+        """Switching kg_snapshot_format leaves the other format readable;
+        a book's shard is converted the next time that book is saved."""
+        path = tmp_path / "kg.json"
+        svc = await self._two_books(path)
+        svc._shard_suffix = ".json"
+        await svc.save()
+
+        mixed = KGService(persistence_path=str(path))
+        await mixed.load()
+        await mixed.add_entity(
+            Entity(name="Carol", entity_type=EntityType.CHARACTER, document_id="book-a")
+        )
+        await mixed.save()
+
+        files = {e["document_id"]: e["file"] for e in self._manifest(path)["shards"]}
+        assert files["book-a"] == "book-a.kgsnap"
+        assert files["book-b"] == "book-b.json"
+        assert not (tmp_path / "kg.shards" / "book-a.json").exists()
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert reloaded.entity_count == 6
+
+
+class TestKGServiceLazyLoading:
+    @staticmethod
+    async def _saved_library(path) -> KGService:
+        svc = await TestKGServiceShardedPersistence._two_books(path)
+        await svc.save()
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_load_defers_books_until_queried(self, tmp_path):
+        path = tmp_path / "kg.json"
+        await self._saved_library(path)
+
+        svc = KGService(persistence_path=str(path), lazy=True)
+        await svc.load()
+
+        assert svc._entities == {}
+        assert (svc.entity_count, svc.relation_count, svc.event_count) == (5, 2, 2)
+        assert len(await svc.list_entities(document_id="book-a")) == 2
+        assert {e.document_id for e in svc._entities.values()} == {"book-a"}
+        assert set(svc._cold) == {"book-b", None}
+        assert svc.entity_count == 5
+
+    @pytest.mark.asyncio
+    async def test_id_and_name_lookups_load_the_owning_book(self, tmp_path):
+        path = tmp_path / "kg.json"
+        seed = await self._saved_library(path)
+        [bob_b] = [e for e in await seed.list_entities(document_id="book-b") if e.name == "Bob"]
+        [event_b] = await seed.get_events(document_id="book-b")
+
+        svc = KGService(persistence_path=str(path), lazy=True)
+        await svc.load()
+
+        assert (await svc.get_entity(bob_b.id)).name == "Bob"
+        assert set(svc._cold) == {"book-a", None}
+        assert (await svc.get_event(event_b.id)).document_id == "book-b"
+        assert len(await svc.get_relations(bob_b.id)) == 1
+        assert (await svc.get_entity_by_name("loose")).document_id is None
+        assert set(svc._cold) == {"book-a"}
+        assert await svc.get_entity_by_name("Nobody") is None
+
+    @pytest.mark.asyncio
+    async def test_unscoped_queries_load_every_book(self, tmp_path):
+        path = tmp_path / "kg.json"
+        await self._saved_library(path)
+
+        svc = KGService(persistence_path=str(path), lazy=True)
+        await svc.load()
+
+        assert len(await svc.list_entities()) == 5
+        assert svc._cold == {}
+
+    @pytest.mark.asyncio
+    async def test_changing_a_cold_book_keeps_its_saved_records(self, tmp_path):
+        path = tmp_path / "kg.json"
+        await self._saved_library(path)
+
+        svc = KGService(persistence_path=str(path), lazy=True)
+        await svc.load()
+        await svc.add_entity(
+            Entity(name="Carol", entity_type=EntityType.CHARACTER, document_id="book-a")
+        )
+        await svc.save()
+
+        reloaded = KGService(persistence_path=str(path), lazy=False)
+        await reloaded.load()
+        assert len(await reloaded.list_entities(document_id="book-a")) == 3
+        assert len(await reloaded.list_relations(document_id="book-a")) == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_saved_books_are_unloaded(self, tmp_path):
+        path = tmp_path / "kg.json"
+        await self._saved_library(path)
+
+        svc = KGService(persistence_path=str(path), lazy=True, max_resident_books=1)
+        await svc.load()
+        await svc.list_entities(document_id="book-a")
+        await svc.list_entities(document_id="book-b")
+
+        assert "book-a" in svc._cold
+        assert {e.document_id for e in svc._entities.values()} == {"book-b"}
+        assert svc.entity_count == 5
+        # Unloaded books come back on demand, with their relations.
+        assert len(await svc.list_relations(document_id="book-a")) == 1
+        assert "book-b" in svc._cold
+
+    @pytest.mark.asyncio
+    async def test_unsaved_books_are_never_unloaded(self, tmp_path):
+        path = tmp_path / "kg.json"
+        await self._saved_library(path)
+
+        svc = KGService(persistence_path=str(path), lazy=True, max_resident_books=1)
+        await svc.load()
+        await svc.add_entity(
+            Entity(name="Carol", entity_type=EntityType.CHARACTER, document_id="book-a")
+        )
+        await svc.list_entities(document_id="book-b")
+
+        assert "book-a" not in svc._cold
+        assert (await svc.get_entity_by_name("Carol")).document_id == "book-a"
+
+    @pytest.mark.asyncio
+    async def test_json_shards_load_eagerly(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await TestKGServiceShardedPersistence._two_books(path)
+        svc._shard_suffix = ".json"
+        await svc.save()
+
+        reloaded = KGService(persistence_path=str(path), lazy=True)
+        await reloaded.load()
+
+        assert reloaded._cold == {}
+        assert len(reloaded._entities) == 5
+
+
+class TestKGServiceMutationLog:
+    @staticmethod
+    def _wal(path):
+        return path.with_name(f"{path.stem}.shards") / "_wal.jsonl"
+
+    @pytest.mark.asyncio
+    async def test_unsaved_mutations_survive_a_crash(self, tmp_path):
+        path = tmp_path / "kg.json"
+        seed = await TestKGServiceShardedPersistence._two_books(path)
+        await seed.save()
+        [event_a] = await seed.get_events(document_id="book-a")
+
+        svc = KGService(persistence_path=str(path))
+        await svc.load()
+        carol = Entity(name="Carol", entity_type=EntityType.CHARACTER, document_id="book-a")
+        await svc.add_entity(carol)
+        await svc.update_event_chron_index(event_a.id, 7)
+        await svc.remove_temporal_relations("book-b")  # nothing to remove: not logged
+        assert len(self._wal(path).read_text(encoding="utf-8").splitlines()) == 2
+        # No save(): the process dies here.
+
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        assert (await recovered.get_entity(carol.id)).name == "Carol"
+        assert (await recovered.get_event(event_a.id)).chron_index == 7
+        # Replay is folded into the shards straight away.
+        assert not self._wal(path).exists()
+        again = KGService(persistence_path=str(path), lazy=False)
+        await again.load()
+        assert (await again.get_event(event_a.id)).chron_index == 7
+
+    @pytest.mark.asyncio
+    async def test_loading_is_not_logged_and_save_empties_the_log(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = await TestKGServiceShardedPersistence._two_books(path)
+        assert self._wal(path).exists()
+        await svc.save()
+        assert not self._wal(path).exists()
+
+        reloaded = KGService(persistence_path=str(path), lazy=False)
+        await reloaded.load()
+        assert not self._wal(path).exists()
+
+    @pytest.mark.asyncio
+    async def test_a_torn_line_is_skipped(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = KGService(persistence_path=str(path))
+        await svc.add_entity(_make_entity("Alice"))
+        svc._wal.close()
+        with open(self._wal(path), "ab") as fh:
+            fh.write(b'{"op":"add_entity","args":[{"na')  # the OS died mid-write
+
+        after = KGService(persistence_path=str(path))
+        await after.add_entity(_make_entity("Bob"))
+
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        assert {e.name for e in await recovered.list_entities()} == {"Alice", "Bob"}
+
+    @pytest.mark.asyncio
+    async def test_log_is_compacted_at_the_record_limit(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = KGService(persistence_path=str(path), wal_compact_records=2)
+        await svc.add_entity(_make_entity("Alice"))
+        assert not path.exists()
+        await svc.add_entity(_make_entity("Bob"))
+
+        assert path.exists()
+        assert not self._wal(path).exists()
+        reloaded = KGService(persistence_path=str(path))
+        await reloaded.load()
+        assert reloaded.entity_count == 2
+
+    @pytest.mark.asyncio
+    async def test_appends_follow_a_log_another_instance_cleared(self, tmp_path):
+        path = tmp_path / "kg.json"
+        live = KGService(persistence_path=str(path))
+        await live.add_entity(_make_entity("Alice"))
+
+        other = KGService(persistence_path=str(path))
+        await other.load()  # replays Alice, saves, unlinks the log
+        assert not self._wal(path).exists()
+        await live.add_entity(_make_entity("Bob"))
+        # No save(): the live process dies here.
+
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        assert {e.name for e in await recovered.list_entities()} == {"Alice", "Bob"}
+
+    @pytest.mark.asyncio
+    async def test_read_only_load_replays_without_saving(self, tmp_path):
+        path = tmp_path / "kg.json"
+        live = KGService(persistence_path=str(path))
+        await live.add_entity(_make_entity("Alice"))
+
+        reader = KGService(persistence_path=str(path), read_only=True)
+        await reader.load()
+        assert [e.name for e in await reader.list_entities()] == ["Alice"]
+        assert self._wal(path).exists()
+        assert not path.exists()
+        await reader.add_entity(_make_entity("Bob"))
+        with pytest.raises(RuntimeError, match="read-only"):
+            await reader.save()
+
+        await live.add_entity(_make_entity("Carol"))
+        recovered = KGService(persistence_path=str(path))
+        await recovered.load()
+        assert {e.name for e in await recovered.list_entities()} == {"Alice", "Carol"}
+
+    @pytest.mark.asyncio
+    async def test_disabled_log_writes_nothing(self, tmp_path):
+        path = tmp_path / "kg.json"
+        svc = KGService(persistence_path=str(path), wal=False)
+        await svc.add_entity(_make_entity("Alice"))
+        assert not self._wal(path).exists()
+
+
+class TestKGSnapshot:
+    def test_round_trip_keeps_each_records_own_keys(self):
+        payload = {
+            "document_id": "book-a",
+            "entities": {
+                "e1": {"id": "e1", "name": "Alice", "aliases": ["Al"], "attributes": {"age": 9}},
+                "e2": {"id": "e2", "name": "Bob", "aliases": [], "attributes": {}},
+            },
+            "events": {},
+            "temporal_relations": {},
+            "edges": [
+                {"source": "e1", "target": "e2", "key": "r1", "weight": 0.5},
+                # A legacy edge saved before ``weight`` existed.
+                {"source": "e2", "target": "e1", "key": "r2"},
+            ],
+        }
+
+        data = encode_snapshot(payload)
+
+        assert decode_shard(data) == payload
+        assert read_header(data)["counts"] == {
+            "entities": 2, "events": 0, "temporal_relations": 0, "edges": 2,
+        }
+
+    def test_edge_tuples_match_the_row_layout(self):
+        payload = {
+            "document_id": "book-a",
+            "edges": [
+                {"source": "e1", "target": "e2", "key": "r1", "weight": 0.5},
+                {"source": "e2", "target": "e1", "key": "r2"},
+            ],
+        }
+        expected = [("e1", "e2", "r1", {"weight": 0.5}), ("e2", "e1", "r2", {})]
+
+        binary = decode_shard(encode_snapshot(payload), edge_tuples=True)
+        plain = decode_shard(json.dumps(payload).encode(), edge_tuples=True)
+
+        assert binary["edges"] == expected
+        assert plain["edges"] == expected
+
+    def test_plain_json_shards_decode_unchanged(self):
+        payload = {"document_id": None, "entities": {}, "events": {}, "edges": []}
+        data = json.dumps(payload).encode()
+
+        assert decode_shard(data) == payload
+        assert read_header(data) is None
+
+    def test_newer_version_is_refused(self):
+        data = bytearray(encode_snapshot({"document_id": "b"}))
+        data[8] = 99  # version field, little-endian
+
+        with pytest.raises(ValueError, match="version 99"):
+            decode_shard(bytes(data))
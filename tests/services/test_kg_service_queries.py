@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import Counter
+
 import pytest
 from storysphere.domain.entities import Entity, EntityType
 from storysphere.domain.events import Event, EventType
@@ -101,6 +103,83 @@ class TestGetRelationPaths:
         paths = await service.get_relation_paths("x", "y")
         assert paths == []
 
+    @pytest.mark.asyncio
+    async def test_strong_detour_beats_weak_link(self, service):
+        a, b, c = _make_entity("Alice"), _make_entity("Bob"), _make_entity("Carol")
+        await service.add_entities([a, b, c])
+        await service.add_relations([
+            Relation(source_id=a.id, target_id=c.id, relation_type=RelationType.OTHER, weight=0.1),
+            Relation(source_id=a.id, target_id=b.id, relation_type=RelationType.FAMILY, weight=1.0),
+            Relation(source_id=c.id, target_id=b.id, relation_type=RelationType.FAMILY, weight=0.9),
+        ])
+
+        paths = await service.get_relation_paths(a.id, c.id)
+        assert [[n.name for n in p.nodes] for p in paths] == [
+            ["Alice", "Bob", "Carol"], ["Alice", "Carol"]]
+        assert paths[0].cost < paths[1].cost
+        assert paths[0].nodes[2].relation_from_prev["weight"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_cheapest_paths_match_exhaustive_search(self, service):
+        import networkx as nx  # noqa: PLC0415
+        from storysphere.services.kg_paths import hop_cost  # noqa: PLC0415
+
+        await _random_book(service, seed=11)
+        entities = await service.list_entities(document_id="book")
+        undirected = service._graph.to_undirected(as_view=True)
+        for source, target in zip(entities[:6], entities[6:12], strict=True):
+            exhaustive = sorted(
+                sum(hop_cost(service._best_edge(u, v)["weight"]) for u, v in zip(p, p[1:], strict=False))
+                # A path per node sequence; all_simple_paths repeats it per parallel edge.
+                for p in {tuple(p) for p in nx.all_simple_paths(
+                    undirected, source.id, target.id, cutoff=4)}
+            )
+            paths = await service.get_relation_paths(source.id, target.id, max_length=4, max_paths=15)
+            assert [p.cost for p in paths] == pytest.approx(exhaustive[:15])
+            for path in paths:
+                ids = [n.entity_id for n in path.nodes]
+                assert ids[0] == source.id and ids[-1] == target.id
+                assert len(set(ids)) == len(ids)
+
+    @pytest.mark.asyncio
+    async def test_paths_stay_in_the_book(self, service):
+        a = Entity(name="A", entity_type=EntityType.CHARACTER, document_id="one")
+        b = Entity(name="B", entity_type=EntityType.CHARACTER, document_id="one")
+        x = Entity(name="X", entity_type=EntityType.CHARACTER, document_id="two")
+        await service.add_entities([a, b, x])
+        await service.add_relations([
+            Relation(source_id=a.id, target_id=x.id, relation_type=RelationType.OTHER),
+            Relation(source_id=x.id, target_id=b.id, relation_type=RelationType.OTHER),
+        ])
+        assert await service.get_relation_paths(a.id, b.id) == []
+        assert len(await service.get_relation_paths(a.id, x.id)) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_paths_and_deadline_bound_the_search(self, service):
+        from storysphere.services.kg_paths import cheapest_paths  # noqa: PLC0415
+
+        people = [_make_entity(f"p{i}") for i in range(25)]
+        await service.add_entities(people)
+        await service.add_relations([
+            Relation(source_id=u.id, target_id=v.id, relation_type=RelationType.ALLY,
+                     weight=0.5 + (i % 5) / 10)
+            for i, (u, v) in enumerate(
+                (u, v) for n, u in enumerate(people) for v in people[n + 1:])
+        ])
+        src, dst = people[0].id, people[-1].id
+
+        paths = await service.get_relation_paths(src, dst, max_length=4, max_paths=7)
+        assert len(paths) == 7
+        assert [p.cost for p in paths] == sorted(p.cost for p in paths)
+
+        undirected = service._graph.to_undirected(as_view=True)
+        found, complete = cheapest_paths(
+            lambda n: undirected[n], lambda u, v: 0.5, src, dst,
+            max_length=4, max_paths=10**6, deadline=0.0,
+        )
+        assert not complete
+        assert len(found) < 10**6
+
 
 # ── get_subgraph ─────────────────────────────────────────────────────────────
 
@@ -191,3 +270,200 @@ class TestGetRelationStats:
         stats = await service.get_relation_stats()
         assert stats.total_relations == 0
         assert stats.weight_avg == 0.0
+
+    @pytest.mark.asyncio
+    async def test_document_scoped_stats(self, service):
+        a, b = Entity(name="A", entity_type=EntityType.CHARACTER, document_id="one"), Entity(
+            name="B", entity_type=EntityType.CHARACTER, document_id="one")
+        c, d = Entity(name="C", entity_type=EntityType.CHARACTER, document_id="two"), Entity(
+            name="D", entity_type=EntityType.CHARACTER, document_id="two")
+        await service.add_entities([a, b, c, d])
+        await service.add_relations([
+            Relation(source_id=a.id, target_id=b.id, relation_type=RelationType.FAMILY,
+                     weight=0.4, document_id="one", is_bidirectional=True),
+            Relation(source_id=c.id, target_id=d.id, relation_type=RelationType.ENEMY,
+                     weight=0.9, document_id="two"),
+        ])
+
+        one = await service.get_relation_stats(document_id="one")
+        assert one.total_relations == 1  # the reverse edge is not a second relation
+        assert one.type_distribution == {"family": 1}
+        assert one.weight_max == 0.4
+        assert (await service.get_relation_stats(entity_id=b.id, document_id="two")).total_relations == 0
+        assert (await service.get_relation_stats(document_id="three")).total_relations == 0
+        assert (await service.get_relation_stats()).total_relations == 2
+
+    @pytest.mark.asyncio
+    async def test_tallies_follow_mutations(self, service):
+        """The running tallies match a count over the relations after every change."""
+        await _random_book(service, seed=7)
+        entities = await service.list_entities(document_id="book")
+        other = Entity(name="x", entity_type=EntityType.CHARACTER, document_id="other")
+        await service.add_entity(other)
+        relations = await service.list_relations(document_id="book")
+        # Re-filed weight and type, a self loop, and a relation under another book.
+        await service.add_relation(relations[0].model_copy(
+            update={"weight": 0.05, "relation_type": RelationType.ENEMY}))
+        await service.add_relation(Relation(
+            source_id=entities[0].id, target_id=entities[0].id,
+            relation_type=RelationType.OTHER, weight=0.99, document_id="book"))
+        await service.add_relation(Relation(
+            source_id=other.id, target_id=entities[1].id,
+            relation_type=RelationType.FRIENDSHIP, weight=0.5, document_id="other"))
+
+        async def check() -> None:
+            everything = [r for e in await service.list_entities()
+                          for r in await service.get_relations(e.id)]
+            unique = list({r.id: r for r in everything}.values())
+            for document_id in (None, "book", "other"):
+                expected = [r for r in unique if document_id in (None, r.document_id)]
+                stats = await service.get_relation_stats(document_id=document_id)
+                assert stats.total_relations == len(expected)
+                assert stats.type_distribution == dict(
+                    Counter(r.relation_type.value for r in expected))
+                if expected:
+                    weights = [r.weight for r in expected]
+                    assert stats.weight_min == min(weights)
+                    assert stats.weight_max == max(weights)
+                    assert stats.weight_avg == pytest.approx(sum(weights) / len(weights))
+            for entity in await service.list_entities():
+                stats = await service.get_relation_stats(entity_id=entity.id)
+                assert stats.total_relations == len(await service.get_relations(entity.id))
+
+        await check()
+        await service.add_relations([
+            Relation(source_id=a.id, target_id=b.id, relation_type=RelationType.ALLY,
+                     weight=0.01, document_id="book", is_bidirectional=True)
+            for a, b in zip(entities, entities[1:], strict=False)
+        ])
+        await check()
+        await service.remove_by_document("other")
+        await check()
+        await service.remove_by_document("book")
+        assert (await service.get_relation_stats()).total_relations == 0
+        assert service._relation_stats == {}
+        assert service._entity_relation_stats == {}
+
+    @pytest.mark.asyncio
+    async def test_stats_survive_save_and_lazy_load(self, tmp_path):
+        first = KGService(persistence_path=str(tmp_path / "kg.json"), wal=False)
+        await _random_book(first, seed=3)
+        await first.save()
+        expected = await first.get_relation_stats(document_id="book")
+
+        second = KGService(persistence_path=str(tmp_path / "kg.json"), lazy=True, wal=False)
+        await second.load()
+        assert await second.get_relation_stats(document_id="book") == expected
+
+
+# ── get_snapshot / get_snapshot_delta ────────────────────────────────────────
+
+
+def _visible(position: int, start: int | None, end: int | None) -> bool:
+    return (start is None or start <= position) and (end is None or end > position)
+
+
+async def _random_book(service: KGService, seed: int) -> None:
+    import random  # noqa: PLC0415
+
+    rng = random.Random(seed)
+
+    def maybe(value: int) -> int | None:
+        return None if rng.random() < 0.3 else value
+
+    entities = []
+    for i in range(30):
+        first = rng.randint(0, 8)
+        entities.append(Entity(
+            name=f"e{i}", entity_type=EntityType.CHARACTER, document_id="book",
+            first_appearance_chapter=maybe(first),
+            valid_to_chapter=maybe(first + rng.randint(0, 5)),
+            first_chron_index=maybe(first),
+            valid_to_chron_index=maybe(first + rng.randint(1, 5)),
+        ))
+    await service.add_entities(entities)
+    relations = []
+    for _ in range(80):
+        a, b = rng.sample(entities, 2)
+        start = rng.randint(0, 9)
+        relations.append(Relation(
+            source_id=a.id, target_id=b.id, relation_type=RelationType.ALLY,
+            document_id="book", valid_from_chapter=maybe(start),
+            valid_to_chapter=maybe(start + rng.randint(0, 4)),
+            valid_from_chron_index=maybe(start), valid_to_chron_index=maybe(start + 2),
+        ))
+    await service.add_relations(relations)
+    await service.add_events([
+        Event(title=f"ev{i}", event_type=EventType.PLOT, description="", document_id="book",
+              chapter=rng.randint(1, 10), chron_index=maybe(rng.randint(1, 10)),
+              participants=[rng.choice(entities).id])
+        for i in range(40)
+    ])
+
+
+def _reference(events, entities, relations, mode: str, position: int):
+    """The filter get_snapshot ran on every call before it had an index."""
+    if mode == "chapter":
+        evs = [e for e in events if (e.chapter or 0) <= position]
+        ents = [e for e in entities
+                if _visible(position, e.first_appearance_chapter or 0, e.valid_to_chapter)]
+        window = {r.id: (r.valid_from_chapter, r.valid_to_chapter) for r in relations}
+    else:
+        evs = [e for e in events if e.chron_index is not None and e.chron_index <= position]
+        ents = [e for e in entities if e.first_chron_index is not None
+                and _visible(position, e.first_chron_index, e.valid_to_chron_index)]
+        window = {r.id: (r.valid_from_chron_index, r.valid_to_chron_index) for r in relations}
+    ids = {e.id for e in ents}
+    rels = [r for r in relations
+            if r.source_id in ids and r.target_id in ids and _visible(position, *window[r.id])]
+    return evs, ents, rels
+
+
+def _ids(records) -> set[str]:
+    return {r.id for r in records}
+
+
+class TestGetSnapshot:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["chapter", "story"])
+    async def test_matches_a_full_filter_at_every_position(self, service, mode):
+        await _random_book(service, seed=7)
+        events = await service.get_events(document_id="book")
+        entities = await service.list_entities(document_id="book")
+        relations = await service.list_relations(document_id="book")
+
+        for position in range(-1, 13):
+            got = await service.get_snapshot("book", mode, position)
+            want = _reference(events, entities, relations, mode, position)
+            assert [_ids(part) for part in got] == [_ids(part) for part in want], position
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["chapter", "story"])
+    async def test_delta_turns_one_snapshot_into_the_other(self, service, mode):
+        await _random_book(service, seed=11)
+
+        for a in range(0, 12, 3):
+            for b in range(0, 12, 2):
+                delta = await service.get_snapshot_delta("book", mode, a, b)
+                before = await service.get_snapshot("book", mode, a)
+                after = await service.get_snapshot("book", mode, b)
+                for part, name in enumerate(("events", "entities", "relations")):
+                    added = _ids(getattr(delta, f"added_{name}"))
+                    removed = _ids(getattr(delta, f"removed_{name}"))
+                    assert (_ids(before[part]) - removed) | added == _ids(after[part])
+                    assert not added & _ids(before[part])
+
+    @pytest.mark.asyncio
+    async def test_index_follows_changes_to_the_book(self, service):
+        alice = Entity(name="Alice", entity_type=EntityType.CHARACTER, document_id="book",
+                       first_appearance_chapter=1)
+        await service.add_entity(alice)
+        event = Event(title="Duel", event_type=EventType.BATTLE, description="",
+                      document_id="book", chapter=3, participants=[alice.id])
+        await service.add_event(event)
+        assert (await service.get_snapshot("book", "story", 5))[0] == []
+
+        await service.update_event_chron_index(event.id, 2)
+        assert _ids((await service.get_snapshot("book", "story", 5))[0]) == {event.id}
+        await service.add_entity(alice.model_copy(update={"first_appearance_chapter": 4}))
+        assert (await service.get_snapshot("book", "chapter", 3))[1] == []
@@ -0,0 +1,73 @@
+"""Tests for moving per-book Qdrant collections into a shared collection."""
+
+from __future__ import annotations
+
+import pytest
+from qdrant_client import QdrantClient
+from storysphere.services.vector_migration import migrate_to_shared_collection
+from storysphere.services.vector_service import VectorService
+
+
+@pytest.fixture
+def qdrant_client():
+    return QdrantClient(":memory:")
+
+
+@pytest.fixture
+async def per_book(qdrant_client):
+    service = VectorService(client=qdrant_client, vector_size=4, prefix="test", shared_collection="")
+    for book, n_points in (("doc1", 3), ("doc2", 2)):
+        await service.upsert_paragraphs(
+            [
+                {
+                    "id": f"00000000-0000-0000-{book[-1]}000-{n:012d}",
+                    "embedding": [1.0, float(n), 0.0, 0.0],
+                    "text": f"{book} paragraph {n}",
+                    "document_id": book,
+                    "chapter_number": 1,
+                    "position": n,
+                    "keywords": ["hero"],
+                    "keyword_scores": {"hero": 0.5},
+                }
+                for n in range(n_points)
+            ],
+            document_id=book,
+        )
+    return service
+
+
+def _shared(client):
+    return VectorService(client=client, vector_size=4, prefix="test", shared_collection="shared")
+
+
+@pytest.mark.asyncio
+async def test_copies_every_book(per_book, qdrant_client):
+    counts = await migrate_to_shared_collection("shared", client=qdrant_client, prefix="test", vector_size=4, batch_size=2)
+
+    assert counts == {"collections": 2, "points": 5, "dropped": 0}
+    shared = _shared(qdrant_client)
+    assert sorted(shared.list_book_collections()) == ["doc1", "doc2"]
+    hits = await shared.search_by_keyword("hero", document_id="doc2")
+    assert sorted(h.text for h in hits) == ["doc2 paragraph 0", "doc2 paragraph 1"]
+    assert hits[0].keyword_scores == {"hero": 0.5}
+    # Sources are left alone unless asked.
+    assert sorted(per_book.list_book_collections()) == ["doc1", "doc2"]
+
+
+@pytest.mark.asyncio
+async def test_rerun_is_idempotent_and_drop_source_removes_books(per_book, qdrant_client):
+    await migrate_to_shared_collection("shared", client=qdrant_client, prefix="test", vector_size=4)
+    counts = await migrate_to_shared_collection("shared", client=qdrant_client, prefix="test", vector_size=4, drop_source=True)
+
+    assert counts == {"collections": 2, "points": 5, "dropped": 2}
+    assert qdrant_client.count("shared").count == 5
+    assert sorted(c.name for c in qdrant_client.get_collections().collections) == [
+        "_shared_keyword_revisions",
+        "shared",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_requires_a_target(qdrant_client):
+    with pytest.raises(ValueError):
+        await migrate_to_shared_collection("", client=qdrant_client)
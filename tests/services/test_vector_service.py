@@ -187,3 +187,361 @@ class TestUpsertAndSearch:
         assert len(results) == 2
         doc_ids = {r.document_id for r in results}
         assert doc_ids == {"doc1", "doc2"}
+
+
+class _CountingEmbeddings:
+    """Stands in for the embedding model; records every call it gets."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def _vector(self, text):
+        return [float(len(text)), 1.0, 0.0, 0.0]
+
+    def embed_query(self, text):
+        self.calls.append([text])
+        return self._vector(text)
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [self._vector(t) for t in texts]
+
+
+class TestQueryEmbeddingCache:
+    @pytest.fixture
+    def model(self, service):
+        service._embedding_fn = _CountingEmbeddings()
+        return service._embedding_fn
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_is_embedded_once(self, service, model):
+        from storysphere.core.metrics import get_metrics
+
+        get_metrics().reset()
+        first = await service._embed("who betrays the king?")
+        second = await service._embed("who betrays the king?")
+
+        assert first == second == [21.0, 1.0, 0.0, 0.0]
+        assert model.calls == [["who betrays the king?"]]
+        events = get_metrics().get_stats()["cache_events"]["query_embedding"]
+        assert (events["hit"], events["miss"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_normalised_text_shares_an_entry(self, service, model):
+        await service._embed("the  king\n")
+        await service._embed(" the king")
+        assert model.calls == [["the  king\n"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_is_one_model_call(self, service, model):
+        await service._embed("a")
+        vectors = await service.embed_queries(["a", "bb", "ccc", "bb"])
+
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 2.0]
+        assert model.calls == [["a"], ["bb", "ccc"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_are_one_model_call(self, service, model):
+        import asyncio
+
+        vectors = await asyncio.gather(
+            service._embed("x"), service._embed("yy"), service._embed("x")
+        )
+        assert [v[0] for v in vectors] == [1.0, 2.0, 1.0]
+        assert model.calls == [["x", "yy"]]
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_is_evicted(self, service, model):
+        service._query_cache_size = 2
+        await service._embed("a")
+        await service._embed("b")
+        await service._embed("a")
+        await service._embed("c")  # evicts "b"
+        await service._embed("a")
+        await service._embed("b")
+        assert model.calls == [["a"], ["b"], ["c"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller_and_is_not_cached(self, service, model):
+        import asyncio
+
+        model.embed_documents = lambda texts: (_ for _ in ()).throw(RuntimeError("oom"))
+        results = await asyncio.gather(
+            service._embed("x"), service._embed("y"), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await service._embed("x") == [1.0, 1.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_fails_its_callers_and_frees_the_next(self, service, model):
+        import asyncio
+
+        caller = asyncio.ensure_future(service._embed("x"))
+        await asyncio.sleep(0)  # "x" is queued, its batch not started yet
+        service._query_batch_task.cancel()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await caller
+        assert model.calls == []
+        assert await service._embed("x") == [1.0, 1.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_leaves_shared_query_to_the_others(self, service, model):
+        import asyncio
+
+        first = asyncio.ensure_future(service._embed("x"))
+        second = asyncio.ensure_future(service._embed("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == [1.0, 1.0, 0.0, 0.0]
+        assert first.cancelled()
+
+
+def _paragraph(n: int, document_id: str, embedding, keywords=()):
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012d}",
+        "embedding": embedding,
+        "text": f"{document_id} paragraph {n}",
+        "document_id": document_id,
+        "chapter_number": 1,
+        "position": n,
+        "keywords": list(keywords),
+    }
+
+
+class TestSharedCollection:
+    @pytest.fixture
+    def shared(self, qdrant_client):
+        return VectorService(
+            client=qdrant_client, vector_size=4, prefix="test", shared_collection="test_shared"
+        )
+
+    @pytest.fixture
+    async def library(self, shared):
+        await shared.upsert_paragraphs(
+            [_paragraph(1, "doc1", [1.0, 0.0, 0.0, 0.0], ["hero"])], document_id="doc1"
+        )
+        await shared.upsert_paragraphs(
+            [_paragraph(2, "doc2", [0.9, 0.1, 0.0, 0.0], ["hero"])], document_id="doc2"
+        )
+        await shared.upsert_paragraphs(
+            [_paragraph(3, "doc3", [0.0, 1.0, 0.0, 0.0], ["villain"])], document_id="doc3"
+        )
+        return shared
+
+    @pytest.mark.asyncio
+    async def test_books_share_one_collection(self, library, qdrant_client):
+        names = sorted(c.name for c in qdrant_client.get_collections().collections)
+        assert names == ["_test_shared_keyword_revisions", "test_shared"]
+        assert sorted(library.list_book_collections()) == ["doc1", "doc2", "doc3"]
+
+    @pytest.mark.asyncio
+    async def test_search_filters_by_book(self, library):
+        with patch.object(library, "_embed", new_callable=AsyncMock) as mock_embed:
+            mock_embed.return_value = [1.0, 0.0, 0.0, 0.0]
+            one = await library.search("q", top_k=5, document_id="doc2")
+            some = await library.search("q", top_k=5, document_ids=["doc1", "doc3"])
+            every = await library.search("q", top_k=2)
+
+        assert [r.document_id for r in one] == ["doc2"]
+        assert [r.document_id for r in some] == ["doc1", "doc3"]
+        assert [r.document_id for r in every] == ["doc1", "doc2"]
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_filters_by_book(self, library):
+        every = await library.search_by_keyword("Hero", top_k=10)
+        one = await library.search_by_keyword("hero", document_ids=["doc2"])
+        assert sorted(r.document_id for r in every) == ["doc1", "doc2"]
+        assert [r.document_id for r in one] == ["doc2"]
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_only_that_book(self, library):
+        assert await library.delete_collection("doc1") is True
+        assert await library.delete_collection("doc1") is False
+        assert sorted(library.list_book_collections()) == ["doc2", "doc3"]
+
+    @pytest.mark.asyncio
+    async def test_empty_library(self, shared):
+        assert shared.list_book_collections() == []
+        assert await shared.search_by_keyword("hero") == []
+        assert await shared.delete_collection("doc1") is False
+
+
+def _scored(n: int, document_id: str, scores: dict[str, float]):
+    return {
+        **_paragraph(n, document_id, [1.0, float(n), 0.0, 0.0], scores),
+        "keyword_scores": scores,
+    }
+
+
+class TestKeywordRanking:
+    @pytest.fixture
+    async def books(self, service):
+        await service.upsert_paragraphs(
+            [
+                _scored(1, "doc1", {"hero": 0.2}),
+                _scored(2, "doc1", {"hero": 0.9, "sword": 0.4}),
+                _scored(3, "doc1", {"sword": 0.8}),
+                _scored(4, "doc1", {"hero": 0.5}),
+            ],
+            document_id="doc1",
+        )
+        await service.upsert_paragraphs(
+            [_scored(5, "doc2", {"hero": 0.7}), _scored(6, "doc2", {"hero": 0.1})],
+            document_id="doc2",
+        )
+        return service
+
+    @staticmethod
+    def _positions(results):
+        return [r.position for r in results]
+
+    @pytest.mark.asyncio
+    async def test_best_scores_first(self, books):
+        results = await books.search_by_keyword("Hero", top_k=2, document_id="doc1")
+        assert self._positions(results) == [2, 4]
+        assert results[0].keyword_scores == {"hero": 0.9, "sword": 0.4}
+
+    @pytest.mark.asyncio
+    async def test_cross_book_rankings_are_merged(self, books):
+        results = await books.search_by_keyword("hero", top_k=4)
+        assert self._positions(results) == [2, 5, 4, 1]
+
+    @pytest.mark.asyncio
+    async def test_upserts_update_a_loaded_index(self, books):
+        await books.search_by_keyword("hero", document_id="doc1")
+        await books.upsert_paragraphs(
+            [_scored(2, "doc1", {"sword": 0.4}), _scored(1, "doc1", {"hero": 1.0})],
+            document_id="doc1",
+        )
+        results = await books.search_by_keyword("hero", document_id="doc1")
+        assert self._positions(results) == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_index_is_loaded_for_existing_collections(self, books, qdrant_client):
+        fresh = VectorService(client=qdrant_client, vector_size=4, prefix="test")
+        results = await fresh.search_by_keyword("sword", document_id="doc1")
+        assert self._positions(results) == [3, 2]
+        assert await fresh.search_by_keyword("dragon", document_id="doc1") == []
+
+    @pytest.mark.asyncio
+    async def test_writes_by_another_process_rebuild_a_loaded_index(self, books, qdrant_client):
+        assert self._positions(await books.search_by_keyword("hero", document_id="doc1")) == [2, 4, 1]
+        worker = VectorService(client=qdrant_client, vector_size=4, prefix="test")
+        await worker.upsert_paragraphs(
+            [_scored(2, "doc1", {"sword": 0.4}), _scored(7, "doc1", {"hero": 1.0})],
+            document_id="doc1",
+        )
+        results = await books.search_by_keyword("hero", document_id="doc1")
+        assert self._positions(results) == [7, 4, 1]
+
+        # Its own write keeps the index it has; the worker's is stale now.
+        await books.upsert_paragraphs([_scored(4, "doc1", {"hero": 0.1})], document_id="doc1")
+        assert "test_doc1" in books._keyword_indexes
+        results = await worker.search_by_keyword("hero", document_id="doc1")
+        assert self._positions(results) == [7, 1, 4]
+
+        await worker.delete_collection("doc2")
+        assert self._positions(await books.search_by_keyword("hero")) == [7, 1, 4]
+
+    @pytest.mark.asyncio
+    async def test_shared_collection(self, qdrant_client):
+        shared = VectorService(
+            client=qdrant_client, vector_size=4, prefix="test", shared_collection="test_shared"
+        )
+        await shared.upsert_paragraphs(
+            [_scored(1, "doc1", {"hero": 0.3}), _scored(2, "doc2", {"hero": 0.6})]
+        )
+        await shared.upsert_paragraphs([_scored(3, "doc1", {"hero": 0.9})])
+
+        results = await shared.search_by_keyword("hero")
+        assert self._positions(results) == [3, 2, 1]
+        results = await shared.search_by_keyword("hero", document_id="doc1")
+        assert self._positions(results) == [3, 1]
+
+        worker = VectorService(
+            client=qdrant_client, vector_size=4, prefix="test", shared_collection="test_shared"
+        )
+        await worker.upsert_paragraphs([_scored(1, "doc1", {"hero": 1.0})])
+        results = await shared.search_by_keyword("hero", document_id="doc1")
+        assert self._positions(results) == [1, 3]
+
+
+class TestQuantizedStorage:
+    @staticmethod
+    def _service(client, **overrides):
+        from storysphere.config.settings import Settings
+
+        settings = Settings(**overrides)
+        with patch("storysphere.config.settings.get_settings", return_value=settings):
+            return VectorService(client=client, vector_size=4, prefix="test")
+
+    @staticmethod
+    def _server_client():
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        client.init_options = {"location": None, "url": "http://qdrant:6333", "path": None}
+        client.get_collections.return_value.collections = []
+        return client
+
+    @pytest.mark.asyncio
+    async def test_default_is_float32_in_ram(self):
+        client = self._server_client()
+        service = self._service(client)
+        await service.ensure_collection("doc1")
+
+        kwargs = client.create_collection.call_args.kwargs
+        assert kwargs["quantization_config"] is None
+        assert not kwargs["vectors_config"].on_disk
+        assert service._search_params is None
+
+    @pytest.mark.asyncio
+    async def test_scalar_quantization_with_rescoring(self):
+        from qdrant_client import models
+
+        client = self._server_client()
+        service = self._service(
+            client, qdrant_quantization="scalar", qdrant_on_disk_vectors=True
+        )
+        await service.ensure_collection("doc1")
+
+        kwargs = client.create_collection.call_args.kwargs
+        assert kwargs["vectors_config"].on_disk is True
+        scalar = kwargs["quantization_config"].scalar
+        assert scalar.type == models.ScalarType.INT8
+        assert scalar.always_ram is True
+
+        with patch.object(service, "_embed", new_callable=AsyncMock) as mock_embed:
+            mock_embed.return_value = [1.0, 0.0, 0.0, 0.0]
+            await service.search("q", document_id="doc1")
+        params = client.query_points.call_args.kwargs["search_params"].quantization
+        assert (params.rescore, params.oversampling) == (True, 2.0)
+
+    @pytest.mark.asyncio
+    async def test_binary_quantization_in_shared_collection(self):
+        client = self._server_client()
+        client.collection_exists.return_value = False
+        service = self._service(
+            client,
+            qdrant_quantization="binary",
+            qdrant_quantization_oversampling=4.0,
+            qdrant_shared_collection="test_shared",
+        )
+        await service.ensure_collection("doc1")
+
+        kwargs = client.create_collection.call_args.kwargs
+        assert kwargs["quantization_config"].binary.always_ram is True
+        assert service._search_params.quantization.oversampling == 4.0
+
+    @pytest.mark.asyncio
+    async def test_local_mode_searches_exact_vectors(self, qdrant_client):
+        service = self._service(qdrant_client, qdrant_quantization="scalar")
+        assert service._search_params is None
+
+        await service.upsert_paragraphs(
+            [_paragraph(1, "doc1", [1.0, 0.0, 0.0, 0.0])], document_id="doc1"
+        )
+        with patch.object(service, "_embed", new_callable=AsyncMock) as mock_embed:
+            mock_embed.return_value = [1.0, 0.0, 0.0, 0.0]
+            results = await service.search("q", document_id="doc1")
+        assert results[0].score == pytest.approx(1.0)
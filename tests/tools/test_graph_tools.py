@@ -77,6 +77,18 @@ class TestGetRelationPathsTool:
         assert "paths" in result
         assert result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_bounds_the_number_of_paths(self, mock_kg_service):
+        tool = GetRelationPathsTool(kg_service=mock_kg_service)
+        await tool._arun("Alice", "Bob", max_paths=3)
+        assert mock_kg_service.get_relation_paths.await_args.kwargs["max_paths"] == 3
+
+    @pytest.mark.asyncio
+    async def test_path_bound_defaults_to_the_service_setting(self, mock_kg_service):
+        tool = GetRelationPathsTool(kg_service=mock_kg_service)
+        await tool._arun("Alice", "Bob")
+        assert mock_kg_service.get_relation_paths.await_args.kwargs["max_paths"] is None
+
     @pytest.mark.asyncio
     async def test_source_not_found(self, mock_kg_service):
         tool = GetRelationPathsTool(kg_service=mock_kg_service)
@@ -113,3 +125,9 @@ class TestGetRelationStatsTool:
         tool = GetRelationStatsTool(kg_service=mock_kg_service)
         result = json.loads(await tool._arun(entity_id="ent-alice"))
         assert "total_relations" in result
+
+    @pytest.mark.asyncio
+    async def test_document_scoped(self, mock_kg_service):
+        tool = GetRelationStatsTool(kg_service=mock_kg_service)
+        await tool._arun(document_id="doc-1")
+        mock_kg_service.get_relation_stats.assert_awaited_with(entity_id=None, document_id="doc-1")
@@ -10,6 +10,7 @@ from storysphere.tools.retrieval_tools import (
     GenSummaryTool,
     GetParagraphsTool,
     GetSummaryTool,
+    HybridSearchTool,
     VectorSearchTool,
 )
 
@@ -32,6 +33,19 @@ class TestVectorSearchTool:
         )
 
 
+class TestHybridSearchTool:
+    @pytest.mark.asyncio
+    async def test_delegates_to_service(self):
+        service = AsyncMock()
+        service.search = AsyncMock(return_value=[{"id": "p1", "score": 0.03}])
+        tool = HybridSearchTool(hybrid_search_service=service)
+
+        result = json.loads(await tool._arun("大觀園", top_k=3, document_id="doc-1"))
+
+        assert result == [{"id": "p1", "score": 0.03}]
+        service.search.assert_awaited_once_with(query="大觀園", top_k=3, document_id="doc-1")
+
+
 class TestGetSummaryTool:
     @pytest.mark.asyncio
     async def test_single_chapter(self, mock_doc_service):
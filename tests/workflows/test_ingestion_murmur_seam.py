@@ -12,7 +12,7 @@ landed in the store can catch that.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -72,7 +72,8 @@ def _workflow(doc: Document, kg_run) -> IngestionWorkflow:
 async def _run_phase2(wf: IngestionWorkflow, doc_id: str, task_id: str):
     reporter = TaskStoreReporter(task_id)
     with patch("storysphere.services.analysis_cache.AnalysisCache"), patch(
-        "storysphere.config.settings.get_settings"
+        "storysphere.config.settings.get_settings",
+        return_value=MagicMock(ingestion_stream_chapters=False),
     ):
         return await wf.run_phase2(
             doc_id, progress_cb=reporter.progress, murmur_cb=reporter.murmur
@@ -17,7 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from storysphere.domain.documents import Document, FileType, PipelineStatus, StepStatus
-from storysphere.workflows.ingestion import IngestionWorkflow
+from storysphere.workflows.ingestion import INGESTION_STEPS, IngestionWorkflow
 
 DOC_ID = "book-x"
 
@@ -47,7 +47,7 @@ def _workflow(doc: Document | None, *, failing: str | None = None, kg=None):
     doc_svc = AsyncMock()
     doc_svc.get_document = AsyncMock(return_value=doc)
     doc_svc.update_pipeline_status = AsyncMock()
-    doc_svc.save_document = AsyncMock()
+    doc_svc.save_document_fields = AsyncMock()
 
     if kg is None:
         kg = AsyncMock()
@@ -72,7 +72,7 @@ def _workflow(doc: Document | None, *, failing: str | None = None, kg=None):
     return wf, doc_svc, kg
 
 
-async def _rerun(wf, step: str, *, cache=None, lp_store=None):
+async def _rerun(wf, step: str, *, cache=None, lp_store=None, stream_chapters=False):
     """Run a rerun with the analysis cache stubbed; return the cache mock.
 
     ``LinkPredictionStore`` is stubbed for the same reason ``AnalysisCache`` is:
@@ -90,7 +90,10 @@ async def _rerun(wf, step: str, *, cache=None, lp_store=None):
             "storysphere.services.link_prediction_store.LinkPredictionStore",
             return_value=lp_store,
         ),
-        patch("storysphere.config.settings.get_settings"),
+        patch(
+            "storysphere.config.settings.get_settings",
+            return_value=MagicMock(ingestion_stream_chapters=stream_chapters),
+        ),
     ):
         outcome = await wf.rerun_step(step, DOC_ID)
     return outcome, cache
@@ -149,14 +152,16 @@ class TestStepOutcome:
 
 
 class TestPersistsDocumentOutput:
-    """Chapter summaries and keywords live on the Document, so a rerun must save it.
+    """Summaries, keywords and entity mentions live on the Document, so a rerun must save them.
 
     The pipelines mutate the Document in place and never write to SQLite —
     without an explicit save the LLM output is generated, charged for, and
     then dropped.
     """
 
-    @pytest.mark.parametrize("step", ["summarization", "feature-extraction"])
+    @pytest.mark.parametrize(
+        "step", ["summarization", "feature-extraction", "knowledge-graph"]
+    )
     @pytest.mark.asyncio
     async def test_saves_document_after_doc_mutating_step(self, step):
         doc = _make_doc()
@@ -164,7 +169,9 @@ class TestPersistsDocumentOutput:
 
         await _rerun(wf, step)
 
-        doc_svc.save_document.assert_awaited_once_with(doc)
+        doc_svc.save_document_fields.assert_awaited_once_with(
+            doc, INGESTION_STEPS[step].document_fields
+        )
 
     @pytest.mark.parametrize("step", ["summarization", "feature-extraction"])
     @pytest.mark.asyncio
@@ -176,31 +183,53 @@ class TestPersistsDocumentOutput:
 
         await _rerun(wf, step)
 
-        doc_svc.save_document.assert_awaited_once_with(doc)
+        doc_svc.save_document_fields.assert_awaited_once_with(
+            doc, INGESTION_STEPS[step].document_fields
+        )
 
-    @pytest.mark.parametrize("step", ["knowledge-graph", "symbol-discovery"])
     @pytest.mark.asyncio
-    async def test_does_not_rewrite_document_for_non_doc_steps(self, step):
-        """These write to the KG / symbol store, not the Document — rewriting
-        every chapter and paragraph row would be cost without effect."""
+    async def test_does_not_rewrite_document_for_non_doc_steps(self):
+        """Symbol discovery writes to the symbol store, not the Document —
+        rewriting every chapter and paragraph row would be cost without effect."""
         doc = _make_doc()
         wf, doc_svc, _ = _workflow(doc)
 
-        await _rerun(wf, step)
+        await _rerun(wf, "symbol-discovery")
 
+        doc_svc.save_document_fields.assert_not_awaited()
         doc_svc.save_document.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_persist_failure_does_not_fail_the_step(self):
         doc = _make_doc()
         wf, doc_svc, _ = _workflow(doc)
-        doc_svc.save_document = AsyncMock(side_effect=RuntimeError("disk full"))
+        doc_svc.save_document_fields = AsyncMock(side_effect=RuntimeError("disk full"))
 
         outcome, _ = await _rerun(wf, "summarization")
 
         assert outcome.ok
 
 
+class TestStreamedRerun:
+    @pytest.mark.asyncio
+    async def test_loads_headers_and_streams_chapters(self):
+        from storysphere.services.document_service import (  # noqa: PLC0415
+            PROJECTION_HEADERS,
+        )
+
+        doc = _make_doc()
+        wf, doc_svc, _ = _workflow(doc)
+
+        await _rerun(wf, "knowledge-graph", stream_chapters=True)
+
+        doc_svc.get_document.assert_awaited_once_with(DOC_ID, projection=PROJECTION_HEADERS)
+        call = wf._kg_pipeline.run.await_args
+        assert call.args[0] is doc
+        assert call.kwargs["chapters"] is not None
+        # paragraphs.entities was saved chapter by chapter by the stream.
+        doc_svc.save_document_fields.assert_not_awaited()
+
+
 class TestCacheInvalidation:
     """A successful rerun drops the analyses derived from that step."""
 
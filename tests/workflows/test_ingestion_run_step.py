@@ -4,7 +4,7 @@
 ``run_phase2`` and the rerun endpoint both drive:
 
     pipeline.run() → mark_done | failed → update_pipeline_status
-                   → save_document (doc-mutating steps only)
+                   → save_document_fields (doc-mutating steps only)
 
 The two callers differ only in what they do with the outcome — continue or
 abort — so everything below is about the shared mechanism.
@@ -28,7 +28,7 @@ from storysphere.workflows.ingestion import INGESTION_STEPS, IngestionWorkflow
 ALL_STEPS = [
     ("summarization", "summarization", True),
     ("feature-extraction", "feature_extraction", True),
-    ("knowledge-graph", "knowledge_graph", False),
+    ("knowledge-graph", "knowledge_graph", True),
     ("symbol-discovery", "symbol_discovery", False),
 ]
 
@@ -204,10 +204,26 @@ class TestPersistence:
 
         await wf.run_step(step, doc)
 
+        save = wf._document_service.save_document_fields
         if mutates:
-            wf._document_service.save_document.assert_awaited_once_with(doc)
+            save.assert_awaited_once_with(doc, INGESTION_STEPS[step].document_fields)
         else:
-            wf._document_service.save_document.assert_not_awaited()
+            save.assert_not_awaited()
+        wf._document_service.save_document.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        ("step", "fields"),
+        [
+            ("summarization", {"document.summary", "chapters.summary"}),
+            ("feature-extraction", {"document.keywords", "chapters.keywords"}),
+            ("knowledge-graph", {"paragraphs.entities"}),
+        ],
+    )
+    def test_steps_name_the_columns_they_write(self, step, fields):
+        """Only the step's own columns are rewritten — never paragraph text."""
+        declared = INGESTION_STEPS[step].document_fields
+        assert fields <= declared
+        assert not any(f in declared for f in ("paragraphs.text", "chapters.title"))
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize("step", ["summarization", "feature-extraction"])
@@ -220,13 +236,15 @@ class TestPersistence:
 
         await wf.run_step(step, doc)
 
-        wf._document_service.save_document.assert_awaited_once_with(doc)
+        wf._document_service.save_document_fields.assert_awaited_once_with(
+            doc, INGESTION_STEPS[step].document_fields
+        )
 
     @pytest.mark.asyncio
     async def test_persist_failure_does_not_fail_the_step(self):
         doc = _make_doc()
         wf = _make_workflow()
-        wf._document_service.save_document.side_effect = RuntimeError("disk full")
+        wf._document_service.save_document_fields.side_effect = RuntimeError("disk full")
 
         outcome = await wf.run_step("summarization", doc)
 
@@ -234,6 +252,49 @@ class TestPersistence:
         assert doc.pipeline_status.summarization == StepStatus.done
 
 
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_stream_is_passed_to_the_pipeline(self):
+        doc = _make_doc()
+        wf = _make_workflow()
+        stream = object()
+
+        await wf.run_step("summarization", doc, stream=stream)
+
+        assert wf._summarization_pipeline.run.await_args.kwargs["chapters"] is stream
+
+    @pytest.mark.asyncio
+    async def test_no_stream_keyword_without_a_stream(self):
+        doc = _make_doc()
+        wf = _make_workflow()
+
+        await wf.run_step("summarization", doc)
+
+        assert "chapters" not in wf._summarization_pipeline.run.await_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_streamed_step_saves_only_document_and_chapter_columns(self):
+        """Paragraph columns were saved chapter by chapter by the stream; the
+        header Document has no paragraphs to save them from."""
+        doc = _make_doc()
+        wf = _make_workflow()
+
+        await wf.run_step("feature-extraction", doc, stream=object())
+
+        wf._document_service.save_document_fields.assert_awaited_once_with(
+            doc, frozenset({"document.keywords", "chapters.keywords"})
+        )
+
+    @pytest.mark.asyncio
+    async def test_streamed_kg_step_saves_nothing_itself(self):
+        doc = _make_doc()
+        wf = _make_workflow()
+
+        await wf.run_step("knowledge-graph", doc, stream=object())
+
+        wf._document_service.save_document_fields.assert_not_awaited()
+
+
 class TestKgSavePolicy:
     @pytest.mark.asyncio
     async def test_run_step_never_saves_the_kg(self):